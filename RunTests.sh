@@ -2,12 +2,63 @@
 japaneseVerbFormGeneratorTests="JapaneseVerbFormGeneratorTests.py"
 utilsTests="UtilsTests.py"
 decoratorsTests="DecoratorsTests.py"
+columnarExporterTests="ColumnarExporterTests.py"
+conjugationIndexTests="ConjugationIndexTests.py"
+profilingTests="ProfilingTests.py"
+textRewriterTests="TextRewriterTests.py"
+differentialTestingTests="DifferentialTestingTests.py"
+goldenCorpusTests="GoldenCorpusTests.py"
+conjugationServerTests="ConjugationServerTests.py"
+loadGeneratorTests="LoadGeneratorTests.py"
+conjugationCacheTests="ConjugationCacheTests.py"
+verbClassResolverTests="VerbClassResolverTests.py"
+japaneseAdjectiveFormGeneratorTests="JapaneseAdjectiveFormGeneratorTests.py"
+paradigmSerializerTests="ParadigmSerializerTests.py"
+integerConjugatorTests="IntegerConjugatorTests.py"
+specializedConjugatorsTests="SpecializedConjugatorsTests.py"
+asyncJapaneseVerbFormGeneratorTests="AsyncJapaneseVerbFormGeneratorTests.py"
+lazyParadigmTests="LazyParadigmTests.py"
+dictionaryIngestionTests="DictionaryIngestionTests.py"
+conjugationTrieTests="ConjugationTrieTests.py"
+performanceRegressionTests="PerformanceRegressionTests.py"
+conjugationWorkerPoolTests="ConjugationWorkerPoolTests.py"
+lexiconCoverageTests="LexiconCoverageTests.py"
+paradigmDigestTests="ParadigmDigestTests.py"
+if [ "$1" == "perf" ]
+  then
+    # fails when a workload is slower than tests/data/performance_baseline.json allows
+    shift
+    python -m src.PerformanceRegression "$@"
+    exit $?
+fi
 if [ $# -gt 0 ]
   then
     srcdir = "src"
     coverage run -a --source $srcdir "tests/$japaneseVerbFormGeneratorTests"
     coverage run -a --include "$srcdir/Utils.py" "tests/$utilsTests"
     coverage run -a --include "$srcdir/Decorators.py" "tests/$decoratorsTests"
+    coverage run -a --include "$srcdir/ColumnarExporter.py" "tests/$columnarExporterTests"
+    coverage run -a --include "$srcdir/ConjugationIndex.py" "tests/$conjugationIndexTests"
+    coverage run -a --include "$srcdir/Profiling.py" "tests/$profilingTests"
+    coverage run -a --include "$srcdir/TextRewriter.py" "tests/$textRewriterTests"
+    coverage run -a --include "$srcdir/DifferentialTesting.py" "tests/$differentialTestingTests"
+    coverage run -a --include "$srcdir/GoldenCorpus.py" "tests/$goldenCorpusTests"
+    coverage run -a --include "$srcdir/ConjugationServer.py" "tests/$conjugationServerTests"
+    coverage run -a --include "$srcdir/LoadGenerator.py" "tests/$loadGeneratorTests"
+    coverage run -a --include "$srcdir/ConjugationCache.py" "tests/$conjugationCacheTests"
+    coverage run -a --include "$srcdir/VerbClassResolver.py" "tests/$verbClassResolverTests"
+    coverage run -a --include "$srcdir/JapaneseAdjectiveFormGenerator.py" "tests/$japaneseAdjectiveFormGeneratorTests"
+    coverage run -a --include "$srcdir/ParadigmSerializer.py" "tests/$paradigmSerializerTests"
+    coverage run -a --include "$srcdir/IntegerConjugator.py" "tests/$integerConjugatorTests"
+    coverage run -a --include "$srcdir/SpecializedConjugators.py" "tests/$specializedConjugatorsTests"
+    coverage run -a --include "$srcdir/AsyncJapaneseVerbFormGenerator.py" "tests/$asyncJapaneseVerbFormGeneratorTests"
+    coverage run -a --include "$srcdir/LazyParadigm.py" "tests/$lazyParadigmTests"
+    coverage run -a --include "$srcdir/DictionaryIngestion.py" "tests/$dictionaryIngestionTests"
+    coverage run -a --include "$srcdir/ConjugationTrie.py" "tests/$conjugationTrieTests"
+    coverage run -a --include "$srcdir/PerformanceRegression.py" "tests/$performanceRegressionTests"
+    coverage run -a --include "$srcdir/ConjugationWorkerPool.py" "tests/$conjugationWorkerPoolTests"
+    coverage run -a --include "$srcdir/LexiconCoverage.py" "tests/$lexiconCoverageTests"
+    coverage run -a --include "$srcdir/ParadigmDigest.py" "tests/$paradigmDigestTests"
     if [ $1 == "report" ]
     then
       coverage report -m # prints to console
@@ -20,4 +71,26 @@ else
   python "tests/$japaneseVerbFormGeneratorTests"  
   python "tests/$utilsTests"
   python "tests/$decoratorsTests"
+  python "tests/$columnarExporterTests"
+  python "tests/$conjugationIndexTests"
+  python "tests/$profilingTests"
+  python "tests/$textRewriterTests"
+  python "tests/$differentialTestingTests"
+  python "tests/$goldenCorpusTests"
+  python "tests/$conjugationServerTests"
+  python "tests/$loadGeneratorTests"
+  python "tests/$conjugationCacheTests"
+  python "tests/$verbClassResolverTests"
+  python "tests/$japaneseAdjectiveFormGeneratorTests"
+  python "tests/$paradigmSerializerTests"
+  python "tests/$integerConjugatorTests"
+  python "tests/$specializedConjugatorsTests"
+  python "tests/$asyncJapaneseVerbFormGeneratorTests"
+  python "tests/$lazyParadigmTests"
+  python "tests/$dictionaryIngestionTests"
+  python "tests/$conjugationTrieTests"
+  python "tests/$performanceRegressionTests"
+  python "tests/$conjugationWorkerPoolTests"
+  python "tests/$lexiconCoverageTests"
+  python "tests/$paradigmDigestTests"
 fi
\ No newline at end of file
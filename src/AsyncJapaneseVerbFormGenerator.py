@@ -0,0 +1,226 @@
+import argparse
+import asyncio
+import collections
+import concurrent.futures
+import time
+
+# Local modules
+from .JapaneseVerbFormGenerator import JapaneseVerbFormGenerator
+from .LoadGenerator import percentile
+from .Paradigm import PARADIGM_SIGNATURES, conjugate_form, generate_paradigm
+
+DEFAULT_CHUNK_SIZE = 256
+DEFAULT_INLINE_THRESHOLD = 64
+DEFAULT_MAX_PENDING_CHUNKS = 2
+
+def conjugate_chunk(generator, requests):
+    '''Conjugate a chunk of requests synchronously. This is the function run on
+    the executor, so it must stay importable at module level for process pools.
+
+    Args:
+        generator (JapaneseVerbFormGenerator): generator used to conjugate the verbs
+        requests (list): (verb, verb_class, form, tense, formality, polarity) tuples
+
+    Returns:
+        list: conjugated verbs in request order, None for unsupported forms
+    '''
+    return [conjugate_form(generator, *request) for request in requests]
+
+class AsyncJapaneseVerbFormGenerator:
+    ''' Conjugates verbs from asyncio code without blocking the event loop.
+    Requests are (verb, verb_class, form, tense, formality, polarity) tuples,
+    as in ConjugationServer. Batches up to inline_threshold requests are
+    conjugated directly on the loop, which is cheaper than a round trip to
+    another thread. Larger batches are split into chunks that run on the
+    executor, and at most max_pending_chunks chunks are submitted ahead of
+    the consumer.
+
+    Cancelling the consuming task cancels the chunks that have not started.
+    A chunk that is already running finishes in the background, so chunk_size
+    bounds the work wasted by a cancellation. When leaving an async for loop
+    early, close the iterator (contextlib.aclosing) to release its chunks at
+    once.
+
+    A thread pool keeps the loop responsive only between the chunks' GIL
+    switches (sys.getswitchinterval). A ProcessPoolExecutor takes conjugation
+    off the loop's interpreter entirely, at the cost of pickling the generator
+    and each chunk.
+    '''
+    def __init__(self, generator=None, executor=None, chunk_size=DEFAULT_CHUNK_SIZE,
+                 inline_threshold=DEFAULT_INLINE_THRESHOLD, max_pending_chunks=DEFAULT_MAX_PENDING_CHUNKS):
+        ''' Args:
+            generator (:obj: JapaneseVerbFormGenerator, optional): synchronous
+                generator doing the work. Defaults to a new generator.
+            executor (:obj: concurrent.futures.Executor, optional): executor for
+                large batches. Defaults to None, the loop's default executor.
+            chunk_size (:obj: int, optional): requests per executor job.
+                Defaults to DEFAULT_CHUNK_SIZE.
+            inline_threshold (:obj: int, optional): largest batch conjugated on
+                the loop itself. Defaults to DEFAULT_INLINE_THRESHOLD.
+            max_pending_chunks (:obj: int, optional): chunks submitted ahead of
+                the consumer. Defaults to DEFAULT_MAX_PENDING_CHUNKS.
+        '''
+        self.generator = JapaneseVerbFormGenerator() if generator is None else generator
+        self.executor = executor
+        self.chunk_size = chunk_size
+        self.inline_threshold = inline_threshold
+        self.max_pending_chunks = max_pending_chunks
+
+    async def conjugate(self, verb, verb_class, form, tense=None, formality=None, polarity=None):
+        '''Conjugate a single verb on the loop
+
+        Args:
+            verb (str): Japanese verb in kana, might contain kanji
+            verb_class (enum): VerbClass Enum representing the verb class
+                to which the verb belongs
+            form (enum): VerbForm Enum representing the conjugation form
+            tense (:obj: enum, optional): Tense Enum, only used by tense forms.
+                Defaults to None.
+            formality (:obj: enum, optional): Formality Enum, only used by formality
+                forms. Defaults to None.
+            polarity (:obj: enum, optional): Polarity Enum, unused by
+                unparameterized forms. Defaults to None.
+
+        Returns:
+            str: conjugated verb, or None if the form is not supported
+        '''
+        return conjugate_form(self.generator, verb, verb_class, form, tense, formality, polarity)
+
+    async def generate_paradigm(self, verb, verb_class):
+        '''Conjugate a verb into every form of its paradigm on the loop
+
+        Args:
+            verb (str): Japanese verb in kana, might contain kanji
+            verb_class (enum): VerbClass Enum representing the verb class
+                to which the verb belongs
+
+        Returns:
+            list: (form, tense, formality, polarity, surface) tuples, see
+                Paradigm.generate_paradigm
+        '''
+        return list(generate_paradigm(self.generator, verb, verb_class))
+
+    async def iter_conjugations(self, requests):
+        '''Conjugate a batch of requests, yielding results in request order as
+        their chunks complete. Validation errors are raised when the failing
+        request's chunk is reached.
+
+        Args:
+            requests (iterable): (verb, verb_class, form, tense, formality, polarity) tuples
+
+        Yields:
+            str: conjugated verb, or None if the form is not supported
+        '''
+        requests = list(requests)
+        if len(requests) <= self.inline_threshold:
+            for request in requests:
+                yield conjugate_form(self.generator, *request)
+            return
+        loop = asyncio.get_running_loop()
+        chunks = collections.deque(requests[start:start + self.chunk_size] for start in range(0, len(requests), self.chunk_size))
+        pending = collections.deque()
+        try:
+            while chunks or pending:
+                while chunks and len(pending) < self.max_pending_chunks:
+                    pending.append(loop.run_in_executor(self.executor, conjugate_chunk, self.generator, chunks.popleft()))
+                for surface in await pending.popleft():
+                    yield surface
+        finally:
+            for future in pending:
+                future.cancel()
+
+    async def conjugate_many(self, requests):
+        '''Conjugate a batch of requests, see iter_conjugations
+
+        Args:
+            requests (iterable): (verb, verb_class, form, tense, formality, polarity) tuples
+
+        Returns:
+            list: conjugated verbs in request order, None for unsupported forms
+        '''
+        return [surface async for surface in self.iter_conjugations(requests)]
+
+# ---------------------------------------------------------- #
+#                  LOOP RESPONSIVENESS BENCHMARK             #
+# ---------------------------------------------------------- #
+LoopLatencyReport = collections.namedtuple("LoopLatencyReport", ["mode", "batch_seconds", "p50_ms", "p99_ms", "max_ms"])
+
+async def measure_loop_latency(run_batch, interval=0.001):
+    '''Run a batch while a heartbeat task sleeps for interval seconds in a
+    loop, recording how late each wake-up is
+
+    Args:
+        run_batch (callable): coroutine function running the batch
+        interval (:obj: float, optional): heartbeat period in seconds.
+            Defaults to 0.001.
+
+    Returns:
+        tuple: (batch seconds, sorted heartbeat delays in seconds)
+    '''
+    loop = asyncio.get_running_loop()
+    delays = []
+    is_running = True
+
+    async def heartbeat():
+        while is_running:
+            deadline = loop.time() + interval
+            await asyncio.sleep(interval)
+            delays.append(max(0.0, loop.time() - deadline))
+
+    heartbeat_task = asyncio.ensure_future(heartbeat())
+    await asyncio.sleep(interval)
+    start = time.perf_counter()
+    await run_batch()
+    batch_seconds = time.perf_counter() - start
+    is_running = False
+    await heartbeat_task
+    return batch_seconds, sorted(delays)
+
+def benchmark_loop_latency(requests, chunk_size=DEFAULT_CHUNK_SIZE, interval=0.001):
+    '''Compare event loop responsiveness while conjugating a batch directly on
+    the loop, through a thread pool and through a process pool
+
+    Args:
+        requests (list): (verb, verb_class, form, tense, formality, polarity) tuples
+        chunk_size (:obj: int, optional): requests per executor job.
+            Defaults to DEFAULT_CHUNK_SIZE.
+        interval (:obj: float, optional): heartbeat period in seconds.
+            Defaults to 0.001.
+
+    Returns:
+        list: LoopLatencyReport per mode
+    '''
+    generator = JapaneseVerbFormGenerator()
+    reports = []
+
+    async def run_blocking():
+        conjugate_chunk(generator, requests)
+
+    with concurrent.futures.ThreadPoolExecutor(1) as thread_pool, concurrent.futures.ProcessPoolExecutor(1) as process_pool:
+        # start the worker process before timing
+        process_pool.submit(conjugate_chunk, generator, requests[:1]).result()
+        modes = [("blocking", run_blocking)]
+        for mode, executor in (("thread", thread_pool), ("process", process_pool)):
+            async_generator = AsyncJapaneseVerbFormGenerator(generator, executor, chunk_size=chunk_size)
+            modes.append((mode, lambda async_generator=async_generator: async_generator.conjugate_many(requests)))
+        for mode, run_batch in modes:
+            batch_seconds, delays = asyncio.run(measure_loop_latency(run_batch, interval))
+            reports.append(LoopLatencyReport(mode, batch_seconds, 1000 * percentile(delays, 0.5),
+                1000 * percentile(delays, 0.99), 1000 * (delays[-1] if delays else 0.0)))
+    return reports
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure event loop responsiveness while conjugating a batch.")
+    parser.add_argument("--verbs", type=int, default=500, help="number of golden corpus verbs, each conjugated into its full paradigm")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="requests per executor job")
+    args = parser.parse_args(argv)
+
+    from .GoldenCorpus import load_golden_corpus
+    requests = [(entry.verb, entry.verb_class) + signature for entry in load_golden_corpus()[:args.verbs] for signature in PARADIGM_SIGNATURES]
+    print("{} requests".format(len(requests)))
+    print("{:<10}{:>10}{:>10}{:>10}{:>10}".format("mode", "batch s", "p50 ms", "p99 ms", "max ms"))
+    for report in benchmark_loop_latency(requests, args.chunk_size):
+        print("{:<10}{:>10.3f}{:>10.2f}{:>10.2f}{:>10.2f}".format(*report))
+
+if __name__ == "__main__":
+    main()
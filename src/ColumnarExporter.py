@@ -0,0 +1,146 @@
+# Local modules
+from .constants.EnumeratedTypes import Formality, Polarity, Tense, VerbClass, VerbForm
+
+from .JapaneseVerbFormGenerator import JapaneseVerbFormGenerator
+from .Paradigm import generate_paradigm
+
+# External Libraries (optional)
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+DEFAULT_BATCH_SIZE = 65536
+
+PARQUET_FORMAT = "parquet"
+ARROW_IPC_FORMAT = "arrow"
+
+# (column name, enum type) for every dictionary-encoded column
+ENUM_COLUMNS = (
+    ("verb_class", VerbClass),
+    ("form", VerbForm),
+    ("tense", Tense),
+    ("formality", Formality),
+    ("polarity", Polarity),
+)
+
+COLUMN_NAMES = ("lemma", "verb_class", "form", "tense", "formality", "polarity", "surface")
+
+def _require_pyarrow():
+    if pyarrow is None:
+        raise ImportError("pyarrow is required for columnar export. Install it with `pip install pyarrow`.")
+
+def _enum_dictionary(enum_type):
+    # enum values are 1-based and contiguous, so member.value - 1 is the dictionary index
+    return pyarrow.array([member.name for member in enum_type], type=pyarrow.string())
+
+def conjugation_table_schema():
+    '''Build the Arrow schema of an exported conjugation table. Enum columns are
+    dictionary encoded with int8 indices into the enum member names.
+
+    Returns:
+        pyarrow.Schema: schema of the record batches produced by iterate_record_batches
+    '''
+    _require_pyarrow()
+    enum_type = pyarrow.dictionary(pyarrow.int8(), pyarrow.string())
+    return pyarrow.schema([
+        ("lemma", pyarrow.string()),
+        ("verb_class", enum_type),
+        ("form", enum_type),
+        ("tense", enum_type),
+        ("formality", enum_type),
+        ("polarity", enum_type),
+        ("surface", pyarrow.string()),
+    ])
+
+def _build_record_batch(schema, dictionaries, columns):
+    arrays = [pyarrow.array(columns["lemma"], type=pyarrow.string())]
+    for name, _ in ENUM_COLUMNS:
+        indices = pyarrow.array(columns[name], type=pyarrow.int8())
+        arrays.append(pyarrow.DictionaryArray.from_arrays(indices, dictionaries[name]))
+    arrays.append(pyarrow.array(columns["surface"], type=pyarrow.string()))
+    return pyarrow.RecordBatch.from_arrays(arrays, schema=schema)
+
+def iterate_record_batches(verbs, batch_size=DEFAULT_BATCH_SIZE, generator=None):
+    '''Stream the full paradigm of each verb into Arrow record batches of at most
+    batch_size rows. Only one batch worth of rows is buffered at a time.
+
+    Args:
+        verbs (iterable): (verb, verb_class) pairs to conjugate
+        batch_size (:obj: int, optional): maximum number of rows per record batch.
+            Defaults to DEFAULT_BATCH_SIZE.
+        generator (:obj: JapaneseVerbFormGenerator, optional): generator used to
+            conjugate the verbs. Defaults to a new JapaneseVerbFormGenerator.
+
+    Yields:
+        pyarrow.RecordBatch: rows of (lemma, verb_class, form, tense, formality,
+            polarity, surface). Parameters that do not apply to a form are null.
+    '''
+    _require_pyarrow()
+    if batch_size < 1:
+        raise ValueError("batch_size must be a positive integer", batch_size)
+    if generator is None:
+        generator = JapaneseVerbFormGenerator()
+
+    schema = conjugation_table_schema()
+    dictionaries = {name: _enum_dictionary(enum_type) for name, enum_type in ENUM_COLUMNS}
+    columns = {name: [] for name in COLUMN_NAMES}
+    num_rows = 0
+
+    for verb, verb_class in verbs:
+        verb_class_index = verb_class.value - 1
+        for form, tense, formality, polarity, surface in generate_paradigm(generator, verb, verb_class):
+            columns["lemma"].append(verb)
+            columns["verb_class"].append(verb_class_index)
+            columns["form"].append(form.value - 1)
+            columns["tense"].append(None if tense is None else tense.value - 1)
+            columns["formality"].append(None if formality is None else formality.value - 1)
+            columns["polarity"].append(None if polarity is None else polarity.value - 1)
+            columns["surface"].append(surface)
+            num_rows += 1
+
+            if num_rows == batch_size:
+                yield _build_record_batch(schema, dictionaries, columns)
+                columns = {name: [] for name in COLUMN_NAMES}
+                num_rows = 0
+
+    if num_rows > 0:
+        yield _build_record_batch(schema, dictionaries, columns)
+
+def export_conjugation_table(verbs, path, file_format=PARQUET_FORMAT, batch_size=DEFAULT_BATCH_SIZE, generator=None):
+    '''Write the full paradigm of each verb to a Parquet or Arrow IPC file, one
+    record batch (Parquet row group) at a time
+
+    Args:
+        verbs (iterable): (verb, verb_class) pairs to conjugate
+        path (str): destination file path
+        file_format (:obj: str, optional): PARQUET_FORMAT or ARROW_IPC_FORMAT.
+            Defaults to PARQUET_FORMAT.
+        batch_size (:obj: int, optional): maximum number of rows per record batch.
+            Defaults to DEFAULT_BATCH_SIZE.
+        generator (:obj: JapaneseVerbFormGenerator, optional): generator used to
+            conjugate the verbs. Defaults to a new JapaneseVerbFormGenerator.
+
+    Returns:
+        int: number of rows written
+    '''
+    _require_pyarrow()
+    if file_format not in [PARQUET_FORMAT, ARROW_IPC_FORMAT]:
+        raise ValueError("Unsupported columnar file format", file_format)
+
+    schema = conjugation_table_schema()
+    if file_format == PARQUET_FORMAT:
+        import pyarrow.parquet
+        writer = pyarrow.parquet.ParquetWriter(path, schema)
+    else:
+        import pyarrow.ipc
+        writer = pyarrow.ipc.new_file(path, schema)
+
+    num_rows = 0
+    try:
+        for record_batch in iterate_record_batches(verbs, batch_size, generator):
+            writer.write_batch(record_batch)
+            num_rows += record_batch.num_rows
+    finally:
+        writer.close()
+    return num_rows
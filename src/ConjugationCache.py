@@ -0,0 +1,417 @@
+import argparse
+import collections
+import multiprocessing
+import random
+import struct
+import sys
+import time
+import zlib
+from multiprocessing import shared_memory
+
+# Local modules
+from .GoldenCorpus import load_golden_corpus
+from .JapaneseVerbFormGenerator import JapaneseVerbFormGenerator
+from .Paradigm import PARADIGM_SIGNATURES, conjugate_form
+
+DEFAULT_NUM_SLOTS = 65536
+DEFAULT_ARENA_SIZE = 4 * 1024 * 1024
+DEFAULT_PROBE_LENGTH = 8
+DEFAULT_LOCAL_CACHE_SIZE = 65536
+DEFAULT_NEAR_CACHE_SIZE = 4096
+
+# (form, verb_class, *parameters) -> encoded enum values
+_KEY_PREFIXES = {}
+
+def encode_cache_key(key):
+    '''Encode a conjugation cache key as bytes that are identical in every process
+
+    Args:
+        key (tuple): (verb, form, verb_class, *parameters), where the parameters
+            are the Tense / Formality / Polarity arguments of the generate_* method
+
+    Returns:
+        bytes: enum values (0 for None) followed by the UTF-8 verb
+    '''
+    enum_members = key[1:]
+    prefix = _KEY_PREFIXES.get(enum_members)
+    if prefix is None:
+        prefix = _KEY_PREFIXES[enum_members] = bytes(0 if member is None else member.value for member in enum_members)
+    return prefix + key[0].encode("utf-8")
+
+# ---------------------------------------------------------- #
+#                     PER-PROCESS CACHE                      #
+# ---------------------------------------------------------- #
+class LocalConjugationCache:
+    ''' Conjugation cache private to one process. It is cleared when full, like
+    the token cache of StreamingVerbRewriter.
+    '''
+    def __init__(self, max_entries=DEFAULT_LOCAL_CACHE_SIZE):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = {}
+
+    def lookup(self, key):
+        '''Find a cached conjugation
+
+        Args:
+            key (tuple): (verb, form, verb_class, *parameters)
+
+        Returns:
+            tuple: (True, conjugated verb) on a hit, (False, None) on a miss
+        '''
+        entries = self._entries
+        if key in entries:
+            self.hits += 1
+            return True, entries[key]
+        self.misses += 1
+        return False, None
+
+    def store(self, key, value):
+        '''Cache a conjugation
+
+        Args:
+            key (tuple): (verb, form, verb_class, *parameters)
+            value (str): conjugated verb, None for unsupported forms
+        '''
+        if len(self._entries) >= self.max_entries:
+            self._entries.clear()
+        self._entries[key] = value
+
+# ---------------------------------------------------------- #
+#                     SHARED MEMORY CACHE                    #
+# ---------------------------------------------------------- #
+# Layout of the shared memory block:
+#   header | slot table | string arena
+# The slot table is an open addressing hash table of (key hash, arena position + 1)
+# slots, 0 marking an empty slot. Entries are appended to the arena, which is a
+# ring buffer: positions grow forever and an entry lives at position % arena_size
+# until the tail has moved a full arena past it. Old entries are therefore
+# evicted in insertion order and memory use is fixed at creation time.
+CACHE_MAGIC = b"JVCC"
+CACHE_VERSION = 2
+CACHE_HEADER = struct.Struct("<4sIIIIIQ")  # magic, version, num_slots, arena_size, probe_length, resource tracker pid, tail
+TAIL_OFFSET = CACHE_HEADER.size - 8
+TAIL = struct.Struct("<Q")
+SLOT = struct.Struct("<IQ")
+ENTRY_HEADER = struct.Struct("<HH")  # key length, value length
+NONE_VALUE_LENGTH = 0xFFFF
+# SharedMemory can attach without registering the block with the resource
+# tracker from Python 3.13 on
+ATTACH_WITHOUT_TRACKING = sys.version_info >= (3, 13)
+
+class SharedConjugationCache:
+    ''' Conjugation cache stored in multiprocessing.shared_memory so every worker
+    process reads and writes the same entries.
+
+    Writers serialize on a multiprocessing lock. Readers take no lock: they
+    check the key bytes of an entry and that the arena tail has not moved a full
+    arena past it once they have copied the value out, so they never return an
+    entry that was overwritten while they read it.
+
+    Conjugations never change, so each process also keeps its most recent hits
+    in a small private dict (near_cache_size entries, 0 to disable) that is
+    checked before the shared table.
+
+    Create the cache in the parent process before forking workers (e.g. in a
+    gunicorn on_starting hook or with preload_app) so the workers inherit both
+    the shared memory and the lock. Processes that attach by name must pass a
+    lock shared with the other writers.
+    '''
+    def __init__(self, name=None, num_slots=DEFAULT_NUM_SLOTS, arena_size=DEFAULT_ARENA_SIZE,
+                 probe_length=DEFAULT_PROBE_LENGTH, create=True, lock=None, near_cache_size=DEFAULT_NEAR_CACHE_SIZE):
+        if create:
+            if num_slots < probe_length or arena_size < ENTRY_HEADER.size:
+                raise ValueError("Shared conjugation cache is too small", num_slots, arena_size)
+            size = CACHE_HEADER.size + num_slots * SLOT.size + arena_size
+            self.shared_memory = shared_memory.SharedMemory(name=name, create=True, size=size)
+            CACHE_HEADER.pack_into(self.shared_memory.buf, 0, CACHE_MAGIC, CACHE_VERSION, num_slots, arena_size,
+                                   probe_length, _resource_tracker_pid() or 0, 0)
+        else:
+            if ATTACH_WITHOUT_TRACKING:
+                self.shared_memory = shared_memory.SharedMemory(name=name, track=False)
+            else:
+                self.shared_memory = shared_memory.SharedMemory(name=name)
+            magic, version, num_slots, arena_size, probe_length, tracker_pid, _ = CACHE_HEADER.unpack_from(self.shared_memory.buf, 0)
+            _unregister_attached_memory(self.shared_memory, tracker_pid)
+            if magic != CACHE_MAGIC or version != CACHE_VERSION:
+                self.shared_memory.close()
+                raise ValueError("Shared memory block is not a conjugation cache", name)
+
+        self.name = self.shared_memory.name
+        self.num_slots = num_slots
+        self.arena_size = arena_size
+        self.probe_length = probe_length
+        self.lock = lock if lock is not None else multiprocessing.Lock()
+        self.near_cache_size = near_cache_size
+        self.hits = 0
+        self.misses = 0
+        self._near_cache = {}
+        # key, key bytes and hash of the last lookup, reused by the store after a miss
+        self._last_key = None
+        self._last_key_bytes = None
+        self._last_key_hash = None
+        self._buffer = self.shared_memory.buf
+        self._slots_offset = CACHE_HEADER.size
+        self._arena_offset = CACHE_HEADER.size + num_slots * SLOT.size
+
+    def close(self):
+        '''Detach this process from the shared memory block'''
+        self._buffer = None
+        self.shared_memory.close()
+
+    def unlink(self):
+        '''Destroy the shared memory block. Call once, from the creating process.'''
+        self.shared_memory.unlink()
+
+    def _tail(self):
+        return TAIL.unpack_from(self._buffer, TAIL_OFFSET)[0]
+
+    def _slot_offset(self, key_hash, probe):
+        return self._slots_offset + ((key_hash + probe) % self.num_slots) * SLOT.size
+
+    def _remember(self, key, value):
+        if self.near_cache_size:
+            if len(self._near_cache) >= self.near_cache_size:
+                self._near_cache.clear()
+            self._near_cache[key] = value
+
+    def _encode(self, key):
+        if key is not self._last_key:
+            key_bytes = encode_cache_key(key)
+            self._last_key, self._last_key_bytes, self._last_key_hash = key, key_bytes, zlib.crc32(key_bytes)
+        return self._last_key_bytes, self._last_key_hash
+
+    def _read_value(self, key_bytes, position):
+        # returns (True, raw UTF-8 value or None) if the entry at position holds
+        # key_bytes. The value is decoded by lookup once it has checked that the
+        # entry was not overwritten while it was copied.
+        buffer = self._buffer
+        entry_offset = self._arena_offset + position % self.arena_size
+        key_length, value_length = ENTRY_HEADER.unpack_from(buffer, entry_offset)
+        key_start = entry_offset + ENTRY_HEADER.size
+        if key_length != len(key_bytes) or buffer[key_start:key_start + key_length] != key_bytes:
+            return False, None
+        if value_length == NONE_VALUE_LENGTH:
+            return True, None
+        value_start = key_start + key_length
+        return True, bytes(buffer[value_start:value_start + value_length])
+
+    def lookup(self, key):
+        '''Find a cached conjugation
+
+        Args:
+            key (tuple): (verb, form, verb_class, *parameters)
+
+        Returns:
+            tuple: (True, conjugated verb) on a hit, (False, None) on a miss
+        '''
+        near_cache = self._near_cache
+        if key in near_cache:
+            self.hits += 1
+            return True, near_cache[key]
+
+        key_bytes, key_hash = self._encode(key)
+        buffer = self._buffer
+        num_slots = self.num_slots
+        arena_size = self.arena_size
+        for probe in range(self.probe_length):
+            slot_hash, slot_position = SLOT.unpack_from(buffer, self._slots_offset + (key_hash + probe) % num_slots * SLOT.size)
+            if slot_position == 0:
+                break
+            if slot_hash != key_hash:
+                continue
+            position = slot_position - 1
+            if TAIL.unpack_from(buffer, TAIL_OFFSET)[0] - position > arena_size:
+                continue
+            is_match, value = self._read_value(key_bytes, position)
+            # the entry may have been overwritten while it was being copied
+            if not is_match or TAIL.unpack_from(buffer, TAIL_OFFSET)[0] - position > arena_size:
+                continue
+            if value is not None:
+                try:
+                    value = str(value, "utf-8")
+                except UnicodeDecodeError:
+                    continue
+            self.hits += 1
+            self._remember(key, value)
+            return True, value
+        self.misses += 1
+        return False, None
+
+    def store(self, key, value):
+        '''Cache a conjugation, evicting the oldest entries when the arena is full
+
+        Args:
+            key (tuple): (verb, form, verb_class, *parameters)
+            value (str): conjugated verb, None for unsupported forms
+        '''
+        self._remember(key, value)
+        key_bytes, key_hash = self._encode(key)
+        value_bytes = b"" if value is None else value.encode("utf-8")
+        entry_size = ENTRY_HEADER.size + len(key_bytes) + len(value_bytes)
+        if entry_size > self.arena_size or len(value_bytes) >= NONE_VALUE_LENGTH:
+            return
+        buffer = self._buffer
+
+        with self.lock:
+            position = self._tail()
+            arena_position = position % self.arena_size
+            if arena_position + entry_size > self.arena_size:
+                # entries never wrap around the end of the arena
+                position += self.arena_size - arena_position
+                arena_position = 0
+            # move the tail first so readers stop trusting the bytes about to be overwritten
+            TAIL.pack_into(buffer, TAIL_OFFSET, position + entry_size)
+
+            entry_offset = self._arena_offset + arena_position
+            ENTRY_HEADER.pack_into(buffer, entry_offset, len(key_bytes), NONE_VALUE_LENGTH if value is None else len(value_bytes))
+            key_start = entry_offset + ENTRY_HEADER.size
+            buffer[key_start:key_start + len(key_bytes)] = key_bytes
+            buffer[key_start + len(key_bytes):key_start + len(key_bytes) + len(value_bytes)] = value_bytes
+
+            # reuse an empty, stale, or same-hash slot, otherwise evict the oldest slot of the probe window
+            tail = position + entry_size
+            target_offset = None
+            oldest_position = None
+            for probe in range(self.probe_length):
+                slot_offset = self._slot_offset(key_hash, probe)
+                slot_hash, slot_position = SLOT.unpack_from(buffer, slot_offset)
+                if slot_position == 0 or slot_hash == key_hash or tail - (slot_position - 1) > self.arena_size:
+                    target_offset = slot_offset
+                    break
+                if oldest_position is None or slot_position < oldest_position:
+                    target_offset, oldest_position = slot_offset, slot_position
+            SLOT.pack_into(buffer, target_offset, key_hash, position + 1)
+
+    def clear(self):
+        '''Drop every cached conjugation. Other processes keep their near cache.'''
+        self._near_cache.clear()
+        with self.lock:
+            slots_end = self._arena_offset
+            self._buffer[self._slots_offset:slots_end] = bytes(slots_end - self._slots_offset)
+
+def _resource_tracker_pid():
+    # pid of the resource tracker this process launched or inherited by fork,
+    # None in processes started by spawn, which only inherit its descriptor.
+    # Only needed before Python 3.13, whose attaching processes never register
+    # the block, and read from a private attribute because no public API
+    # exposes it: None whenever it is missing.
+    if ATTACH_WITHOUT_TRACKING:
+        return None
+    try:
+        from multiprocessing import resource_tracker
+        return getattr(resource_tracker._resource_tracker, "_pid", None)
+    except Exception:
+        return None
+
+def _unregister_attached_memory(attached_memory, creator_tracker_pid):
+    # attaching registers the block with this process's resource tracker. Forked
+    # and spawned children share the creator's tracker, where the registration
+    # is the creator's own and must stay until it unlinks the block. A process
+    # that runs its own tracker would instead unlink the block when it exits
+    # although the creator owns it, so only that registration is dropped.
+    if ATTACH_WITHOUT_TRACKING:
+        return
+    tracker_pid = _resource_tracker_pid()
+    if tracker_pid is None or tracker_pid == creator_tracker_pid:
+        return
+    try:
+        from multiprocessing import resource_tracker
+        resource_tracker.unregister(attached_memory._name, "shared_memory")
+    except Exception:
+        pass
+
+# ---------------------------------------------------------- #
+#                          BENCHMARK                         #
+# ---------------------------------------------------------- #
+CacheBenchmarkResult = collections.namedtuple("CacheBenchmarkResult", ["name", "num_requests", "hits", "misses", "hit_rate", "mean_latency_us"])
+
+def cache_workload(lexicon, num_requests, exponent=1.1, seed=0):
+    '''Sample (verb, verb_class, signature) requests whose verbs follow a Zipf
+    distribution over the lexicon ranks and whose forms are uniform
+
+    Args:
+        lexicon (sequence): (verb, verb_class) pairs ordered by rank
+        num_requests (int): number of requests
+        exponent (:obj: float, optional): Zipf exponent. Defaults to 1.1.
+        seed (:obj: int, optional): random seed. Defaults to 0.
+
+    Returns:
+        list: (verb, verb_class, (form, tense, formality, polarity)) tuples
+    '''
+    rng = random.Random(seed)
+    weights = [1.0 / (rank ** exponent) for rank in range(1, len(lexicon) + 1)]
+    verbs = rng.choices(lexicon, weights=weights, k=num_requests)
+    return [(verb, verb_class, rng.choice(PARADIGM_SIGNATURES)) for verb, verb_class in verbs]
+
+def _run_cache_worker(cache, workload):
+    generator = JapaneseVerbFormGenerator(cache=cache)
+    # CPU time, so workers sharing a core do not inflate each other's latency
+    start = time.process_time()
+    for verb, verb_class, (form, tense, formality, polarity) in workload:
+        conjugate_form(generator, verb, verb_class, form, tense, formality, polarity)
+    elapsed = time.process_time() - start
+    if cache is None:
+        return 0, len(workload), elapsed
+    return cache.hits, cache.misses, elapsed
+
+def _benchmark_worker(arguments):
+    cache_kind, lexicon, num_requests, seed = arguments
+    if cache_kind == "shared":
+        cache = _SHARED_BENCHMARK_CACHE
+    elif cache_kind == "per-process":
+        cache = LocalConjugationCache()
+    else:
+        cache = None
+    return _run_cache_worker(cache, cache_workload(lexicon, num_requests, seed=seed))
+
+_SHARED_BENCHMARK_CACHE = None
+
+def benchmark_caches(lexicon, num_workers=4, requests_per_worker=50000):
+    '''Run the same Zipf workload in forked worker processes three times:
+    without a cache, with a per-process cache in each worker, and with one
+    SharedConjugationCache for all workers
+
+    Args:
+        lexicon (sequence): (verb, verb_class) pairs ordered by rank
+        num_workers (:obj: int, optional): number of worker processes. Defaults to 4.
+        requests_per_worker (:obj: int, optional): requests per worker. Defaults to 50000.
+
+    Returns:
+        list: CacheBenchmarkResult for each of the three runs
+    '''
+    global _SHARED_BENCHMARK_CACHE
+    context = multiprocessing.get_context("fork")
+    results = []
+    for cache_kind in ("uncached", "per-process", "shared"):
+        if cache_kind == "shared":
+            _SHARED_BENCHMARK_CACHE = SharedConjugationCache(lock=context.Lock())
+        try:
+            with context.Pool(num_workers) as pool:
+                worker_results = pool.map(_benchmark_worker, [(cache_kind, lexicon, requests_per_worker, seed) for seed in range(num_workers)])
+        finally:
+            if cache_kind == "shared":
+                _SHARED_BENCHMARK_CACHE.close()
+                _SHARED_BENCHMARK_CACHE.unlink()
+                _SHARED_BENCHMARK_CACHE = None
+        hits = sum(worker_hits for worker_hits, _, _ in worker_results)
+        misses = sum(worker_misses for _, worker_misses, _ in worker_results)
+        elapsed = sum(worker_elapsed for _, _, worker_elapsed in worker_results)
+        num_requests = num_workers * requests_per_worker
+        results.append(CacheBenchmarkResult(cache_kind, num_requests, hits, misses, float(hits) / num_requests, elapsed / num_requests * 1000000))
+    return results
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare per-process and shared memory conjugation caches.")
+    parser.add_argument("--workers", type=int, default=4, help="number of worker processes")
+    parser.add_argument("--requests", type=int, default=50000, help="requests per worker")
+    args = parser.parse_args(argv)
+
+    lexicon = [(entry.verb, entry.verb_class) for entry in load_golden_corpus()]
+    for result in benchmark_caches(lexicon, args.workers, args.requests):
+        print("{:<12} hit rate {:.2%}, {:.2f}us per request ({} hits, {} misses)".format(
+            result.name, result.hit_rate, result.mean_latency_us, result.hits, result.misses))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+import json
+
+# Local modules
+from .constants.EnumeratedTypes import VerbClass
+
+from .JapaneseVerbFormGenerator import JapaneseVerbFormGenerator
+from .Paradigm import generate_paradigm
+
+SNAPSHOT_VERSION = 1
+
+# ---------------------------------------------------------- #
+#                  SURFACE TO LEMMA INDEX                    #
+# ---------------------------------------------------------- #
+class ConjugationIndex:
+    ''' Surface form to lemma lookup that is maintained incrementally. Adding or
+    removing a verb only conjugates that verb's paradigm. Surfaces shared between
+    lemmas (or between forms of one lemma) are reference counted, so removing
+    one lemma never drops a surface another lemma still produces.
+
+    Lemmas are identified by (verb, verb_class) so the same spelling can be
+    indexed under more than one verb class.
+    '''
+    def __init__(self, generator=None):
+        if generator is None:
+            generator = JapaneseVerbFormGenerator()
+        self.generator = generator
+        # (verb, verb_class) -> tuple of surfaces produced by the paradigm
+        self._lemma_surfaces = {}
+        # surface -> {(verb, verb_class): reference count}
+        self._surface_lemmas = {}
+
+    def __len__(self):
+        return len(self._lemma_surfaces)
+
+    def __contains__(self, surface):
+        return surface in self._surface_lemmas
+
+    def _compute_surfaces(self, verb, verb_class, paradigm=None):
+        if paradigm is None:
+            paradigm = generate_paradigm(self.generator, verb, verb_class)
+        surfaces = []
+        for _, _, _, _, surface in paradigm:
+            if surface is not None:
+                surfaces.append(surface)
+        return tuple(surfaces)
+
+    def _link(self, lemma, surfaces):
+        self._lemma_surfaces[lemma] = surfaces
+        for surface in surfaces:
+            lemma_counts = self._surface_lemmas.setdefault(surface, {})
+            lemma_counts[lemma] = lemma_counts.get(lemma, 0) + 1
+
+    def _unlink(self, lemma):
+        for surface in self._lemma_surfaces.pop(lemma):
+            lemma_counts = self._surface_lemmas[surface]
+            if lemma_counts[lemma] == 1:
+                del lemma_counts[lemma]
+                if not lemma_counts:
+                    del self._surface_lemmas[surface]
+            else:
+                lemma_counts[lemma] -= 1
+
+    def add_verb(self, verb, verb_class, paradigm=None):
+        '''Conjugate a verb and index every surface form of its paradigm. Adding a
+        verb that is already indexed recomputes and replaces its surfaces.
+
+        Args:
+            verb (str): Japanese verb in kana, might contain kanji
+            verb_class (enum): VerbClass Enum representing the verb class
+                to which the verb belongs
+            paradigm (:obj: list, optional): (form, tense, formality, polarity,
+                surface) tuples of the verb already conjugated by the caller.
+                Defaults to None, conjugating the verb with the index's generator.
+        '''
+        lemma = (verb, verb_class)
+        # conjugate before unlinking so an invalid verb leaves the index untouched
+        surfaces = self._compute_surfaces(verb, verb_class, paradigm)
+        if lemma in self._lemma_surfaces:
+            self._unlink(lemma)
+        self._link(lemma, surfaces)
+
+    def remove_verb(self, verb, verb_class):
+        '''Remove a verb and release its surface forms from the index
+
+        Args:
+            verb (str): Japanese verb in kana, might contain kanji
+            verb_class (enum): VerbClass Enum representing the verb class
+                to which the verb belongs
+
+        Returns:
+            bool: True if the verb was indexed, false otherwise
+        '''
+        lemma = (verb, verb_class)
+        if lemma not in self._lemma_surfaces:
+            return False
+        self._unlink(lemma)
+        return True
+
+    def lookup(self, surface):
+        '''Find every indexed lemma that produces a surface form
+
+        Args:
+            surface (str): conjugated verb
+
+        Returns:
+            tuple: (verb, verb_class) pairs, empty if the surface is not indexed
+        '''
+        lemma_counts = self._surface_lemmas.get(surface)
+        if lemma_counts is None:
+            return ()
+        return tuple(lemma_counts)
+
+    def reference_count(self, surface):
+        '''Count how many paradigm entries across all lemmas produce a surface form
+
+        Args:
+            surface (str): conjugated verb
+
+        Returns:
+            int: total reference count, 0 if the surface is not indexed
+        '''
+        return sum(self._surface_lemmas.get(surface, {}).values())
+
+    def surfaces(self, verb, verb_class):
+        '''List the indexed surface forms of a verb
+
+        Args:
+            verb (str): Japanese verb in kana, might contain kanji
+            verb_class (enum): VerbClass Enum representing the verb class
+                to which the verb belongs
+
+        Returns:
+            tuple: surfaces in paradigm order, empty if the verb is not indexed
+        '''
+        return self._lemma_surfaces.get((verb, verb_class), ())
+
+    def lemmas(self):
+        '''List every indexed lemma
+
+        Returns:
+            list: (verb, verb_class) pairs in insertion order
+        '''
+        return list(self._lemma_surfaces)
+
+    def snapshot(self, path):
+        '''Write the index to disk. Surfaces are stored with each lemma so
+        restoring does not conjugate any verbs.
+
+        Args:
+            path (str): destination file path
+        '''
+        lemmas = [[verb, verb_class.value, list(surfaces)] for (verb, verb_class), surfaces in self._lemma_surfaces.items()]
+        with open(path, "w", encoding="utf-8") as snapshot_file:
+            json.dump({"version": SNAPSHOT_VERSION, "lemmas": lemmas}, snapshot_file, ensure_ascii=False)
+
+    @classmethod
+    def restore(cls, path, generator=None):
+        '''Load an index written by snapshot
+
+        Args:
+            path (str): snapshot file path
+            generator (:obj: JapaneseVerbFormGenerator, optional): generator used
+                by later add_verb calls. Defaults to a new JapaneseVerbFormGenerator.
+
+        Returns:
+            ConjugationIndex: index with the same lemmas and reference counts
+        '''
+        with open(path, encoding="utf-8") as snapshot_file:
+            snapshot = json.load(snapshot_file)
+        if snapshot.get("version") != SNAPSHOT_VERSION:
+            raise ValueError("Unsupported conjugation index snapshot version", snapshot.get("version"))
+
+        index = cls(generator)
+        for verb, verb_class_value, surfaces in snapshot["lemmas"]:
+            index._link((verb, VerbClass(verb_class_value)), tuple(surfaces))
+        return index
@@ -0,0 +1,345 @@
+import argparse
+import os
+import socket
+import socketserver
+import struct
+
+# Local modules
+from .constants.EnumeratedTypes import Formality, Polarity, Tense, VerbClass, VerbForm
+
+from .Exceptions import InvalidJapaneseVerbException
+from .JapaneseVerbFormGenerator import JapaneseVerbFormGenerator
+from .Paradigm import conjugate_form
+
+# ---------------------------------------------------------- #
+#                     BINARY WIRE PROTOCOL                   #
+# ---------------------------------------------------------- #
+# Every message is a frame: a 4 byte big-endian payload length followed by the
+# payload. A request payload is a 4 byte request count followed by that many
+# requests, each made of five enum codes (form, verb class, tense, formality,
+# polarity; one byte each), a 2 byte verb length and the UTF-8 verb. Enum codes
+# are the integer values of VerbForm / VerbClass / Tense / Formality / Polarity
+# and 0 stands for None. A response payload is a 4 byte result count followed
+# by one result per request, in request order: a status byte, a 2 byte length
+# and the UTF-8 conjugated verb (empty unless the status is STATUS_OK). A
+# conjugated verb longer than MAX_SURFACE_SIZE bytes is sent as STATUS_ERROR.
+FRAME_HEADER = struct.Struct("!I")
+COUNT_HEADER = struct.Struct("!I")
+REQUEST_HEADER = struct.Struct("!BBBBBH")
+RESULT_HEADER = struct.Struct("!BH")
+
+MAX_FRAME_SIZE = 16 * 1024 * 1024
+MAX_SURFACE_SIZE = 0xFFFF
+
+STATUS_OK = 0
+STATUS_INVALID_VERB = 1
+STATUS_UNSUPPORTED_FORM = 2
+STATUS_ERROR = 3
+
+# enum code -> member, index 0 is None
+_ENUM_MEMBERS = {enum_type: (None,) + tuple(enum_type) for enum_type in (VerbForm, VerbClass, Tense, Formality, Polarity)}
+
+class ProtocolError(ValueError):
+    ''' Raised when a frame does not follow the binary conjugation protocol '''
+
+def _enum_code(member):
+    return 0 if member is None else member.value
+
+def _enum_member(enum_type, code):
+    members = _ENUM_MEMBERS[enum_type]
+    if code >= len(members):
+        raise ProtocolError("Unknown enum code", enum_type.__name__, code)
+    return members[code]
+
+def encode_requests(requests):
+    '''Encode conjugation requests into a single frame
+
+    Args:
+        requests (sequence): (verb, verb_class, form, tense, formality, polarity)
+            tuples. tense, formality and polarity may be None.
+
+    Returns:
+        bytes: frame holding every request
+    '''
+    parts = [COUNT_HEADER.pack(len(requests))]
+    for verb, verb_class, form, tense, formality, polarity in requests:
+        verb_bytes = verb.encode("utf-8")
+        parts.append(REQUEST_HEADER.pack(form.value, verb_class.value, _enum_code(tense),
+            _enum_code(formality), _enum_code(polarity), len(verb_bytes)))
+        parts.append(verb_bytes)
+    payload = b"".join(parts)
+    return b"".join([FRAME_HEADER.pack(len(payload)), payload])
+
+def decode_requests(payload):
+    '''Decode the payload of a request frame
+
+    Args:
+        payload (bytes): frame payload, without the length header
+
+    Returns:
+        list: (verb, verb_class, form, tense, formality, polarity) tuples
+    '''
+    try:
+        num_requests, = COUNT_HEADER.unpack_from(payload, 0)
+        offset = COUNT_HEADER.size
+        requests = []
+        for _ in range(num_requests):
+            form, verb_class, tense, formality, polarity, verb_length = REQUEST_HEADER.unpack_from(payload, offset)
+            offset += REQUEST_HEADER.size
+            verb = payload[offset:offset + verb_length].decode("utf-8")
+            offset += verb_length
+            requests.append((verb, _enum_member(VerbClass, verb_class), _enum_member(VerbForm, form),
+                _enum_member(Tense, tense), _enum_member(Formality, formality), _enum_member(Polarity, polarity)))
+    except (struct.error, UnicodeDecodeError) as error:
+        raise ProtocolError("Malformed request frame", str(error))
+    if offset != len(payload):
+        raise ProtocolError("Trailing bytes in request frame", len(payload) - offset)
+    return requests
+
+def encode_responses(results):
+    '''Encode conjugation results into a single frame
+
+    Args:
+        results (sequence): (status, surface) tuples. surface is ignored unless
+            status is STATUS_OK. A surface too long for its 2 byte length is
+            encoded as STATUS_ERROR.
+
+    Returns:
+        bytes: frame holding every result
+    '''
+    parts = [COUNT_HEADER.pack(len(results))]
+    for status, surface in results:
+        surface_bytes = surface.encode("utf-8") if status == STATUS_OK else b""
+        if len(surface_bytes) > MAX_SURFACE_SIZE:
+            status, surface_bytes = STATUS_ERROR, b""
+        parts.append(RESULT_HEADER.pack(status, len(surface_bytes)))
+        parts.append(surface_bytes)
+    payload = b"".join(parts)
+    return b"".join([FRAME_HEADER.pack(len(payload)), payload])
+
+def decode_responses(payload):
+    '''Decode the payload of a response frame
+
+    Args:
+        payload (bytes): frame payload, without the length header
+
+    Returns:
+        list: (status, surface) tuples, surface is None unless status is STATUS_OK
+    '''
+    try:
+        num_results, = COUNT_HEADER.unpack_from(payload, 0)
+        offset = COUNT_HEADER.size
+        results = []
+        for _ in range(num_results):
+            status, surface_length = RESULT_HEADER.unpack_from(payload, offset)
+            offset += RESULT_HEADER.size
+            surface = None
+            if status == STATUS_OK:
+                surface = payload[offset:offset + surface_length].decode("utf-8")
+            offset += surface_length
+            results.append((status, surface))
+    except (struct.error, UnicodeDecodeError) as error:
+        raise ProtocolError("Malformed response frame", str(error))
+    return results
+
+def read_frame(stream):
+    '''Read one frame from a binary stream
+
+    Args:
+        stream (file): binary file object, e.g. socket.makefile("rb")
+
+    Returns:
+        bytes: frame payload, or None if the stream ended before a new frame
+    '''
+    header = stream.read(FRAME_HEADER.size)
+    if not header:
+        return None
+    if len(header) < FRAME_HEADER.size:
+        raise ProtocolError("Truncated frame header")
+    payload_size, = FRAME_HEADER.unpack(header)
+    if payload_size > MAX_FRAME_SIZE:
+        raise ProtocolError("Frame exceeds MAX_FRAME_SIZE", payload_size)
+    payload = stream.read(payload_size)
+    if len(payload) < payload_size:
+        raise ProtocolError("Truncated frame payload")
+    return payload
+
+def conjugate_requests(generator, requests):
+    '''Conjugate decoded requests, turning failures into status codes
+
+    Args:
+        generator (JapaneseVerbFormGenerator): generator used to conjugate the verbs
+        requests (iterable): (verb, verb_class, form, tense, formality, polarity) tuples
+
+    Returns:
+        list: (status, surface) tuples in request order
+    '''
+    results = []
+    for verb, verb_class, form, tense, formality, polarity in requests:
+        try:
+            surface = conjugate_form(generator, verb, verb_class, form, tense, formality, polarity)
+        except InvalidJapaneseVerbException:
+            results.append((STATUS_INVALID_VERB, None))
+            continue
+        except Exception:
+            results.append((STATUS_ERROR, None))
+            continue
+        if surface is None:
+            results.append((STATUS_UNSUPPORTED_FORM, None))
+        else:
+            results.append((STATUS_OK, surface))
+    return results
+
+# ---------------------------------------------------------- #
+#                       SOCKET SERVER                        #
+# ---------------------------------------------------------- #
+class ConjugationRequestHandler(socketserver.StreamRequestHandler):
+    ''' Serves frames on one connection until the client disconnects. Frames
+    are answered in order, so clients may pipeline several frames. A malformed
+    frame closes the connection.
+    '''
+    def setup(self):
+        super(ConjugationRequestHandler, self).setup()
+        if self.connection.family != getattr(socket, "AF_UNIX", None):
+            self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def handle(self):
+        generator = self.server.generator
+        while True:
+            try:
+                payload = read_frame(self.rfile)
+                if payload is None:
+                    return
+                requests = decode_requests(payload)
+            except ProtocolError:
+                return
+            self.wfile.write(encode_responses(conjugate_requests(generator, requests)))
+            self.wfile.flush()
+
+class ConjugationTCPServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    ''' TCP conjugation server, one thread per connection '''
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address, generator=None):
+        self.generator = generator if generator is not None else JapaneseVerbFormGenerator()
+        socketserver.TCPServer.__init__(self, address, ConjugationRequestHandler)
+
+if hasattr(socketserver, "UnixStreamServer"):
+    class ConjugationUnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        ''' Unix domain socket conjugation server, one thread per connection '''
+        daemon_threads = True
+
+        def __init__(self, path, generator=None):
+            self.generator = generator if generator is not None else JapaneseVerbFormGenerator()
+            socketserver.UnixStreamServer.__init__(self, path, ConjugationRequestHandler)
+
+def create_server(address, generator=None):
+    '''Create a conjugation server. Call serve_forever() on it to start serving.
+
+    Args:
+        address (tuple | str): (host, port) for TCP or a filesystem path for a
+            Unix domain socket
+        generator (:obj: JapaneseVerbFormGenerator, optional): generator shared
+            by every connection. Defaults to a new JapaneseVerbFormGenerator.
+
+    Returns:
+        socketserver.BaseServer: bound and listening server
+    '''
+    if isinstance(address, str):
+        return ConjugationUnixServer(address, generator)
+    return ConjugationTCPServer(address, generator)
+
+# ---------------------------------------------------------- #
+#                           CLIENT                           #
+# ---------------------------------------------------------- #
+class ConjugationClient:
+    ''' Blocking client of the binary conjugation protocol '''
+    def __init__(self, address, timeout=None):
+        if isinstance(address, str):
+            self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        else:
+            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.socket.settimeout(timeout)
+        self.socket.connect(address)
+        self._stream = self.socket.makefile("rb")
+
+    def close(self):
+        self._stream.close()
+        self.socket.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def send_requests(self, requests):
+        '''Send one frame of requests without waiting for the response
+
+        Args:
+            requests (sequence): (verb, verb_class, form, tense, formality, polarity) tuples
+        '''
+        self.socket.sendall(encode_requests(requests))
+
+    def receive_results(self):
+        '''Wait for the response to the oldest unanswered frame
+
+        Returns:
+            list: (status, surface) tuples in request order
+        '''
+        payload = read_frame(self._stream)
+        if payload is None:
+            raise ProtocolError("Connection closed by the server")
+        return decode_responses(payload)
+
+    def conjugate_many(self, requests):
+        '''Conjugate many verbs in a single round trip
+
+        Args:
+            requests (sequence): (verb, verb_class, form, tense, formality, polarity) tuples
+
+        Returns:
+            list: (status, surface) tuples in request order
+        '''
+        self.send_requests(requests)
+        return self.receive_results()
+
+    def conjugate(self, verb, verb_class, form, tense=None, formality=None, polarity=None):
+        '''Conjugate a single verb
+
+        Args:
+            verb (str): Japanese verb in kana, might contain kanji
+            verb_class (enum): VerbClass Enum representing the verb class
+                to which the verb belongs
+            form (enum): VerbForm Enum representing the conjugation form
+            tense (:obj: enum, optional): Tense Enum. Defaults to None.
+            formality (:obj: enum, optional): Formality Enum. Defaults to None.
+            polarity (:obj: enum, optional): Polarity Enum. Defaults to None.
+
+        Returns:
+            str: conjugated verb, or None if the verb is invalid or the form unsupported
+        '''
+        status, surface = self.conjugate_many([(verb, verb_class, form, tense, formality, polarity)])[0]
+        return surface
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve conjugations over the binary socket protocol.")
+    parser.add_argument("--host", default="127.0.0.1", help="TCP host to bind")
+    parser.add_argument("--port", type=int, default=7878, help="TCP port to bind")
+    parser.add_argument("--unix", help="serve on this Unix domain socket path instead of TCP")
+    args = parser.parse_args(argv)
+
+    server = create_server(args.unix or (args.host, args.port))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if args.unix:
+            os.remove(args.unix)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,388 @@
+import argparse
+import array
+import collections
+import heapq
+import random
+import struct
+import sys
+import time
+
+# Local modules
+from .constants.EnumeratedTypes import VerbClass
+
+from .JapaneseVerbFormGenerator import JapaneseVerbFormGenerator
+from .Paradigm import PARADIGM_SIGNATURES, generate_paradigm
+from .Profiling import best_time
+
+DEFAULT_TOP_K = 10
+
+Completion = collections.namedtuple("Completion", ["reading", "surface", "verb", "verb_class", "form", "tense", "formality", "polarity", "score"])
+
+_SIGNATURE_INDEXES = dict((signature, index) for index, signature in enumerate(PARADIGM_SIGNATURES))
+
+# ---------------------------------------------------------- #
+#                          BUILDER                           #
+# ---------------------------------------------------------- #
+class ConjugationTrieBuilder:
+    ''' Collects the conjugated forms of a lexicon for a ConjugationTrie. Verbs
+    may be added one at a time from a stream, and only their forms are kept.
+
+    Each form is keyed by the conjugated reading, so kana input finds verbs
+    written with kanji. Its score is the verb's weight times the weight of
+    the form's signature.
+    '''
+    def __init__(self, generator=None, form_weights=None):
+        ''' Args:
+            generator (:obj: JapaneseVerbFormGenerator, optional): generator used
+                to conjugate the verbs. Defaults to a new JapaneseVerbFormGenerator.
+            form_weights (:obj: dict, optional): (form, tense, formality, polarity)
+                signature -> weight. Missing signatures weigh 1. Defaults to None.
+        '''
+        self.generator = JapaneseVerbFormGenerator() if generator is None else generator
+        self.form_weights = {} if form_weights is None else form_weights
+        self._lemmas = []
+        # (reading, surface, lemma index) -> (score, signature index), keeping the best signature
+        self._entries = {}
+
+    def add_verb(self, verb, verb_class, weight=1.0, reading=None):
+        '''Conjugate a verb and add every form of its paradigm
+
+        Args:
+            verb (str): Japanese verb in kana, might contain kanji
+            verb_class (enum): VerbClass Enum representing the verb class
+                to which the verb belongs
+            weight (:obj: float, optional): frequency weight of the verb. Defaults to 1.0.
+            reading (:obj: str, optional): kana reading of the verb, conjugated
+                into the search keys. Defaults to None, which keys forms by
+                their surface.
+
+        Raises:
+            InvalidJapaneseVerbException: if the verb or its reading fails validation
+        '''
+        surfaces = list(generate_paradigm(self.generator, verb, verb_class))
+        readings = surfaces if reading is None else list(generate_paradigm(self.generator, reading, verb_class))
+        lemma_index = len(self._lemmas)
+        self._lemmas.append((verb, verb_class))
+        entries = self._entries
+        for surface_entry, reading_entry in zip(surfaces, readings):
+            surface, key = surface_entry[4], reading_entry[4]
+            if surface is None or key is None:
+                continue
+            signature = surface_entry[:4]
+            score = weight * self.form_weights.get(signature, 1.0)
+            entry_key = (key, surface, lemma_index)
+            best = entries.get(entry_key)
+            if best is None or score > best[0]:
+                entries[entry_key] = (score, _SIGNATURE_INDEXES[signature])
+
+    def add_lexicon(self, lexicon):
+        '''Add many verbs
+
+        Args:
+            lexicon (iterable): (verb, verb_class[, weight[, reading]]) tuples
+        '''
+        for row in lexicon:
+            self.add_verb(*row)
+
+    def build(self, top_k=DEFAULT_TOP_K):
+        '''Build the radix trie and the top-k completions of every node
+
+        Args:
+            top_k (:obj: int, optional): completions kept per node, the largest
+                k a query can ask for. Defaults to DEFAULT_TOP_K.
+
+        Returns:
+            ConjugationTrie: trie over every added form
+        '''
+        # entry ids are ranks: best score, then shortest reading
+        ranked = sorted(self._entries.items(), key=lambda item: (-item[1][0], len(item[0][0]), item[0][0]))
+        key_entries = collections.defaultdict(list)
+        for entry_id, ((key, _, _), _) in enumerate(ranked):
+            key_entries[key].append(entry_id)
+        keys = sorted(key_entries)
+
+        labels = []
+        children = []
+        node_entries = []
+
+        def build_node(low, high, depth, label):
+            node = len(labels)
+            labels.append(label)
+            children.append([])
+            node_entries.append([])
+            index = low
+            if index < high and len(keys[index]) == depth:
+                node_entries[node] = key_entries[keys[index]]
+                index += 1
+            while index < high:
+                character = keys[index][depth]
+                end = index + 1
+                while end < high and keys[end][depth] == character:
+                    end += 1
+                first, last = keys[index], keys[end - 1]
+                common = depth + 1
+                while common < len(first) and common < len(last) and first[common] == last[common]:
+                    common += 1
+                children[node].append(build_node(index, end, common, first[depth:common]))
+                index = end
+            return node
+
+        build_node(0, len(keys), 0, "")
+
+        # children always have larger ids than their parent
+        top_entries = [None] * len(labels)
+        for node in range(len(labels) - 1, -1, -1):
+            candidates = list(node_entries[node])
+            for child in children[node]:
+                candidates.extend(top_entries[child])
+            top_entries[node] = heapq.nsmallest(top_k, candidates)
+
+        # breadth-first numbering keeps the children of a node contiguous
+        order = [0]
+        for node in order:
+            order.extend(children[node])
+        child_start = array.array("I")
+        next_child = 1
+        for node in order:
+            child_start.append(next_child)
+            next_child += len(children[node])
+        child_start.append(next_child)
+        top_start = array.array("I", [0])
+        top_ids = array.array("I")
+        for node in order:
+            top_ids.extend(top_entries[node])
+            top_start.append(len(top_ids))
+
+        return ConjugationTrie(
+            [labels[node] for node in order], child_start, top_start, top_ids,
+            [key for (key, _, _), _ in ranked], [surface for (_, surface, _), _ in ranked],
+            array.array("I", [lemma_index for (_, _, lemma_index), _ in ranked]),
+            array.array("B", [signature_index for _, (_, signature_index) in ranked]),
+            array.array("d", [score for _, (score, _) in ranked]),
+            [verb for verb, _ in self._lemmas], array.array("B", [verb_class.value for _, verb_class in self._lemmas]),
+            top_k)
+
+# ---------------------------------------------------------- #
+#                      FROZEN RADIX TRIE                     #
+# ---------------------------------------------------------- #
+# file layout: magic, format version and top_k, then each array as its type
+# code, item count and little-endian items, and each string list as its item
+# count, byte length and NUL separated UTF-8 items.
+TRIE_MAGIC = b"JVCT"
+TRIE_FORMAT_VERSION = 1
+TRIE_HEADER = struct.Struct("<4sBH")
+ARRAY_HEADER = struct.Struct("<cI")
+STRINGS_HEADER = struct.Struct("<II")
+
+class ConjugationTrie:
+    ''' Prefix search over conjugated forms. The trie is a radix trie stored in
+    flat arrays: the children of a node are contiguous, and the first
+    character of their edge labels is kept in one string, so finding the edge
+    to follow is one str.find. Every node stores the ids of its best top_k
+    completions, so a query walks the prefix and slices a list.
+
+    Build it with ConjugationTrieBuilder or ConjugationTrie.build, and reload
+    a saved trie with ConjugationTrie.load.
+    '''
+    def __init__(self, labels, child_start, top_start, top_ids, readings, surfaces,
+                 lemma_indexes, signature_indexes, scores, lemma_verbs, lemma_classes, top_k):
+        self.labels = labels
+        self.child_start = child_start
+        self.top_start = top_start
+        self.top_ids = top_ids
+        self.readings = readings
+        self.surfaces = surfaces
+        self.lemma_indexes = lemma_indexes
+        self.signature_indexes = signature_indexes
+        self.scores = scores
+        self.lemma_verbs = lemma_verbs
+        self.lemma_classes = lemma_classes
+        self.top_k = top_k
+        self._edge_initials = "".join(label[:1] or "\0" for label in labels)
+        self._verb_classes = dict((verb_class.value, verb_class) for verb_class in VerbClass)
+
+    @classmethod
+    def build(cls, lexicon, top_k=DEFAULT_TOP_K, form_weights=None, generator=None):
+        '''Build a trie from a stream of verbs, see ConjugationTrieBuilder
+
+        Args:
+            lexicon (iterable): (verb, verb_class[, weight[, reading]]) tuples
+            top_k (:obj: int, optional): completions kept per node.
+                Defaults to DEFAULT_TOP_K.
+            form_weights (:obj: dict, optional): signature -> weight. Defaults to None.
+            generator (:obj: JapaneseVerbFormGenerator, optional): generator used
+                to conjugate the verbs. Defaults to None.
+
+        Returns:
+            ConjugationTrie: trie over every form of the lexicon
+        '''
+        builder = ConjugationTrieBuilder(generator, form_weights)
+        builder.add_lexicon(lexicon)
+        return builder.build(top_k)
+
+    def __len__(self):
+        return len(self.readings)
+
+    def _find_node(self, prefix):
+        labels = self.labels
+        child_start = self.child_start
+        edge_initials = self._edge_initials
+        node = 0
+        position = 0
+        while position < len(prefix):
+            node = edge_initials.find(prefix[position], child_start[node], child_start[node + 1])
+            if node < 0:
+                return None
+            label = labels[node]
+            if not prefix.startswith(label, position) and not label.startswith(prefix[position:]):
+                return None
+            position += len(label)
+        return node
+
+    def complete(self, prefix, k=None):
+        '''Find the best scored forms whose reading starts with prefix
+
+        Args:
+            prefix (str): typed kana
+            k (:obj: int, optional): number of completions, at most top_k.
+                Defaults to top_k.
+
+        Returns:
+            list: Completion tuples, best first
+        '''
+        node = self._find_node(prefix)
+        if node is None:
+            return []
+        start = self.top_start[node]
+        end = self.top_start[node + 1]
+        if k is not None:
+            end = min(end, start + k)
+        return [self._completion(entry_id) for entry_id in self.top_ids[start:end]]
+
+    def _completion(self, entry_id):
+        lemma_index = self.lemma_indexes[entry_id]
+        form, tense, formality, polarity = PARADIGM_SIGNATURES[self.signature_indexes[entry_id]]
+        return Completion(self.readings[entry_id], self.surfaces[entry_id], self.lemma_verbs[lemma_index],
+            self._verb_classes[self.lemma_classes[lemma_index]], form, tense, formality, polarity, self.scores[entry_id])
+
+    def save(self, path):
+        '''Write the trie to disk
+
+        Args:
+            path (str): destination file path
+        '''
+        with open(path, "wb") as trie_file:
+            trie_file.write(TRIE_HEADER.pack(TRIE_MAGIC, TRIE_FORMAT_VERSION, self.top_k))
+            for values in (self.child_start, self.top_start, self.top_ids, self.lemma_indexes, self.signature_indexes, self.scores, self.lemma_classes):
+                _write_array(trie_file, values)
+            for strings in (self.labels, self.readings, self.surfaces, self.lemma_verbs):
+                _write_strings(trie_file, strings)
+
+    @classmethod
+    def load(cls, path):
+        '''Load a trie written by save
+
+        Args:
+            path (str): trie file path
+
+        Returns:
+            ConjugationTrie: the saved trie
+        '''
+        with open(path, "rb") as trie_file:
+            data = trie_file.read()
+        magic, version, top_k = TRIE_HEADER.unpack_from(data, 0)
+        if magic != TRIE_MAGIC or version != TRIE_FORMAT_VERSION:
+            raise ValueError("Unsupported conjugation trie file", magic, version)
+        offset = TRIE_HEADER.size
+        arrays = []
+        for _ in range(7):
+            values, offset = _read_array(data, offset)
+            arrays.append(values)
+        strings = []
+        for _ in range(4):
+            values, offset = _read_strings(data, offset)
+            strings.append(values)
+        child_start, top_start, top_ids, lemma_indexes, signature_indexes, scores, lemma_classes = arrays
+        labels, readings, surfaces, lemma_verbs = strings
+        return cls(labels, child_start, top_start, top_ids, readings, surfaces,
+            lemma_indexes, signature_indexes, scores, lemma_verbs, lemma_classes, top_k)
+
+def _write_array(trie_file, values):
+    trie_file.write(ARRAY_HEADER.pack(values.typecode.encode("ascii"), len(values)))
+    if sys.byteorder == "big":
+        values = array.array(values.typecode, values)
+        values.byteswap()
+    trie_file.write(values.tobytes())
+
+def _read_array(data, offset):
+    typecode, count = ARRAY_HEADER.unpack_from(data, offset)
+    offset += ARRAY_HEADER.size
+    values = array.array(typecode.decode("ascii"))
+    end = offset + count * values.itemsize
+    values.frombytes(data[offset:end])
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values, end
+
+def _write_strings(trie_file, strings):
+    encoded = "\0".join(strings).encode("utf-8")
+    trie_file.write(STRINGS_HEADER.pack(len(strings), len(encoded)))
+    trie_file.write(encoded)
+
+def _read_strings(data, offset):
+    count, length = STRINGS_HEADER.unpack_from(data, offset)
+    offset += STRINGS_HEADER.size
+    strings = data[offset:offset + length].decode("utf-8").split("\0") if count else []
+    return strings, offset + length
+
+# ---------------------------------------------------------- #
+#                          BENCHMARK                         #
+# ---------------------------------------------------------- #
+def measure_completion_time(trie, prefixes, k=None, repeat=3):
+    '''Measure the mean time of a completion query
+
+    Args:
+        trie (ConjugationTrie): trie under test
+        prefixes (list): typed prefixes
+        k (:obj: int, optional): completions per query. Defaults to top_k.
+        repeat (:obj: int, optional): number of timed passes, the fastest is kept.
+            Defaults to 3.
+
+    Returns:
+        float: seconds per query
+    '''
+    def query_pass():
+        for prefix in prefixes:
+            trie.complete(prefix, k)
+
+    return best_time(query_pass, repeat) / len(prefixes)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build a conjugation autocomplete trie and measure query time.")
+    parser.add_argument("--jmdict", metavar="PATH", help="JMdict-style XML lexicon. Defaults to the golden corpus verbs.")
+    parser.add_argument("--save", metavar="PATH", help="write the trie to PATH")
+    parser.add_argument("--top-k", type=int, default=DEFAULT_TOP_K, help="completions kept per node")
+    parser.add_argument("prefixes", nargs="*", help="prefixes to complete")
+    args = parser.parse_args(argv)
+
+    if args.jmdict:
+        from .DictionaryIngestion import iter_dictionary_verbs
+        lexicon = ((entry.verb, entry.verb_class, 1.0, entry.reading) for entry in iter_dictionary_verbs(args.jmdict))
+    else:
+        from .GoldenCorpus import load_golden_corpus
+        lexicon = ((entry.verb, entry.verb_class) for entry in load_golden_corpus())
+    start = time.perf_counter()
+    trie = ConjugationTrie.build(lexicon, args.top_k)
+    print("{} forms, {} nodes, built in {:.2f}s".format(len(trie), len(trie.labels), time.perf_counter() - start))
+    if args.save:
+        trie.save(args.save)
+
+    rng = random.Random(0)
+    prefixes = [reading[:rng.randint(1, len(reading))] for reading in rng.sample(trie.readings, min(10000, len(trie)))]
+    print("{:.2f}us per query".format(measure_completion_time(trie, prefixes) * 1e6))
+    for prefix in args.prefixes:
+        for completion in trie.complete(prefix):
+            print("{}\t{}\t{}\t{}".format(completion.reading, completion.surface, completion.verb, completion.form.name))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,452 @@
+import argparse
+import array
+import collections
+import concurrent.futures
+import multiprocessing
+import multiprocessing.connection
+import os
+import struct
+import time
+from multiprocessing.shared_memory import SharedMemory
+
+# Local modules
+from .constants.EnumeratedTypes import VerbClass
+
+from .Decorators import raise_for_error_code, validate_many
+from .IntegerConjugator import PARADIGM_FORM_IDS, MAX_FORM_ID
+from .Paradigm import PARADIGM_SIGNATURES
+from .SpecializedConjugators import specialized_function
+
+DEFAULT_SLOTS = 4
+DEFAULT_SEGMENT_BYTES = 1 << 20
+DEFAULT_CHUNK_SIZE = 4096
+
+# ---------------------------------------------------------- #
+#                     SHARED MEMORY RECORDS                  #
+# ---------------------------------------------------------- #
+# Every worker owns an input ring and an output ring in shared memory, each
+# split into slots of segment_bytes. A job written to an input slot is a
+# JOB_HEADER (job kind, record count, verb bytes, form ID count), the verb
+# class code of every record (one byte each), the form IDs (two bytes each,
+# little-endian) and the NUL separated UTF-8 verbs. JOB_RECORDS jobs carry one
+# form ID per record; JOB_PARADIGMS jobs carry one list of form IDs applied to
+# every record. The worker writes the NUL separated UTF-8 results of the job
+# to the output slot of the same index, NONE_MARKER standing for None.
+# Only slot indexes and status tuples travel through the worker's pipe.
+JOB_HEADER = struct.Struct("<BIIH")
+JOB_RECORDS = 0
+JOB_PARADIGMS = 1
+
+NONE_MARKER = "\x01"
+
+STATUS_OK = 0
+STATUS_INVALID_VERB = 1
+STATUS_UNSUPPORTED_FORM = 2
+STATUS_OVERFLOW = 3
+
+_WORKER_READY = "ready"
+
+def build_function_tables():
+    '''Build the specialized function of every paradigm signature and verb
+    class, indexed by verb class code and form ID
+
+    Returns:
+        dict: verb class code -> list of functions indexed by form ID, None
+            for form IDs outside the paradigm
+    '''
+    tables = {}
+    for verb_class in VerbClass:
+        table = [None] * (MAX_FORM_ID + 1)
+        for signature, form_id in zip(PARADIGM_SIGNATURES, PARADIGM_FORM_IDS):
+            table[form_id] = specialized_function(verb_class, *signature)
+        tables[verb_class.value] = table
+    return tables
+
+def encode_job(kind, verbs, verb_classes, form_ids):
+    '''Encode a job for an input slot
+
+    Args:
+        kind (int): JOB_RECORDS or JOB_PARADIGMS
+        verbs (list): Japanese verbs
+        verb_classes (bytes): verb class code of every verb
+        form_ids (array.array): "H" array of form IDs, one per verb for
+            JOB_RECORDS jobs
+
+    Returns:
+        bytes: encoded job
+    '''
+    verb_bytes = "\0".join(verbs).encode("utf-8")
+    form_id_bytes = form_ids.tobytes() if form_ids.itemsize == 2 else array.array("H", form_ids).tobytes()
+    return b"".join([JOB_HEADER.pack(kind, len(verbs), len(verb_bytes), len(form_ids)), verb_classes, form_id_bytes, verb_bytes])
+
+def run_job(tables, job):
+    '''Conjugate an encoded job
+
+    Args:
+        tables (dict): see build_function_tables
+        job (memoryview): encoded job, see encode_job
+
+    Returns:
+        tuple: (status, value, error code). value is the encoded results for
+            STATUS_OK, the index of the first invalid verb for
+            STATUS_INVALID_VERB and the rejected form ID or verb class code
+            for STATUS_UNSUPPORTED_FORM
+    '''
+    kind, count, verb_length, form_count = JOB_HEADER.unpack_from(job, 0)
+    position = JOB_HEADER.size
+    verb_classes = bytes(job[position:position + count])
+    position += count
+    form_ids = array.array("H")
+    form_ids.frombytes(job[position:position + 2 * form_count])
+    position += 2 * form_count
+    verbs = bytes(job[position:position + verb_length]).decode("utf-8").split("\0")
+
+    for verb_class in set(verb_classes):
+        if verb_class not in tables:
+            return STATUS_UNSUPPORTED_FORM, verb_class, 0
+    for form_id in set(form_ids):
+        if form_id > MAX_FORM_ID or tables[VerbClass.GODAN.value][form_id] is None:
+            return STATUS_UNSUPPORTED_FORM, form_id, 0
+    error_codes = validate_many(verbs)
+    if any(error_codes):
+        index = next(index for index, error_code in enumerate(error_codes) if error_code)
+        return STATUS_INVALID_VERB, index, error_codes[index]
+
+    if kind == JOB_RECORDS:
+        results = [tables[verb_class][form_id](verb) or NONE_MARKER for verb, verb_class, form_id in zip(verbs, verb_classes, form_ids)]
+    else:
+        class_functions = dict((verb_class, [tables[verb_class][form_id] for form_id in form_ids]) for verb_class in set(verb_classes))
+        results = []
+        for verb, verb_class in zip(verbs, verb_classes):
+            results.extend([function(verb) or NONE_MARKER for function in class_functions[verb_class]])
+    return STATUS_OK, "\0".join(results).encode("utf-8"), 0
+
+def _worker_main(connection, input_name, output_name, segment_bytes, cpus):
+    if cpus is not None:
+        os.sched_setaffinity(0, cpus)
+    input_memory = SharedMemory(input_name)
+    output_memory = SharedMemory(output_name)
+    tables = build_function_tables()
+    connection.send(_WORKER_READY)
+    try:
+        while True:
+            slot = connection.recv()
+            if slot is None:
+                break
+            offset = slot * segment_bytes
+            job = input_memory.buf[offset:offset + segment_bytes]
+            try:
+                status, value, error_code = run_job(tables, job)
+            finally:
+                job.release()
+            if status == STATUS_OK:
+                if len(value) > segment_bytes:
+                    status, value = STATUS_OVERFLOW, 0
+                else:
+                    output_memory.buf[offset:offset + len(value)] = value
+                    value = len(value)
+            connection.send((status, value, error_code))
+    finally:
+        input_memory.close()
+        output_memory.close()
+
+# ---------------------------------------------------------- #
+#                         WORKER POOL                        #
+# ---------------------------------------------------------- #
+_Worker = collections.namedtuple("_Worker", ["process", "connection", "input_memory", "output_memory", "free_slots", "pending"])
+
+class ConjugationWorkerPool:
+    ''' Long-lived worker processes for large conjugation batches. Each worker
+    builds every specialized conjugation function once when it starts, and the
+    pool waits until all workers are ready, so jobs pay neither process start
+    nor warm-up.
+
+    Requests are columns of verbs, verb class codes and form IDs (see
+    IntegerConjugator). They are written as flat records into shared memory
+    ring buffers, slots round-robin over the workers with up to slots jobs in
+    flight per worker. Results are read back from the output ring, so neither
+    requests nor results are pickled.
+
+    Invalid verbs raise InvalidJapaneseVerbException, form IDs outside the
+    paradigm and verbs whose job does not fit in a slot raise ValueError. The
+    jobs already submitted finish first, so the pool stays usable. A worker
+    that exits closes the pool and raises RuntimeError. Verbs are validated
+    with validate_many in the workers.
+    '''
+    def __init__(self, workers=None, slots=DEFAULT_SLOTS, segment_bytes=DEFAULT_SEGMENT_BYTES,
+                 chunk_size=DEFAULT_CHUNK_SIZE, cpu_affinity=False, context=None):
+        ''' Args:
+            workers (:obj: int, optional): number of worker processes. Defaults
+                to the number of usable CPUs.
+            slots (:obj: int, optional): jobs in flight per worker, the number
+                of slots of each ring. Defaults to DEFAULT_SLOTS.
+            segment_bytes (:obj: int, optional): size of a slot. Jobs whose
+                input or results do not fit are split. Defaults to
+                DEFAULT_SEGMENT_BYTES.
+            chunk_size (:obj: int, optional): conjugations per job.
+                Defaults to DEFAULT_CHUNK_SIZE.
+            cpu_affinity (:obj: bool, optional): pin worker i to the i-th usable
+                CPU, on platforms with os.sched_setaffinity. Defaults to False.
+            context (:obj: str, optional): multiprocessing start method.
+                Defaults to None, the platform default.
+        '''
+        cpus = sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else list(range(os.cpu_count() or 1))
+        if workers is None:
+            workers = len(cpus)
+        self.segment_bytes = segment_bytes
+        self.chunk_size = chunk_size
+        self._workers = []
+        multiprocessing_context = multiprocessing.get_context(context)
+        try:
+            for index in range(workers):
+                input_memory = SharedMemory(create=True, size=slots * segment_bytes)
+                output_memory = SharedMemory(create=True, size=slots * segment_bytes)
+                connection, child_connection = multiprocessing_context.Pipe()
+                worker_cpus = {cpus[index % len(cpus)]} if cpu_affinity and hasattr(os, "sched_setaffinity") else None
+                process = multiprocessing_context.Process(target=_worker_main, daemon=True,
+                    args=(child_connection, input_memory.name, output_memory.name, segment_bytes, worker_cpus))
+                self._workers.append(_Worker(process, connection, input_memory, output_memory, collections.deque(range(slots)), collections.deque()))
+                process.start()
+                child_connection.close()
+            for worker in self._workers:
+                if worker.connection.recv() != _WORKER_READY:
+                    raise RuntimeError("Conjugation worker failed to start")
+        except BaseException:
+            self.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        '''Stop the workers and free the shared memory'''
+        for worker in self._workers:
+            try:
+                worker.connection.send(None)
+            except (OSError, ValueError):
+                pass
+        for worker in self._workers:
+            if worker.process.pid is not None:
+                worker.process.join()
+            worker.connection.close()
+            for memory in (worker.input_memory, worker.output_memory):
+                memory.close()
+                memory.unlink()
+        self._workers = []
+
+    def conjugate_records(self, verbs, verb_classes, form_ids):
+        '''Conjugate each verb into its own form
+
+        Args:
+            verbs (sequence): Japanese verbs
+            verb_classes (sequence): VerbClass value of every verb
+            form_ids (sequence): form ID of every verb, see IntegerConjugator
+
+        Returns:
+            list: conjugated verbs in request order, None for unsupported forms
+        '''
+        step = self.chunk_size
+        jobs = [(JOB_RECORDS, verbs[start:start + step], bytes(verb_classes[start:start + step]), array.array("H", form_ids[start:start + step]))
+                for start in range(0, len(verbs), step)]
+        return self._run(jobs)
+
+    def conjugate_many(self, rows):
+        '''Conjugate (verb, verb class code, form ID) rows, see conjugate_records
+
+        Args:
+            rows (iterable): (verb, verb class code, form ID) tuples
+
+        Returns:
+            list: conjugated verbs in request order, None for unsupported forms
+        '''
+        columns = list(zip(*rows))
+        if not columns:
+            return []
+        verbs, verb_classes, form_ids = columns
+        return self.conjugate_records(list(verbs), verb_classes, form_ids)
+
+    def conjugate_paradigms(self, verbs, verb_classes, form_ids=PARADIGM_FORM_IDS):
+        '''Conjugate every verb into every form ID
+
+        Args:
+            verbs (sequence): Japanese verbs
+            verb_classes (sequence): VerbClass value of every verb
+            form_ids (:obj: sequence, optional): form IDs. Defaults to every
+                paradigm signature, in paradigm order.
+
+        Returns:
+            list: flat list of the conjugated verbs, the form ID j of verb i
+                being at i * len(form_ids) + j. None for unsupported forms.
+        '''
+        step = max(1, self.chunk_size // max(1, len(form_ids)))
+        form_id_array = array.array("H", form_ids)
+        jobs = [(JOB_PARADIGMS, verbs[start:start + step], bytes(verb_classes[start:start + step]), form_id_array)
+                for start in range(0, len(verbs), step)]
+        return self._run(jobs)
+
+    def _run(self, jobs):
+        if not self._workers:
+            raise RuntimeError("Conjugation worker pool is closed")
+        # job keys sort in request order, also once a job is split in halves
+        queue = collections.deque(((index,), job) for index, job in enumerate(jobs))
+        results = {}
+        # (key, job, status, value, error code). Failures raised in this process
+        # have no status and hold the exception as their value. Once anything
+        # failed no job is submitted, but every pending reply is still read, so
+        # none is left for the next call to take as its own.
+        errors = []
+        worker_exited = False
+        by_connection = dict((worker.connection, worker) for worker in self._workers)
+        while True:
+            for worker in self._workers:
+                while queue and worker.free_slots and not errors:
+                    key, job = queue.popleft()
+                    try:
+                        self._submit(worker, queue, key, job)
+                    except ValueError as error:
+                        errors.append((key, job, None, error, None))
+                    except OSError:
+                        worker_exited = True
+                        errors.append((key, job, None, RuntimeError("Conjugation worker exited", worker.process.exitcode), None))
+            busy = [worker.connection for worker in self._workers if worker.pending]
+            if not busy:
+                break
+            for connection in multiprocessing.connection.wait(busy):
+                worker = by_connection[connection]
+                try:
+                    status, value, error_code = connection.recv()
+                except EOFError:
+                    # the replies of this worker are lost with it
+                    worker_exited = True
+                    _, key, job = worker.pending[0]
+                    errors.append((key, job, None, RuntimeError("Conjugation worker exited", worker.process.exitcode), None))
+                    worker.pending.clear()
+                    continue
+                slot, key, job = worker.pending.popleft()
+                if status == STATUS_OK:
+                    offset = slot * self.segment_bytes
+                    text = bytes(worker.output_memory.buf[offset:offset + value]).decode("utf-8")
+                    surfaces = text.split("\0") if text or job[1] else []
+                    if NONE_MARKER in text:
+                        surfaces = [None if surface == NONE_MARKER else surface for surface in surfaces]
+                    results[key] = surfaces
+                elif status == STATUS_OVERFLOW:
+                    try:
+                        queue.extendleft(reversed(_split_job(key, job)))
+                    except ValueError as error:
+                        errors.append((key, job, None, error, None))
+                else:
+                    errors.append((key, job, status, value, error_code))
+                worker.free_slots.append(slot)
+        if worker_exited:
+            self.close()
+        if errors:
+            key, job, status, value, error_code = min(errors, key=lambda error: error[0])
+            if status is None:
+                raise value
+            if status == STATUS_INVALID_VERB:
+                raise_for_error_code(job[1][value], error_code)
+            raise ValueError("Unsupported verb class code or form ID", value)
+        surfaces = []
+        for key in sorted(results):
+            surfaces.extend(results[key])
+        return surfaces
+
+    def _submit(self, worker, queue, key, job):
+        payload = encode_job(*job)
+        if len(payload) > self.segment_bytes:
+            if len(job[1]) < 2:
+                raise ValueError("Job does not fit in a segment", self.segment_bytes)
+            queue.extendleft(reversed(_split_job(key, job)))
+            return
+        slot = worker.free_slots[0]
+        offset = slot * self.segment_bytes
+        worker.input_memory.buf[offset:offset + len(payload)] = payload
+        worker.connection.send(slot)
+        worker.free_slots.popleft()
+        worker.pending.append((slot, key, job))
+
+def _split_job(key, job):
+    kind, verbs, verb_classes, form_ids = job
+    if len(verbs) < 2:
+        raise ValueError("Job results do not fit in a segment")
+    middle = len(verbs) // 2
+    if kind == JOB_RECORDS:
+        return [(key + (0,), (kind, verbs[:middle], verb_classes[:middle], form_ids[:middle])),
+                (key + (1,), (kind, verbs[middle:], verb_classes[middle:], form_ids[middle:]))]
+    return [(key + (0,), (kind, verbs[:middle], verb_classes[:middle], form_ids)),
+            (key + (1,), (kind, verbs[middle:], verb_classes[middle:], form_ids))]
+
+# ---------------------------------------------------------- #
+#                          BENCHMARK                         #
+# ---------------------------------------------------------- #
+def _pickled_chunk(rows):
+    tables = _pickled_chunk.tables
+    return [tables[verb_class][form_id](verb) for verb, verb_class, form_id in rows]
+
+def _warm_pickled_worker():
+    _pickled_chunk.tables = build_function_tables()
+
+def benchmark_worker_pool(verbs, worker_counts, chunk_size=DEFAULT_CHUNK_SIZE):
+    '''Time full paradigms of a batch of verbs in process, through a
+    ProcessPoolExecutor sending pickled rows, and through worker pools
+
+    Args:
+        verbs (list): (verb, verb_class) pairs
+        worker_counts (list): numbers of pool workers to time
+        chunk_size (:obj: int, optional): conjugations per job. Defaults to DEFAULT_CHUNK_SIZE.
+
+    Returns:
+        list: (name, conjugations per second, startup seconds)
+    '''
+    verb_list = [verb for verb, _ in verbs]
+    verb_classes = [verb_class.value for _, verb_class in verbs]
+    num_conjugations = len(verbs) * len(PARADIGM_FORM_IDS)
+    reports = []
+
+    start = time.perf_counter()
+    tables = build_function_tables()
+    startup = time.perf_counter() - start
+    start = time.perf_counter()
+    for verb, verb_class in zip(verb_list, verb_classes):
+        table = tables[verb_class]
+        [table[form_id](verb) for form_id in PARADIGM_FORM_IDS]
+    reports.append(("in process", num_conjugations / (time.perf_counter() - start), startup))
+
+    rows = [(verb, verb_class, form_id) for verb, verb_class in zip(verb_list, verb_classes) for form_id in PARADIGM_FORM_IDS]
+    chunks = [rows[start:start + chunk_size] for start in range(0, len(rows), chunk_size)]
+    for workers in worker_counts:
+        start = time.perf_counter()
+        with concurrent.futures.ProcessPoolExecutor(workers, initializer=_warm_pickled_worker) as executor:
+            list(executor.map(_pickled_chunk, chunks[:workers]))
+            startup = time.perf_counter() - start
+            start = time.perf_counter()
+            list(executor.map(_pickled_chunk, chunks))
+            reports.append(("pickled x{}".format(workers), num_conjugations / (time.perf_counter() - start), startup))
+
+        start = time.perf_counter()
+        with ConjugationWorkerPool(workers, chunk_size=chunk_size) as pool:
+            startup = time.perf_counter() - start
+            start = time.perf_counter()
+            pool.conjugate_paradigms(verb_list, verb_classes)
+            reports.append(("shared x{}".format(workers), num_conjugations / (time.perf_counter() - start), startup))
+    return reports
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the shared memory conjugation worker pool.")
+    parser.add_argument("--workers", type=int, nargs="+", default=[os.cpu_count() or 1], help="worker counts to time")
+    parser.add_argument("--repeat-corpus", type=int, default=20, help="copies of the golden corpus verbs to conjugate")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="conjugations per job")
+    args = parser.parse_args(argv)
+
+    from .GoldenCorpus import load_golden_corpus
+    verbs = [(entry.verb, entry.verb_class) for entry in load_golden_corpus()] * args.repeat_corpus
+    print("{} verbs x {} forms".format(len(verbs), len(PARADIGM_FORM_IDS)))
+    for name, rate, startup in benchmark_worker_pool(verbs, args.workers, args.chunk_size):
+        print("{:<16}{:>14,.0f} conjugations/s  startup {:.2f}s".format(name, rate, startup))
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,40 @@
-from .constants.ParticleConstants import U_PARTICLE, KU_PARTICLE, GU_PARTICLE, SU_PARTICLE, TSU_PARTICLE, NU_PARTICLE, BU_PARTICLE, MU_PARTICLE, RU_PARTICLE
+from .constants.EnumeratedTypes import AdjectiveClass
+from .constants.ParticleConstants import I_PARTICLE, U_PARTICLE, KU_PARTICLE, GU_PARTICLE, SU_PARTICLE, TSU_PARTICLE, NU_PARTICLE, BU_PARTICLE, MU_PARTICLE, RU_PARTICLE
+from .Exceptions import VALID_VERB, INVALID_VERB_LENGTH, INVALID_VERB_ENDING, NON_JAPANESE_CHARACTER, VALIDATION_EXCEPTIONS, ADJECTIVE_VALIDATION_EXCEPTIONS
+
+JAPANESE_CHARACTER_RANGES = (
+    # https://stackoverflow.com/questions/30069846/how-to-find-out-chinese-or-japanese-character-in-a-string-in-python
+    (ord(u"\u3300"), ord(u"\u33ff")),         # compatibility ideographs
+    (ord(u"\ufe30"), ord(u"\ufe4f")),         # compatibility ideographs
+    (ord(u"\uf900"), ord(u"\ufaff")),         # compatibility ideographs
+    (ord(u"\U0002F800"), ord(u"\U0002fa1f")), # compatibility ideographs
+    (ord(u'\u3040'), ord(u'\u309f')),         # Japanese Hiragana
+    (ord(u"\u30a0"), ord(u"\u30ff")),         # Japanese Katakana
+    (ord(u"\u2e80"), ord(u"\u2eff")),         # cjk radicals supplement
+    (ord(u"\u4e00"), ord(u"\u9fff")),
+    (ord(u"\u3400"), ord(u"\u4dbf")),
+    (ord(u"\U00020000"), ord(u"\U0002a6df")),
+    (ord(u"\U0002a700"), ord(u"\U0002b73f")),
+    (ord(u"\U0002b740"), ord(u"\U0002b81f")),
+    (ord(u"\U0002b820"), ord(u"\U0002ceaf"))  # included as of Unicode 8.0
+)
+
+VALID_VERB_ENDINGS = frozenset([U_PARTICLE, KU_PARTICLE, GU_PARTICLE, SU_PARTICLE, TSU_PARTICLE, NU_PARTICLE, BU_PARTICLE, MU_PARTICLE, RU_PARTICLE])
+
+def isJapaneseCharacter(char):
+    ''' Compute whether or not a single character is kana or kanji
+
+    Args:
+        char (str): single character
+
+    Returns:
+        bool: True if the character is in one of the Japanese ranges, false otherwise
+    '''
+    code_point = ord(char)
+    for start, end in JAPANESE_CHARACTER_RANGES:
+        if start <= code_point <= end:
+            return True
+    return False
 
 def containsJapaneseCharacters(verb):
     ''' Compute whether or not a Japanese verb contains any kanji characters
@@ -9,41 +45,138 @@ def containsJapaneseCharacters(verb):
     Returns:
         bool: True if kanji is found, false otherwise
     '''
-    ranges = [
-        # https://stackoverflow.com/questions/30069846/how-to-find-out-chinese-or-japanese-character-in-a-string-in-python
-        {"from": ord(u"\u3300"), "to": ord(u"\u33ff")},         # compatibility ideographs
-        {"from": ord(u"\ufe30"), "to": ord(u"\ufe4f")},         # compatibility ideographs
-        {"from": ord(u"\uf900"), "to": ord(u"\ufaff")},         # compatibility ideographs
-        {"from": ord(u"\U0002F800"), "to": ord(u"\U0002fa1f")}, # compatibility ideographs
-        {'from': ord(u'\u3040'), 'to': ord(u'\u309f')},         # Japanese Hiragana
-        {"from": ord(u"\u30a0"), "to": ord(u"\u30ff")},         # Japanese Katakana
-        {"from": ord(u"\u2e80"), "to": ord(u"\u2eff")},         # cjk radicals supplement
-        {"from": ord(u"\u4e00"), "to": ord(u"\u9fff")},
-        {"from": ord(u"\u3400"), "to": ord(u"\u4dbf")},
-        {"from": ord(u"\U00020000"), "to": ord(u"\U0002a6df")},
-        {"from": ord(u"\U0002a700"), "to": ord(u"\U0002b73f")},
-        {"from": ord(u"\U0002b740"), "to": ord(u"\U0002b81f")},
-        {"from": ord(u"\U0002b820"), "to": ord(u"\U0002ceaf")}  # included as of Unicode 8.0
-    ]
-
     for char in verb:
-        if not any([range["from"] <= ord(char) <= range["to"] for range in ranges]):
+        if not isJapaneseCharacter(char):
             return False
     return True
 
-def validateJapaneseVerbDecorator(func):
-    def wrapper(self, verb, *args):
+def validate_verb(verb):
+    ''' Validate a Japanese verb without raising an exception
+
+    Args:
+        verb (str): Japanese verb in kana or kanji
+
+    Returns:
+        int: VALID_VERB, or the bitwise OR of every failing check's error code
+    '''
+    error_code = VALID_VERB
+    if len(verb) < 2:
+        error_code |= INVALID_VERB_LENGTH
+    if verb[-1:] not in VALID_VERB_ENDINGS:
+        error_code |= INVALID_VERB_ENDING
+    if not containsJapaneseCharacters(verb):
+        error_code |= NON_JAPANESE_CHARACTER
+    return error_code
+
+def validate_many(verbs):
+    ''' Validate many Japanese verbs without raising an exception. Character
+    checks are shared between verbs, so repeated kana and kanji are only
+    classified once per call.
+
+    Args:
+        verbs (iterable): Japanese verbs in kana or kanji
+
+    Returns:
+        bytearray: one error code per verb, in input order. A zero byte
+            (VALID_VERB) means the verb passed validation.
+    '''
+    known_characters = {}
+    error_codes = bytearray()
+    for verb in verbs:
+        error_code = VALID_VERB
         if len(verb) < 2:
-            print("here")
-            raise Exception("Invalid Japanese Verb Length", len(verb), verb)
+            error_code |= INVALID_VERB_LENGTH
+        if verb[-1:] not in VALID_VERB_ENDINGS:
+            error_code |= INVALID_VERB_ENDING
+        for char in verb:
+            is_japanese = known_characters.get(char)
+            if is_japanese is None:
+                is_japanese = known_characters[char] = isJapaneseCharacter(char)
+            if not is_japanese:
+                error_code |= NON_JAPANESE_CHARACTER
+                break
+        error_codes.append(error_code)
+    return error_codes
+
+def raise_for_error_code(verb, error_code, exception_classes=VALIDATION_EXCEPTIONS):
+    ''' Raise the exception for the first failing check of a verb's error code
+
+    Args:
+        verb (str): Japanese verb in kana or kanji
+        error_code (int): error code returned by validate_verb or validate_many
+        exception_classes (:obj: tuple, optional): exceptions checked in order.
+            Defaults to VALIDATION_EXCEPTIONS, ADJECTIVE_VALIDATION_EXCEPTIONS
+            for the error codes of validate_adjective.
 
-        if verb[-1:] not in [U_PARTICLE, KU_PARTICLE, GU_PARTICLE, SU_PARTICLE, TSU_PARTICLE, NU_PARTICLE, BU_PARTICLE, MU_PARTICLE, RU_PARTICLE]:
-            raise Exception("Invalid Japanese Verb Ending Particle", verb[-1:])
-        
-        if not containsJapaneseCharacters(verb):
-            raise Exception("Non-Japanese Character Found", verb)
+    Raises:
+        InvalidJapaneseVerbException: subclass matching the first failing check
+    '''
+    for exception_class in exception_classes:
+        if error_code & exception_class.code:
+            raise exception_class(verb)
+
+def validate_adjective(adjective, adjective_class):
+    ''' Validate a Japanese adjective without raising an exception, with the
+    error codes of validate_verb. i-adjectives must be at least two characters
+    long and end in い. na-adjectives may be a single kanji (楽) and end in any
+    character.
+
+    Args:
+        adjective (str): Japanese adjective in kana or kanji
+        adjective_class (enum): AdjectiveClass Enum of the adjective
+
+    Returns:
+        int: VALID_VERB, or the bitwise OR of every failing check's error code
+    '''
+    error_code = VALID_VERB
+    if adjective_class == AdjectiveClass.I_ADJECTIVE:
+        if len(adjective) < 2:
+            error_code |= INVALID_VERB_LENGTH
+        if adjective[-1:] != I_PARTICLE:
+            error_code |= INVALID_VERB_ENDING
+    elif not adjective:
+        error_code |= INVALID_VERB_LENGTH
+    if not containsJapaneseCharacters(adjective):
+        error_code |= NON_JAPANESE_CHARACTER
+    return error_code
+
+def validateJapaneseVerbDecorator(func):
+    def wrapper(self, verb, *args):
+        error_code = validate_verb(verb)
+        if error_code != VALID_VERB:
+            raise_for_error_code(verb, error_code)
 
         # assuming *args will always have the correct arguments because initial function call succeeded
         return func(self, verb, *args)
     return wrapper
-    
\ No newline at end of file
+
+def validateJapaneseAdjectiveDecorator(func):
+    def wrapper(self, adjective, adjective_class, *args):
+        error_code = validate_adjective(adjective, adjective_class)
+        if error_code != VALID_VERB:
+            raise_for_error_code(adjective, error_code, ADJECTIVE_VALIDATION_EXCEPTIONS)
+        return func(self, adjective, adjective_class, *args)
+    return wrapper
+
+def cacheConjugationDecorator(form):
+    ''' Look up the result of a generate_* method in the generator's cache
+    before conjugating, and store it afterwards. Generators without a cache
+    call the method directly. Invalid verbs raise before anything is stored.
+
+    Args:
+        form (enum): VerbForm Enum of the decorated method, part of the cache key
+    '''
+    def decorator(func):
+        def wrapper(self, verb, verb_class, *args):
+            cache = self.cache
+            if cache is None:
+                return func(self, verb, verb_class, *args)
+            key = (verb, form, verb_class) + args
+            is_cached, conjugated_verb = cache.lookup(key)
+            if is_cached:
+                return conjugated_verb
+            conjugated_verb = func(self, verb, verb_class, *args)
+            cache.store(key, conjugated_verb)
+            return conjugated_verb
+        return wrapper
+    return decorator
@@ -0,0 +1,189 @@
+import argparse
+import collections
+import re
+import sys
+import xml.etree.ElementTree as ElementTree
+
+# Local modules
+from .constants.EnumeratedTypes import VerbClass
+from .constants.VerbEndingConstants import SURU_ENDING
+
+from .Decorators import validate_many
+from .Exceptions import VALID_VERB
+from .GoldenCorpus import signature_label
+from .Paradigm import PARADIGM_SIGNATURES
+from .SpecializedConjugators import specialized_function
+
+DEFAULT_BATCH_SIZE = 1000
+
+# ---------------------------------------------------------- #
+#                  PART-OF-SPEECH MAPPING                    #
+# ---------------------------------------------------------- #
+# JMdict part-of-speech code -> (VerbClass, text appended to the headword).
+# vs headwords are nouns that take する, so する is appended to them.
+POS_VERB_CLASSES = {
+    "v1": (VerbClass.ICHIDAN, ""),
+    "v5b": (VerbClass.GODAN, ""),
+    "v5g": (VerbClass.GODAN, ""),
+    "v5k": (VerbClass.GODAN, ""),
+    "v5m": (VerbClass.GODAN, ""),
+    "v5n": (VerbClass.GODAN, ""),
+    "v5r": (VerbClass.GODAN, ""),
+    "v5s": (VerbClass.GODAN, ""),
+    "v5t": (VerbClass.GODAN, ""),
+    "v5u": (VerbClass.GODAN, ""),
+    "vk": (VerbClass.IRREGULAR, ""),
+    "vs-i": (VerbClass.IRREGULAR, ""),
+    "vs": (VerbClass.IRREGULAR, SURU_ENDING),
+}
+
+# verbs whose irregularities the generator does not model (行く -> 行って,
+# ある -> ない, くれる -> くれ, 愛する -> 愛さない, archaic classes). They are
+# counted and skipped rather than conjugated wrongly.
+UNSUPPORTED_VERB_POS = frozenset([
+    "v1-s", "v5aru", "v5k-s", "v5r-i", "v5u-s", "v5uru", "vs-s", "vs-c", "vz", "vn", "vr",
+    "v2a-s", "v4h", "v4r", "v4k", "v4g", "v4s", "v4t", "v4n", "v4b", "v4m",
+])
+
+DictionaryVerb = collections.namedtuple("DictionaryVerb", ["sequence", "verb", "reading", "verb_class", "pos"])
+
+_ENTITY_DECLARATION = re.compile(r'<!ENTITY\s+(\S+)\s+"([^"]*)"\s*>')
+
+def read_entity_declarations(path):
+    '''Read the entity declarations of a JMdict file's internal DTD. The XML
+    parser replaces &v5k; by its text, which this maps back to the code.
+
+    Args:
+        path (str): JMdict-style XML file
+
+    Returns:
+        dict: entity text -> entity name, e.g. "Ichidan verb" -> "v1"
+    '''
+    declarations = {}
+    with open(path, encoding="utf-8") as dictionary_file:
+        for line in dictionary_file:
+            if line.startswith("<JMdict"):
+                break
+            match = _ENTITY_DECLARATION.search(line)
+            if match is not None:
+                declarations[match.group(2)] = match.group(1)
+    return declarations
+
+# ---------------------------------------------------------- #
+#                     STREAMING PARSER                       #
+# ---------------------------------------------------------- #
+def _entry_verb(entry, pos_codes, stats):
+    spellings = [element.text for element in entry.iter("keb")]
+    readings = [element.text for element in entry.iter("reb")]
+    if not readings:
+        return None
+    entry_pos = [pos_codes.get(element.text, element.text) for element in entry.iter("pos")]
+    for pos in entry_pos:
+        mapping = POS_VERB_CLASSES.get(pos)
+        if mapping is not None:
+            verb_class, suffix = mapping
+            verb = "{}{}".format(spellings[0] if spellings else readings[0], suffix)
+            stats["verbs"] += 1
+            return DictionaryVerb(int(entry.findtext("ent_seq")), verb, "{}{}".format(readings[0], suffix), verb_class, pos)
+    if any(pos in UNSUPPORTED_VERB_POS for pos in entry_pos):
+        stats["unsupported"] += 1
+    return None
+
+def iter_dictionary_verbs(path, stats=None):
+    '''Stream the verbs of a JMdict-style XML file. Entries are parsed one at
+    a time with iterparse and cleared once read, so memory use does not grow
+    with the size of the file.
+
+    The headword is the first kanji spelling, or the first reading for kana
+    only entries. The verb class comes from the first part of speech of the
+    entry found in POS_VERB_CLASSES.
+
+    Args:
+        path (str): JMdict-style XML file
+        stats (:obj: collections.Counter, optional): incremented under
+            "entries", "verbs" and "unsupported". Defaults to None.
+
+    Yields:
+        DictionaryVerb: one per verb entry, in file order
+    '''
+    if stats is None:
+        stats = collections.Counter()
+    pos_codes = read_entity_declarations(path)
+    root = None
+    for event, element in ElementTree.iterparse(path, events=("start", "end")):
+        if root is None:
+            root = element
+        if event != "end" or element.tag != "entry":
+            continue
+        stats["entries"] += 1
+        dictionary_verb = _entry_verb(element, pos_codes, stats)
+        # drop the entry and every finished sibling held by the root
+        root.clear()
+        if dictionary_verb is not None:
+            yield dictionary_verb
+
+# ---------------------------------------------------------- #
+#                    BATCH CONJUGATION                       #
+# ---------------------------------------------------------- #
+def conjugate_dictionary(path, signatures=PARADIGM_SIGNATURES, batch_size=DEFAULT_BATCH_SIZE, stats=None):
+    '''Stream the verbs of a JMdict-style XML file into batch conjugation. At
+    most batch_size verbs are held at once. Each batch is validated with
+    validate_many and conjugated with the specialized function of every
+    signature.
+
+    Args:
+        path (str): JMdict-style XML file
+        signatures (:obj: sequence, optional): entries of
+            Paradigm.PARADIGM_SIGNATURES to conjugate. Defaults to all of them.
+        batch_size (:obj: int, optional): verbs per batch. Defaults to
+            DEFAULT_BATCH_SIZE.
+        stats (:obj: collections.Counter, optional): see iter_dictionary_verbs,
+            also incremented under "invalid". Defaults to None.
+
+    Yields:
+        tuple: (DictionaryVerb, surfaces) where surfaces follows signatures
+    '''
+    if stats is None:
+        stats = collections.Counter()
+    functions = {verb_class: [specialized_function(verb_class, *signature) for signature in signatures] for verb_class in VerbClass}
+    batch = []
+    for dictionary_verb in iter_dictionary_verbs(path, stats):
+        batch.append(dictionary_verb)
+        if len(batch) == batch_size:
+            for result in _conjugate_batch(batch, functions, stats):
+                yield result
+            batch = []
+    for result in _conjugate_batch(batch, functions, stats):
+        yield result
+
+def _conjugate_batch(batch, functions, stats):
+    error_codes = validate_many([dictionary_verb.verb for dictionary_verb in batch])
+    for dictionary_verb, error_code in zip(batch, error_codes):
+        if error_code != VALID_VERB:
+            stats["invalid"] += 1
+            continue
+        verb = dictionary_verb.verb
+        yield dictionary_verb, [function(verb) for function in functions[dictionary_verb.verb_class]]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Conjugate every verb of a JMdict-style XML file into a TSV table.")
+    parser.add_argument("path", help="JMdict-style XML file")
+    parser.add_argument("--output", help="TSV output path. Defaults to stdout.")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="verbs conjugated per batch")
+    args = parser.parse_args(argv)
+
+    stats = collections.Counter()
+    output_file = sys.stdout if args.output is None else open(args.output, "w", encoding="utf-8")
+    try:
+        output_file.write("\t".join(["verb", "verb_class"] + [signature_label(signature) for signature in PARADIGM_SIGNATURES]) + "\n")
+        for dictionary_verb, surfaces in conjugate_dictionary(args.path, batch_size=args.batch_size, stats=stats):
+            cells = [dictionary_verb.verb, dictionary_verb.verb_class.name] + [surface or "" for surface in surfaces]
+            output_file.write("\t".join(cells) + "\n")
+    finally:
+        if output_file is not sys.stdout:
+            output_file.close()
+    sys.stderr.write("{} entries, {} verbs, {} unsupported, {} invalid\n".format(
+        stats["entries"], stats["verbs"], stats["unsupported"], stats["invalid"]))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+import argparse
+import array
+import collections
+import random
+import time
+
+# Local modules
+from .constants.EnumeratedTypes import Polarity, VerbClass
+from .constants.ParticleConstants import U_PARTICLE, KU_PARTICLE, GU_PARTICLE, SU_PARTICLE, TSU_PARTICLE, NU_PARTICLE, BU_PARTICLE, MU_PARTICLE, RU_PARTICLE
+from .constants.VerbEndingConstants import SURU_ENDING, KURU_ENDING, KURU_KANJI_ENDING
+
+from .ConjugationWorkerPool import JOB_RECORDS, NONE_MARKER, STATUS_INVALID_VERB, build_function_tables, encode_job, run_job
+from .Decorators import raise_for_error_code
+from .IntegerConjugator import IntegerConjugator, signature_form_id
+from .JapaneseVerbFormGenerator import JapaneseVerbFormGenerator
+from .LazyParadigm import LazyParadigm
+from .Paradigm import PARADIGM_SIGNATURES, conjugate_form, conjugate_with_verb_forms
+from .PositiveVerbFormGenerator import PositiveVerbForms
+from .SpecializedConjugators import specialized_function
+from .NegativeVerbFormGenerator import NegativeVerbForms
+
+GODAN_FINAL_KANA = (U_PARTICLE, KU_PARTICLE, GU_PARTICLE, SU_PARTICLE, TSU_PARTICLE, NU_PARTICLE, BU_PARTICLE, MU_PARTICLE, RU_PARTICLE)
+# kana of the -i and -e rows, which precede る in kana-spelled ichidan verbs
+ICHIDAN_STEM_FINAL_KANA = "いきぎしじちにひびみりえけげせぜてでねへべめれ"
+IRREGULAR_ENDINGS = (SURU_ENDING, KURU_ENDING, KURU_KANJI_ENDING)
+STEM_CHARACTERS = "飲食勉強持見話書読待遊泳死買使作呼急出始起教着寝帰分言思運動あかさたなはまやらわがざだばぱアカサタナ"
+
+Mismatch = collections.namedtuple("Mismatch", ["engine", "verb", "verb_class", "form", "tense", "formality", "polarity", "expected", "actual"])
+
+# ---------------------------------------------------------- #
+#                 REFERENCE AND CANDIDATE ENGINES            #
+# ---------------------------------------------------------- #
+_POSITIVE_VERB_FORMS = PositiveVerbForms()
+_NEGATIVE_VERB_FORMS = NegativeVerbForms()
+
+def reference_conjugation(verb, verb_class, form, tense=None, formality=None, polarity=None):
+    '''Conjugate a verb with PositiveVerbForms / NegativeVerbForms directly. This
+    is the reference implementation every optimized engine must agree with.
+
+    Args:
+        verb (str): Japanese verb in kana, might contain kanji
+        verb_class (enum): VerbClass Enum representing the verb class
+            to which the verb belongs
+        form (enum): VerbForm Enum representing the conjugation form
+        tense (:obj: enum, optional): Tense Enum. Defaults to None.
+        formality (:obj: enum, optional): Formality Enum. Defaults to None.
+        polarity (:obj: enum, optional): Polarity Enum. Defaults to None.
+
+    Returns:
+        str: conjugated verb, or None if the form is not supported
+    '''
+    verb_forms = _NEGATIVE_VERB_FORMS if polarity == Polarity.NEGATIVE else _POSITIVE_VERB_FORMS
+    return conjugate_with_verb_forms(verb_forms, verb, verb_class, form, tense, formality)
+
+def _generator_engine():
+    generator = JapaneseVerbFormGenerator()
+    def conjugate(verb, verb_class, form, tense=None, formality=None, polarity=None):
+        return conjugate_form(generator, verb, verb_class, form, tense, formality, polarity)
+    return conjugate
+
+def _integer_engine():
+    conjugator = IntegerConjugator()
+    def conjugate(verb, verb_class, form, tense=None, formality=None, polarity=None):
+        return conjugator.conjugate(verb, verb_class.value, signature_form_id((form, tense, formality, polarity)))
+    return conjugate
+
+def _specialized_engine(verb, verb_class, form, tense=None, formality=None, polarity=None):
+    return specialized_function(verb_class, form, tense, formality, polarity)(verb)
+
+def _lazy_paradigm_engine(verb, verb_class, form, tense=None, formality=None, polarity=None):
+    return LazyParadigm(verb, verb_class)[(form, tense, formality, polarity)]
+
+def _worker_record_engine():
+    # runs the worker's shared memory record path in process
+    tables = []
+    def conjugate(verb, verb_class, form, tense=None, formality=None, polarity=None):
+        if not tables:
+            tables.append(build_function_tables())
+        form_ids = array.array("H", [signature_form_id((form, tense, formality, polarity))])
+        status, value, error_code = run_job(tables[0], memoryview(encode_job(JOB_RECORDS, [verb], bytes([verb_class.value]), form_ids)))
+        if status == STATUS_INVALID_VERB:
+            raise_for_error_code(verb, error_code)
+        surface = value.decode("utf-8")
+        return None if surface == NONE_MARKER else surface
+    return conjugate
+
+# name -> callable(verb, verb_class, form, tense, formality, polarity). Every
+# optimized engine is registered here so the harness checks it automatically.
+CANDIDATE_ENGINES = collections.OrderedDict()
+
+def register_engine(name, engine):
+    '''Add an optimized engine to the differential harness
+
+    Args:
+        name (str): engine name used in mismatch reports
+        engine (callable): conjugates (verb, verb_class, form, tense, formality,
+            polarity) like reference_conjugation
+    '''
+    CANDIDATE_ENGINES[name] = engine
+
+register_engine("JapaneseVerbFormGenerator", _generator_engine())
+register_engine("IntegerConjugator", _integer_engine())
+register_engine("SpecializedConjugators", _specialized_engine)
+register_engine("LazyParadigm", _lazy_paradigm_engine)
+register_engine("ConjugationWorkerPool", _worker_record_engine())
+
+# ---------------------------------------------------------- #
+#                    RANDOM VERB GENERATION                  #
+# ---------------------------------------------------------- #
+def random_verb(rng, verb_class, ending=None):
+    '''Generate a random verb that passes validation for a verb class
+
+    Args:
+        rng (random.Random): random number generator
+        verb_class (enum): VerbClass Enum of the generated verb
+        ending (:obj: str, optional): final kana (godan), stem final kana (ichidan),
+            or irregular ending (irregular). Defaults to a random choice.
+
+    Returns:
+        str: random verb
+    '''
+    stem = "".join(rng.choice(STEM_CHARACTERS) for _ in range(rng.randint(1, 3)))
+    if verb_class == VerbClass.GODAN:
+        return "{}{}".format(stem, ending or rng.choice(GODAN_FINAL_KANA))
+    elif verb_class == VerbClass.ICHIDAN:
+        return "{}{}{}".format(stem, ending or rng.choice(ICHIDAN_STEM_FINAL_KANA), RU_PARTICLE)
+    # irregular verbs may be bare (する) or compound (勉強する)
+    if rng.random() < 0.25:
+        stem = ""
+    return "{}{}".format(stem, ending or rng.choice(IRREGULAR_ENDINGS))
+
+def random_cases(rng):
+    '''Endlessly generate random verbs, cycling through every verb class and ending
+
+    Args:
+        rng (random.Random): random number generator
+
+    Yields:
+        tuple: (verb, verb_class)
+    '''
+    endings = [(VerbClass.GODAN, ending) for ending in GODAN_FINAL_KANA]
+    endings += [(VerbClass.ICHIDAN, ending) for ending in ICHIDAN_STEM_FINAL_KANA]
+    endings += [(VerbClass.IRREGULAR, ending) for ending in IRREGULAR_ENDINGS]
+    while True:
+        for verb_class, ending in endings:
+            yield random_verb(rng, verb_class, ending), verb_class
+
+# ---------------------------------------------------------- #
+#                      DIFFERENTIAL HARNESS                  #
+# ---------------------------------------------------------- #
+def _outcome(engine, verb, verb_class, signature):
+    form, tense, formality, polarity = signature
+    try:
+        return engine(verb, verb_class, form, tense, formality, polarity)
+    except Exception as exception:
+        return "<{}: {}>".format(type(exception).__name__, exception)
+
+def minimize_verb(engine, verb, verb_class, signature):
+    '''Shrink a verb that produces a mismatch by removing stem characters while
+    the engine still disagrees with the reference
+
+    Args:
+        engine (callable): engine that disagrees with the reference
+        verb (str): verb producing the mismatch
+        verb_class (enum): VerbClass Enum of the verb
+        signature (tuple): (form, tense, formality, polarity)
+
+    Returns:
+        str: shortest verb found that still produces a mismatch
+    '''
+    ending_length = 2 if verb_class == VerbClass.IRREGULAR else 1
+    minimum_length = 2
+    shrunk = True
+    while shrunk:
+        shrunk = False
+        for index in range(len(verb) - ending_length):
+            candidate = "{}{}".format(verb[:index], verb[index + 1:])
+            if len(candidate) < minimum_length:
+                continue
+            if _outcome(engine, candidate, verb_class, signature) != _outcome(reference_conjugation, candidate, verb_class, signature):
+                verb = candidate
+                shrunk = True
+                break
+    return verb
+
+def run_differential(num_cases=100000, seed=0, engines=None, max_mismatches=20):
+    '''Compare every candidate engine with the reference implementation on random
+    verbs across every form of the paradigm
+
+    Args:
+        num_cases (:obj: int, optional): number of (verb, form) cases per engine.
+            Defaults to 100000.
+        seed (:obj: int, optional): random seed. Defaults to 0.
+        engines (:obj: dict, optional): name -> engine. Defaults to CANDIDATE_ENGINES.
+        max_mismatches (:obj: int, optional): stop after this many mismatches.
+            Defaults to 20.
+
+    Returns:
+        list: Mismatch records with minimized verbs, empty when all engines agree
+    '''
+    if engines is None:
+        engines = CANDIDATE_ENGINES
+    rng = random.Random(seed)
+    mismatches = []
+    num_checked = 0
+    for verb, verb_class in random_cases(rng):
+        for signature in PARADIGM_SIGNATURES:
+            expected = _outcome(reference_conjugation, verb, verb_class, signature)
+            for name, engine in engines.items():
+                actual = _outcome(engine, verb, verb_class, signature)
+                if actual != expected:
+                    minimized_verb = minimize_verb(engine, verb, verb_class, signature)
+                    mismatches.append(Mismatch(name, minimized_verb, verb_class, *signature,
+                        expected=_outcome(reference_conjugation, minimized_verb, verb_class, signature),
+                        actual=_outcome(engine, minimized_verb, verb_class, signature)))
+                    if len(mismatches) >= max_mismatches:
+                        return mismatches
+            num_checked += 1
+            if num_checked >= num_cases:
+                return mismatches
+    return mismatches
+
+def format_mismatch(mismatch):
+    '''Format a mismatch as a one line repro
+
+    Args:
+        mismatch (Mismatch): mismatch returned by run_differential
+
+    Returns:
+        str: human readable repro
+    '''
+    return "[{}] {} ({}) form={} tense={} formality={} polarity={}: expected {!r}, got {!r}".format(
+        mismatch.engine, mismatch.verb, mismatch.verb_class.name, mismatch.form.name,
+        getattr(mismatch.tense, "name", None), getattr(mismatch.formality, "name", None),
+        getattr(mismatch.polarity, "name", None), mismatch.expected, mismatch.actual)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Differentially test optimized conjugation engines against the reference implementation.")
+    parser.add_argument("--cases", type=int, default=100000, help="number of (verb, form) cases per engine")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    mismatches = run_differential(args.cases, args.seed)
+    elapsed = time.perf_counter() - start
+    for mismatch in mismatches:
+        print(format_mismatch(mismatch))
+    print("{} cases x {} engines in {:.2f}s, {} mismatches".format(args.cases, len(CANDIDATE_ENGINES), elapsed, len(mismatches)))
+    return 1 if mismatches else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
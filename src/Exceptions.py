@@ -0,0 +1,61 @@
+# ---------------------------------------------------------- #
+#                  VERB VALIDATION EXCEPTIONS                #
+# ---------------------------------------------------------- #
+# error codes are bit flags so that every problem with a verb can be
+# reported in a single byte by validate_many
+VALID_VERB = 0
+INVALID_VERB_LENGTH = 1
+INVALID_VERB_ENDING = 2
+NON_JAPANESE_CHARACTER = 4
+
+class InvalidJapaneseVerbException(Exception):
+    ''' Base class for all verb validation errors. Subclasses keep the
+    (message, *details) argument layout of the original exceptions.
+    '''
+    code = None
+
+class InvalidVerbLengthException(InvalidJapaneseVerbException):
+    ''' Raised when a verb is shorter than two characters '''
+    code = INVALID_VERB_LENGTH
+
+    def __init__(self, verb):
+        super(InvalidVerbLengthException, self).__init__("Invalid Japanese Verb Length", len(verb), verb)
+
+class InvalidVerbEndingException(InvalidJapaneseVerbException):
+    ''' Raised when a verb does not end with a valid dictionary form particle '''
+    code = INVALID_VERB_ENDING
+
+    def __init__(self, verb):
+        super(InvalidVerbEndingException, self).__init__("Invalid Japanese Verb Ending Particle", verb[-1:])
+
+class NonJapaneseCharacterException(InvalidJapaneseVerbException):
+    ''' Raised when a verb contains a character that is not kana or kanji '''
+    code = NON_JAPANESE_CHARACTER
+
+    def __init__(self, verb):
+        super(NonJapaneseCharacterException, self).__init__("Non-Japanese Character Found", verb)
+
+# checked in this order, so the first failing check determines which exception is raised
+VALIDATION_EXCEPTIONS = (InvalidVerbLengthException, InvalidVerbEndingException, NonJapaneseCharacterException)
+
+# ---------------------------------------------------------- #
+#               ADJECTIVE VALIDATION EXCEPTIONS              #
+# ---------------------------------------------------------- #
+# adjectives share the verb error codes. Each exception subclasses its verb
+# counterpart, so code catching the verb exceptions keeps working.
+class InvalidAdjectiveLengthException(InvalidVerbLengthException):
+    ''' Raised when an i-adjective is shorter than two characters or a na-adjective is empty '''
+    def __init__(self, adjective):
+        InvalidJapaneseVerbException.__init__(self, "Invalid Japanese Adjective Length", len(adjective), adjective)
+
+class InvalidAdjectiveEndingException(InvalidVerbEndingException):
+    ''' Raised when an i-adjective does not end with い '''
+    def __init__(self, adjective):
+        InvalidJapaneseVerbException.__init__(self, "Invalid Japanese Adjective Ending", adjective[-1:])
+
+class NonJapaneseAdjectiveCharacterException(NonJapaneseCharacterException):
+    ''' Raised when an adjective contains a character that is not kana or kanji '''
+    def __init__(self, adjective):
+        InvalidJapaneseVerbException.__init__(self, "Non-Japanese Character Found in Adjective", adjective)
+
+ADJECTIVE_VALIDATION_EXCEPTIONS = (InvalidAdjectiveLengthException, InvalidAdjectiveEndingException, NonJapaneseAdjectiveCharacterException)
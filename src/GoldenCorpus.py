@@ -0,0 +1,181 @@
+import argparse
+import collections
+import gzip
+import os
+import time
+
+# Local modules
+from .constants.EnumeratedTypes import VerbClass
+
+from .JapaneseVerbFormGenerator import JapaneseVerbFormGenerator
+from .Paradigm import PARADIGM_SIGNATURES, generate_paradigm
+
+DEFAULT_GOLDEN_CORPUS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests", "data", "golden_conjugations.tsv.gz")
+
+LABEL_SEPARATOR = "|"
+
+GoldenEntry = collections.namedtuple("GoldenEntry", ["verb", "verb_class", "expected"])
+GoldenMismatch = collections.namedtuple("GoldenMismatch", ["verb", "verb_class", "label", "expected", "actual"])
+
+# ---------------------------------------------------------- #
+#                    GOLDEN CORPUS FILE FORMAT               #
+# ---------------------------------------------------------- #
+# gzip compressed, tab separated UTF-8. The header row is "verb", "verb_class"
+# followed by one label per paradigm signature, e.g. "PLAIN|PAST||POSITIVE".
+# Each following row holds a verb, its VerbClass name, and the expected surface
+# of every labelled form. An empty cell means the form is expected to be None.
+def signature_label(signature):
+    '''Build the column label of a paradigm signature
+
+    Args:
+        signature (tuple): (form, tense, formality, polarity)
+
+    Returns:
+        str: label such as "CAUSATIVE||POLITE|NEGATIVE" or "TE|||"
+    '''
+    return LABEL_SEPARATOR.join("" if member is None else member.name for member in signature)
+
+def write_golden_corpus(entries, path):
+    '''Write a golden corpus file. Only the labels used by at least one entry
+    become columns, so forms added to the paradigm later stay missing rather
+    than being expected to be None.
+
+    Args:
+        entries (iterable): GoldenEntry records whose expected dicts are keyed
+            by signature label
+        path (str): destination file path
+    '''
+    entries = list(entries)
+    used_labels = set(label for entry in entries for label in entry.expected)
+    labels = [label for label in map(signature_label, PARADIGM_SIGNATURES) if label in used_labels]
+    with gzip.open(path, "wt", encoding="utf-8", newline="\n") as corpus_file:
+        corpus_file.write("\t".join(["verb", "verb_class"] + labels) + "\n")
+        for entry in entries:
+            cells = [entry.expected.get(label) or "" for label in labels]
+            corpus_file.write("\t".join([entry.verb, entry.verb_class.name] + cells) + "\n")
+
+def load_golden_corpus(path=DEFAULT_GOLDEN_CORPUS_PATH):
+    '''Load every entry of a golden corpus file
+
+    Args:
+        path (:obj: str, optional): golden corpus file path.
+            Defaults to DEFAULT_GOLDEN_CORPUS_PATH.
+
+    Returns:
+        list: GoldenEntry records whose expected dicts are keyed by signature label
+    '''
+    entries = []
+    with gzip.open(path, "rt", encoding="utf-8", newline="\n") as corpus_file:
+        labels = corpus_file.readline().rstrip("\n").split("\t")[2:]
+        for line in corpus_file:
+            cells = line.rstrip("\n").split("\t")
+            expected = {label: cell or None for label, cell in zip(labels, cells[2:])}
+            entries.append(GoldenEntry(cells[0], VerbClass[cells[1]], expected))
+    return entries
+
+# ---------------------------------------------------------- #
+#                       BULK VERIFICATION                    #
+# ---------------------------------------------------------- #
+class GoldenCorpusReport:
+    ''' Accuracy of a conjugation run against a golden corpus, aggregated per
+    form label and per verb class. Only the first max_mismatches mismatches are
+    kept so the report stays small on a badly broken build.
+    '''
+    def __init__(self, max_mismatches=50):
+        self.max_mismatches = max_mismatches
+        # key -> [correct, total]
+        self.per_form = collections.OrderedDict()
+        self.per_class = collections.OrderedDict()
+        self.mismatches = []
+        self.num_mismatches = 0
+        self.elapsed = 0.0
+
+    def record(self, verb, verb_class, label, expected, actual):
+        is_correct = expected == actual
+        for counts in (self.per_form.setdefault(label, [0, 0]), self.per_class.setdefault(verb_class, [0, 0])):
+            counts[0] += is_correct
+            counts[1] += 1
+        if not is_correct:
+            self.num_mismatches += 1
+            if len(self.mismatches) < self.max_mismatches:
+                self.mismatches.append(GoldenMismatch(verb, verb_class, label, expected, actual))
+
+    @property
+    def total(self):
+        return sum(total for _, total in self.per_class.values())
+
+    @property
+    def accuracy(self):
+        if not self.total:
+            return 1.0
+        return float(self.total - self.num_mismatches) / self.total
+
+    def class_accuracy(self, verb_class):
+        correct, total = self.per_class.get(verb_class, [0, 0])
+        return float(correct) / total if total else 1.0
+
+    def form_accuracy(self, label):
+        correct, total = self.per_form.get(label, [0, 0])
+        return float(correct) / total if total else 1.0
+
+    def format(self):
+        '''Format the report for the command line
+
+        Returns:
+            str: multi-line accuracy summary per form and per class
+        '''
+        lines = ["{} conjugations in {:.2f}s, accuracy {:.4%}".format(self.total, self.elapsed, self.accuracy), "", "Per verb class:"]
+        for verb_class, (correct, total) in self.per_class.items():
+            lines.append("  {:<12} {:>8}/{:<8} {:.4%}".format(verb_class.name, correct, total, float(correct) / total))
+        lines += ["", "Per form:"]
+        for label, (correct, total) in self.per_form.items():
+            lines.append("  {:<28} {:>8}/{:<8} {:.4%}".format(label, correct, total, float(correct) / total))
+        if self.mismatches:
+            lines += ["", "First {} of {} mismatches:".format(len(self.mismatches), self.num_mismatches)]
+            for mismatch in self.mismatches:
+                lines.append("  {} ({}) {}: expected {!r}, got {!r}".format(mismatch.verb, mismatch.verb_class.name, mismatch.label, mismatch.expected, mismatch.actual))
+        return "\n".join(lines)
+
+def verify_golden_corpus(entries=None, generator=None, max_mismatches=50):
+    '''Conjugate every verb of a golden corpus into its full paradigm and compare
+    the results with the expected surfaces. Columns missing from the corpus are
+    skipped, so older corpus files stay usable as forms are added.
+
+    Args:
+        entries (:obj: list, optional): GoldenEntry records. Defaults to the
+            entries of DEFAULT_GOLDEN_CORPUS_PATH.
+        generator (:obj: JapaneseVerbFormGenerator, optional): generator under test.
+            Defaults to a new JapaneseVerbFormGenerator.
+        max_mismatches (:obj: int, optional): number of mismatches kept in the
+            report. Defaults to 50.
+
+    Returns:
+        GoldenCorpusReport: accuracy per form and per verb class
+    '''
+    if entries is None:
+        entries = load_golden_corpus()
+    if generator is None:
+        generator = JapaneseVerbFormGenerator()
+
+    labels = {signature: signature_label(signature) for signature in PARADIGM_SIGNATURES}
+    report = GoldenCorpusReport(max_mismatches)
+    start = time.perf_counter()
+    for entry in entries:
+        for form, tense, formality, polarity, surface in generate_paradigm(generator, entry.verb, entry.verb_class):
+            label = labels[(form, tense, formality, polarity)]
+            if label in entry.expected:
+                report.record(entry.verb, entry.verb_class, label, entry.expected[label], surface)
+    report.elapsed = time.perf_counter() - start
+    return report
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Verify conjugations against the golden corpus.")
+    parser.add_argument("path", nargs="?", default=DEFAULT_GOLDEN_CORPUS_PATH, help="golden corpus file")
+    parser.add_argument("--mismatches", type=int, default=50, help="number of mismatches to list")
+    args = parser.parse_args(argv)
+
+    report = verify_golden_corpus(load_golden_corpus(args.path), max_mismatches=args.mismatches)
+    print(report.format())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,276 @@
+import argparse
+import collections
+
+# Local modules
+from .constants.EnumeratedTypes import Formality, Polarity, Tense, VerbClass, VerbForm
+
+from .Decorators import raise_for_error_code, validate_verb
+from .Exceptions import VALID_VERB
+from .IrregularVerbTables import conjugate_irregular_verb
+from .JapaneseVerbFormGenerator import JapaneseVerbFormGenerator
+from .Paradigm import FORMALITY_FORMS, GENERATOR_METHOD_NAMES, PARADIGM_SIGNATURES, TENSE_FORMS, conjugate_form
+from .Profiling import best_time
+
+# ---------------------------------------------------------- #
+#                       PACKED FORM IDS                      #
+# ---------------------------------------------------------- #
+# a form ID packs the enum values of a paradigm signature into one int:
+# form << 6 | tense << 4 | formality << 2 | polarity, with 0 for None
+FORM_SHIFT = 6
+TENSE_SHIFT = 4
+FORMALITY_SHIFT = 2
+FIELD_MASK = 3
+
+def pack_form_id(form, tense=0, formality=0, polarity=0):
+    '''Pack the integer codes of a paradigm signature into a form ID
+
+    Args:
+        form (int): VerbForm value
+        tense (:obj: int, optional): Tense value, 0 if unused. Defaults to 0.
+        formality (:obj: int, optional): Formality value, 0 if unused. Defaults to 0.
+        polarity (:obj: int, optional): Polarity value, 0 if unused. Defaults to 0.
+
+    Returns:
+        int: packed form ID
+    '''
+    return form << FORM_SHIFT | tense << TENSE_SHIFT | formality << FORMALITY_SHIFT | polarity
+
+def unpack_form_id(form_id):
+    '''Split a form ID into its integer codes
+
+    Args:
+        form_id (int): packed form ID
+
+    Returns:
+        tuple: (form, tense, formality, polarity) codes, 0 for unused parameters
+    '''
+    return (form_id >> FORM_SHIFT, form_id >> TENSE_SHIFT & FIELD_MASK, form_id >> FORMALITY_SHIFT & FIELD_MASK, form_id & FIELD_MASK)
+
+def _enum_code(member):
+    return 0 if member is None else member.value
+
+def signature_form_id(signature):
+    '''Form ID of a (form, tense, formality, polarity) signature of Enum members
+
+    Args:
+        signature (tuple): entry of Paradigm.PARADIGM_SIGNATURES
+
+    Returns:
+        int: packed form ID
+    '''
+    return pack_form_id(*[_enum_code(member) for member in signature])
+
+# form IDs of every signature, in paradigm order
+PARADIGM_FORM_IDS = tuple(signature_form_id(signature) for signature in PARADIGM_SIGNATURES)
+MAX_FORM_ID = max(PARADIGM_FORM_IDS)
+MAX_VERB_CLASS = max(verb_class.value for verb_class in VerbClass)
+
+# ---------------------------------------------------------- #
+#                         JUMP TABLE                         #
+# ---------------------------------------------------------- #
+# each routine conjugates a verb into one signature for one verb class. The
+# enum arguments are bound when the table is built, so a call makes the same
+# PositiveVerbForms / NegativeVerbForms or irregular table call as the
+# generate_* methods without building or comparing any Enum member.
+def _irregular_routine(form, tense, formality, polarity):
+    def conjugate(verb):
+        return conjugate_irregular_verb(verb, form, tense, formality, polarity)
+    return conjugate
+
+def _parameterized_routine(method, verb_class, parameter):
+    def conjugate(verb):
+        return method(verb, verb_class, parameter)
+    return conjugate
+
+def _unparameterized_routine(method, verb_class):
+    def conjugate(verb):
+        return method(verb, verb_class)
+    return conjugate
+
+def build_jump_table(generator):
+    '''Build the routines of every signature and verb class
+
+    Args:
+        generator (JapaneseVerbFormGenerator): generator whose PositiveVerbForms
+            and NegativeVerbForms conjugate regular verbs
+
+    Returns:
+        list: indexed by form ID, None for IDs outside the paradigm. Each entry
+            is a tuple of routines indexed by VerbClass value, index 0 is None.
+    '''
+    jump_table = [None] * (MAX_FORM_ID + 1)
+    for signature, form_id in zip(PARADIGM_SIGNATURES, PARADIGM_FORM_IDS):
+        form, tense, formality, polarity = signature
+        verb_forms = generator.negativeVerbForms if polarity == Polarity.NEGATIVE else generator.positiveVerbForms
+        method = getattr(verb_forms, GENERATOR_METHOD_NAMES[form])
+        routines = [None] * (MAX_VERB_CLASS + 1)
+        for verb_class in VerbClass:
+            if verb_class == VerbClass.IRREGULAR:
+                routine = _irregular_routine(form, tense, formality, polarity)
+            elif form in TENSE_FORMS:
+                routine = _parameterized_routine(method, verb_class, tense)
+            elif form in FORMALITY_FORMS:
+                routine = _parameterized_routine(method, verb_class, formality)
+            else:
+                routine = _unparameterized_routine(method, verb_class)
+            routines[verb_class.value] = routine
+        jump_table[form_id] = tuple(routines)
+    return jump_table
+
+class IntegerConjugator:
+    ''' Conjugates verbs from plain integer codes instead of Enum members, for
+    batch clients that store forms as integers. A form is either a packed form
+    ID (see pack_form_id) or separate form, tense, formality and polarity codes,
+    and the verb class is its VerbClass value. Each call is two list lookups
+    into a jump table and one call of a prebuilt routine.
+
+    Results match the generate_* methods of JapaneseVerbFormGenerator, but the
+    generator's cache is not consulted.
+    '''
+    def __init__(self, generator=None):
+        ''' Args:
+            generator (:obj: JapaneseVerbFormGenerator, optional): generator whose
+                verb forms are dispatched to. Defaults to a new generator.
+        '''
+        self.generator = JapaneseVerbFormGenerator() if generator is None else generator
+        self.jump_table = build_jump_table(self.generator)
+
+    def conjugate(self, verb, verb_class, form_id, validate=True):
+        '''Conjugate a verb into the form of a packed form ID
+
+        Args:
+            verb (str): Japanese verb in kana, might contain kanji
+            verb_class (int): VerbClass value of the verb
+            form_id (int): packed form ID
+            validate (:obj: bool, optional): validate the verb like the
+                generate_* methods. Defaults to True.
+
+        Returns:
+            str: conjugated verb
+
+        Raises:
+            ValueError: if the form ID or verb class is not part of the paradigm
+            InvalidJapaneseVerbException: if validation fails
+        '''
+        if validate:
+            error_code = validate_verb(verb)
+            if error_code != VALID_VERB:
+                raise_for_error_code(verb, error_code)
+        return self.routine(verb_class, form_id)(verb)
+
+    def routine(self, verb_class, form_id):
+        '''Look up the jump table routine of a verb class and form ID
+
+        Args:
+            verb_class (int): VerbClass value of the verb
+            form_id (int): packed form ID
+
+        Returns:
+            callable: conjugates a verb without validating it
+
+        Raises:
+            ValueError: if the form ID or verb class is not part of the paradigm
+        '''
+        routine = None
+        if form_id >= 0 and verb_class >= 0:
+            try:
+                routine = self.jump_table[form_id][verb_class]
+            except (IndexError, TypeError):
+                pass
+        if routine is None:
+            raise ValueError("Unknown form ID or verb class", form_id, verb_class)
+        return routine
+
+    def conjugate_codes(self, verb, verb_class, form, tense=0, formality=0, polarity=0, validate=True):
+        '''Conjugate a verb from separate integer codes
+
+        Args:
+            verb (str): Japanese verb in kana, might contain kanji
+            verb_class (int): VerbClass value of the verb
+            form (int): VerbForm value
+            tense (:obj: int, optional): Tense value, 0 if unused. Defaults to 0.
+            formality (:obj: int, optional): Formality value, 0 if unused. Defaults to 0.
+            polarity (:obj: int, optional): Polarity value, 0 if unused. Defaults to 0.
+            validate (:obj: bool, optional): validate the verb like the
+                generate_* methods. Defaults to True.
+
+        Returns:
+            str: conjugated verb
+        '''
+        return self.conjugate(verb, verb_class, form << FORM_SHIFT | tense << TENSE_SHIFT | formality << FORMALITY_SHIFT | polarity, validate)
+
+    def conjugate_many(self, rows, validate=True):
+        '''Conjugate many (verb, verb_class, form_id) rows
+
+        Args:
+            rows (iterable): (verb, verb_class, form_id) integer rows
+            validate (:obj: bool, optional): validate every verb like the
+                generate_* methods. Defaults to True.
+
+        Returns:
+            list: conjugated verbs in row order
+        '''
+        routine = self.routine
+        results = []
+        for verb, verb_class, form_id in rows:
+            if validate:
+                error_code = validate_verb(verb)
+                if error_code != VALID_VERB:
+                    raise_for_error_code(verb, error_code)
+            results.append(routine(verb_class, form_id)(verb))
+        return results
+
+# ---------------------------------------------------------- #
+#                          BENCHMARK                         #
+# ---------------------------------------------------------- #
+IntegerBenchmark = collections.namedtuple("IntegerBenchmark", ["enum_from_codes", "enum_prebuilt", "integer"])
+
+def benchmark_integer_path(verbs, repeat=3):
+    '''Time the full paradigm of each verb through the Enum-based generate_*
+    methods and through IntegerConjugator
+
+    Args:
+        verbs (list): (verb, verb_class) pairs
+        repeat (:obj: int, optional): number of timed passes, the fastest is kept.
+            Defaults to 3.
+
+    Returns:
+        IntegerBenchmark: seconds per form when the Enum members are rebuilt
+            from stored codes for every row, when they are built beforehand,
+            and through IntegerConjugator from the stored codes
+    '''
+    generator = JapaneseVerbFormGenerator()
+    conjugator = IntegerConjugator(generator)
+    rows = [(verb, verb_class.value, form_id) for verb, verb_class in verbs for form_id in PARADIGM_FORM_IDS]
+    enum_rows = [(verb, verb_class) + signature for verb, verb_class in verbs for signature in PARADIGM_SIGNATURES]
+    enum_types = (VerbForm, Tense, Formality, Polarity)
+
+    def enum_from_codes_pass():
+        for verb, verb_class, form_id in rows:
+            members = [enum_type(code) if code else None for enum_type, code in zip(enum_types, unpack_form_id(form_id))]
+            conjugate_form(generator, verb, VerbClass(verb_class), *members)
+
+    def enum_prebuilt_pass():
+        for row in enum_rows:
+            conjugate_form(generator, *row)
+
+    def integer_pass():
+        conjugator.conjugate_many(rows)
+
+    timings = [best_time(timed_pass, repeat) / len(rows) for timed_pass in (enum_from_codes_pass, enum_prebuilt_pass, integer_pass)]
+    return IntegerBenchmark(*timings)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the integer conjugation fast path against the Enum-based API.")
+    parser.add_argument("--verbs", type=int, default=300, help="number of golden corpus verbs to conjugate")
+    parser.add_argument("--repeat", type=int, default=3, help="number of timed passes")
+    args = parser.parse_args(argv)
+
+    from .GoldenCorpus import load_golden_corpus
+    verbs = [(entry.verb, entry.verb_class) for entry in load_golden_corpus()[:args.verbs]]
+    result = benchmark_integer_path(verbs, args.repeat)
+    for name, seconds in zip(result._fields, result):
+        print("{:<16}{:.2f}us/form ({:.2f}x)".format(name, seconds * 1e6, result.enum_from_codes / seconds))
+
+if __name__ == "__main__":
+    main()
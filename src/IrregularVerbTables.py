@@ -0,0 +1,56 @@
+# Local modules
+from .constants.EnumeratedTypes import Polarity, VerbClass
+
+from .Utils import IRREGULAR_VERB_ENDINGS
+from .Paradigm import PARADIGM_SIGNATURES, conjugate_with_verb_forms
+from .PositiveVerbFormGenerator import PositiveVerbForms
+from .NegativeVerbFormGenerator import NegativeVerbForms
+
+# ---------------------------------------------------------- #
+#                IRREGULAR VERB ENDING TABLES                #
+# ---------------------------------------------------------- #
+def build_irregular_conjugation_table():
+    ''' Precompute the ending of every irregular verb conjugation. Irregular verbs
+    only change their last two kana, so conjugating the bare irregular verb (する,
+    くる, 来る) through PositiveVerbForms / NegativeVerbForms yields the ending
+    that is attached to the stem of any compound verb (勉強する, 持ってくる).
+
+    Returns:
+        dict: (irregular verb ending, form, tense, formality, polarity) -> ending.
+            Unsupported conjugations map to None.
+    '''
+    verb_forms = {
+        Polarity.POSITIVE: PositiveVerbForms(),
+        Polarity.NEGATIVE: NegativeVerbForms(),
+        None: PositiveVerbForms(),
+    }
+    table = {}
+    for irregular_ending in IRREGULAR_VERB_ENDINGS:
+        for form, tense, formality, polarity in PARADIGM_SIGNATURES:
+            ending = conjugate_with_verb_forms(verb_forms[polarity], irregular_ending, VerbClass.IRREGULAR, form, tense, formality)
+            table[(irregular_ending, form, tense, formality, polarity)] = ending
+    return table
+
+IRREGULAR_CONJUGATION_TABLE = build_irregular_conjugation_table()
+
+def conjugate_irregular_verb(verb, form, tense=None, formality=None, polarity=None):
+    ''' Conjugate a suru or kuru verb with one split and one table lookup
+
+    Args:
+        verb (str): Japanese verb in kana, might contain kanji
+        form (enum): VerbForm Enum representing the conjugation form
+        tense (:obj: enum, optional): Tense Enum, only used by tense forms.
+            Defaults to None.
+        formality (:obj: enum, optional): Formality Enum, only used by formality
+            forms. Defaults to None.
+        polarity (:obj: enum, optional): Polarity Enum, unused by the -te form.
+            Defaults to None.
+
+    Returns:
+        str: conjugated verb, or None if the verb is not a suru / kuru verb or
+            the conjugation is not supported
+    '''
+    ending = IRREGULAR_CONJUGATION_TABLE.get((verb[-2:], form, tense, formality, polarity))
+    if ending is None:
+        return None
+    return "{}{}".format(verb[:-2], ending)
@@ -0,0 +1,120 @@
+# Local modules
+from .constants.EnumeratedTypes import Polarity
+
+from .Decorators import validateJapaneseAdjectiveDecorator
+from .PositiveAdjectiveFormGenerator import PositiveAdjectiveForms
+from .NegativeAdjectiveFormGenerator import NegativeAdjectiveForms
+
+
+class JapaneseAdjectiveFormGenerator():
+    def __init__(self):
+        self.positiveAdjectiveForms = PositiveAdjectiveForms()
+        self.negativeAdjectiveForms = NegativeAdjectiveForms()
+
+    @validateJapaneseAdjectiveDecorator
+    def generate_plain_form(self, adjective, adjective_class, tense, polarity):
+        '''Generate the plain form of the adjective depending on the tense and
+        polarity.
+
+        Args:
+            adjective (str): Japanese adjective in kana, might contain kanji
+            adjective_class (enum): AdjectiveClass Enum representing the adjective
+                class to which the adjective belongs
+            tense (enum): Tense Enum representing the tense for the conjugated adjective
+            polarity (enum): Polarity Enum representing the polarity for the
+                conjugated adjective
+
+        Returns:
+            str: plain form of the adjective based on the tense and polarity
+        parameters
+        '''
+        if polarity == Polarity.POSITIVE:
+            return self.positiveAdjectiveForms.generate_plain_form(adjective, adjective_class, tense)
+        return self.negativeAdjectiveForms.generate_plain_form(adjective, adjective_class, tense)
+
+    @validateJapaneseAdjectiveDecorator
+    def generate_polite_form(self, adjective, adjective_class, tense, polarity):
+        '''Generate the polite form of the adjective depending on the tense and
+        polarity.
+
+        Args:
+            adjective (str): Japanese adjective in kana, might contain kanji
+            adjective_class (enum): AdjectiveClass Enum representing the adjective
+                class to which the adjective belongs
+            tense (enum): Tense Enum representing the tense for the conjugated adjective
+            polarity (enum): Polarity Enum representing the polarity for the
+                conjugated adjective
+
+        Returns:
+            str: polite form of the adjective based on the tense and polarity
+        parameters
+        '''
+        if polarity == Polarity.POSITIVE:
+            return self.positiveAdjectiveForms.generate_polite_form(adjective, adjective_class, tense)
+        return self.negativeAdjectiveForms.generate_polite_form(adjective, adjective_class, tense)
+
+    @validateJapaneseAdjectiveDecorator
+    def generate_te_form(self, adjective, adjective_class):
+        '''Generate the -te form of the adjective
+
+        Args:
+            adjective (str): Japanese adjective in kana, might contain kanji
+            adjective_class (enum): AdjectiveClass Enum representing the adjective
+                class to which the adjective belongs
+
+        Returns:
+            str: -te form of the adjective
+        '''
+        return self.positiveAdjectiveForms.generate_te_form(adjective, adjective_class)
+
+    @validateJapaneseAdjectiveDecorator
+    def generate_adverbial_form(self, adjective, adjective_class):
+        '''Generate the adverbial (-ku / -ni) form of the adjective
+
+        Args:
+            adjective (str): Japanese adjective in kana, might contain kanji
+            adjective_class (enum): AdjectiveClass Enum representing the adjective
+                class to which the adjective belongs
+
+        Returns:
+            str: adverbial form of the adjective
+        '''
+        return self.positiveAdjectiveForms.generate_adverbial_form(adjective, adjective_class)
+
+    @validateJapaneseAdjectiveDecorator
+    def generate_conditional_form(self, adjective, adjective_class, polarity):
+        '''Generate the conditional (-tara) form of the adjective depending on
+        the polarity.
+
+        Args:
+            adjective (str): Japanese adjective in kana, might contain kanji
+            adjective_class (enum): AdjectiveClass Enum representing the adjective
+                class to which the adjective belongs
+            polarity (enum): Polarity Enum representing the polarity for the
+                conjugated adjective
+
+        Returns:
+            str: conditional form of the adjective based on the polarity parameter
+        '''
+        if polarity == Polarity.POSITIVE:
+            return self.positiveAdjectiveForms.generate_conditional_form(adjective, adjective_class)
+        return self.negativeAdjectiveForms.generate_conditional_form(adjective, adjective_class)
+
+    @validateJapaneseAdjectiveDecorator
+    def generate_provisional_form(self, adjective, adjective_class, polarity):
+        '''Generate the provisional (-ba / nara) form of the adjective depending
+        on the polarity.
+
+        Args:
+            adjective (str): Japanese adjective in kana, might contain kanji
+            adjective_class (enum): AdjectiveClass Enum representing the adjective
+                class to which the adjective belongs
+            polarity (enum): Polarity Enum representing the polarity for the
+                conjugated adjective
+
+        Returns:
+            str: provisional form of the adjective based on the polarity parameter
+        '''
+        if polarity == Polarity.POSITIVE:
+            return self.positiveAdjectiveForms.generate_provisional_form(adjective, adjective_class)
+        return self.negativeAdjectiveForms.generate_provisional_form(adjective, adjective_class)
@@ -1,16 +1,29 @@
 # Local modules
-from .constants.EnumeratedTypes import Polarity
+from .constants.EnumeratedTypes import Polarity, VerbClass, VerbForm
 
-from .Decorators import validateJapaneseVerbDecorator
+from .Decorators import cacheConjugationDecorator, validateJapaneseVerbDecorator
+from .IrregularVerbTables import conjugate_irregular_verb
+from .Paradigm import EXTENDED_SIGNATURES
 from .PositiveVerbFormGenerator import PositiveVerbForms
 from .NegativeVerbFormGenerator import NegativeVerbForms
+from .Utils import EXTENDED_FORM_AFFIXES, verb_stems
+
+# (signature, affixes) in paradigm order, used by generate_extended_forms
+_EXTENDED_FORM_AFFIXES = tuple((signature, EXTENDED_FORM_AFFIXES[signature]) for signature in EXTENDED_SIGNATURES)
 
 
 class JapaneseVerbFormGenerator():
-    def __init__(self):
+    def __init__(self, cache=None):
+        ''' Args:
+            cache (:obj: LocalConjugationCache | SharedConjugationCache, optional):
+                cache of conjugation results consulted by every generate_* method.
+                Defaults to None, which disables caching.
+        '''
         self.positiveVerbForms = PositiveVerbForms()
         self.negativeVerbForms = NegativeVerbForms()
+        self.cache = cache
 
+    @cacheConjugationDecorator(VerbForm.PLAIN)
     @validateJapaneseVerbDecorator
     def generate_plain_form(self, verb, verb_class, tense, polarity):
         '''Generate the plain form of the verb depending on the tense and 
@@ -28,10 +41,13 @@ class JapaneseVerbFormGenerator():
             str: plain form of the verb based on the tense and polarity
         parameters
         '''
+        if verb_class == VerbClass.IRREGULAR:
+            return conjugate_irregular_verb(verb, VerbForm.PLAIN, tense=tense, polarity=polarity)
         if polarity == Polarity.POSITIVE:
             return self.positiveVerbForms.generate_plain_form(verb, verb_class, tense)
         return self.negativeVerbForms.generate_plain_form(verb, verb_class, tense)
 
+    @cacheConjugationDecorator(VerbForm.POLITE)
     @validateJapaneseVerbDecorator
     def generate_polite_form(self, verb, verb_class, tense, polarity):
         '''Generate the polite form of the verb depending on the tense and 
@@ -49,10 +65,13 @@ class JapaneseVerbFormGenerator():
             str: polite form of the verb based on the tense and polarity
         parameters
         '''
+        if verb_class == VerbClass.IRREGULAR:
+            return conjugate_irregular_verb(verb, VerbForm.POLITE, tense=tense, polarity=polarity)
         if polarity == Polarity.POSITIVE:
             return self.positiveVerbForms.generate_polite_form(verb, verb_class, tense)
         return self.negativeVerbForms.generate_polite_form(verb, verb_class, tense)
 
+    @cacheConjugationDecorator(VerbForm.TE)
     @validateJapaneseVerbDecorator
     def generate_te_form(self, verb, verb_class):
         '''Utilize base_te_ta_form function to generate the -te form 
@@ -66,8 +85,11 @@ class JapaneseVerbFormGenerator():
         Returns:
             str: -te form of the verb
         '''
+        if verb_class == VerbClass.IRREGULAR:
+            return conjugate_irregular_verb(verb, VerbForm.TE)
         return self.positiveVerbForms.generate_te_form(verb, verb_class)
 
+    @cacheConjugationDecorator(VerbForm.CONDITIONAL)
     @validateJapaneseVerbDecorator
     def generate_conditional_form(self, verb, verb_class, formality, polarity):
         '''Generate the conditional form of the verb depending on the formality.
@@ -85,10 +107,13 @@ class JapaneseVerbFormGenerator():
             str: conditional form of the verb based on the formality and polarity 
         parameters
         '''
+        if verb_class == VerbClass.IRREGULAR:
+            return conjugate_irregular_verb(verb, VerbForm.CONDITIONAL, formality=formality, polarity=polarity)
         if polarity == Polarity.POSITIVE:
             return self.positiveVerbForms.generate_conditional_form(verb, verb_class, formality)
         return self.negativeVerbForms.generate_conditional_form(verb, verb_class, formality)
 
+    @cacheConjugationDecorator(VerbForm.VOLITIONAL)
     @validateJapaneseVerbDecorator
     def generate_volitional_form(self, verb, verb_class, formality, polarity):
         '''Generate the volitional form of the verb depending on the formality. 
@@ -106,10 +131,13 @@ class JapaneseVerbFormGenerator():
             str: volitional form of the verb based on the formality and polarity 
         parameters
         '''        
+        if verb_class == VerbClass.IRREGULAR:
+            return conjugate_irregular_verb(verb, VerbForm.VOLITIONAL, formality=formality, polarity=polarity)
         if polarity == Polarity.POSITIVE:
             return self.positiveVerbForms.generate_volitional_form(verb, verb_class, formality)
         return self.negativeVerbForms.generate_volitional_form(verb, verb_class, formality)
 
+    @cacheConjugationDecorator(VerbForm.POTENTIAL)
     @validateJapaneseVerbDecorator
     def generate_potential_form(self, verb, verb_class, formality, polarity):
         '''Generate the potential form of the verb depending on the formality.
@@ -127,10 +155,13 @@ class JapaneseVerbFormGenerator():
             str: potential form of the verb based on the formality and polarity 
         parameters
         '''
+        if verb_class == VerbClass.IRREGULAR:
+            return conjugate_irregular_verb(verb, VerbForm.POTENTIAL, formality=formality, polarity=polarity)
         if polarity == Polarity.POSITIVE:
             return self.positiveVerbForms.generate_potential_form(verb, verb_class, formality)
         return self.negativeVerbForms.generate_potential_form(verb, verb_class, formality)
 
+    @cacheConjugationDecorator(VerbForm.IMPERATIVE)
     @validateJapaneseVerbDecorator
     def generate_imperative_form(self, verb, verb_class, formality, polarity):
         '''Generate the imperative form of the verb depending on the formality.
@@ -148,10 +179,13 @@ class JapaneseVerbFormGenerator():
             str: imperative form of the verb based on the formality and polarity 
         parameters
         '''
+        if verb_class == VerbClass.IRREGULAR:
+            return conjugate_irregular_verb(verb, VerbForm.IMPERATIVE, formality=formality, polarity=polarity)
         if polarity == Polarity.POSITIVE:
             return self.positiveVerbForms.generate_imperative_form(verb, verb_class, formality)
         return self.negativeVerbForms.generate_imperative_form(verb, verb_class, formality)
 
+    @cacheConjugationDecorator(VerbForm.PROVISIONAL)
     @validateJapaneseVerbDecorator
     def generate_provisional_form(self, verb, verb_class, formality, polarity):
         '''Generate the provisional form of the verb depending on the formality.
@@ -169,10 +203,13 @@ class JapaneseVerbFormGenerator():
             str: provisional form of the verb based on the formality and polarity 
         parameters
         '''
+        if verb_class == VerbClass.IRREGULAR:
+            return conjugate_irregular_verb(verb, VerbForm.PROVISIONAL, formality=formality, polarity=polarity)
         if polarity == Polarity.POSITIVE:
             return self.positiveVerbForms.generate_provisional_form(verb, verb_class, formality)
         return self.negativeVerbForms.generate_provisional_form(verb, verb_class, formality)
 
+    @cacheConjugationDecorator(VerbForm.CAUSATIVE)
     @validateJapaneseVerbDecorator
     def generate_causative_form(self, verb, verb_class, formality, polarity):
         '''Generate the causative form of the verb depending on the formality.
@@ -190,10 +227,13 @@ class JapaneseVerbFormGenerator():
             str: causative form of the verb based on the formality and polarity 
         parameters
         '''
+        if verb_class == VerbClass.IRREGULAR:
+            return conjugate_irregular_verb(verb, VerbForm.CAUSATIVE, formality=formality, polarity=polarity)
         if polarity == Polarity.POSITIVE:
             return self.positiveVerbForms.generate_causative_form(verb, verb_class, formality)
         return self.negativeVerbForms.generate_causative_form(verb, verb_class, formality)
 
+    @cacheConjugationDecorator(VerbForm.PASSIVE)
     @validateJapaneseVerbDecorator
     def generate_passive_form(self, verb, verb_class, formality, polarity):
         '''Generate the passive form of the verb depending on the formality.
@@ -211,6 +251,177 @@ class JapaneseVerbFormGenerator():
             str: passive form of the verb based on the formality and polarity 
         parameters
         '''
+        if verb_class == VerbClass.IRREGULAR:
+            return conjugate_irregular_verb(verb, VerbForm.PASSIVE, formality=formality, polarity=polarity)
         if polarity == Polarity.POSITIVE:
             return self.positiveVerbForms.generate_passive_form(verb, verb_class, formality)
         return self.negativeVerbForms.generate_passive_form(verb, verb_class, formality)
+
+    @cacheConjugationDecorator(VerbForm.DESIRE)
+    @validateJapaneseVerbDecorator
+    def generate_desire_form(self, verb, verb_class, formality, polarity):
+        '''Generate the desire (-tai) form of the verb depending on the formality.
+
+        Args:
+            verb (str): Japanese verb in kana, might contain kanji
+            verb_class (enum): VerbClass Enum representing the verb class
+                to which the verb belongs
+            formality (enum): Formality Enum representing the formality class
+                for the conjugated verb
+            polarity (enum): Polarity Enum representing the polarity for the
+                conjugated verb
+
+        Returns:
+            str: desire (-tai) form of the verb based on the formality and polarity
+        parameters
+        '''
+        if verb_class == VerbClass.IRREGULAR:
+            return conjugate_irregular_verb(verb, VerbForm.DESIRE, formality=formality, polarity=polarity)
+        if polarity == Polarity.POSITIVE:
+            return self.positiveVerbForms.generate_desire_form(verb, verb_class, formality)
+        return self.negativeVerbForms.generate_desire_form(verb, verb_class, formality)
+
+    @cacheConjugationDecorator(VerbForm.SOU)
+    @validateJapaneseVerbDecorator
+    def generate_sou_form(self, verb, verb_class, formality, polarity):
+        '''Generate the appearance (-sou) form of the verb depending on the formality.
+
+        Args:
+            verb (str): Japanese verb in kana, might contain kanji
+            verb_class (enum): VerbClass Enum representing the verb class
+                to which the verb belongs
+            formality (enum): Formality Enum representing the formality class
+                for the conjugated verb
+            polarity (enum): Polarity Enum representing the polarity for the
+                conjugated verb
+
+        Returns:
+            str: appearance (-sou) form of the verb based on the formality and polarity
+        parameters
+        '''
+        if verb_class == VerbClass.IRREGULAR:
+            return conjugate_irregular_verb(verb, VerbForm.SOU, formality=formality, polarity=polarity)
+        if polarity == Polarity.POSITIVE:
+            return self.positiveVerbForms.generate_sou_form(verb, verb_class, formality)
+        return self.negativeVerbForms.generate_sou_form(verb, verb_class, formality)
+
+    @cacheConjugationDecorator(VerbForm.NAGARA)
+    @validateJapaneseVerbDecorator
+    def generate_nagara_form(self, verb, verb_class):
+        '''Generate the -nagara form of the verb
+
+        Args:
+            verb (str): Japanese verb in kana, might contain kanji
+            verb_class (enum): VerbClass Enum representing the verb class
+                to which the verb belongs
+
+        Returns:
+            str: -nagara form of the verb
+        '''
+        if verb_class == VerbClass.IRREGULAR:
+            return conjugate_irregular_verb(verb, VerbForm.NAGARA)
+        return self.positiveVerbForms.generate_nagara_form(verb, verb_class)
+
+    @cacheConjugationDecorator(VerbForm.ZU)
+    @validateJapaneseVerbDecorator
+    def generate_zu_form(self, verb, verb_class):
+        '''Generate the -zu form of the verb
+
+        Args:
+            verb (str): Japanese verb in kana, might contain kanji
+            verb_class (enum): VerbClass Enum representing the verb class
+                to which the verb belongs
+
+        Returns:
+            str: -zu form of the verb
+        '''
+        if verb_class == VerbClass.IRREGULAR:
+            return conjugate_irregular_verb(verb, VerbForm.ZU)
+        return self.positiveVerbForms.generate_zu_form(verb, verb_class)
+
+    @cacheConjugationDecorator(VerbForm.TARI)
+    @validateJapaneseVerbDecorator
+    def generate_tari_form(self, verb, verb_class):
+        '''Generate the -tari form of the verb
+
+        Args:
+            verb (str): Japanese verb in kana, might contain kanji
+            verb_class (enum): VerbClass Enum representing the verb class
+                to which the verb belongs
+
+        Returns:
+            str: -tari form of the verb
+        '''
+        if verb_class == VerbClass.IRREGULAR:
+            return conjugate_irregular_verb(verb, VerbForm.TARI)
+        return self.positiveVerbForms.generate_tari_form(verb, verb_class)
+
+    @cacheConjugationDecorator(VerbForm.HONORIFIC)
+    @validateJapaneseVerbDecorator
+    def generate_honorific_form(self, verb, verb_class, formality, polarity):
+        '''Generate the honorific form of the verb depending on the formality.
+
+        Args:
+            verb (str): Japanese verb in kana, might contain kanji
+            verb_class (enum): VerbClass Enum representing the verb class
+                to which the verb belongs
+            formality (enum): Formality Enum representing the formality class
+                for the conjugated verb
+            polarity (enum): Polarity Enum representing the polarity for the
+                conjugated verb
+
+        Returns:
+            str: honorific form of the verb based on the formality and polarity
+        parameters
+        '''
+        if verb_class == VerbClass.IRREGULAR:
+            return conjugate_irregular_verb(verb, VerbForm.HONORIFIC, formality=formality, polarity=polarity)
+        if polarity == Polarity.POSITIVE:
+            return self.positiveVerbForms.generate_honorific_form(verb, verb_class, formality)
+        return self.negativeVerbForms.generate_honorific_form(verb, verb_class, formality)
+
+    @cacheConjugationDecorator(VerbForm.HUMBLE)
+    @validateJapaneseVerbDecorator
+    def generate_humble_form(self, verb, verb_class, formality, polarity):
+        '''Generate the humble form of the verb depending on the formality.
+
+        Args:
+            verb (str): Japanese verb in kana, might contain kanji
+            verb_class (enum): VerbClass Enum representing the verb class
+                to which the verb belongs
+            formality (enum): Formality Enum representing the formality class
+                for the conjugated verb
+            polarity (enum): Polarity Enum representing the polarity for the
+                conjugated verb
+
+        Returns:
+            str: humble form of the verb based on the formality and polarity
+        parameters
+        '''
+        if verb_class == VerbClass.IRREGULAR:
+            return conjugate_irregular_verb(verb, VerbForm.HUMBLE, formality=formality, polarity=polarity)
+        if polarity == Polarity.POSITIVE:
+            return self.positiveVerbForms.generate_humble_form(verb, verb_class, formality)
+        return self.negativeVerbForms.generate_humble_form(verb, verb_class, formality)
+
+    @validateJapaneseVerbDecorator
+    def generate_extended_forms(self, verb, verb_class):
+        '''Generate every desire, appearance, -nagara, -zu, -tari, honorific
+        and humble form of the verb at once. The stems they share are computed
+        once, so each form costs a single concatenation.
+
+        Args:
+            verb (str): Japanese verb in kana, might contain kanji
+            verb_class (enum): VerbClass Enum representing the verb class
+                to which the verb belongs
+
+        Returns:
+            list: (form, tense, formality, polarity, surface) for each entry of
+                Paradigm.EXTENDED_SIGNATURES
+        '''
+        if verb_class == VerbClass.IRREGULAR:
+            return [(form, tense, formality, polarity, conjugate_irregular_verb(verb, form, tense, formality, polarity))
+                for form, tense, formality, polarity in EXTENDED_SIGNATURES]
+        stems = verb_stems(verb, verb_class)
+        return [(form, tense, formality, polarity, "{}{}{}".format(prefix, stems[stem_index], ending))
+            for (form, tense, formality, polarity), (prefix, stem_index, ending) in _EXTENDED_FORM_AFFIXES]
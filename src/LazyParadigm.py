@@ -0,0 +1,266 @@
+import argparse
+import collections
+
+# Local modules
+from .constants.EnumeratedTypes import VerbClass
+from .constants.ParticleConstants import DA_PARTICLE, DE_PARTICLE, TA_PARTICLE, TE_PARTICLE
+
+from .Decorators import raise_for_error_code, validate_verb
+from .Exceptions import VALID_VERB
+from .JapaneseVerbFormGenerator import JapaneseVerbFormGenerator
+from .Paradigm import PARADIGM_SIGNATURES, conjugate_form, generate_paradigm, signature_name
+from .Profiling import best_time
+from .SpecializedConjugators import IRREGULAR_ENDING_KEYS, PROBE_STEMS, REGULAR_ENDING_KEYS, specialized_function
+from .Utils import base_masu_form, base_nai_form, base_te_ta_form, generate_nai_form, map_dictionary_to_e_ending, map_dictionary_to_o_ending, splice_verb
+
+# ---------------------------------------------------------- #
+#                   SHARED INTERMEDIATES                     #
+# ---------------------------------------------------------- #
+def _stem(verb, verb_class):
+    return splice_verb(verb, verb_class)
+
+def _a_base(verb, verb_class):
+    return base_nai_form(verb, verb_class, "")
+
+def _i_base(verb, verb_class):
+    return base_masu_form(verb, verb_class, "")
+
+def _e_base(verb, verb_class):
+    if verb_class == VerbClass.GODAN:
+        return map_dictionary_to_e_ending(verb)
+    elif verb_class == VerbClass.IRREGULAR:
+        return None
+    return splice_verb(verb, verb_class)
+
+def _o_base(verb, verb_class):
+    if verb_class == VerbClass.GODAN:
+        return map_dictionary_to_o_ending(verb)
+    elif verb_class == VerbClass.IRREGULAR:
+        return None
+    return splice_verb(verb, verb_class)
+
+def _nai_form(verb, verb_class):
+    return generate_nai_form(verb, verb_class, True)
+
+def _te_form(verb, verb_class):
+    return base_te_ta_form(verb, verb_class, TE_PARTICLE, DE_PARTICLE)
+
+def _ta_form(verb, verb_class):
+    return base_te_ta_form(verb, verb_class, TA_PARTICLE, DA_PARTICLE)
+
+def _dictionary_form(verb, verb_class):
+    return verb
+
+# intermediate name -> function of (verb, verb_class), in the order forms are
+# matched against them: longer intermediates first, so they save more work.
+# e_base and o_base are not defined for irregular verbs.
+INTERMEDIATES = collections.OrderedDict([
+    ("te_form", _te_form),
+    ("ta_form", _ta_form),
+    ("nai_form", _nai_form),
+    ("i_base", _i_base),
+    ("a_base", _a_base),
+    ("e_base", _e_base),
+    ("o_base", _o_base),
+    ("stem", _stem),
+    ("verb", _dictionary_form),
+])
+
+# ---------------------------------------------------------- #
+#                       FORM RECIPES                         #
+# ---------------------------------------------------------- #
+# A recipe builds a form as prefix + intermediate + ending. Recipes are
+# derived like SpecializedConjugators.derive_endings: probe verbs for every
+# final kana are conjugated, and the first intermediate that every result is
+# built from with the same prefix and ending is kept. Forms that no
+# intermediate explains (suppletive irregular forms, such as できる) have no
+# recipe and are conjugated by their specialized function.
+FORM_NAMES = tuple(signature_name(signature) for signature in PARADIGM_SIGNATURES)
+_FORM_SIGNATURES = dict(zip(FORM_NAMES, PARADIGM_SIGNATURES))
+_SIGNATURE_FORM_NAMES = dict(zip(PARADIGM_SIGNATURES, FORM_NAMES))
+
+def derive_recipe(signature, verb_class):
+    '''Find how a form is built from the shared intermediates
+
+    Args:
+        signature (tuple): entry of Paradigm.PARADIGM_SIGNATURES
+        verb_class (enum): VerbClass Enum of the verbs to conjugate
+
+    Returns:
+        tuple: (prefix, intermediate name, ending), or None if no
+            intermediate builds the form for every verb ending
+    '''
+    conjugate = specialized_function(verb_class, *signature)
+    keys = IRREGULAR_ENDING_KEYS if verb_class == VerbClass.IRREGULAR else REGULAR_ENDING_KEYS
+    probes = [(verb, conjugate(verb)) for verb in ("{}{}".format(stem, key) for key in keys for stem in PROBE_STEMS)]
+    for name, intermediate_function in INTERMEDIATES.items():
+        affixes = set()
+        for verb, conjugated_verb in probes:
+            intermediate = intermediate_function(verb, verb_class)
+            if conjugated_verb is None or not intermediate or intermediate not in conjugated_verb:
+                break
+            index = conjugated_verb.index(intermediate)
+            affixes.add((conjugated_verb[:index], conjugated_verb[index + len(intermediate):]))
+        else:
+            if len(affixes) == 1:
+                prefix, ending = affixes.pop()
+                return prefix, name, ending
+    return None
+
+# (verb_class, form name) -> recipe, derived on first use
+_RECIPES = {}
+
+def form_recipe(verb_class, name):
+    '''Recipe of a form, see derive_recipe
+
+    Args:
+        verb_class (enum): VerbClass Enum of the verbs to conjugate
+        name (str): form name, see Paradigm.signature_name
+
+    Returns:
+        tuple: (prefix, intermediate name, ending), or None
+    '''
+    key = (verb_class, name)
+    if key not in _RECIPES:
+        _RECIPES[key] = derive_recipe(_FORM_SIGNATURES[name], verb_class)
+    return _RECIPES[key]
+
+# ---------------------------------------------------------- #
+#                      LAZY PARADIGM                         #
+# ---------------------------------------------------------- #
+class LazyParadigm:
+    ''' Paradigm of one verb whose forms are conjugated on first access.
+    Forms are attributes named after their signature (plain_past_negative,
+    te, honorific_polite_positive, see Paradigm.signature_name) or keys given
+    as (form, tense, formality, polarity) signatures. Each is computed once
+    and kept in a slot, as are the intermediates it is built from (stem,
+    a_base, i_base, e_base, o_base, nai_form, te_form, ta_form), so forms
+    sharing an intermediate only attach their ending to it.
+
+    Iterating yields (form, tense, formality, polarity, surface) for every
+    signature, like Paradigm.generate_paradigm, computing the missing forms.
+    '''
+    __slots__ = ("verb_class",) + tuple(INTERMEDIATES) + FORM_NAMES
+
+    def __init__(self, verb, verb_class):
+        ''' Args:
+            verb (str): Japanese verb in kana, might contain kanji
+            verb_class (enum): VerbClass Enum representing the verb class
+                to which the verb belongs
+
+        Raises:
+            InvalidJapaneseVerbException: if the verb fails validation
+        '''
+        error_code = validate_verb(verb)
+        if error_code != VALID_VERB:
+            raise_for_error_code(verb, error_code)
+        self.verb = verb
+        self.verb_class = verb_class
+
+    def __getattr__(self, name):
+        # only reached for empty slots and unknown names
+        intermediate_function = INTERMEDIATES.get(name)
+        if intermediate_function is not None:
+            value = intermediate_function(self.verb, self.verb_class)
+        elif name in _FORM_SIGNATURES:
+            value = self._conjugate(name)
+        else:
+            raise AttributeError(name)
+        setattr(self, name, value)
+        return value
+
+    def _conjugate(self, name):
+        verb_class = self.verb_class
+        keys = IRREGULAR_ENDING_KEYS if verb_class == VerbClass.IRREGULAR else REGULAR_ENDING_KEYS
+        if not self.verb.endswith(keys):
+            # recipes only hold for the probed endings, and the generator does
+            # not conjugate irregular verbs with other endings (できる)
+            return None
+        recipe = form_recipe(verb_class, name)
+        if recipe is not None:
+            intermediate = getattr(self, recipe[1])
+            if intermediate is not None:
+                return "{}{}{}".format(recipe[0], intermediate, recipe[2])
+        return specialized_function(verb_class, *_FORM_SIGNATURES[name])(self.verb)
+
+    def __getitem__(self, signature):
+        return getattr(self, _SIGNATURE_FORM_NAMES[signature])
+
+    def __iter__(self):
+        for signature, name in zip(PARADIGM_SIGNATURES, FORM_NAMES):
+            yield signature + (getattr(self, name),)
+
+    def __len__(self):
+        return len(PARADIGM_SIGNATURES)
+
+    def computed_names(self):
+        '''Names of the forms and intermediates computed so far
+
+        Returns:
+            list: slot names holding a value, in slot order
+        '''
+        names = []
+        for name in LazyParadigm.__slots__:
+            try:
+                object.__getattribute__(self, name)
+            except AttributeError:
+                continue
+            names.append(name)
+        return names
+
+# ---------------------------------------------------------- #
+#                          BENCHMARK                         #
+# ---------------------------------------------------------- #
+def benchmark_lazy_paradigm(verbs, names, repeat=3):
+    '''Time conjugating a few forms of every verb through the generate_*
+    methods, a full eager paradigm and a LazyParadigm
+
+    Args:
+        verbs (list): (verb, verb_class) pairs
+        names (list): form names to access, see Paradigm.signature_name
+        repeat (:obj: int, optional): number of timed passes, the fastest is kept.
+            Defaults to 3.
+
+    Returns:
+        list: (name, seconds per verb) for each approach
+    '''
+    generator = JapaneseVerbFormGenerator()
+    signatures = [_FORM_SIGNATURES[name] for name in names]
+    for verb_class in VerbClass:
+        for name in names:
+            form_recipe(verb_class, name)
+
+    def generator_pass():
+        for verb, verb_class in verbs:
+            for signature in signatures:
+                conjugate_form(generator, verb, verb_class, *signature)
+
+    def eager_pass():
+        for verb, verb_class in verbs:
+            list(generate_paradigm(generator, verb, verb_class))
+
+    def lazy_pass():
+        for verb, verb_class in verbs:
+            paradigm = LazyParadigm(verb, verb_class)
+            for name in names:
+                getattr(paradigm, name)
+
+    return [(approach, best_time(timed_pass, repeat) / len(verbs))
+            for approach, timed_pass in (("generate_*", generator_pass), ("eager paradigm", eager_pass), ("LazyParadigm", lazy_pass))]
+
+DEFAULT_BENCHMARK_FORMS = ("plain_past_negative", "polite_nonpast_positive", "te", "potential_plain_positive")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark lazy paradigms against eager conjugation.")
+    parser.add_argument("forms", nargs="*", default=DEFAULT_BENCHMARK_FORMS, help="form names to access")
+    parser.add_argument("--verbs", type=int, default=500, help="number of golden corpus verbs")
+    parser.add_argument("--repeat", type=int, default=3, help="number of timed passes")
+    args = parser.parse_args(argv)
+
+    from .GoldenCorpus import load_golden_corpus
+    verbs = [(entry.verb, entry.verb_class) for entry in load_golden_corpus()[:args.verbs]]
+    for approach, seconds in benchmark_lazy_paradigm(verbs, args.forms, args.repeat):
+        print("{:<16}{:.2f}us/verb".format(approach, seconds * 1e6))
+
+if __name__ == "__main__":
+    main()
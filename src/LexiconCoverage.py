@@ -0,0 +1,231 @@
+import argparse
+import collections
+import json
+import time
+
+# Local modules
+from .constants.EnumeratedTypes import VerbClass
+
+from .Decorators import validate_verb
+from .Exceptions import VALID_VERB
+from .JapaneseVerbFormGenerator import JapaneseVerbFormGenerator
+from .Paradigm import PARADIGM_SIGNATURES, conjugate_form, signature_name
+from .SpecializedConjugators import IRREGULAR_ENDING_KEYS
+
+OUTCOME_OK = "ok"
+OUTCOME_NONE = "none"
+
+CoverageBucket = collections.namedtuple("CoverageBucket", ["form", "verb_class", "ending", "outcome", "count", "examples"])
+
+def verb_ending(verb, verb_class):
+    '''Ending a verb is grouped under: its final kana, or the irregular ending
+    (する, くる, 来る) of irregular verbs
+
+    Args:
+        verb (str): Japanese verb in kana, might contain kanji
+        verb_class (enum): VerbClass Enum representing the verb class
+            to which the verb belongs
+
+    Returns:
+        str: ending of the verb
+    '''
+    if verb_class == VerbClass.IRREGULAR:
+        for ending in IRREGULAR_ENDING_KEYS:
+            if verb.endswith(ending):
+                return ending
+    return verb[-1:]
+
+# ---------------------------------------------------------- #
+#                       COVERAGE REPORT                      #
+# ---------------------------------------------------------- #
+class CoverageReport:
+    ''' Counts of a lexicon run through every paradigm form, aggregated per
+    (form, verb class, ending). Only counters keyed by those groups and a few
+    example verbs per failure bucket are kept, so memory does not grow with
+    the size of the lexicon.
+
+    A conjugation's outcome is OUTCOME_OK, OUTCOME_NONE when the form is not
+    supported, or the name of the exception it raised.
+    '''
+    def __init__(self, max_examples=3):
+        self.max_examples = max_examples
+        # (verb_class, ending) -> verbs
+        self.verbs = collections.Counter()
+        # (verb_class, ending, error code) -> verbs rejected by validation
+        self.invalid_verbs = collections.Counter()
+        # (form, verb_class, ending, outcome) -> conjugations
+        self.outcomes = collections.Counter()
+        # (form, verb_class, ending) -> [conjugations, seconds, slowest seconds]
+        self.timings = {}
+        # (form, verb_class, ending, outcome) -> example verbs of failures
+        self.examples = {}
+        self.elapsed = 0.0
+
+    def record_verb(self, verb, verb_class, ending, error_code=VALID_VERB):
+        self.verbs[(verb_class, ending)] += 1
+        if error_code != VALID_VERB:
+            self.invalid_verbs[(verb_class, ending, error_code)] += 1
+
+    def record(self, verb, verb_class, ending, form, outcome, seconds):
+        key = (form, verb_class, ending)
+        self.outcomes[key + (outcome,)] += 1
+        timing = self.timings.get(key)
+        if timing is None:
+            self.timings[key] = [1, seconds, seconds]
+        else:
+            timing[0] += 1
+            timing[1] += seconds
+            if seconds > timing[2]:
+                timing[2] = seconds
+        if outcome != OUTCOME_OK:
+            examples = self.examples.setdefault(key + (outcome,), [])
+            if len(examples) < self.max_examples:
+                examples.append(verb)
+
+    @property
+    def num_verbs(self):
+        return sum(self.verbs.values())
+
+    @property
+    def num_conjugations(self):
+        return sum(self.outcomes.values())
+
+    def failure_buckets(self):
+        '''Every (form, verb class, ending, outcome) group that did not conjugate
+
+        Returns:
+            list: CoverageBucket tuples, largest first
+        '''
+        buckets = [CoverageBucket(form, verb_class, ending, outcome, count, self.examples.get((form, verb_class, ending, outcome), []))
+                   for (form, verb_class, ending, outcome), count in self.outcomes.items() if outcome != OUTCOME_OK]
+        return sorted(buckets, key=lambda bucket: (-bucket.count, bucket.form, bucket.verb_class.value, bucket.ending, bucket.outcome))
+
+    def slowest_groups(self, top=10):
+        '''Groups with the highest mean time per conjugation
+
+        Args:
+            top (:obj: int, optional): number of groups. Defaults to 10.
+
+        Returns:
+            list: ((form, verb class, ending), conjugations, mean seconds, slowest seconds)
+        '''
+        groups = [(key, count, seconds / count, slowest) for key, (count, seconds, slowest) in self.timings.items()]
+        return sorted(groups, key=lambda group: -group[2])[:top]
+
+    def to_dict(self):
+        '''Report as JSON-serializable data
+
+        Returns:
+            dict: verbs, invalid verbs, outcomes and timings as lists of rows
+        '''
+        return {
+            "verbs": [{"verb_class": verb_class.name, "ending": ending, "count": count} for (verb_class, ending), count in sorted(self.verbs.items(), key=_group_order)],
+            "invalid_verbs": [{"verb_class": verb_class.name, "ending": ending, "error_code": error_code, "count": count}
+                for (verb_class, ending, error_code), count in sorted(self.invalid_verbs.items(), key=_group_order)],
+            "outcomes": [{"form": form, "verb_class": verb_class.name, "ending": ending, "outcome": outcome, "count": count}
+                for (form, verb_class, ending, outcome), count in sorted(self.outcomes.items(), key=_form_group_order)],
+            "timings": [{"form": form, "verb_class": verb_class.name, "ending": ending, "count": count, "seconds": seconds, "slowest_seconds": slowest}
+                for (form, verb_class, ending), (count, seconds, slowest) in sorted(self.timings.items(), key=_form_group_order)],
+            "failures": [{"form": bucket.form, "verb_class": bucket.verb_class.name, "ending": bucket.ending, "outcome": bucket.outcome,
+                "count": bucket.count, "examples": bucket.examples} for bucket in self.failure_buckets()],
+            "elapsed": self.elapsed,
+        }
+
+    def format(self, top=20):
+        '''Format the report for the command line
+
+        Args:
+            top (:obj: int, optional): failure buckets and slow groups listed.
+                Defaults to 20.
+
+        Returns:
+            str: multi-line summary
+        '''
+        lines = ["{} verbs, {} conjugations in {:.2f}s".format(self.num_verbs, self.num_conjugations, self.elapsed), "", "Verbs per class and ending:"]
+        for (verb_class, ending), count in sorted(self.verbs.items(), key=_group_order):
+            lines.append("  {:<12} {:<4} {:>8}".format(verb_class.name, ending, count))
+        if self.invalid_verbs:
+            lines += ["", "Invalid verbs:"]
+            for (verb_class, ending, error_code), count in sorted(self.invalid_verbs.items(), key=_group_order):
+                lines.append("  {:<12} {:<4} error {:<4} {:>8}".format(verb_class.name, ending, error_code, count))
+        failures = self.failure_buckets()
+        lines += ["", "{} failure buckets{}".format(len(failures), ":" if failures else "")]
+        for bucket in failures[:top]:
+            lines.append("  {:<36} {:<12} {:<4} {:<28} {:>8}  e.g. {}".format(bucket.form, bucket.verb_class.name, bucket.ending,
+                bucket.outcome, bucket.count, ", ".join(bucket.examples)))
+        lines += ["", "Slowest groups:"]
+        for (form, verb_class, ending), count, mean, slowest in self.slowest_groups(top):
+            lines.append("  {:<36} {:<12} {:<4} {:>8.2f}us mean {:>8.2f}us max".format(form, verb_class.name, ending, mean * 1e6, slowest * 1e6))
+        return "\n".join(lines)
+
+def _group_order(item):
+    return (item[0][0].value,) + item[0][1:]
+
+def _form_group_order(item):
+    form, verb_class = item[0][:2]
+    return (_FORM_ORDER[form], verb_class.value) + item[0][2:]
+
+_FORM_NAMES = tuple((signature, signature_name(signature)) for signature in PARADIGM_SIGNATURES)
+_FORM_ORDER = dict((name, index) for index, (_, name) in enumerate(_FORM_NAMES))
+
+# ---------------------------------------------------------- #
+#                          ANALYZER                          #
+# ---------------------------------------------------------- #
+def analyze_lexicon(lexicon, generator=None, max_examples=3):
+    '''Conjugate every verb of a lexicon into every paradigm form in one pass,
+    counting outcomes and timing each conjugation. Verbs that fail validation
+    are counted and not conjugated.
+
+    Args:
+        lexicon (iterable): (verb, verb_class) pairs, read once
+        generator (:obj: JapaneseVerbFormGenerator, optional): generator under
+            test. Defaults to a new JapaneseVerbFormGenerator.
+        max_examples (:obj: int, optional): example verbs kept per failure
+            bucket. Defaults to 3.
+
+    Returns:
+        CoverageReport: counts, failure buckets and timings
+    '''
+    if generator is None:
+        generator = JapaneseVerbFormGenerator()
+    report = CoverageReport(max_examples)
+    record = report.record
+    clock = time.perf_counter
+    start = clock()
+    for verb, verb_class in lexicon:
+        ending = verb_ending(verb, verb_class)
+        error_code = validate_verb(verb)
+        report.record_verb(verb, verb_class, ending, error_code)
+        if error_code != VALID_VERB:
+            continue
+        for signature, name in _FORM_NAMES:
+            conjugation_start = clock()
+            try:
+                outcome = OUTCOME_NONE if conjugate_form(generator, verb, verb_class, *signature) is None else OUTCOME_OK
+            except Exception as error:
+                outcome = type(error).__name__
+            record(verb, verb_class, ending, name, outcome, clock() - conjugation_start)
+    report.elapsed = clock() - start
+    return report
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report per-form conjugation outcomes and timings of a lexicon.")
+    parser.add_argument("--jmdict", metavar="PATH", help="JMdict-style XML lexicon. Defaults to the golden corpus verbs.")
+    parser.add_argument("--json", metavar="PATH", help="also write the report as JSON to PATH")
+    parser.add_argument("--top", type=int, default=20, help="failure buckets and slow groups listed")
+    args = parser.parse_args(argv)
+
+    if args.jmdict:
+        from .DictionaryIngestion import iter_dictionary_verbs
+        lexicon = ((entry.verb, entry.verb_class) for entry in iter_dictionary_verbs(args.jmdict))
+    else:
+        from .GoldenCorpus import load_golden_corpus
+        lexicon = ((entry.verb, entry.verb_class) for entry in load_golden_corpus())
+    report = analyze_lexicon(lexicon)
+    print(report.format(args.top))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as report_file:
+            json.dump(report.to_dict(), report_file, ensure_ascii=False, indent=1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+import argparse
+import collections
+import math
+import os
+import random
+import tempfile
+import threading
+import time
+
+# Local modules
+from .ConjugationServer import STATUS_OK, STATUS_UNSUPPORTED_FORM, ConjugationClient, create_server, encode_requests
+from .Paradigm import PARADIGM_SIGNATURES
+from .Profiling import zipf_workload
+
+LoadReport = collections.namedtuple("LoadReport", ["num_requests", "elapsed", "achieved_rate", "p50_ms", "p99_ms", "max_ms", "num_failures"])
+
+def percentile(sorted_values, fraction):
+    '''Nearest-rank percentile of an already sorted list
+
+    Args:
+        sorted_values (list): values in ascending order
+        fraction (float): percentile between 0 and 1, e.g. 0.99
+
+    Returns:
+        float: smallest value greater than or equal to fraction of the values
+    '''
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(math.ceil(fraction * len(sorted_values))))
+    return sorted_values[rank - 1]
+
+def build_request_frames(num_frames, batch_size, seed=0):
+    '''Pre-encode request frames of Zipf-distributed verbs and random forms, so
+    encoding is not part of the measured latency
+
+    Args:
+        num_frames (int): number of distinct frames
+        batch_size (int): requests per frame
+        seed (:obj: int, optional): random seed. Defaults to 0.
+
+    Returns:
+        list: encoded frames
+    '''
+    rng = random.Random(seed)
+    verbs = zipf_workload(num_frames * batch_size, seed=seed)
+    frames = []
+    for frame_index in range(num_frames):
+        requests = []
+        for verb, verb_class in verbs[frame_index * batch_size:(frame_index + 1) * batch_size]:
+            form, tense, formality, polarity = rng.choice(PARADIGM_SIGNATURES)
+            requests.append((verb, verb_class, form, tense, formality, polarity))
+        frames.append(encode_requests(requests))
+    return frames
+
+def run_load(address, rate=50000, duration=5.0, batch_size=100, seed=0):
+    '''Drive a conjugation server at a fixed request rate and measure latency.
+    The load is open loop: frames are sent on schedule whatever the server's
+    progress, and each request's latency is measured from its scheduled send
+    time, so a server that falls behind is charged for the queueing delay.
+
+    Args:
+        address (tuple | str): (host, port) or Unix domain socket path of the server
+        rate (:obj: int, optional): target requests per second. Defaults to 50000.
+        duration (:obj: float, optional): seconds of load. Defaults to 5.0.
+        batch_size (:obj: int, optional): requests per frame. Defaults to 100.
+        seed (:obj: int, optional): random seed of the requests. Defaults to 0.
+
+    Returns:
+        LoadReport: achieved rate and latency percentiles in milliseconds
+    '''
+    num_frames = max(1, int(rate * duration / batch_size))
+    interval = float(batch_size) / rate
+    frames = build_request_frames(min(num_frames, 256), batch_size, seed)
+    scheduled_times = [0.0] * num_frames
+
+    client = ConjugationClient(address)
+    start = time.perf_counter() + 0.01
+
+    def send_frames():
+        for frame_index in range(num_frames):
+            scheduled_time = start + frame_index * interval
+            delay = scheduled_time - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            scheduled_times[frame_index] = scheduled_time
+            client.socket.sendall(frames[frame_index % len(frames)])
+
+    sender = threading.Thread(target=send_frames)
+    sender.daemon = True
+    sender.start()
+
+    latencies = []
+    num_failures = 0
+    try:
+        for frame_index in range(num_frames):
+            results = client.receive_results()
+            latencies.append(time.perf_counter() - scheduled_times[frame_index])
+            # forms the library does not support yet are answered, not failed
+            num_failures += sum(1 for status, _ in results if status not in (STATUS_OK, STATUS_UNSUPPORTED_FORM))
+        elapsed = time.perf_counter() - start
+    finally:
+        sender.join()
+        client.close()
+
+    # every request of a frame shares the frame's latency
+    latencies.sort()
+    return LoadReport(num_frames * batch_size, elapsed, num_frames * batch_size / elapsed,
+        percentile(latencies, 0.5) * 1000, percentile(latencies, 0.99) * 1000, latencies[-1] * 1000, num_failures)
+
+def run_local_load(rate=50000, duration=5.0, batch_size=100, unix_socket=False, seed=0):
+    '''Start a conjugation server in this process and drive it with run_load
+
+    Args:
+        rate (:obj: int, optional): target requests per second. Defaults to 50000.
+        duration (:obj: float, optional): seconds of load. Defaults to 5.0.
+        batch_size (:obj: int, optional): requests per frame. Defaults to 100.
+        unix_socket (:obj: bool, optional): serve on a Unix domain socket instead
+            of TCP. Defaults to False.
+        seed (:obj: int, optional): random seed of the requests. Defaults to 0.
+
+    Returns:
+        LoadReport: achieved rate and latency percentiles in milliseconds
+    '''
+    socket_directory = None
+    if unix_socket:
+        socket_directory = tempfile.mkdtemp()
+        server = create_server(os.path.join(socket_directory, "conjugation.sock"))
+    else:
+        server = create_server(("127.0.0.1", 0))
+    server_thread = threading.Thread(target=server.serve_forever)
+    server_thread.daemon = True
+    server_thread.start()
+    try:
+        return run_load(server.server_address, rate, duration, batch_size, seed)
+    finally:
+        server.shutdown()
+        server.server_close()
+        if socket_directory is not None:
+            os.remove(server.server_address)
+            os.rmdir(socket_directory)
+
+def format_report(report):
+    '''Format a load report as a single line
+
+    Args:
+        report (LoadReport): report returned by run_load
+
+    Returns:
+        str: human readable summary
+    '''
+    return "{} requests in {:.2f}s ({:.0f} req/s): p50 {:.2f}ms, p99 {:.2f}ms, max {:.2f}ms, {} failures".format(
+        report.num_requests, report.elapsed, report.achieved_rate, report.p50_ms, report.p99_ms, report.max_ms, report.num_failures)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure conjugation server latency at a fixed request rate.")
+    parser.add_argument("--rate", type=int, default=50000, help="target requests per second")
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds of load")
+    parser.add_argument("--batch-size", type=int, default=100, help="requests per frame")
+    parser.add_argument("--host", help="host of a running server. A local server is started when omitted.")
+    parser.add_argument("--port", type=int, default=7878, help="port of a running server")
+    parser.add_argument("--unix", help="Unix domain socket path of a running server")
+    parser.add_argument("--local-unix", action="store_true", help="serve the local server on a Unix domain socket")
+    args = parser.parse_args(argv)
+
+    if args.unix:
+        report = run_load(args.unix, args.rate, args.duration, args.batch_size)
+    elif args.host:
+        report = run_load((args.host, args.port), args.rate, args.duration, args.batch_size)
+    else:
+        report = run_local_load(args.rate, args.duration, args.batch_size, args.local_unix)
+    print(format_report(report))
+
+if __name__ == "__main__":
+    main()
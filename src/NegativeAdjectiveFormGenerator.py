@@ -0,0 +1,69 @@
+# Local modules
+from .constants.AdjectiveEndingConstants import *
+from .constants.EnumeratedTypes import Tense
+
+from .Utils import base_adjective_form
+
+# ---------------------------------------------------------- #
+#                    Negative Adjective Forms                #
+# ---------------------------------------------------------- #
+class NegativeAdjectiveForms:
+    def generate_plain_form(self, adjective, adjective_class, tense):
+        '''Generate the negative plain form of the adjective depending
+        on the tense.
+
+        Args:
+            adjective (str): Japanese adjective in kana, might contain kanji
+            adjective_class (enum): AdjectiveClass Enum representing the adjective
+                class to which the adjective belongs
+            tense (enum): Tense Enum representing the tense for the conjugated adjective
+
+        Returns:
+            str: negative plain form of the adjective based on the tense parameter
+        '''
+        if tense == Tense.NONPAST:
+            return base_adjective_form(adjective, adjective_class, I_ADJECTIVE_PLAIN_NEGATIVE_NONPAST_ENDING, NA_ADJECTIVE_PLAIN_NEGATIVE_NONPAST_ENDING)
+        return base_adjective_form(adjective, adjective_class, I_ADJECTIVE_PLAIN_NEGATIVE_PAST_ENDING, NA_ADJECTIVE_PLAIN_NEGATIVE_PAST_ENDING)
+
+    def generate_polite_form(self, adjective, adjective_class, tense):
+        '''Generate the negative polite form of the adjective depending
+        on the tense.
+
+        Args:
+            adjective (str): Japanese adjective in kana, might contain kanji
+            adjective_class (enum): AdjectiveClass Enum representing the adjective
+                class to which the adjective belongs
+            tense (enum): Tense Enum representing the tense for the conjugated adjective
+
+        Returns:
+            str: negative polite form of the adjective based on the tense parameter
+        '''
+        if tense == Tense.NONPAST:
+            return base_adjective_form(adjective, adjective_class, I_ADJECTIVE_POLITE_NEGATIVE_NONPAST_ENDING, NA_ADJECTIVE_POLITE_NEGATIVE_NONPAST_ENDING)
+        return base_adjective_form(adjective, adjective_class, I_ADJECTIVE_POLITE_NEGATIVE_PAST_ENDING, NA_ADJECTIVE_POLITE_NEGATIVE_PAST_ENDING)
+
+    def generate_conditional_form(self, adjective, adjective_class):
+        '''Generate the negative conditional (-nakattara) form of the adjective
+
+        Args:
+            adjective (str): Japanese adjective in kana, might contain kanji
+            adjective_class (enum): AdjectiveClass Enum representing the adjective
+                class to which the adjective belongs
+
+        Returns:
+            str: negative conditional form of the adjective
+        '''
+        return base_adjective_form(adjective, adjective_class, I_ADJECTIVE_CONDITIONAL_NEGATIVE_ENDING, NA_ADJECTIVE_CONDITIONAL_NEGATIVE_ENDING)
+
+    def generate_provisional_form(self, adjective, adjective_class):
+        '''Generate the negative provisional (-nakereba) form of the adjective
+
+        Args:
+            adjective (str): Japanese adjective in kana, might contain kanji
+            adjective_class (enum): AdjectiveClass Enum representing the adjective
+                class to which the adjective belongs
+
+        Returns:
+            str: negative provisional form of the adjective
+        '''
+        return base_adjective_form(adjective, adjective_class, I_ADJECTIVE_PROVISIONAL_NEGATIVE_ENDING, NA_ADJECTIVE_PROVISIONAL_NEGATIVE_ENDING)
@@ -23,11 +23,9 @@ class NegativeVerbForms:
             str: negative plain form of the verb based on the tense
         parameter
         '''
-        verb = generate_nai_form(verb, verb_class, True)
         if tense == Tense.NONPAST:
-            return verb
-        # force a non-irregular verb class to remove ending -i particle
-        return "{}{}".format(splice_verb(verb, VerbClass.NONIRREGULAR), KATTA_ENDING)
+            return base_nai_form(verb, verb_class, NAI_ENDING)
+        return base_nai_form(verb, verb_class, NAKATTA_ENDING)
 
     def generate_polite_form(self, verb, verb_class, tense):
         '''Generate the negative polite form of the verb depending
@@ -47,14 +45,7 @@ class NegativeVerbForms:
         if tense == Tense.NONPAST:
             ending = MASU_NEGATIVE_NONPAST
 
-        if verb_class == VerbClass.IRREGULAR:
-            return handle_irregular_verb(verb, append_stem_particle=True, suru_ending=ending, kuru_ending=ending)
-        else:
-            verb_base = splice_verb(verb, verb_class)
-            if verb_class == VerbClass.GODAN:
-                verb_base = map_dictionary_to_i_ending(verb)
-            # no change needed for ichidan verb
-            return "{}{}".format(verb_base, ending)
+        return base_masu_form(verb, verb_class, ending)
 
 
     def generate_conditional_form(self, verb, verb_class, formality):
@@ -73,10 +64,8 @@ class NegativeVerbForms:
         parameter
         '''
         if formality == Formality.PLAIN:
-            verb = self.generate_plain_form(verb, verb_class, Tense.PAST)
-        else:
-            verb = self.generate_polite_form(verb, verb_class, Tense.PAST)
-        return "{}{}".format(verb, RA_PARTICLE)   
+            return base_nai_form(verb, verb_class, CONDITIONAL_PLAIN_NEGATIVE_ENDING)
+        return base_masu_form(verb, verb_class, CONDITIONAL_POLITE_NEGATIVE_ENDING)
 
     def generate_volitional_form(self, verb, verb_class, formality):
         '''Generate the negative volitional form of the verb depending
@@ -93,11 +82,10 @@ class NegativeVerbForms:
             str: negative volitional form of the verb based on the formality
         parameter
         '''
-        verb_nai_form = generate_nai_form(verb, verb_class, True)
         if formality == Formality.PLAIN:
-            return "{}{}".format(verb_nai_form, VOLITIONAL_PLAIN_COPULA)
+            return base_nai_form(verb, verb_class, VOLITIONAL_PLAIN_NEGATIVE_ENDING)
         elif formality == Formality.POLITE:
-            return "{}{}".format(verb_nai_form, VOLITIONAL_POLITE_COPULA)
+            return base_nai_form(verb, verb_class, VOLITIONAL_POLITE_NEGATIVE_ENDING)
 
     def generate_potential_form(self, verb, verb_class, formality):
         '''Generate the negative potential form of the verb depending
@@ -119,21 +107,15 @@ class NegativeVerbForms:
                 return handle_irregular_verb(verb, suru_ending=POTENTIAL_SURU_PLAIN_NEGATIVE_ENDING, kuru_ending=POTENTIAL_KURU_PLAIN_NEGATIVE_ENDING)
             else:
                 return handle_irregular_verb(verb, suru_ending=POTENTIAL_SURU_POLITE_NEGATIVE_ENDING, kuru_ending=POTENTIAL_KURU_POLITE_NEGATIVE_ENDING)
-        else:
-            verb_base = map_dictionary_to_e_ending(verb)
-
-            if verb_class == VerbClass.GODAN:
-                if formality == Formality.PLAIN:
-                    return generate_nai_form(verb_base, verb_class, False)
-                else:
-                    return "{}{}".format(verb_base, MASU_NEGATIVE_NONPAST)
-            elif verb_class == VerbClass.ICHIDAN:
-                verb_base = splice_verb(verb, verb_class)
-                verb_with_rare = "{}{}".format(verb_base, "られ")
-                if formality == Formality.PLAIN:
-                    return generate_nai_form(verb_with_rare, verb_class, False)
-                else:
-                    return "{}{}".format(verb_with_rare, MASU_NEGATIVE_NONPAST)
+        elif verb_class == VerbClass.GODAN:
+            if formality == Formality.PLAIN:
+                return map_dictionary_to_e_ending(verb, NAI_ENDING)
+            return map_dictionary_to_e_ending(verb, MASU_NEGATIVE_NONPAST)
+        elif verb_class == VerbClass.ICHIDAN:
+            ending = POTENTIAL_ICHIDAN_PLAIN_NEGATIVE_ENDING
+            if formality == Formality.POLITE:
+                ending = POTENTIAL_ICHIDAN_POLITE_NEGATIVE_ENDING
+            return "{}{}".format(splice_verb(verb, verb_class), ending)
     
     def generate_imperative_form(self, verb, verb_class, formality):
         '''Generate the negative imperative form of the verb depending
@@ -150,17 +132,11 @@ class NegativeVerbForms:
             str: negative imperative form of the verb based on the formality
         parameter
         '''
-        if verb_class == VerbClass.IRREGULAR:
-            if formality == Formality.PLAIN:
-                return handle_irregular_verb(verb, suru_ending="{}{}".format(SURU_ENDING, NA_PARTICLE), kuru_ending="{}{}".format(KURU_ENDING, NA_PARTICLE))
-            else:
-                nai_form = generate_nai_form(verb, verb_class, True)
-                return "{}{}{}".format(nai_form, DE_PARTICLE, KUDASAI)
-        else:
-            if formality == Formality.PLAIN:
-                return "{}{}".format(verb, NA_PARTICLE)
-            else:
-                return "{}{}{}".format(generate_nai_form(verb, verb_class, True), DE_PARTICLE, KUDASAI)
+        if formality == Formality.PLAIN:
+            if verb_class == VerbClass.IRREGULAR:
+                return handle_irregular_verb(verb, suru_ending=IMPERATIVE_SURU_PLAIN_NEGATIVE_ENDING, kuru_ending=IMPERATIVE_KURU_PLAIN_NEGATIVE_ENDING)
+            return "{}{}".format(verb, NA_PARTICLE)
+        return base_nai_form(verb, verb_class, IMPERATIVE_POLITE_NEGATIVE_ENDING)
     
     def generate_provisional_form(self, verb, verb_class, formality):
         '''Generate the negative provisional form of the verb depending
@@ -182,17 +158,13 @@ class NegativeVerbForms:
                 if splice_verb(verb, verb_class, False) == SURU_ENDING:
                     return handle_irregular_verb(verb, append_stem_particle=True, suru_ending=PROVISIONAL_ICHIDAN_PLAIN_NEGATIVE_ENDING)
                 else:
-                    return "{}{}".format(KO_PARTICLE, PROVISIONAL_ICHIDAN_PLAIN_NEGATIVE_ENDING)
+                    return handle_irregular_verb(verb, kuru_ending=PROVISIONAL_KURU_PLAIN_NEGATIVE_ENDING)
             else:
-                intermediate_verb = handle_irregular_verb(verb, append_stem_particle=True, suru_ending=MASU_NEGATIVE_NONPAST, kuru_ending=MASU_NEGATIVE_NONPAST)
-                return "{}{}{}".format(intermediate_verb, NA_PARTICLE, RA_PARTICLE)
-        else:
-            verb_stem = splice_verb(verb, verb_class)
-            if verb_class == VerbClass.GODAN:
-                verb_with_a_ending = map_dictionary_to_a_ending(verb)
-                return "{}{}".format(verb_with_a_ending, PROVISIONAL_ICHIDAN_PLAIN_NEGATIVE_ENDING)
-            elif verb_class == VerbClass.ICHIDAN:
-                return "{}{}".format(verb_stem, PROVISIONAL_ICHIDAN_PLAIN_NEGATIVE_ENDING)
+                return handle_irregular_verb(verb, append_stem_particle=True, suru_ending=PROVISIONAL_POLITE_NEGATIVE_ENDING, kuru_ending=PROVISIONAL_POLITE_NEGATIVE_ENDING)
+        elif verb_class == VerbClass.GODAN:
+            return map_dictionary_to_a_ending(verb, PROVISIONAL_ICHIDAN_PLAIN_NEGATIVE_ENDING)
+        elif verb_class == VerbClass.ICHIDAN:
+            return "{}{}".format(splice_verb(verb, verb_class), PROVISIONAL_ICHIDAN_PLAIN_NEGATIVE_ENDING)
     
 
     def generate_causative_form(self, verb, verb_class, formality):
@@ -213,23 +185,18 @@ class NegativeVerbForms:
         if verb_class == VerbClass.IRREGULAR:
             if splice_verb(verb, verb_class, False) != SURU_ENDING:
                 if formality == Formality.PLAIN: 
-                    return generate_nai_form(CAUSATIVE_KURU_NEGATIVE_BASE, verb_class, False)
-                else:
-                    return "{}{}".format(CAUSATIVE_KURU_NEGATIVE_BASE, MASU_NEGATIVE_NONPAST)
-        else:
-            verb_stem = splice_verb(verb, verb_class)
-            if verb_class == VerbClass.GODAN:
-                modified_verb_stem = "{}{}".format(map_dictionary_to_a_ending(verb), SE_PARTICLE)
-                if formality == Formality.PLAIN:
-                    return generate_nai_form(modified_verb_stem, verb_class, False)
+                    return handle_irregular_verb(verb, kuru_ending=CAUSATIVE_KURU_PLAIN_NEGATIVE_ENDING)
                 else:
-                    return "{}{}".format(modified_verb_stem, MASU_NEGATIVE_NONPAST)
-            elif verb_class == VerbClass.ICHIDAN:
-                modified_verb_stem = "{}{}{}".format(verb_stem, SA_PARTICLE, SE_PARTICLE)
-                if formality == Formality.PLAIN:
-                    return generate_nai_form(modified_verb_stem, verb_class, False)
-                else:
-                    return "{}{}".format(modified_verb_stem, MASU_NEGATIVE_NONPAST)
+                    return handle_irregular_verb(verb, kuru_ending=CAUSATIVE_KURU_POLITE_NEGATIVE_ENDING)
+        elif verb_class == VerbClass.GODAN:
+            if formality == Formality.PLAIN:
+                return map_dictionary_to_a_ending(verb, CAUSATIVE_GODAN_PLAIN_NEGATIVE_ENDING)
+            return map_dictionary_to_a_ending(verb, CAUSATIVE_GODAN_POLITE_NEGATIVE_ENDING)
+        elif verb_class == VerbClass.ICHIDAN:
+            ending = CAUSATIVE_ICHIDAN_PLAIN_NEGATIVE_ENDING
+            if formality == Formality.POLITE:
+                ending = CAUSATIVE_ICHIDAN_POLITE_NEGATIVE_ENDING
+            return "{}{}".format(splice_verb(verb, verb_class), ending)
 
     def generate_passive_form(self, verb, verb_class, formality):
         '''Generate the negative passive form of the verb depending
@@ -247,14 +214,93 @@ class NegativeVerbForms:
         parameter
         '''
         if verb_class == VerbClass.GODAN:
-            verb_with_updated_ending = "{}{}".format(map_dictionary_to_a_ending(verb), RE_PARTICLE)
             if formality == Formality.PLAIN:
-                return generate_nai_form(verb_with_updated_ending, verb_class, False)
-            else:
-                return "{}{}".format(verb_with_updated_ending, MASU_NEGATIVE_NONPAST)
+                return map_dictionary_to_a_ending(verb, PASSIVE_GODAN_PLAIN_NEGATIVE_ENDING)
+            return map_dictionary_to_a_ending(verb, PASSIVE_GODAN_POLITE_NEGATIVE_ENDING)
         elif verb_class == VerbClass.ICHIDAN:
-            modified_verb_stem = "{}{}{}".format(splice_verb(verb, verb_class), RA_PARTICLE, RE_PARTICLE)
+            ending = PASSIVE_ICHIDAN_PLAIN_NEGATIVE_ENDING
+            if formality == Formality.POLITE:
+                ending = PASSIVE_ICHIDAN_POLITE_NEGATIVE_ENDING
+            return "{}{}".format(splice_verb(verb, verb_class), ending)
+
+    def generate_desire_form(self, verb, verb_class, formality):
+        '''Generate the negative desire (-takunai) form of the verb depending
+        on the level of formality.
+
+        Args:
+            verb (str): Japanese verb in kana, might contain kanji
+            verb_class (enum): VerbClass Enum representing the verb class
+                to which the verb belongs
+            formality (enum): Formality Enum representing the formality class
+                for the conjugated verb
+
+        Returns:
+            str: negative desire form based on the specified formality parameter
+        '''
+        if formality == Formality.PLAIN:
+            return base_masu_form(verb, verb_class, TAI_PLAIN_NEGATIVE_ENDING)
+        return base_masu_form(verb, verb_class, TAI_POLITE_NEGATIVE_ENDING)
+
+    def generate_sou_form(self, verb, verb_class, formality):
+        '''Generate the negative appearance (-nasasou) form of the verb
+        depending on the level of formality.
+
+        Args:
+            verb (str): Japanese verb in kana, might contain kanji
+            verb_class (enum): VerbClass Enum representing the verb class
+                to which the verb belongs
+            formality (enum): Formality Enum representing the formality class
+                for the conjugated verb
+
+        Returns:
+            str: negative appearance form based on the specified formality parameter
+        '''
+        if formality == Formality.PLAIN:
+            return base_nai_form(verb, verb_class, SOU_PLAIN_NEGATIVE_ENDING)
+        return base_nai_form(verb, verb_class, SOU_POLITE_NEGATIVE_ENDING)
+
+    def generate_honorific_form(self, verb, verb_class, formality):
+        '''Generate the negative honorific (o- -ni naranai) form of the verb
+        depending on the level of formality.
+
+        Args:
+            verb (str): Japanese verb in kana, might contain kanji
+            verb_class (enum): VerbClass Enum representing the verb class
+                to which the verb belongs
+            formality (enum): Formality Enum representing the formality class
+                for the conjugated verb
+
+        Returns:
+            str: negative honorific form based on the specified formality parameter
+        '''
+        if verb_class == VerbClass.IRREGULAR:
             if formality == Formality.PLAIN:
-                return generate_nai_form(modified_verb_stem, verb_class, False)
-            else:
-                return "{}{}".format(modified_verb_stem, MASU_NEGATIVE_NONPAST)
+                return suppletive_irregular_form(verb, HONORIFIC_SURU_PLAIN_NEGATIVE_ENDING, HONORIFIC_KURU_PLAIN_NEGATIVE_ENDING)
+            return suppletive_irregular_form(verb, HONORIFIC_SURU_POLITE_NEGATIVE_ENDING, HONORIFIC_KURU_POLITE_NEGATIVE_ENDING)
+        ending = HONORIFIC_PLAIN_NEGATIVE_ENDING
+        if formality == Formality.POLITE:
+            ending = HONORIFIC_POLITE_NEGATIVE_ENDING
+        return "{}{}".format(HONORIFIC_PREFIX, base_masu_form(verb, verb_class, ending))
+
+    def generate_humble_form(self, verb, verb_class, formality):
+        '''Generate the negative humble (o- -shinai) form of the verb depending
+        on the level of formality.
+
+        Args:
+            verb (str): Japanese verb in kana, might contain kanji
+            verb_class (enum): VerbClass Enum representing the verb class
+                to which the verb belongs
+            formality (enum): Formality Enum representing the formality class
+                for the conjugated verb
+
+        Returns:
+            str: negative humble form based on the specified formality parameter
+        '''
+        if verb_class == VerbClass.IRREGULAR:
+            if formality == Formality.PLAIN:
+                return suppletive_irregular_form(verb, HUMBLE_SURU_PLAIN_NEGATIVE_ENDING, HUMBLE_KURU_PLAIN_NEGATIVE_ENDING)
+            return suppletive_irregular_form(verb, HUMBLE_SURU_POLITE_NEGATIVE_ENDING, HUMBLE_KURU_POLITE_NEGATIVE_ENDING)
+        ending = HUMBLE_PLAIN_NEGATIVE_ENDING
+        if formality == Formality.POLITE:
+            ending = HUMBLE_POLITE_NEGATIVE_ENDING
+        return "{}{}".format(HUMBLE_PREFIX, base_masu_form(verb, verb_class, ending))
@@ -0,0 +1,243 @@
+# Local modules
+from .constants.EnumeratedTypes import AdjectiveForm, Formality, Polarity, Tense, VerbForm
+
+# ---------------------------------------------------------- #
+#                     PARADIGM DEFINITION                    #
+# ---------------------------------------------------------- #
+# forms conjugated by tense and polarity
+TENSE_FORMS = (VerbForm.PLAIN, VerbForm.POLITE)
+
+# forms conjugated by formality and polarity
+FORMALITY_FORMS = (
+    VerbForm.CONDITIONAL,
+    VerbForm.VOLITIONAL,
+    VerbForm.POTENTIAL,
+    VerbForm.IMPERATIVE,
+    VerbForm.PROVISIONAL,
+    VerbForm.CAUSATIVE,
+    VerbForm.PASSIVE,
+    VerbForm.DESIRE,
+    VerbForm.SOU,
+    VerbForm.HONORIFIC,
+    VerbForm.HUMBLE,
+)
+
+# forms conjugated without any parameters besides the verb class
+UNPARAMETERIZED_FORMS = (VerbForm.TE, VerbForm.NAGARA, VerbForm.ZU, VerbForm.TARI)
+
+# forms built from the stems of Utils.verb_stems by a single concatenation
+EXTENDED_FORMS = (
+    VerbForm.DESIRE,
+    VerbForm.SOU,
+    VerbForm.NAGARA,
+    VerbForm.ZU,
+    VerbForm.TARI,
+    VerbForm.HONORIFIC,
+    VerbForm.HUMBLE,
+)
+
+GENERATOR_METHOD_NAMES = {
+    VerbForm.PLAIN: "generate_plain_form",
+    VerbForm.POLITE: "generate_polite_form",
+    VerbForm.TE: "generate_te_form",
+    VerbForm.CONDITIONAL: "generate_conditional_form",
+    VerbForm.VOLITIONAL: "generate_volitional_form",
+    VerbForm.POTENTIAL: "generate_potential_form",
+    VerbForm.IMPERATIVE: "generate_imperative_form",
+    VerbForm.PROVISIONAL: "generate_provisional_form",
+    VerbForm.CAUSATIVE: "generate_causative_form",
+    VerbForm.PASSIVE: "generate_passive_form",
+    VerbForm.DESIRE: "generate_desire_form",
+    VerbForm.SOU: "generate_sou_form",
+    VerbForm.NAGARA: "generate_nagara_form",
+    VerbForm.ZU: "generate_zu_form",
+    VerbForm.TARI: "generate_tari_form",
+    VerbForm.HONORIFIC: "generate_honorific_form",
+    VerbForm.HUMBLE: "generate_humble_form",
+}
+
+def _build_paradigm_signatures():
+    signatures = []
+    for form in VerbForm:
+        if form in TENSE_FORMS:
+            for tense in Tense:
+                for polarity in Polarity:
+                    signatures.append((form, tense, None, polarity))
+        elif form in FORMALITY_FORMS:
+            for formality in Formality:
+                for polarity in Polarity:
+                    signatures.append((form, None, formality, polarity))
+        else:
+            signatures.append((form, None, None, None))
+    return tuple(signatures)
+
+# every (form, tense, formality, polarity) combination in a verb's paradigm,
+# in a stable order. Parameters that do not apply to a form are None.
+PARADIGM_SIGNATURES = _build_paradigm_signatures()
+BASIC_SIGNATURES = tuple(signature for signature in PARADIGM_SIGNATURES if signature[0] not in EXTENDED_FORMS)
+EXTENDED_SIGNATURES = tuple(signature for signature in PARADIGM_SIGNATURES if signature[0] in EXTENDED_FORMS)
+
+def signature_name(signature):
+    '''Python identifier naming a paradigm signature
+
+    Args:
+        signature (tuple): entry of PARADIGM_SIGNATURES
+
+    Returns:
+        str: lower case names of the signature's members joined by
+            underscores, e.g. plain_past_negative or te
+    '''
+    return "_".join(member.name.lower() for member in signature if member is not None)
+
+# ---------------------------------------------------------- #
+#                  PARADIGM GENERATOR FUNCTIONS              #
+# ---------------------------------------------------------- #
+def conjugate_form(generator, verb, verb_class, form, tense=None, formality=None, polarity=None):
+    '''Conjugate a verb into a single form through the public generate_* method
+    of a JapaneseVerbFormGenerator
+
+    Args:
+        generator (JapaneseVerbFormGenerator): generator used to conjugate the verb
+        verb (str): Japanese verb in kana, might contain kanji
+        verb_class (enum): VerbClass Enum representing the verb class
+            to which the verb belongs
+        form (enum): VerbForm Enum representing the conjugation form
+        tense (:obj: enum, optional): Tense Enum, only used by tense forms.
+            Defaults to None.
+        formality (:obj: enum, optional): Formality Enum, only used by formality
+            forms. Defaults to None.
+        polarity (:obj: enum, optional): Polarity Enum, unused by the -te form.
+            Defaults to None.
+
+    Returns:
+        str: conjugated verb, or None if the generator does not support the form
+    '''
+    method = getattr(generator, GENERATOR_METHOD_NAMES[form])
+    if form in TENSE_FORMS:
+        return method(verb, verb_class, tense, polarity)
+    elif form in FORMALITY_FORMS:
+        return method(verb, verb_class, formality, polarity)
+    return method(verb, verb_class)
+
+def generate_paradigm(generator, verb, verb_class):
+    '''Conjugate a verb into every form of its paradigm
+
+    Args:
+        generator (JapaneseVerbFormGenerator): generator used to conjugate the verb
+        verb (str): Japanese verb in kana, might contain kanji
+        verb_class (enum): VerbClass Enum representing the verb class
+            to which the verb belongs
+
+    Yields:
+        tuple: (form, tense, formality, polarity, surface) for each entry of
+            PARADIGM_SIGNATURES. surface is None for unsupported forms.
+    '''
+    for form, tense, formality, polarity in BASIC_SIGNATURES:
+        surface = conjugate_form(generator, verb, verb_class, form, tense, formality, polarity)
+        yield form, tense, formality, polarity, surface
+    # the extended forms share their stems, so they are generated together
+    for entry in generator.generate_extended_forms(verb, verb_class):
+        yield entry
+
+def conjugate_with_verb_forms(verb_forms, verb, verb_class, form, tense=None, formality=None):
+    '''Conjugate a verb into a single form by calling a PositiveVerbForms or
+    NegativeVerbForms instance directly, bypassing validation
+
+    Args:
+        verb_forms (PositiveVerbForms | NegativeVerbForms): forms matching the
+            desired polarity. The -te form is only defined on PositiveVerbForms.
+        verb (str): Japanese verb in kana, might contain kanji
+        verb_class (enum): VerbClass Enum representing the verb class
+            to which the verb belongs
+        form (enum): VerbForm Enum representing the conjugation form
+        tense (:obj: enum, optional): Tense Enum, only used by tense forms.
+            Defaults to None.
+        formality (:obj: enum, optional): Formality Enum, only used by formality
+            forms. Defaults to None.
+
+    Returns:
+        str: conjugated verb, or None if the form is not supported
+    '''
+    method = getattr(verb_forms, GENERATOR_METHOD_NAMES[form])
+    if form in TENSE_FORMS:
+        return method(verb, verb_class, tense)
+    elif form in FORMALITY_FORMS:
+        return method(verb, verb_class, formality)
+    return method(verb, verb_class)
+
+# ---------------------------------------------------------- #
+#                ADJECTIVE PARADIGM DEFINITION               #
+# ---------------------------------------------------------- #
+# adjective forms conjugated by tense and polarity
+ADJECTIVE_TENSE_FORMS = (AdjectiveForm.PLAIN, AdjectiveForm.POLITE)
+
+# adjective forms conjugated by polarity only
+ADJECTIVE_POLARITY_FORMS = (AdjectiveForm.CONDITIONAL, AdjectiveForm.PROVISIONAL)
+
+ADJECTIVE_GENERATOR_METHOD_NAMES = {
+    AdjectiveForm.PLAIN: "generate_plain_form",
+    AdjectiveForm.POLITE: "generate_polite_form",
+    AdjectiveForm.TE: "generate_te_form",
+    AdjectiveForm.ADVERBIAL: "generate_adverbial_form",
+    AdjectiveForm.CONDITIONAL: "generate_conditional_form",
+    AdjectiveForm.PROVISIONAL: "generate_provisional_form",
+}
+
+def _build_adjective_paradigm_signatures():
+    signatures = []
+    for form in AdjectiveForm:
+        if form in ADJECTIVE_TENSE_FORMS:
+            for tense in Tense:
+                for polarity in Polarity:
+                    signatures.append((form, tense, None, polarity))
+        elif form in ADJECTIVE_POLARITY_FORMS:
+            for polarity in Polarity:
+                signatures.append((form, None, None, polarity))
+        else:
+            signatures.append((form, None, None, None))
+    return tuple(signatures)
+
+# every (form, tense, formality, polarity) combination in an adjective's
+# paradigm, in the layout of PARADIGM_SIGNATURES. Adjectives take no formality.
+ADJECTIVE_PARADIGM_SIGNATURES = _build_adjective_paradigm_signatures()
+
+def conjugate_adjective_form(generator, adjective, adjective_class, form, tense=None, polarity=None):
+    '''Conjugate an adjective into a single form through the public generate_*
+    method of a JapaneseAdjectiveFormGenerator
+
+    Args:
+        generator (JapaneseAdjectiveFormGenerator): generator used to conjugate the adjective
+        adjective (str): Japanese adjective in kana, might contain kanji
+        adjective_class (enum): AdjectiveClass Enum representing the adjective
+            class to which the adjective belongs
+        form (enum): AdjectiveForm Enum representing the conjugation form
+        tense (:obj: enum, optional): Tense Enum, only used by tense forms.
+            Defaults to None.
+        polarity (:obj: enum, optional): Polarity Enum, unused by the -te and
+            adverbial forms. Defaults to None.
+
+    Returns:
+        str: conjugated adjective
+    '''
+    method = getattr(generator, ADJECTIVE_GENERATOR_METHOD_NAMES[form])
+    if form in ADJECTIVE_TENSE_FORMS:
+        return method(adjective, adjective_class, tense, polarity)
+    elif form in ADJECTIVE_POLARITY_FORMS:
+        return method(adjective, adjective_class, polarity)
+    return method(adjective, adjective_class)
+
+def generate_adjective_paradigm(generator, adjective, adjective_class):
+    '''Conjugate an adjective into every form of its paradigm
+
+    Args:
+        generator (JapaneseAdjectiveFormGenerator): generator used to conjugate the adjective
+        adjective (str): Japanese adjective in kana, might contain kanji
+        adjective_class (enum): AdjectiveClass Enum representing the adjective
+            class to which the adjective belongs
+
+    Yields:
+        tuple: (form, tense, formality, polarity, surface) for each entry of
+            ADJECTIVE_PARADIGM_SIGNATURES. formality is always None.
+    '''
+    for form, tense, formality, polarity in ADJECTIVE_PARADIGM_SIGNATURES:
+        yield form, tense, formality, polarity, conjugate_adjective_form(generator, adjective, adjective_class, form, tense, polarity)
@@ -0,0 +1,265 @@
+import argparse
+import collections
+import gzip
+import hashlib
+import sys
+
+# Local modules
+from .constants.EnumeratedTypes import VerbClass
+
+from .GoldenCorpus import signature_label
+from .JapaneseVerbFormGenerator import JapaneseVerbFormGenerator
+from .Paradigm import generate_paradigm
+
+DIGEST_VERSION = 1
+DIGEST_FILE_MAGIC = "#paradigm-digest"
+# leaves are spread over 2 ** MERKLE_DEPTH buckets by the hash of their key,
+# so adding or removing a verb only changes the path of one bucket
+MERKLE_DEPTH = 8
+MERKLE_BUCKETS = 1 << MERKLE_DEPTH
+
+LexiconDiff = collections.namedtuple("LexiconDiff", ["changed", "added", "removed"])
+
+# ---------------------------------------------------------- #
+#                       PARADIGM DIGESTS                     #
+# ---------------------------------------------------------- #
+# A paradigm is hashed as UTF-8 lines "label<TAB>surface", one per signature
+# in paradigm order, after a line holding the digest version, the verb and
+# its class name. Labels and class names are Enum names (see
+# GoldenCorpus.signature_label), so digests do not depend on Enum values,
+# dict order or the Python version. None is an empty surface. A verb that
+# raises is hashed as the name of its exception.
+def paradigm_digest(verb, verb_class, generator=None):
+    '''Stable digest of the full paradigm of a verb
+
+    Args:
+        verb (str): Japanese verb in kana, might contain kanji
+        verb_class (enum): VerbClass Enum representing the verb class
+            to which the verb belongs
+        generator (:obj: JapaneseVerbFormGenerator, optional): generator whose
+            output is hashed. Defaults to a new JapaneseVerbFormGenerator.
+
+    Returns:
+        str: hex SHA-256 digest
+    '''
+    if generator is None:
+        generator = JapaneseVerbFormGenerator()
+    lines = ["{}\t{}\t{}".format(DIGEST_VERSION, verb, verb_class.name)]
+    try:
+        for form, tense, formality, polarity, surface in generate_paradigm(generator, verb, verb_class):
+            lines.append("{}\t{}".format(signature_label((form, tense, formality, polarity)), surface or ""))
+    except Exception as error:
+        lines = lines[:1] + ["!{}".format(type(error).__name__)]
+    return hashlib.sha256("\n".join(lines).encode("utf-8")).hexdigest()
+
+def _leaf_key(verb, verb_class):
+    return "{}\t{}".format(verb, verb_class.name)
+
+def _bucket(key):
+    return hashlib.sha256(key.encode("utf-8")).digest()[0] >> (8 - MERKLE_DEPTH)
+
+# ---------------------------------------------------------- #
+#                        LEXICON DIGEST                      #
+# ---------------------------------------------------------- #
+class LexiconDigest:
+    ''' Paradigm digests of a lexicon under a Merkle tree. Each verb's leaf
+    hashes its key and paradigm digest. Leaves fall into MERKLE_BUCKETS
+    buckets by the hash of their key, a bucket hashes its leaves in key order,
+    and a binary tree of MERKLE_DEPTH levels is built over the buckets. The
+    root digest identifies the conjugations of the whole lexicon, and diff
+    descends only into the subtrees whose hashes differ.
+    '''
+    def __init__(self):
+        # (verb, verb_class) -> hex paradigm digest
+        self.digests = {}
+        self._levels = None
+
+    @classmethod
+    def compute(cls, lexicon, generator=None):
+        '''Digest every verb of a lexicon
+
+        Args:
+            lexicon (iterable): (verb, verb_class) pairs
+            generator (:obj: JapaneseVerbFormGenerator, optional): generator whose
+                output is hashed. Defaults to a new JapaneseVerbFormGenerator.
+
+        Returns:
+            LexiconDigest: digests of the lexicon
+        '''
+        if generator is None:
+            generator = JapaneseVerbFormGenerator()
+        lexicon_digest = cls()
+        for verb, verb_class in lexicon:
+            lexicon_digest.add(verb, verb_class, paradigm_digest(verb, verb_class, generator))
+        return lexicon_digest
+
+    def add(self, verb, verb_class, digest):
+        self.digests[(verb, verb_class)] = digest
+        self._levels = None
+
+    def __len__(self):
+        return len(self.digests)
+
+    def levels(self):
+        '''Hashes of the Merkle tree, built on first use
+
+        Returns:
+            list: one list of hashes per level, from the MERKLE_BUCKETS bucket
+                hashes up to the single root hash
+        '''
+        if self._levels is None:
+            buckets = [[] for _ in range(MERKLE_BUCKETS)]
+            for (verb, verb_class), digest in self.digests.items():
+                key = _leaf_key(verb, verb_class)
+                buckets[_bucket(key)].append((key, digest))
+            level = []
+            for leaves in buckets:
+                bucket_hash = hashlib.sha256(b"\x00")
+                for key, digest in sorted(leaves):
+                    bucket_hash.update(hashlib.sha256("{}\t{}".format(key, digest).encode("utf-8")).digest())
+                level.append(bucket_hash.digest())
+            levels = [level]
+            while len(level) > 1:
+                level = [hashlib.sha256(b"\x01" + level[index] + level[index + 1]).digest() for index in range(0, len(level), 2)]
+                levels.append(level)
+            self._levels = levels
+        return self._levels
+
+    @property
+    def root(self):
+        return self.levels()[-1][0].hex()
+
+    def changed_buckets(self, other):
+        '''Buckets whose hashes differ, found by descending from the root
+        through differing nodes only
+
+        Args:
+            other (LexiconDigest): digest to compare with
+
+        Returns:
+            list: bucket indexes
+        '''
+        levels = self.levels()
+        other_levels = other.levels()
+        nodes = [0] if levels[-1][0] != other_levels[-1][0] else []
+        for depth in range(len(levels) - 2, -1, -1):
+            nodes = [child for node in nodes for child in (2 * node, 2 * node + 1) if levels[depth][child] != other_levels[depth][child]]
+        return nodes
+
+    def diff(self, other):
+        '''Verbs whose conjugations differ from another lexicon digest
+
+        Args:
+            other (LexiconDigest): newer digest
+
+        Returns:
+            LexiconDiff: sorted (verb, verb_class) keys that changed, that
+                are only in other (added) and only in self (removed)
+        '''
+        changed_buckets = set(self.changed_buckets(other))
+        if not changed_buckets:
+            return LexiconDiff([], [], [])
+        old = self._bucket_digests(changed_buckets)
+        new = other._bucket_digests(changed_buckets)
+        order = lambda key: (key[0], key[1].name)
+        return LexiconDiff(
+            sorted((key for key in old if key in new and old[key] != new[key]), key=order),
+            sorted((key for key in new if key not in old), key=order),
+            sorted((key for key in old if key not in new), key=order))
+
+    def _bucket_digests(self, buckets):
+        return dict((key, digest) for key, digest in self.digests.items() if _bucket(_leaf_key(*key)) in buckets)
+
+    def save(self, path):
+        '''Write the digests as UTF-8 TSV, gzip compressed if path ends in .gz.
+        The first line holds DIGEST_FILE_MAGIC, the digest version and the root.
+
+        Args:
+            path (str): destination file path
+        '''
+        with _open(path, "wt") as digest_file:
+            digest_file.write("{}\t{}\t{}\n".format(DIGEST_FILE_MAGIC, DIGEST_VERSION, self.root))
+            for (verb, verb_class), digest in sorted(self.digests.items(), key=lambda item: _leaf_key(*item[0])):
+                digest_file.write("{}\t{}\t{}\n".format(verb, verb_class.name, digest))
+
+    @classmethod
+    def load(cls, path):
+        '''Read a digest file written by save
+
+        Args:
+            path (str): digest file path
+
+        Returns:
+            LexiconDigest: the saved digests
+
+        Raises:
+            ValueError: if the file is not a digest file of this version, or
+                its digests do not match its root
+        '''
+        lexicon_digest = cls()
+        with _open(path, "rt") as digest_file:
+            header = digest_file.readline().rstrip("\n").split("\t")
+            if len(header) != 3 or header[0] != DIGEST_FILE_MAGIC or header[1] != str(DIGEST_VERSION):
+                raise ValueError("Unsupported paradigm digest file", path)
+            for line in digest_file:
+                verb, verb_class, digest = line.rstrip("\n").split("\t")
+                lexicon_digest.add(verb, VerbClass[verb_class], digest)
+        if lexicon_digest.root != header[2]:
+            raise ValueError("Paradigm digest file does not match its root", path)
+        return lexicon_digest
+
+def _open(path, mode):
+    if path.endswith(".gz"):
+        return gzip.open(path, mode, encoding="utf-8", newline="\n")
+    return open(path, mode, encoding="utf-8", newline="\n")
+
+def diff_generators(lexicon, old_generator, new_generator):
+    '''Verbs conjugated differently by two generators, e.g. two library versions
+
+    Args:
+        lexicon (iterable): (verb, verb_class) pairs
+        old_generator (JapaneseVerbFormGenerator): generator of the old version
+        new_generator (JapaneseVerbFormGenerator): generator of the new version
+
+    Returns:
+        LexiconDiff: verbs whose paradigms changed
+    '''
+    lexicon = list(lexicon)
+    return LexiconDigest.compute(lexicon, old_generator).diff(LexiconDigest.compute(lexicon, new_generator))
+
+def _read_lexicon(jmdict_path):
+    if jmdict_path:
+        from .DictionaryIngestion import iter_dictionary_verbs
+        return ((entry.verb, entry.verb_class) for entry in iter_dictionary_verbs(jmdict_path))
+    from .GoldenCorpus import load_golden_corpus
+    return ((entry.verb, entry.verb_class) for entry in load_golden_corpus())
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Digest the paradigms of a lexicon and list the verbs whose conjugations changed.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    write_parser = subparsers.add_parser("write", help="digest the lexicon with this library version")
+    write_parser.add_argument("output", help="digest file to write, gzip compressed if it ends in .gz")
+    write_parser.add_argument("--jmdict", metavar="PATH", help="JMdict-style XML lexicon. Defaults to the golden corpus verbs.")
+    diff_parser = subparsers.add_parser("diff", help="list the verbs whose digests differ")
+    diff_parser.add_argument("old", help="digest file of the old version")
+    diff_parser.add_argument("new", nargs="?", help="digest file of the new version. Defaults to digesting the lexicon with this library version.")
+    diff_parser.add_argument("--jmdict", metavar="PATH", help="lexicon digested when new is omitted. Defaults to the golden corpus verbs.")
+    args = parser.parse_args(argv)
+
+    if args.command == "write":
+        lexicon_digest = LexiconDigest.compute(_read_lexicon(args.jmdict))
+        lexicon_digest.save(args.output)
+        print("{} verbs, root {}".format(len(lexicon_digest), lexicon_digest.root))
+        return 0
+    old = LexiconDigest.load(args.old)
+    new = LexiconDigest.load(args.new) if args.new else LexiconDigest.compute(_read_lexicon(args.jmdict))
+    lexicon_diff = old.diff(new)
+    for change, keys in zip(LexiconDiff._fields, lexicon_diff):
+        for verb, verb_class in keys:
+            print("{}\t{}\t{}".format(change, verb, verb_class.name))
+    sys.stderr.write("{} changed, {} added, {} removed of {} verbs\n".format(
+        len(lexicon_diff.changed), len(lexicon_diff.added), len(lexicon_diff.removed), len(new)))
+    return 1 if any(lexicon_diff) else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
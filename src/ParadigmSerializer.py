@@ -0,0 +1,243 @@
+import argparse
+import collections
+import json
+import pickle
+import struct
+
+# Local modules
+from .constants.EnumeratedTypes import Formality, Polarity, Tense, VerbClass, VerbForm
+
+from .Paradigm import PARADIGM_SIGNATURES, generate_paradigm
+from .Profiling import best_time
+
+# ---------------------------------------------------------- #
+#                 BINARY PARADIGM FORMAT                     #
+# ---------------------------------------------------------- #
+# header: format version, verb class and entry count (one byte each), then the
+# UTF-8 lemma prefixed by its byte length. An entry table follows with six bytes
+# per entry: its signature as four enum codes (form, tense, formality,
+# polarity; 0 for None), a kind byte and the length of its text in characters.
+# The texts of all entries come last as one UTF-8 block, so that a paradigm is
+# encoded and decoded with a single codec call. Most surfaces start with the
+# stem of the lemma (the lemma without its last kana, or without する / くる
+# for irregular verbs), which is left out of their text.
+FORMAT_VERSION = 1
+HEADER = struct.Struct("!BBB")
+LENGTH = struct.Struct("!B")
+ENTRY_SIZE = 6
+
+KIND_NONE = 0
+KIND_SUFFIX = 1
+KIND_SURFACE = 2
+
+NONE_ENTRY = bytes((KIND_NONE, 0))
+
+_VERB_CLASSES = {verb_class.value: verb_class for verb_class in VerbClass}
+
+def _enum_code(member):
+    return 0 if member is None else member.value
+
+# signature -> 4 byte prefix of its entries, and back
+_SIGNATURE_CODES = {signature: bytes(_enum_code(member) for member in signature) for signature in PARADIGM_SIGNATURES}
+_CODE_SIGNATURES = {codes: signature for signature, codes in _SIGNATURE_CODES.items()}
+
+def paradigm_stem(verb, verb_class):
+    '''Stem shared by most surfaces of a verb's paradigm
+
+    Args:
+        verb (str): Japanese verb in kana, might contain kanji
+        verb_class (enum): VerbClass Enum representing the verb class
+            to which the verb belongs
+
+    Returns:
+        str: verb without its last kana, or without する / くる for irregular verbs
+    '''
+    if verb_class == VerbClass.IRREGULAR:
+        return verb[:-2]
+    return verb[:-1]
+
+def _entry_table(signatures):
+    # entry table with the enum codes of each signature filled in and zeroed
+    # kind and length bytes
+    signature_codes = _SIGNATURE_CODES
+    table = bytearray()
+    for signature in signatures:
+        codes = signature_codes.get(signature)
+        if codes is None:
+            raise ValueError("Signature is not part of the paradigm", *signature)
+        table += codes
+        table += NONE_ENTRY
+    return table
+
+# signature columns and entry table of a paradigm in generate_paradigm order,
+# whose table is copied instead of rebuilt
+_PARADIGM_COLUMNS = tuple(zip(*PARADIGM_SIGNATURES))
+_PARADIGM_TABLE = bytes(_entry_table(PARADIGM_SIGNATURES))
+
+def encode_paradigm(verb, verb_class, paradigm):
+    '''Encode a verb's paradigm in the compact binary format
+
+    Args:
+        verb (str): Japanese verb in kana, might contain kanji
+        verb_class (enum): VerbClass Enum representing the verb class
+            to which the verb belongs
+        paradigm (iterable): (form, tense, formality, polarity, surface) tuples,
+            e.g. the output of Paradigm.generate_paradigm
+
+    Returns:
+        bytes: encoded paradigm
+    '''
+    stem = paradigm_stem(verb, verb_class)
+    stem_length = len(stem)
+    verb_bytes = verb.encode("utf-8")
+    if len(verb_bytes) > 255:
+        raise ValueError("Verb is too long for the paradigm format", verb)
+    paradigm = list(paradigm)
+    num_entries = len(paradigm)
+    if num_entries > 255:
+        raise ValueError("Too many entries for the paradigm format", num_entries)
+    # the table is filled a column at a time instead of entry by entry
+    columns = tuple(zip(*paradigm)) or ((),) * 5
+    surfaces = columns[4]
+    if columns[:4] == _PARADIGM_COLUMNS:
+        table = bytearray(_PARADIGM_TABLE)
+    else:
+        table = _entry_table(zip(*columns[:4]))
+    kinds = [KIND_NONE if surface is None else KIND_SUFFIX if surface.startswith(stem) else KIND_SURFACE for surface in surfaces]
+    texts = [surface[stem_length:] if kind == KIND_SUFFIX else surface or "" for surface, kind in zip(surfaces, kinds)]
+    table[4::ENTRY_SIZE] = bytes(kinds)
+    try:
+        table[5::ENTRY_SIZE] = bytes(map(len, texts))
+    except ValueError:
+        surface = next(surface for surface, text in zip(surfaces, texts) if len(text) > 255)
+        raise ValueError("Surface is too long for the paradigm format", surface)
+    return b"".join((HEADER.pack(FORMAT_VERSION, verb_class.value, num_entries), LENGTH.pack(len(verb_bytes)), verb_bytes, table, "".join(texts).encode("utf-8")))
+
+def decode_paradigm(data):
+    '''Decode a paradigm encoded by encode_paradigm
+
+    Args:
+        data (bytes): encoded paradigm
+
+    Returns:
+        tuple: (verb, verb_class, entries) where entries is a list of
+            (form, tense, formality, polarity, surface) tuples in encoding order
+    '''
+    try:
+        version, verb_class_code, num_entries = HEADER.unpack_from(data, 0)
+        if version != FORMAT_VERSION:
+            raise ValueError("Unsupported paradigm format version", version)
+        verb_class = _VERB_CLASSES[verb_class_code]
+        offset = HEADER.size
+        verb_length = data[offset]
+        offset += 1
+        verb = data[offset:offset + verb_length].decode("utf-8")
+        offset += verb_length
+        stem = paradigm_stem(verb, verb_class)
+        texts_offset = offset + num_entries * ENTRY_SIZE
+        texts = data[texts_offset:].decode("utf-8")
+        code_signatures = _CODE_SIGNATURES
+        entries = []
+        position = 0
+        for entry_offset in range(offset, texts_offset, ENTRY_SIZE):
+            signature = code_signatures[data[entry_offset:entry_offset + 4]]
+            kind = data[entry_offset + 4]
+            end = position + data[entry_offset + 5]
+            if kind == KIND_SUFFIX:
+                surface = stem + texts[position:end]
+            elif kind == KIND_SURFACE:
+                surface = texts[position:end]
+            elif kind == KIND_NONE:
+                surface = None
+            else:
+                raise ValueError("Unknown entry kind", kind)
+            entries.append(signature + (surface,))
+            position = end
+    except (IndexError, KeyError, struct.error, UnicodeDecodeError) as error:
+        raise ValueError("Malformed paradigm", repr(error))
+    if position != len(texts) or texts_offset > len(data):
+        raise ValueError("Malformed paradigm", "entry lengths do not match the text block")
+    return verb, verb_class, entries
+
+# ---------------------------------------------------------- #
+#                        BENCHMARK                           #
+# ---------------------------------------------------------- #
+# pickle and JSON get the same (verb, verb_class, entries) triple. JSON has no
+# enums, so their names are written instead, as ColumnarExporter does.
+SerializerBenchmark = collections.namedtuple("SerializerBenchmark", ["name", "bytes_per_paradigm", "encodes_per_minute", "decodes_per_minute"])
+
+def _pickle_encode(verb, verb_class, entries):
+    return pickle.dumps((verb, verb_class, entries), pickle.HIGHEST_PROTOCOL)
+
+def _pickle_decode(data):
+    return pickle.loads(data)
+
+def _json_encode(verb, verb_class, entries):
+    rows = [[None if member is None else member.name for member in entry[:4]] + [entry[4]] for entry in entries]
+    return json.dumps([verb, verb_class.name, rows], ensure_ascii=False).encode("utf-8")
+
+_JSON_ENUM_TYPES = (VerbForm, Tense, Formality, Polarity)
+
+def _json_decode(data):
+    verb, verb_class_name, rows = json.loads(data.decode("utf-8"))
+    entries = [tuple(None if name is None else enum_type[name] for enum_type, name in zip(_JSON_ENUM_TYPES, row[:4])) + (row[4],) for row in rows]
+    return verb, VerbClass[verb_class_name], entries
+
+SERIALIZERS = (
+    ("binary", encode_paradigm, decode_paradigm),
+    ("pickle", _pickle_encode, _pickle_decode),
+    ("json", _json_encode, _json_decode),
+)
+
+def _best_time(function, arguments, repeat):
+    def timed_pass():
+        for argument in arguments:
+            function(*argument)
+    return best_time(timed_pass, repeat)
+
+def benchmark_serializers(paradigms, repeat=3):
+    '''Compare the binary format with pickle and JSON
+
+    Args:
+        paradigms (list): (verb, verb_class, entries) triples
+        repeat (:obj: int, optional): number of timed passes, the fastest is kept.
+            Defaults to 3.
+
+    Returns:
+        list: SerializerBenchmark per serializer
+    '''
+    results = []
+    for name, encode, decode in SERIALIZERS:
+        encoded = [(encode(*paradigm),) for paradigm in paradigms]
+        for (data,), paradigm in zip(encoded, paradigms):
+            if decode(data) != paradigm:
+                raise ValueError("Serializer does not round-trip", name, paradigm[0])
+        encode_time = _best_time(encode, paradigms, repeat)
+        decode_time = _best_time(decode, encoded, repeat)
+        results.append(SerializerBenchmark(
+            name,
+            sum(len(data) for data, in encoded) / len(encoded),
+            60 * len(paradigms) / encode_time,
+            60 * len(paradigms) / decode_time,
+        ))
+    return results
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the binary paradigm format against pickle and JSON.")
+    parser.add_argument("--verbs", type=int, default=1000, help="number of golden corpus verbs to serialize")
+    parser.add_argument("--repeat", type=int, default=3, help="number of timed passes")
+    args = parser.parse_args(argv)
+
+    from .GoldenCorpus import load_golden_corpus
+    from .JapaneseVerbFormGenerator import JapaneseVerbFormGenerator
+    generator = JapaneseVerbFormGenerator()
+    paradigms = [
+        (entry.verb, entry.verb_class, list(generate_paradigm(generator, entry.verb, entry.verb_class)))
+        for entry in load_golden_corpus()[:args.verbs]
+    ]
+    print("{:<8}{:>10}{:>16}{:>16}".format("format", "bytes", "encodes/min", "decodes/min"))
+    for result in benchmark_serializers(paradigms, args.repeat):
+        print("{:<8}{:>10.1f}{:>16,.0f}{:>16,.0f}".format(*result))
+
+if __name__ == "__main__":
+    main()
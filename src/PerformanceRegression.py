@@ -0,0 +1,273 @@
+import argparse
+import collections
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+# Local modules
+from .constants.EnumeratedTypes import Polarity, Tense, VerbClass, VerbForm
+
+from .Decorators import validate_many
+from .JapaneseVerbFormGenerator import JapaneseVerbFormGenerator
+from .Paradigm import conjugate_form, generate_paradigm
+from .Profiling import SYNTHETIC_LEXICON, zipf_workload
+
+DEFAULT_BASELINE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests", "data", "performance_baseline.json")
+BASELINE_VERSION = 1
+DEFAULT_TOLERANCE = 0.25
+DEFAULT_MIN_TIME = 0.05
+DEFAULT_REPEAT = 11
+
+# ---------------------------------------------------------- #
+#                        CALIBRATION                         #
+# ---------------------------------------------------------- #
+_CALIBRATION_WORDS = tuple("{}{}".format(verb, index) for index in range(8) for verb, _ in SYNTHETIC_LEXICON)
+
+def calibration_loop(iterations=2000):
+    '''Fixed interpreter workload made of the operations conjugation spends its
+    time on: slicing, string building, dict lookups and comparisons. Workload
+    throughput is divided by the throughput of this loop, which cancels most
+    of the difference between machines and Python builds.
+
+    Args:
+        iterations (:obj: int, optional): passes over the calibration words.
+            Defaults to 2000.
+
+    Returns:
+        int: number of operations performed
+    '''
+    table = dict((word[-1], word[-1:]) for word in _CALIBRATION_WORDS)
+    operations = 0
+    for _ in range(iterations):
+        for word in _CALIBRATION_WORDS:
+            if "{}{}".format(word[:-1], table.get(word[-1], "")) == word:
+                operations += 1
+    return operations
+
+# ---------------------------------------------------------- #
+#                         WORKLOADS                          #
+# ---------------------------------------------------------- #
+IRREGULAR_HEAVY_FRACTION = 0.75
+
+def irregular_heavy_workload(num_verbs, seed=0):
+    '''Sample verbs so that about IRREGULAR_HEAVY_FRACTION of them are irregular
+
+    Args:
+        num_verbs (int): number of verbs to sample
+        seed (:obj: int, optional): random seed. Defaults to 0.
+
+    Returns:
+        list: sampled (verb, verb_class) pairs
+    '''
+    rng = random.Random(seed)
+    irregular = [entry for entry in SYNTHETIC_LEXICON if entry[1] == VerbClass.IRREGULAR]
+    regular = [entry for entry in SYNTHETIC_LEXICON if entry[1] != VerbClass.IRREGULAR]
+    return [rng.choice(irregular if rng.random() < IRREGULAR_HEAVY_FRACTION else regular) for _ in range(num_verbs)]
+
+def _single_conjugation(generator, scale):
+    def run():
+        for _ in range(scale):
+            conjugate_form(generator, "食べる", VerbClass.ICHIDAN, VerbForm.PLAIN, Tense.PAST, None, Polarity.NEGATIVE)
+        return scale
+    return run
+
+def _full_paradigm(generator, scale):
+    def run():
+        count = 0
+        for _ in range(scale):
+            for _ in generate_paradigm(generator, "書く", VerbClass.GODAN):
+                count += 1
+        return count
+    return run
+
+def _batch(generator, scale):
+    verbs = zipf_workload(scale)
+    def run():
+        for verb, verb_class in verbs:
+            conjugate_form(generator, verb, verb_class, VerbForm.POLITE, Tense.NONPAST, None, Polarity.POSITIVE)
+        return len(verbs)
+    return run
+
+def _validation_only(generator, scale):
+    verbs = [verb for verb, _ in zipf_workload(scale)]
+    def run():
+        validate_many(verbs)
+        return len(verbs)
+    return run
+
+def _irregular_heavy(generator, scale):
+    verbs = irregular_heavy_workload(scale)
+    def run():
+        count = 0
+        for verb, verb_class in verbs:
+            for _ in generate_paradigm(generator, verb, verb_class):
+                count += 1
+        return count
+    return run
+
+# workload name -> (factory of (generator, scale) returning a run function
+# that returns its operation count, default scale)
+WORKLOADS = collections.OrderedDict([
+    ("single_conjugation", (_single_conjugation, 1000)),
+    ("full_paradigm", (_full_paradigm, 20)),
+    ("batch_10k", (_batch, 10000)),
+    ("validation_only", (_validation_only, 10000)),
+    ("irregular_heavy", (_irregular_heavy, 100)),
+])
+
+# ---------------------------------------------------------- #
+#                        MEASUREMENT                         #
+# ---------------------------------------------------------- #
+WorkloadResult = collections.namedtuple("WorkloadResult", ["name", "operations_per_second", "calibration_per_second", "score"])
+
+def measure_rate(run, min_time=DEFAULT_MIN_TIME):
+    '''Measure the operations per second of a function, calling it until
+    min_time has elapsed
+
+    Args:
+        run (callable): returns the number of operations it performed
+        min_time (:obj: float, optional): seconds to run for. Defaults to DEFAULT_MIN_TIME.
+
+    Returns:
+        float: operations per second
+    '''
+    operations = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < min_time:
+        operations += run()
+        elapsed = time.perf_counter() - start
+    return operations / elapsed
+
+def run_workloads(names=None, scale=1.0, min_time=DEFAULT_MIN_TIME, repeat=DEFAULT_REPEAT):
+    '''Measure workloads and normalize them by the calibration loop. Each of
+    the repeat rounds times the calibration loop and then the workload, so both
+    run at the same clock speed and under the same load. The score is the
+    median ratio of the rounds, which ignores rounds disturbed by other
+    processes.
+
+    Args:
+        names (:obj: list, optional): workload names. Defaults to every workload.
+        scale (:obj: float, optional): multiplier of the workload sizes.
+            Defaults to 1.0.
+        min_time (:obj: float, optional): seconds per measurement. Defaults to DEFAULT_MIN_TIME.
+        repeat (:obj: int, optional): number of rounds. Defaults to DEFAULT_REPEAT.
+
+    Returns:
+        list: WorkloadResult per workload with median rates, score being the
+            workload rate divided by the calibration rate
+    '''
+    generator = JapaneseVerbFormGenerator()
+    results = []
+    for name in (WORKLOADS if names is None else names):
+        factory, size = WORKLOADS[name]
+        run = factory(generator, max(1, int(size * scale)))
+        # warm up before timing
+        run()
+        calibration_rates = []
+        workload_rates = []
+        for _ in range(repeat):
+            calibration_rates.append(measure_rate(calibration_loop, min_time))
+            workload_rates.append(measure_rate(run, min_time))
+        score = statistics.median(workload_rate / calibration_rate for workload_rate, calibration_rate in zip(workload_rates, calibration_rates))
+        results.append(WorkloadResult(name, statistics.median(workload_rates), statistics.median(calibration_rates), score))
+    return results
+
+# ---------------------------------------------------------- #
+#                     BASELINE COMPARISON                    #
+# ---------------------------------------------------------- #
+Regression = collections.namedtuple("Regression", ["name", "baseline_score", "score", "ratio"])
+
+def write_baseline(results, path=DEFAULT_BASELINE_PATH, tolerance=DEFAULT_TOLERANCE):
+    '''Write workload scores as the baseline
+
+    Args:
+        results (list): WorkloadResult tuples
+        path (:obj: str, optional): baseline JSON path. Defaults to DEFAULT_BASELINE_PATH.
+        tolerance (:obj: float, optional): allowed relative score drop.
+            Defaults to DEFAULT_TOLERANCE.
+    '''
+    baseline = {
+        "version": BASELINE_VERSION,
+        "tolerance": tolerance,
+        "python": "{}.{}".format(*sys.version_info[:2]),
+        "scores": collections.OrderedDict((result.name, round(result.score, 6)) for result in results),
+    }
+    with open(path, "w", encoding="utf-8") as baseline_file:
+        json.dump(baseline, baseline_file, indent=2)
+        baseline_file.write("\n")
+
+def load_baseline(path=DEFAULT_BASELINE_PATH):
+    '''Read a baseline written by write_baseline
+
+    Args:
+        path (:obj: str, optional): baseline JSON path. Defaults to DEFAULT_BASELINE_PATH.
+
+    Returns:
+        dict: the baseline
+
+    Raises:
+        ValueError: if the baseline version is not supported
+    '''
+    with open(path, encoding="utf-8") as baseline_file:
+        baseline = json.load(baseline_file)
+    if baseline.get("version") != BASELINE_VERSION:
+        raise ValueError("Unsupported performance baseline version", baseline.get("version"))
+    return baseline
+
+def compare_to_baseline(results, baseline, tolerance=None):
+    '''Find workloads whose score dropped below the baseline by more than the
+    tolerance. Workloads missing from the baseline are not compared.
+
+    Args:
+        results (list): WorkloadResult tuples
+        baseline (dict): see load_baseline
+        tolerance (:obj: float, optional): allowed relative score drop.
+            Defaults to the baseline's tolerance.
+
+    Returns:
+        list: Regression tuples, empty if no workload regressed
+    '''
+    if tolerance is None:
+        tolerance = baseline["tolerance"]
+    regressions = []
+    for result in results:
+        baseline_score = baseline["scores"].get(result.name)
+        if baseline_score is None:
+            continue
+        ratio = result.score / baseline_score
+        if ratio < 1.0 - tolerance:
+            regressions.append(Regression(result.name, baseline_score, result.score, ratio))
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the performance workloads and fail when they regress against the baseline.")
+    parser.add_argument("workloads", nargs="*", help="workloads to run, out of {}. Defaults to all of them.".format(", ".join(WORKLOADS)))
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE_PATH, help="baseline JSON path")
+    parser.add_argument("--tolerance", type=float, help="allowed relative score drop. Defaults to the baseline's tolerance.")
+    parser.add_argument("--update", action="store_true", help="write the results as the new baseline instead of comparing")
+    parser.add_argument("--scale", type=float, default=1.0, help="multiplier of the workload sizes")
+    args = parser.parse_args(argv)
+    for name in args.workloads:
+        if name not in WORKLOADS:
+            parser.error("unknown workload {}".format(name))
+
+    results = run_workloads(args.workloads or None, args.scale)
+    baseline = None if args.update else load_baseline(args.baseline)
+    print("{:<20}{:>14}{:>12}{:>12}".format("workload", "ops/s", "score", "baseline"))
+    for result in results:
+        baseline_score = "" if baseline is None else baseline["scores"].get(result.name, "")
+        print("{:<20}{:>14.0f}{:>12.6f}{:>12}".format(result.name, result.operations_per_second, result.score, baseline_score))
+    if args.update:
+        write_baseline(results, args.baseline, DEFAULT_TOLERANCE if args.tolerance is None else args.tolerance)
+        return 0
+    regressions = compare_to_baseline(results, baseline, args.tolerance)
+    for regression in regressions:
+        print("REGRESSION {}: score {:.6f} is {:.0%} of baseline {:.6f}".format(regression.name, regression.score, regression.ratio, regression.baseline_score))
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
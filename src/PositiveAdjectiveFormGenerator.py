@@ -0,0 +1,97 @@
+# Local modules
+from .constants.AdjectiveEndingConstants import *
+from .constants.EnumeratedTypes import AdjectiveClass, Tense
+
+from .Utils import base_adjective_form
+
+# ---------------------------------------------------------- #
+#                    Positive Adjective Forms                #
+# ---------------------------------------------------------- #
+class PositiveAdjectiveForms:
+    def generate_plain_form(self, adjective, adjective_class, tense):
+        '''Generate the positive plain form of the adjective depending
+        on the tense.
+
+        Args:
+            adjective (str): Japanese adjective in kana, might contain kanji
+            adjective_class (enum): AdjectiveClass Enum representing the adjective
+                class to which the adjective belongs
+            tense (enum): Tense Enum representing the tense for the conjugated adjective
+
+        Returns:
+            str: positive plain form of the adjective based on the tense parameter
+        '''
+        if tense == Tense.NONPAST:
+            if adjective_class == AdjectiveClass.I_ADJECTIVE:
+                return adjective
+            return "{}{}".format(adjective, NA_ADJECTIVE_PLAIN_POSITIVE_NONPAST_ENDING)
+        return base_adjective_form(adjective, adjective_class, I_ADJECTIVE_PLAIN_POSITIVE_PAST_ENDING, NA_ADJECTIVE_PLAIN_POSITIVE_PAST_ENDING)
+
+    def generate_polite_form(self, adjective, adjective_class, tense):
+        '''Generate the positive polite form of the adjective depending
+        on the tense.
+
+        Args:
+            adjective (str): Japanese adjective in kana, might contain kanji
+            adjective_class (enum): AdjectiveClass Enum representing the adjective
+                class to which the adjective belongs
+            tense (enum): Tense Enum representing the tense for the conjugated adjective
+
+        Returns:
+            str: positive polite form of the adjective based on the tense parameter
+        '''
+        if tense == Tense.NONPAST:
+            return "{}{}".format(adjective, DESU_ENDING)
+        return base_adjective_form(adjective, adjective_class, I_ADJECTIVE_POLITE_POSITIVE_PAST_ENDING, NA_ADJECTIVE_POLITE_POSITIVE_PAST_ENDING)
+
+    def generate_te_form(self, adjective, adjective_class):
+        '''Generate the -te form of the adjective
+
+        Args:
+            adjective (str): Japanese adjective in kana, might contain kanji
+            adjective_class (enum): AdjectiveClass Enum representing the adjective
+                class to which the adjective belongs
+
+        Returns:
+            str: -te form of the adjective
+        '''
+        return base_adjective_form(adjective, adjective_class, I_ADJECTIVE_TE_ENDING, NA_ADJECTIVE_TE_ENDING)
+
+    def generate_adverbial_form(self, adjective, adjective_class):
+        '''Generate the adverbial (-ku / -ni) form of the adjective
+
+        Args:
+            adjective (str): Japanese adjective in kana, might contain kanji
+            adjective_class (enum): AdjectiveClass Enum representing the adjective
+                class to which the adjective belongs
+
+        Returns:
+            str: adverbial form of the adjective
+        '''
+        return base_adjective_form(adjective, adjective_class, I_ADJECTIVE_ADVERBIAL_ENDING, NA_ADJECTIVE_ADVERBIAL_ENDING)
+
+    def generate_conditional_form(self, adjective, adjective_class):
+        '''Generate the positive conditional (-tara) form of the adjective
+
+        Args:
+            adjective (str): Japanese adjective in kana, might contain kanji
+            adjective_class (enum): AdjectiveClass Enum representing the adjective
+                class to which the adjective belongs
+
+        Returns:
+            str: positive conditional form of the adjective
+        '''
+        return base_adjective_form(adjective, adjective_class, I_ADJECTIVE_CONDITIONAL_POSITIVE_ENDING, NA_ADJECTIVE_CONDITIONAL_POSITIVE_ENDING)
+
+    def generate_provisional_form(self, adjective, adjective_class):
+        '''Generate the positive provisional (-ba / nara) form of the adjective
+
+        Args:
+            adjective (str): Japanese adjective in kana, might contain kanji
+            adjective_class (enum): AdjectiveClass Enum representing the adjective
+                class to which the adjective belongs
+
+        Returns:
+            str: positive provisional form of the adjective
+        '''
+        return base_adjective_form(adjective, adjective_class, I_ADJECTIVE_PROVISIONAL_POSITIVE_ENDING, NA_ADJECTIVE_PROVISIONAL_POSITIVE_ENDING)
@@ -42,16 +42,7 @@ class PositiveVerbForms:
         ending = MASU_POSITIVE_PAST
         if tense == Tense.NONPAST:
             ending = MASU_POSITIVE_NONPAST
-    
-        if verb_class == VerbClass.IRREGULAR:
-            # ending is the same regardless. Any way to account for this? 
-            return handle_irregular_verb(verb, True, ending, ending)
-        else:
-            verb_stem = splice_verb(verb, verb_class)
-            if verb_class == VerbClass.GODAN:
-                verb_stem = map_dictionary_to_i_ending(verb)
-            # ichidan verb class check is not needed here
-            return "{}{}".format(verb_stem, ending)
+        return base_masu_form(verb, verb_class, ending)
 
     def generate_te_form(self, verb, verb_class):
         '''Utilize base_te_ta_form function to generate the -te form 
@@ -83,10 +74,8 @@ class PositiveVerbForms:
         parameter
         '''
         if formality == Formality.PLAIN:
-            verb = base_te_ta_form(verb, verb_class, TA_PARTICLE, DA_PARTICLE)
-        else:
-            verb = self.generate_polite_form(verb, verb_class, Tense.PAST)
-        return "{}{}".format(verb, RA_PARTICLE)
+            return base_te_ta_form(verb, verb_class, CONDITIONAL_TA_ENDING, CONDITIONAL_DA_ENDING)
+        return base_masu_form(verb, verb_class, CONDITIONAL_POLITE_POSITIVE_ENDING)
 
     def generate_volitional_form(self, verb, verb_class, formality):
         '''Generate the positive volitional form of the verb depending
@@ -105,23 +94,16 @@ class PositiveVerbForms:
         '''
         if verb_class == VerbClass.IRREGULAR:
             return handle_irregular_verb(verb, suru_ending=VOLITIONAL_SURU_ENDING, kuru_ending=VOLITIONAL_KURU_ENDING)
-        else:
-            verb_base = ""
-            ending = ""
-            if verb_class == VerbClass.GODAN:
-                # assuming plain formality param
-                verb_base = map_dictionary_to_o_ending(verb)
-                ending = U_PARTICLE
-                if formality == Formality.POLITE:
-                    verb_base = map_dictionary_to_i_ending(verb)
-                    ending = VOLITIONAL_POLITE_ENDING
-            elif verb_class == VerbClass.ICHIDAN:
-                verb_base = splice_verb(verb, verb_class)
-                # assuming plain formality param
-                ending = VOLITIONAL_ICHIDAN_PLAIN_ENDING
-                if formality == Formality.POLITE:
-                    ending = VOLITIONAL_POLITE_ENDING
-        return "{}{}".format(verb_base, ending)
+        elif verb_class == VerbClass.GODAN:
+            if formality == Formality.POLITE:
+                return map_dictionary_to_i_ending(verb, VOLITIONAL_POLITE_ENDING)
+            return map_dictionary_to_o_ending(verb, U_PARTICLE)
+        elif verb_class == VerbClass.ICHIDAN:
+            # assuming plain formality param
+            ending = VOLITIONAL_ICHIDAN_PLAIN_ENDING
+            if formality == Formality.POLITE:
+                ending = VOLITIONAL_POLITE_ENDING
+            return "{}{}".format(splice_verb(verb, verb_class), ending)
 
     def generate_potential_form(self, verb, verb_class, formality):
         '''Generate the positive potential form of the verb depending
@@ -143,22 +125,15 @@ class PositiveVerbForms:
                 return handle_irregular_verb(verb, suru_ending=POTENTIAL_SURU_PLAIN_POSITIVE_ENDING, kuru_ending=POTENTIAL_KURU_PLAIN_POSITIVE_ENDING)
             else:
                 return handle_irregular_verb(verb, suru_ending=POTENTIAL_SURU_POLITE_POSITIVE_ENDING, kuru_ending=POTENTIAL_KURU_POLITE_POSITIVE_ENDING)
-        else:
-            # assuming godan plain form 
-            verb_base = map_dictionary_to_e_ending(verb)
-            ending = RU_PARTICLE
-            
-            if verb_class == VerbClass.GODAN:
-                if formality == Formality.POLITE:
-                    verb_base = map_dictionary_to_e_ending(verb)
-                    ending = MASU_POSITIVE_NONPAST
-            elif verb_class == VerbClass.ICHIDAN:
-                verb_base = splice_verb(verb, verb_class)
-                if formality == Formality.PLAIN:
-                    ending = POTENTIAL_ICHIDAN_ENDING
-                else:
-                    ending = POTENTIAL_POLITE_ICHIDAN_ENDING
-            return "{}{}".format(verb_base, ending)
+        elif verb_class == VerbClass.GODAN:
+            if formality == Formality.POLITE:
+                return map_dictionary_to_e_ending(verb, MASU_POSITIVE_NONPAST)
+            return map_dictionary_to_e_ending(verb, RU_PARTICLE)
+        elif verb_class == VerbClass.ICHIDAN:
+            ending = POTENTIAL_ICHIDAN_ENDING
+            if formality == Formality.POLITE:
+                ending = POTENTIAL_POLITE_ICHIDAN_ENDING
+            return "{}{}".format(splice_verb(verb, verb_class), ending)
 
     def generate_imperative_form(self, verb, verb_class, formality):
         '''Generate the positive imperative form of the verb depending
@@ -178,18 +153,12 @@ class PositiveVerbForms:
         if verb_class == VerbClass.IRREGULAR:
             if formality == Formality.PLAIN:
                 return handle_irregular_verb(verb, suru_ending=IMPERATIVE_SURU_PLAIN_POSITIVE_ENDING, kuru_ending=IMPERATIVE_KURU_PLAIN_POSITIVE_ENDING)
-            else:
-                return "{}{}".format(self.generate_te_form(verb, verb_class), KUDASAI)
-        else:
-            verb_base = self.generate_te_form(verb, verb_class)
-            ending = KUDASAI
-            if formality == Formality.PLAIN:
-                if verb_class == VerbClass.GODAN:
-                    return map_dictionary_to_e_ending(verb)
-                else:
-                    verb_base = splice_verb(verb, verb_class)
-                    ending = RO_PARTICLE
-            return "{}{}".format(verb_base, ending)
+        elif formality == Formality.PLAIN:
+            if verb_class == VerbClass.GODAN:
+                return map_dictionary_to_e_ending(verb)
+            return "{}{}".format(splice_verb(verb, verb_class), RO_PARTICLE)
+        # the -te form followed by ください, attached to the stem in one step
+        return base_te_ta_form(verb, verb_class, IMPERATIVE_TE_POLITE_POSITIVE_ENDING, IMPERATIVE_DE_POLITE_POSITIVE_ENDING)
 
     def generate_provisional_form(self, verb, verb_class, formality=None):
         '''Generate the positive provisional form of the verb depending
@@ -212,15 +181,10 @@ class PositiveVerbForms:
                 return handle_irregular_verb(verb, suru_ending=PROVISIONAL_SURU_PLAIN_POSITIVE_ENDING, kuru_ending=PROVISIONAL_KURU_PLAIN_POSITIVE_ENDING)
             else:
                 return handle_irregular_verb(verb, suru_ending=PROVISIONAL_SURU_POLITE_POSITIVE_ENDING, kuru_ending=PROVISIONAL_KURU_POLITE_POSITIVE_ENDING)
-        else:
-            # assuming godan verb 
-            verb_base = map_dictionary_to_e_ending(verb)
-            ending = BA_PARTICLE
-
-            if verb_class == VerbClass.ICHIDAN:
-                verb_base = splice_verb(verb, verb_class)
-                ending = "{}{}".format(RE_PARTICLE, BA_PARTICLE)
-            return "{}{}".format(verb_base, ending)
+        elif verb_class == VerbClass.ICHIDAN:
+            return "{}{}".format(splice_verb(verb, verb_class), PROVISIONAL_ICHIDAN_PLAIN_POSITIVE_ENDING)
+        # assuming godan verb
+        return map_dictionary_to_e_ending(verb, BA_PARTICLE)
 
     def generate_causative_form(self, verb, verb_class, formality):
         '''Generate the positive causative form of the verb depending
@@ -240,20 +204,15 @@ class PositiveVerbForms:
         if verb_class == VerbClass.IRREGULAR:
             if formality == Formality.PLAIN:
                 return handle_irregular_verb(verb, suru_ending=CAUSATIVE_PLAIN_SURU_ENDING, kuru_ending=CAUSATIVE_PLAIN_KURU_ENDING)
-        else:
-            # TODO FIX ALL THIS LOGIC... GROSS :-P
-            if verb_class == VerbClass.GODAN:
-                verb_with_a_ending = map_dictionary_to_a_ending(verb)
-                if formality == Formality.PLAIN:
-                    return "{}{}{}".format(verb_with_a_ending, SE_PARTICLE, RU_PARTICLE)
-                else:
-                    return "{}{}{}".format(verb_with_a_ending, SE_PARTICLE, MASU_POSITIVE_NONPAST)
-            elif verb_class == VerbClass.ICHIDAN:
-                verb_stem = splice_verb(verb, verb_class)
-                if formality == Formality.PLAIN:
-                    return "{}{}{}{}".format(verb_stem, SA_PARTICLE, SE_PARTICLE, RU_PARTICLE)
-                else:
-                    return "{}{}{}{}".format(verb_stem, SA_PARTICLE, SE_PARTICLE, MASU_POSITIVE_NONPAST)
+        elif verb_class == VerbClass.GODAN:
+            if formality == Formality.PLAIN:
+                return map_dictionary_to_a_ending(verb, CAUSATIVE_GODAN_PLAIN_POSITIVE_ENDING)
+            return map_dictionary_to_a_ending(verb, CAUSATIVE_GODAN_POLITE_POSITIVE_ENDING)
+        elif verb_class == VerbClass.ICHIDAN:
+            ending = CAUSATIVE_ICHIDAN_PLAIN_POSITIVE_ENDING
+            if formality == Formality.POLITE:
+                ending = CAUSATIVE_ICHIDAN_POLITE_POSITIVE_ENDING
+            return "{}{}".format(splice_verb(verb, verb_class), ending)
 
     def generate_passive_form(self, verb, verb_class, formality):
         '''Generate the positive passive form of the verb depending
@@ -273,16 +232,139 @@ class PositiveVerbForms:
         if verb_class == VerbClass.IRREGULAR:
             if formality == Formality.PLAIN:
                 return handle_irregular_verb(verb, suru_ending=PASSIVE_SURU_PLAIN_POSITIVE_ENDING, kuru_ending=PASSIVE_KURU_PLAIN_POSITIVE_ENDING)
-        else:
-            if verb_class == VerbClass.GODAN:
-                verb_with_a_ending = map_dictionary_to_a_ending(verb)
-                if formality == Formality.PLAIN:
-                    return "{}{}{}".format(verb_with_a_ending, RE_PARTICLE, RU_PARTICLE)
-                else:
-                    return "{}{}{}".format(verb_with_a_ending, RE_PARTICLE, MASU_POSITIVE_NONPAST)
-            elif verb_class == VerbClass.ICHIDAN:
-                verb_stem = splice_verb(verb, verb_class)
-                if formality == Formality.PLAIN:
-                    return "{}{}".format(verb_stem, PASSIVE_ICHIDAN_PLAIN_POSITIVE_ENDING)
-                else:
-                    return "{}{}".format(verb_stem, PASSIVE_ICHIDAN_POLITE_POSITIVE_ENDING)
+        elif verb_class == VerbClass.GODAN:
+            if formality == Formality.PLAIN:
+                return map_dictionary_to_a_ending(verb, PASSIVE_GODAN_PLAIN_POSITIVE_ENDING)
+            return map_dictionary_to_a_ending(verb, PASSIVE_GODAN_POLITE_POSITIVE_ENDING)
+        elif verb_class == VerbClass.ICHIDAN:
+            ending = PASSIVE_ICHIDAN_PLAIN_POSITIVE_ENDING
+            if formality == Formality.POLITE:
+                ending = PASSIVE_ICHIDAN_POLITE_POSITIVE_ENDING
+            return "{}{}".format(splice_verb(verb, verb_class), ending)
+
+    def generate_desire_form(self, verb, verb_class, formality):
+        '''Generate the positive desire (-tai) form of the verb depending
+        on the level of formality.
+
+        Args:
+            verb (str): Japanese verb in kana, might contain kanji
+            verb_class (enum): VerbClass Enum representing the verb class
+                to which the verb belongs
+            formality (enum): Formality Enum representing the formality class
+                for the conjugated verb
+
+        Returns:
+            str: positive desire form based on the specified formality parameter
+        '''
+        if formality == Formality.PLAIN:
+            return base_masu_form(verb, verb_class, TAI_PLAIN_POSITIVE_ENDING)
+        return base_masu_form(verb, verb_class, TAI_POLITE_POSITIVE_ENDING)
+
+    def generate_sou_form(self, verb, verb_class, formality):
+        '''Generate the positive appearance (-sou, "looks like") form of the
+        verb depending on the level of formality.
+
+        Args:
+            verb (str): Japanese verb in kana, might contain kanji
+            verb_class (enum): VerbClass Enum representing the verb class
+                to which the verb belongs
+            formality (enum): Formality Enum representing the formality class
+                for the conjugated verb
+
+        Returns:
+            str: positive appearance form based on the specified formality parameter
+        '''
+        if formality == Formality.PLAIN:
+            return base_masu_form(verb, verb_class, SOU_PLAIN_POSITIVE_ENDING)
+        return base_masu_form(verb, verb_class, SOU_POLITE_POSITIVE_ENDING)
+
+    def generate_nagara_form(self, verb, verb_class):
+        '''Generate the -nagara ("while doing") form of the verb
+
+        Args:
+            verb (str): Japanese verb in kana, might contain kanji
+            verb_class (enum): VerbClass Enum representing the verb class
+                to which the verb belongs
+
+        Returns:
+            str: -nagara form of the verb
+        '''
+        return base_masu_form(verb, verb_class, NAGARA_ENDING)
+
+    def generate_zu_form(self, verb, verb_class):
+        '''Generate the -zu ("without doing") form of the verb. The form is
+        negative by meaning but takes no polarity, like the -te form.
+
+        Args:
+            verb (str): Japanese verb in kana, might contain kanji
+            verb_class (enum): VerbClass Enum representing the verb class
+                to which the verb belongs
+
+        Returns:
+            str: -zu form of the verb
+        '''
+        if verb_class == VerbClass.IRREGULAR and verb[-2:] == SURU_ENDING:
+            return "{}{}".format(verb[:-2], ZU_SURU_ENDING)
+        return base_nai_form(verb, verb_class, ZU_ENDING)
+
+    def generate_tari_form(self, verb, verb_class):
+        '''Utilize base_te_ta_form function to generate the -tari form
+        of the verb
+
+        Args:
+            verb (str): Japanese verb in kana, might contain kanji
+            verb_class (enum): VerbClass Enum representing the verb class
+                to which the verb belongs
+
+        Returns:
+            str: -tari form of the verb
+        '''
+        return base_te_ta_form(verb, verb_class, TARI_ENDING, DARI_ENDING)
+
+    def generate_honorific_form(self, verb, verb_class, formality):
+        '''Generate the positive honorific (o- -ni naru) form of the verb
+        depending on the level of formality. Suru and kuru verbs become
+        なさる and いらっしゃる. Other verbs with their own honorific verb
+        (見る -> ご覧になる) follow the regular pattern.
+
+        Args:
+            verb (str): Japanese verb in kana, might contain kanji
+            verb_class (enum): VerbClass Enum representing the verb class
+                to which the verb belongs
+            formality (enum): Formality Enum representing the formality class
+                for the conjugated verb
+
+        Returns:
+            str: positive honorific form based on the specified formality parameter
+        '''
+        if verb_class == VerbClass.IRREGULAR:
+            if formality == Formality.PLAIN:
+                return suppletive_irregular_form(verb, HONORIFIC_SURU_PLAIN_POSITIVE_ENDING, HONORIFIC_KURU_PLAIN_POSITIVE_ENDING)
+            return suppletive_irregular_form(verb, HONORIFIC_SURU_POLITE_POSITIVE_ENDING, HONORIFIC_KURU_POLITE_POSITIVE_ENDING)
+        ending = HONORIFIC_PLAIN_POSITIVE_ENDING
+        if formality == Formality.POLITE:
+            ending = HONORIFIC_POLITE_POSITIVE_ENDING
+        return "{}{}".format(HONORIFIC_PREFIX, base_masu_form(verb, verb_class, ending))
+
+    def generate_humble_form(self, verb, verb_class, formality):
+        '''Generate the positive humble (o- -suru) form of the verb depending
+        on the level of formality. Suru and kuru verbs become いたす and まいる.
+
+        Args:
+            verb (str): Japanese verb in kana, might contain kanji
+            verb_class (enum): VerbClass Enum representing the verb class
+                to which the verb belongs
+            formality (enum): Formality Enum representing the formality class
+                for the conjugated verb
+
+        Returns:
+            str: positive humble form based on the specified formality parameter
+        '''
+        if verb_class == VerbClass.IRREGULAR:
+            if formality == Formality.PLAIN:
+                return suppletive_irregular_form(verb, HUMBLE_SURU_PLAIN_POSITIVE_ENDING, HUMBLE_KURU_PLAIN_POSITIVE_ENDING)
+            return suppletive_irregular_form(verb, HUMBLE_SURU_POLITE_POSITIVE_ENDING, HUMBLE_KURU_POLITE_POSITIVE_ENDING)
+        ending = HUMBLE_PLAIN_POSITIVE_ENDING
+        if formality == Formality.POLITE:
+            ending = HUMBLE_POLITE_POSITIVE_ENDING
+        return "{}{}".format(HUMBLE_PREFIX, base_masu_form(verb, verb_class, ending))
@@ -0,0 +1,268 @@
+import argparse
+import cProfile
+import io
+import os
+import pstats
+import random
+import sys
+import time
+import tracemalloc
+
+# Local modules
+from .constants.EnumeratedTypes import VerbClass
+
+from .JapaneseVerbFormGenerator import JapaneseVerbFormGenerator
+from .Paradigm import PARADIGM_SIGNATURES, conjugate_form, generate_paradigm
+
+# ---------------------------------------------------------- #
+#                     SYNTHETIC WORKLOAD                     #
+# ---------------------------------------------------------- #
+# ordered roughly by real-world frequency so that Zipf ranks follow the list.
+# every godan final kana, ichidan verbs, and kana / kanji / compound irregulars are included
+SYNTHETIC_LEXICON = (
+    ("する", VerbClass.IRREGULAR),
+    ("言う", VerbClass.GODAN),
+    ("くる", VerbClass.IRREGULAR),
+    ("思う", VerbClass.GODAN),
+    ("見る", VerbClass.ICHIDAN),
+    ("持つ", VerbClass.GODAN),
+    ("分かる", VerbClass.GODAN),
+    ("書く", VerbClass.GODAN),
+    ("食べる", VerbClass.ICHIDAN),
+    ("話す", VerbClass.GODAN),
+    ("勉強する", VerbClass.IRREGULAR),
+    ("聞く", VerbClass.GODAN),
+    ("飲む", VerbClass.GODAN),
+    ("来る", VerbClass.IRREGULAR),
+    ("始める", VerbClass.ICHIDAN),
+    ("待つ", VerbClass.GODAN),
+    ("読む", VerbClass.GODAN),
+    ("起きる", VerbClass.ICHIDAN),
+    ("帰る", VerbClass.GODAN),
+    ("教える", VerbClass.ICHIDAN),
+    ("買う", VerbClass.GODAN),
+    ("持ってくる", VerbClass.IRREGULAR),
+    ("作る", VerbClass.GODAN),
+    ("寝る", VerbClass.ICHIDAN),
+    ("使う", VerbClass.GODAN),
+    ("遊ぶ", VerbClass.GODAN),
+    ("出す", VerbClass.GODAN),
+    ("運動する", VerbClass.IRREGULAR),
+    ("泳ぐ", VerbClass.GODAN),
+    ("着る", VerbClass.ICHIDAN),
+    ("呼ぶ", VerbClass.GODAN),
+    ("急ぐ", VerbClass.GODAN),
+    ("死ぬ", VerbClass.GODAN),
+)
+
+def zipf_workload(num_verbs=10000, exponent=1.1, seed=0, lexicon=SYNTHETIC_LEXICON):
+    '''Sample verbs from a lexicon following a Zipf distribution over its ranks
+
+    Args:
+        num_verbs (:obj: int, optional): number of verbs to sample. Defaults to 10000.
+        exponent (:obj: float, optional): Zipf exponent, larger values concentrate the
+            workload on the first verbs of the lexicon. Defaults to 1.1.
+        seed (:obj: int, optional): random seed so workloads are reproducible.
+            Defaults to 0.
+        lexicon (:obj: sequence, optional): (verb, verb_class) pairs ordered by rank.
+            Defaults to SYNTHETIC_LEXICON.
+
+    Returns:
+        list: sampled (verb, verb_class) pairs
+    '''
+    weights = [1.0 / (rank ** exponent) for rank in range(1, len(lexicon) + 1)]
+    return random.Random(seed).choices(lexicon, weights=weights, k=num_verbs)
+
+def run_workload(workload, generator=None):
+    '''Conjugate every verb of a workload into every form of its paradigm
+
+    Args:
+        workload (iterable): (verb, verb_class) pairs
+        generator (:obj: JapaneseVerbFormGenerator, optional): generator used to
+            conjugate the verbs. Defaults to a new JapaneseVerbFormGenerator.
+
+    Returns:
+        int: number of conjugations performed
+    '''
+    if generator is None:
+        generator = JapaneseVerbFormGenerator()
+    num_conjugations = 0
+    for verb, verb_class in workload:
+        for _ in generate_paradigm(generator, verb, verb_class):
+            num_conjugations += 1
+    return num_conjugations
+
+def measure_throughput(workload, generator=None, repeat=3):
+    '''Time a workload and report the best of several runs
+
+    Args:
+        workload (list): (verb, verb_class) pairs to conjugate
+        generator (:obj: JapaneseVerbFormGenerator, optional): generator used to
+            conjugate the verbs. Defaults to a new JapaneseVerbFormGenerator.
+        repeat (:obj: int, optional): number of timed runs. Defaults to 3.
+
+    Returns:
+        float: conjugations per second of the fastest run
+    '''
+    if generator is None:
+        generator = JapaneseVerbFormGenerator()
+    best_elapsed = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        num_conjugations = run_workload(workload, generator)
+        elapsed = time.perf_counter() - start
+        if best_elapsed is None or elapsed < best_elapsed:
+            best_elapsed = elapsed
+    return num_conjugations / best_elapsed
+
+def best_time(function, repeat=3):
+    '''Call a function several times and report its fastest call
+
+    Args:
+        function (callable): timed function, called without arguments
+        repeat (:obj: int, optional): number of timed calls. Defaults to 3.
+
+    Returns:
+        float: seconds taken by the fastest call
+    '''
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def measure_peak_allocations(workload, generator=None):
+    '''Trace the memory allocated by each conjugation of a workload with
+    tracemalloc. Results are dropped right away, so the peak of a conjugation is
+    its result plus every intermediate string alive at the same time.
+
+    Args:
+        workload (list): (verb, verb_class) pairs to conjugate
+        generator (:obj: JapaneseVerbFormGenerator, optional): generator used to
+            conjugate the verbs. Defaults to a new JapaneseVerbFormGenerator.
+
+    Returns:
+        float: mean peak bytes allocated per conjugation
+    '''
+    if generator is None:
+        generator = JapaneseVerbFormGenerator()
+    total_peak_bytes = 0
+    num_conjugations = 0
+    tracemalloc.start()
+    try:
+        for verb, verb_class in workload:
+            for form, tense, formality, polarity in PARADIGM_SIGNATURES:
+                tracemalloc.reset_peak()
+                baseline_bytes = tracemalloc.get_traced_memory()[0]
+                conjugate_form(generator, verb, verb_class, form, tense, formality, polarity)
+                total_peak_bytes += tracemalloc.get_traced_memory()[1] - baseline_bytes
+                num_conjugations += 1
+    finally:
+        tracemalloc.stop()
+    return float(total_peak_bytes) / num_conjugations if num_conjugations else 0.0
+
+# ---------------------------------------------------------- #
+#                   COLLAPSED STACK PROFILER                 #
+# ---------------------------------------------------------- #
+class CollapsedStackProfiler:
+    ''' Deterministic profiler that records the self time of every full call
+    stack, in the collapsed "frame;frame;frame weight" format read by
+    flamegraph.pl, speedscope, and inferno. cProfile only keeps caller / callee
+    pairs, so it cannot produce these stacks on its own.
+    '''
+    def __init__(self):
+        self.stack_times = {}
+        self._stack = []
+        self._start_times = []
+        self._child_times = []
+
+    def _frame_name(self, frame, event, arg):
+        if event == "c_call":
+            return "<builtin>:{}".format(getattr(arg, "__qualname__", repr(arg)))
+        code = frame.f_code
+        return "{}:{}".format(os.path.basename(code.co_filename), code.co_name)
+
+    def _profile(self, frame, event, arg):
+        now = time.perf_counter()
+        if event in ("call", "c_call"):
+            self._stack.append(self._frame_name(frame, event, arg))
+            self._start_times.append(now)
+            self._child_times.append(0.0)
+        elif self._stack:
+            elapsed = now - self._start_times.pop()
+            self_time = elapsed - self._child_times.pop()
+            path = ";".join(self._stack)
+            self._stack.pop()
+            self.stack_times[path] = self.stack_times.get(path, 0.0) + self_time
+            if self._child_times:
+                self._child_times[-1] += elapsed
+
+    def runcall(self, func, *args, **kwargs):
+        sys.setprofile(self._profile)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            sys.setprofile(None)
+
+    def write_collapsed(self, path):
+        '''Write the recorded stacks with their self time in microseconds
+
+        Args:
+            path (str): destination file path
+        '''
+        with open(path, "w", encoding="utf-8") as collapsed_file:
+            for stack, seconds in sorted(self.stack_times.items()):
+                microseconds = int(round(seconds * 1000000))
+                if microseconds > 0:
+                    collapsed_file.write("{} {}\n".format(stack, microseconds))
+
+# ---------------------------------------------------------- #
+#                      PROFILING ENTRY POINT                 #
+# ---------------------------------------------------------- #
+def profile_workload(workload, output_prefix, top=25):
+    '''Profile a workload with cProfile and the collapsed stack profiler
+
+    Args:
+        workload (list): (verb, verb_class) pairs to conjugate
+        output_prefix (str): path prefix of the output files. Writes
+            <prefix>.prof (pstats) and <prefix>.collapsed (flamegraph stacks).
+        top (:obj: int, optional): number of functions in the summary. Defaults to 25.
+
+    Returns:
+        str: the top functions sorted by cumulative time
+    '''
+    generator = JapaneseVerbFormGenerator()
+
+    profiler = cProfile.Profile()
+    profiler.runcall(run_workload, workload, generator)
+    profiler.dump_stats("{}.prof".format(output_prefix))
+
+    stack_profiler = CollapsedStackProfiler()
+    stack_profiler.runcall(run_workload, workload, generator)
+    stack_profiler.write_collapsed("{}.collapsed".format(output_prefix))
+
+    summary = io.StringIO()
+    pstats.Stats(profiler, stream=summary).sort_stats("cumulative").print_stats(top)
+    return summary.getvalue()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Profile conjugation of a Zipf-distributed synthetic verb workload.")
+    parser.add_argument("--verbs", type=int, default=10000, help="number of verbs to sample (each is conjugated into every form)")
+    parser.add_argument("--exponent", type=float, default=1.1, help="Zipf exponent of the verb frequency distribution")
+    parser.add_argument("--seed", type=int, default=0, help="random seed of the workload")
+    parser.add_argument("--top", type=int, default=25, help="number of functions in the cumulative time summary")
+    parser.add_argument("--output", default="conjugation_profile", help="output path prefix for the .prof and .collapsed files")
+    parser.add_argument("--benchmark", action="store_true", help="report throughput and tracemalloc peak bytes per conjugation instead of profiling")
+    args = parser.parse_args(argv)
+
+    workload = zipf_workload(args.verbs, args.exponent, args.seed)
+    if args.benchmark:
+        print("{:.0f} conjugations/s".format(measure_throughput(workload)))
+        print("{:.1f} peak bytes allocated per conjugation".format(measure_peak_allocations(workload)))
+        return
+    print(profile_workload(workload, args.output, args.top))
+
+if __name__ == "__main__":
+    main()
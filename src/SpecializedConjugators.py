@@ -0,0 +1,252 @@
+import argparse
+
+# Local modules
+from .constants.EnumeratedTypes import Polarity, VerbClass
+from .constants.VerbEndingConstants import SURU_ENDING, KURU_ENDING, KURU_KANJI_ENDING
+
+from .Decorators import VALID_VERB_ENDINGS
+from .IntegerConjugator import IntegerConjugator, signature_form_id
+from .JapaneseVerbFormGenerator import JapaneseVerbFormGenerator
+from .NegativeVerbFormGenerator import NegativeVerbForms
+from .Paradigm import PARADIGM_SIGNATURES, conjugate_form, conjugate_with_verb_forms, signature_name
+from .PositiveVerbFormGenerator import PositiveVerbForms
+from .Profiling import best_time
+
+# ---------------------------------------------------------- #
+#                     ENDING DERIVATION                      #
+# ---------------------------------------------------------- #
+# For a fixed signature and verb class, every conjugation of a regular verb is
+# prefix + stem + ending, where the stem is the verb without its last kana and
+# the ending depends only on that kana. Irregular verbs drop する / くる / 来る
+# instead. The endings are derived by conjugating probe verbs with
+# PositiveVerbForms / NegativeVerbForms, so the specialized functions follow
+# any change to that logic.
+REGULAR_ENDING_KEYS = tuple(sorted(VALID_VERB_ENDINGS))
+IRREGULAR_ENDING_KEYS = (SURU_ENDING, KURU_ENDING, KURU_KANJI_ENDING)
+
+# two unrelated stems, so that an ending which secretly depends on the stem is caught
+PROBE_STEMS = ("勉強", "読")
+
+_POSITIVE_VERB_FORMS = PositiveVerbForms()
+_NEGATIVE_VERB_FORMS = NegativeVerbForms()
+
+def _reference_conjugation(verb, verb_class, signature):
+    form, tense, formality, polarity = signature
+    verb_forms = _NEGATIVE_VERB_FORMS if polarity == Polarity.NEGATIVE else _POSITIVE_VERB_FORMS
+    return conjugate_with_verb_forms(verb_forms, verb, verb_class, form, tense, formality)
+
+def derive_endings(signature, verb_class):
+    '''Derive the prefix and per-ending suffixes of a signature for a verb class
+
+    Args:
+        signature (tuple): entry of Paradigm.PARADIGM_SIGNATURES
+        verb_class (enum): VerbClass Enum of the verbs to conjugate
+
+    Returns:
+        tuple: (prefix, key_length, suffixes) where suffixes maps the last
+            key_length characters of a verb to the text following its stem.
+            Endings the reference does not conjugate are left out.
+
+    Raises:
+        ValueError: if a conjugation is not of the form prefix + stem + suffix
+    '''
+    keys = IRREGULAR_ENDING_KEYS if verb_class == VerbClass.IRREGULAR else REGULAR_ENDING_KEYS
+    key_length = len(keys[0])
+    prefixes = set()
+    suffixes = {}
+    for key in keys:
+        shapes = set()
+        for stem in PROBE_STEMS:
+            conjugated_verb = _reference_conjugation("{}{}".format(stem, key), verb_class, signature)
+            if conjugated_verb is None:
+                shapes.add(None)
+                continue
+            stem_index = conjugated_verb.find(stem)
+            if stem_index < 0:
+                raise ValueError("Conjugation does not keep the verb stem", signature, verb_class, conjugated_verb)
+            shapes.add((conjugated_verb[:stem_index], conjugated_verb[stem_index + len(stem):]))
+        if len(shapes) != 1:
+            raise ValueError("Conjugation depends on the verb stem", signature, verb_class, key)
+        shape = shapes.pop()
+        if shape is not None:
+            prefixes.add(shape[0])
+            suffixes[key] = shape[1]
+    if len(prefixes) > 1:
+        raise ValueError("Conjugation prefix depends on the verb ending", signature, verb_class)
+    return (prefixes.pop() if prefixes else ""), key_length, suffixes
+
+# ---------------------------------------------------------- #
+#                      CODE GENERATION                       #
+# ---------------------------------------------------------- #
+def function_name(signature, verb_class):
+    '''Name of the specialized function of a signature and verb class,
+    e.g. plain_past_negative_godan
+
+    Args:
+        signature (tuple): entry of Paradigm.PARADIGM_SIGNATURES
+        verb_class (enum): VerbClass Enum
+
+    Returns:
+        str: Python identifier
+    '''
+    return "{}_{}".format(signature_name(signature), verb_class.name.lower())
+
+def function_source(signature, verb_class):
+    '''Source of the specialized function of a signature and verb class. The
+    function takes a verb and returns the conjugated verb, or None where the
+    generic methods return None, including verbs whose ending is not one of
+    the probed endings. It does not otherwise validate the verb.
+
+    Args:
+        signature (tuple): entry of Paradigm.PARADIGM_SIGNATURES
+        verb_class (enum): VerbClass Enum
+
+    Returns:
+        str: source of one function definition, and of its ending table if
+            the suffix depends on the last kana
+    '''
+    name = function_name(signature, verb_class)
+    prefix, key_length, suffixes = derive_endings(signature, verb_class)
+    keys = IRREGULAR_ENDING_KEYS if verb_class == VerbClass.IRREGULAR else REGULAR_ENDING_KEYS
+    stem = "verb[:-{}]".format(key_length)
+    if prefix:
+        stem = "{!r} + {}".format(prefix, stem)
+    if not suffixes:
+        return "def {}(verb):\n    return None\n".format(name)
+    # shapes that do not look the ending up return None themselves for verbs
+    # whose ending was not probed, as the generic methods do (できる)
+    ending_check = "    if verb[-{}:] not in {{{}}}:\n        return None\n".format(key_length, ", ".join(repr(key) for key in keys))
+    if not prefix and all(suffixes.get(key) == key for key in keys):
+        return "def {}(verb):\n{}    return verb\n".format(name, ending_check)
+    suffix_values = set(suffixes.values())
+    if len(suffixes) == len(keys) and suffix_values == set([""]):
+        return "def {}(verb):\n{}    return {}\n".format(name, ending_check, stem)
+    if len(suffixes) == len(keys) and len(suffix_values) == 1:
+        return "def {}(verb):\n{}    return {} + {!r}\n".format(name, ending_check, stem, suffix_values.pop())
+    table_name = "_{}_ENDINGS".format(name.upper())
+    table = "{} = {{{}}}\n".format(table_name, ", ".join("{!r}: {!r}".format(key, suffixes[key]) for key in sorted(suffixes)))
+    return "{}\ndef {}(verb):\n    try:\n        return {} + {}[verb[-{}:]]\n    except KeyError:\n        return None\n".format(
+        table, name, stem, table_name, key_length)
+
+def generate_source():
+    '''Source of a module defining the specialized function of every
+    signature and verb class, and a FUNCTIONS list holding them for each
+    signature of Paradigm.PARADIGM_SIGNATURES and each VerbClass in turn
+
+    Returns:
+        str: Python module source
+    '''
+    sections = ["# Generated by SpecializedConjugators.generate_source, do not edit.\n"]
+    names = []
+    for signature in PARADIGM_SIGNATURES:
+        for verb_class in VerbClass:
+            sections.append(function_source(signature, verb_class))
+            names.append(function_name(signature, verb_class))
+    sections.append("FUNCTIONS = [\n{}]\n".format("".join("    {},\n".format(name) for name in names)))
+    return "\n".join(sections)
+
+# (signature, verb_class) -> specialized function, compiled on first use
+_SPECIALIZED_FUNCTIONS = {}
+
+def build_specialized_functions():
+    '''Generate and compile every specialized function
+
+    Returns:
+        dict: (signature, verb_class) -> specialized function
+    '''
+    namespace = {}
+    exec(compile(generate_source(), "<specialized conjugators>", "exec"), namespace)
+    functions = iter(namespace["FUNCTIONS"])
+    return {(signature, verb_class): next(functions) for signature in PARADIGM_SIGNATURES for verb_class in VerbClass}
+
+def specialized_function(verb_class, form, tense=None, formality=None, polarity=None):
+    '''Fetch the specialized function of a form and verb class, to apply it
+    over many verbs. Verbs are not validated; use Decorators.validate_many
+    beforehand when the input is untrusted.
+
+    Args:
+        verb_class (enum): VerbClass Enum of the verbs to conjugate
+        form (enum): VerbForm Enum representing the conjugation form
+        tense (:obj: enum, optional): Tense Enum, only used by tense forms.
+            Defaults to None.
+        formality (:obj: enum, optional): Formality Enum, only used by formality
+            forms. Defaults to None.
+        polarity (:obj: enum, optional): Polarity Enum, unused by
+            unparameterized forms. Defaults to None.
+
+    Returns:
+        callable: takes a verb and returns the conjugated verb
+
+    Raises:
+        ValueError: if the signature is not part of the paradigm
+    '''
+    if not _SPECIALIZED_FUNCTIONS:
+        _SPECIALIZED_FUNCTIONS.update(build_specialized_functions())
+    function = _SPECIALIZED_FUNCTIONS.get(((form, tense, formality, polarity), verb_class))
+    if function is None:
+        raise ValueError("Signature is not part of the paradigm", form, tense, formality, polarity)
+    return function
+
+# ---------------------------------------------------------- #
+#                          BENCHMARK                         #
+# ---------------------------------------------------------- #
+def benchmark_specialized_functions(verbs, repeat=3):
+    '''Time every form of every verb through the generate_* methods,
+    IntegerConjugator and the specialized functions. Verbs are grouped by
+    form as in a batch, so each callable is fetched once per form.
+
+    Args:
+        verbs (list): (verb, verb_class) pairs
+        repeat (:obj: int, optional): number of timed passes, the fastest is kept.
+            Defaults to 3.
+
+    Returns:
+        list: (name, seconds per form) for each implementation
+    '''
+    generator = JapaneseVerbFormGenerator()
+    conjugator = IntegerConjugator(generator)
+    batches = [(signature, verb_class, [verb for verb, candidate_class in verbs if candidate_class == verb_class])
+        for signature in PARADIGM_SIGNATURES for verb_class in VerbClass]
+    batches = [batch for batch in batches if batch[2]]
+    num_forms = sum(len(batch_verbs) for _, _, batch_verbs in batches)
+
+    def generator_pass():
+        for signature, verb_class, batch_verbs in batches:
+            for verb in batch_verbs:
+                conjugate_form(generator, verb, verb_class, *signature)
+
+    def integer_pass():
+        for signature, verb_class, batch_verbs in batches:
+            routine = conjugator.routine(verb_class.value, signature_form_id(signature))
+            for verb in batch_verbs:
+                routine(verb)
+
+    def specialized_pass():
+        for signature, verb_class, batch_verbs in batches:
+            function = specialized_function(verb_class, *signature)
+            for verb in batch_verbs:
+                function(verb)
+
+    specialized_function(VerbClass.GODAN, *PARADIGM_SIGNATURES[0])
+    return [(name, best_time(timed_pass, repeat) / num_forms)
+            for name, timed_pass in (("generate_*", generator_pass), ("IntegerConjugator", integer_pass), ("specialized", specialized_pass))]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate specialized conjugation functions, or benchmark them.")
+    parser.add_argument("--emit", metavar="PATH", help="write the generated module source to PATH")
+    parser.add_argument("--verbs", type=int, default=300, help="number of golden corpus verbs to benchmark")
+    parser.add_argument("--repeat", type=int, default=3, help="number of timed passes")
+    args = parser.parse_args(argv)
+
+    if args.emit:
+        with open(args.emit, "w", encoding="utf-8") as source_file:
+            source_file.write(generate_source())
+        return
+    from .GoldenCorpus import load_golden_corpus
+    verbs = [(entry.verb, entry.verb_class) for entry in load_golden_corpus()[:args.verbs]]
+    results = benchmark_specialized_functions(verbs, args.repeat)
+    for name, seconds in results:
+        print("{:<20}{:.2f}us/form ({:.2f}x)".format(name, seconds * 1e6, results[0][1] / seconds))
+
+if __name__ == "__main__":
+    main()
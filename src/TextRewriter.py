@@ -0,0 +1,225 @@
+import re
+
+# Local modules
+from .Decorators import JAPANESE_CHARACTER_RANGES, VALID_VERB_ENDINGS, validate_verb
+from .Exceptions import VALID_VERB
+from .Utils import guess_verb_class
+
+from .ConjugationIndex import ConjugationIndex
+from .JapaneseVerbFormGenerator import JapaneseVerbFormGenerator
+from .Paradigm import FORMALITY_FORMS, TENSE_FORMS, conjugate_form, generate_paradigm
+
+DEFAULT_CHUNK_SIZE = 65536
+DEFAULT_TOKEN_CACHE_SIZE = 65536
+
+def _character_class(ranges):
+    return "".join("{}-{}".format(re.escape(chr(start)), re.escape(chr(end))) for start, end in ranges)
+
+JAPANESE_CHARACTER_CLASS = _character_class(JAPANESE_CHARACTER_RANGES)
+JAPANESE_RUN_PATTERN = re.compile("[{0}]+|[^{0}]+".format(JAPANESE_CHARACTER_CLASS))
+NON_JAPANESE_CHARACTER_PATTERN = re.compile("[^{}]".format(JAPANESE_CHARACTER_CLASS))
+
+# a word written with a kanji stem and kana okurigana at the end of a token.
+# Particles written in kana (を, は, が, ...) separate the stem from what
+# precedes it, so 水を飲む yields 飲む.
+GUESSED_WORD_PATTERN = re.compile("[\u3005\u4e00-\u9fff]+[\u3041-\u3096]*$")
+
+# copulas, auxiliaries and fixed expressions that end in a verb ending kana
+# but are never rewritten as verbs
+NON_VERB_ENDINGS = ("です", "ます", "でしょう", "ましょう", "だろう", "ありがとう", "有難う", "おめでとう", "ございます")
+
+def tokenize_japanese_runs(text):
+    '''Default tokenizer. Splits text into alternating runs of Japanese and
+    non-Japanese characters, so punctuation (。、), whitespace and latin text
+    separate tokens and a clause-final verb ends its token.
+
+    Args:
+        text (str): text to tokenize
+
+    Returns:
+        list: tokens whose concatenation is the original text
+    '''
+    return JAPANESE_RUN_PATTERN.findall(text)
+
+# ---------------------------------------------------------- #
+#                  STREAMING VERB REWRITER                   #
+# ---------------------------------------------------------- #
+class StreamingVerbRewriter:
+    ''' Rewrites every verb found in running text into a target form.
+
+    A token is rewritten when its tail is a surface form of a verb in the user
+    lexicon, so polite or past forms can be turned into another form. The tense
+    and polarity of the matched surface are kept: rewriting 飲みませんでした
+    into the plain form gives 飲まなかった. The tense and polarity given to the
+    rewriter are only used when the matched form has none, such as the -te form.
+    A target form conjugated by tense (plain, polite) needs tense and polarity,
+    and one conjugated by formality needs formality and polarity; a missing
+    parameter raises ValueError instead of being guessed.
+
+    When guess_unknown_verbs is set, a word with a kanji stem at the end of a
+    token that ends in one of the dictionary form kana accepted by
+    validateJapaneseVerbDecorator is also rewritten, with a guessed verb class.
+    Copulas and fixed expressions (です, ありがとう, see NON_VERB_ENDINGS) are
+    never guessed. Guessing is off by default, because ordinary words are
+    easily mistaken for verbs.
+
+    Text is processed in chunks cut at non-Japanese characters, so memory use
+    does not grow with input size.
+
+    The tokenizer hook is any callable that takes a string and returns tokens
+    whose concatenation is that string, e.g. a wrapper around a morphological
+    analyzer. Only one chunk of text is passed to it at a time.
+    '''
+    def __init__(self, form, tense=None, formality=None, polarity=None, lexicon=None,
+                 tokenizer=tokenize_japanese_runs, guess_unknown_verbs=False, generator=None,
+                 chunk_size=DEFAULT_CHUNK_SIZE, token_cache_size=DEFAULT_TOKEN_CACHE_SIZE):
+        if form in TENSE_FORMS and (tense is None or polarity is None):
+            raise ValueError("Target form needs a tense and a polarity", form)
+        if form in FORMALITY_FORMS and (formality is None or polarity is None):
+            raise ValueError("Target form needs a formality and a polarity", form)
+        if generator is None:
+            generator = JapaneseVerbFormGenerator()
+        self.generator = generator
+        self.form = form
+        self.tense = tense
+        self.formality = formality
+        self.polarity = polarity
+        self.tokenizer = tokenizer
+        self.guess_unknown_verbs = guess_unknown_verbs
+        self.chunk_size = chunk_size
+        self.token_cache_size = token_cache_size
+        self._token_cache = {}
+
+        self.index = ConjugationIndex(generator)
+        # surface -> {(verb, verb_class): first signature producing it}
+        self._surface_signatures = {}
+        self._max_surface_length = 0
+        for verb, verb_class in lexicon or []:
+            self.add_verb(verb, verb_class)
+
+    def add_verb(self, verb, verb_class):
+        '''Add a verb to the user lexicon so all of its surface forms are recognized
+
+        Args:
+            verb (str): Japanese verb in kana, might contain kanji
+            verb_class (enum): VerbClass Enum representing the verb class
+                to which the verb belongs
+        '''
+        paradigm = list(generate_paradigm(self.generator, verb, verb_class))
+        self.index.add_verb(verb, verb_class, paradigm)
+        lemma = (verb, verb_class)
+        for form, tense, formality, polarity, surface in paradigm:
+            if surface is not None:
+                self._surface_signatures.setdefault(surface, {}).setdefault(lemma, (form, tense, formality, polarity))
+                self._max_surface_length = max(self._max_surface_length, len(surface))
+        self._token_cache.clear()
+
+    def _conjugate(self, verb, verb_class, source_tense=None, source_polarity=None):
+        tense = source_tense if source_tense is not None and self.form in TENSE_FORMS else self.tense
+        polarity = self.polarity if source_polarity is None else source_polarity
+        return conjugate_form(self.generator, verb, verb_class, self.form, tense, self.formality, polarity)
+
+    def _rewrite_lexicon_match(self, token):
+        for length in range(min(len(token), self._max_surface_length), 1, -1):
+            surface = token[-length:]
+            lemmas = self.index.lookup(surface)
+            if lemmas:
+                verb, verb_class = lemmas[0]
+                _, source_tense, _, source_polarity = self._surface_signatures[surface][lemmas[0]]
+                conjugated_verb = self._conjugate(verb, verb_class, source_tense, source_polarity)
+                if conjugated_verb is None:
+                    return token
+                return "{}{}".format(token[:-length], conjugated_verb)
+        return None
+
+    def rewrite_token(self, token):
+        '''Rewrite a single token, returning it unchanged when it is not a verb
+
+        Args:
+            token (str): token produced by the tokenizer
+
+        Returns:
+            str: token with its verb conjugated into the target form
+        '''
+        rewritten_token = self._token_cache.get(token)
+        if rewritten_token is not None:
+            return rewritten_token
+
+        rewritten_token = self._rewrite_lexicon_match(token)
+        if rewritten_token is None:
+            rewritten_token = token
+            if self.guess_unknown_verbs:
+                rewritten_token = self._rewrite_guessed_verb(token)
+
+        if len(self._token_cache) >= self.token_cache_size:
+            self._token_cache.clear()
+        self._token_cache[token] = rewritten_token
+        return rewritten_token
+
+    def _rewrite_guessed_verb(self, token):
+        match = GUESSED_WORD_PATTERN.search(token)
+        if match is None:
+            return token
+        word = match.group()
+        if word[-1:] not in VALID_VERB_ENDINGS or word.endswith(NON_VERB_ENDINGS) or validate_verb(word) != VALID_VERB:
+            return token
+        conjugated_verb = self._conjugate(word, guess_verb_class(word))
+        if conjugated_verb is None:
+            return token
+        return "{}{}".format(token[:match.start()], conjugated_verb)
+
+    def rewrite_text(self, text):
+        '''Rewrite a complete string
+
+        Args:
+            text (str): text containing verbs
+
+        Returns:
+            str: text with every verb conjugated into the target form
+        '''
+        return "".join([self.rewrite_token(token) for token in self.tokenizer(text)])
+
+    def rewrite_stream(self, input_stream):
+        '''Rewrite a text stream chunk by chunk. Each chunk is cut after its last
+        non-Japanese character so that no token spans two chunks. A chunk with no
+        such character is flushed once it grows past 16 times chunk_size.
+
+        Args:
+            input_stream (file): text file object opened for reading
+
+        Yields:
+            str: rewritten text, in input order
+        '''
+        carry = ""
+        max_carry_size = 16 * self.chunk_size
+        while True:
+            chunk = input_stream.read(self.chunk_size)
+            if not chunk:
+                break
+            buffer = "{}{}".format(carry, chunk)
+
+            cut = -1
+            for match in NON_JAPANESE_CHARACTER_PATTERN.finditer(buffer, max(0, len(buffer) - self.chunk_size)):
+                cut = match.end()
+            if cut == -1:
+                if len(buffer) < max_carry_size:
+                    carry = buffer
+                    continue
+                cut = len(buffer)
+            carry = buffer[cut:]
+            yield self.rewrite_text(buffer[:cut])
+
+        if carry:
+            yield self.rewrite_text(carry)
+
+    def rewrite_file(self, input_path, output_path, encoding="utf-8"):
+        '''Rewrite a text file into another file at constant memory
+
+        Args:
+            input_path (str): source file path
+            output_path (str): destination file path
+            encoding (:obj: str, optional): encoding of both files. Defaults to utf-8.
+        '''
+        with open(input_path, encoding=encoding) as input_stream, open(output_path, "w", encoding=encoding) as output_stream:
+            for rewritten_chunk in self.rewrite_stream(input_stream):
+                output_stream.write(rewritten_chunk)
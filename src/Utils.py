@@ -1,11 +1,18 @@
+import collections
+
 # Local modules
 from .constants.ParticleConstants import *
 from .constants.VerbEndingConstants import *
-from .constants.EnumeratedTypes import Formality, Polarity, Tense, VerbClass
+from .constants.AdjectiveEndingConstants import *
+from .constants.EnumeratedTypes import AdjectiveClass, Formality, Polarity, Tense, VerbClass, VerbForm
+
+from .VerbClassResolver import resolve_verb_class
 
 # External Libraries
 import romkan
 
+IRREGULAR_VERB_ENDINGS = (SURU_ENDING, KURU_ENDING, KURU_KANJI_ENDING)
+
 # ---------------------------------------------------------- #
 #                UTIL VERB GENERATOR FUNCTIONS               #
 # ---------------------------------------------------------- #
@@ -28,9 +35,19 @@ def splice_verb(verb, verb_class, should_return_stem=True):
         return verb[:-1*num_ending_particles] 
     return verb[-1*num_ending_particles:] 
 
+# (particle ending, append_stem_particle, suru_ending, kuru_ending) -> irregular ending
+IRREGULAR_ENDING_CACHE = {}
+
+def _kuru_kanji_ending(kuru_ending):
+    # every kuru ending starts with the reading of 来 (き, こ, or く), which the kanji replaces
+    if not kuru_ending:
+        return kuru_ending
+    return "{}{}".format(KURU_KANJI, kuru_ending[1:])
+
 def handle_irregular_verb(verb, append_stem_particle=False, suru_ending=None, kuru_ending=None):
     ''' Handles irregular verb conjugations depending on suru or kuru verb type.
-    Isolates logic of irregular verbs.
+    Isolates logic of irregular verbs. Kuru verbs may be spelled in kana (くる) or
+    kanji (来る). Endings are memoized, so repeated conjugations only splice the verb.
     
     Args:
         verb (str): Japanese verb in kana, might contain kanji
@@ -47,23 +64,73 @@ def handle_irregular_verb(verb, append_stem_particle=False, suru_ending=None, ku
         str: irregular verb with appropriate particles and ending attached depending
             on verb conjugation
     '''
-    particle_ending = splice_verb(verb, VerbClass.IRREGULAR, False)
-    if particle_ending not in [SURU_ENDING, KURU_ENDING]:
-        return None
+    particle_ending = verb[-2:]
+    cache_key = (particle_ending, append_stem_particle, suru_ending, kuru_ending)
+    ending = IRREGULAR_ENDING_CACHE.get(cache_key)
+    if ending is None:
+        if particle_ending not in IRREGULAR_VERB_ENDINGS:
+            return None
 
-    verb_stem = splice_verb(verb, VerbClass.IRREGULAR)
-    ending = ""
-    if particle_ending == SURU_ENDING:
-        if append_stem_particle:
-            ending = SHI_PARTICLE
-        if suru_ending is not None:
-            ending = "{}{}".format(ending, suru_ending)
-    else:
-        if append_stem_particle:
-            ending = KI_PARTICLE
-        if kuru_ending is not None:
-            ending = "{}{}".format(ending, kuru_ending)
-    return "{}{}".format(verb_stem, ending)
+        ending = ""
+        if particle_ending == SURU_ENDING:
+            if append_stem_particle:
+                ending = SHI_PARTICLE
+            if suru_ending is not None:
+                ending = "{}{}".format(ending, suru_ending)
+        else:
+            if append_stem_particle:
+                ending = KI_PARTICLE
+            if kuru_ending is not None:
+                ending = "{}{}".format(ending, kuru_ending)
+            if particle_ending == KURU_KANJI_ENDING:
+                ending = _kuru_kanji_ending(ending)
+        IRREGULAR_ENDING_CACHE[cache_key] = ending
+    return "{}{}".format(verb[:-2], ending)
+
+def base_nai_form(verb, verb_class, ending):
+    ''' Attach an ending to the negative (-a) stem of a verb in a single step,
+    e.g. ない, なかった or なければ. The stem is never built as a separate string.
+
+    Args:
+        verb (str): Japanese verb in kana, might contain kanji
+        verb_class (enum): VerbClass Enum representing the verb class
+            to which the verb belongs
+        ending (str): ending attached to the negative stem
+
+    Returns:
+        str: negative stem of the verb followed by the ending
+    '''
+    if verb_class == VerbClass.IRREGULAR:
+        particle_ending = verb[-2:]
+        if particle_ending == SURU_ENDING:
+            stem_particle = SHI_PARTICLE
+        elif particle_ending == KURU_KANJI_ENDING:
+            stem_particle = KURU_KANJI
+        else:
+            stem_particle = KO_PARTICLE
+        return "{}{}{}".format(verb[:-2], stem_particle, ending)
+    elif verb_class == VerbClass.GODAN:
+        return map_dictionary_to_a_ending(verb, ending)
+    return "{}{}".format(verb[:-1], ending)
+
+def base_masu_form(verb, verb_class, ending):
+    ''' Attach an ending to the polite (-i) stem of a verb in a single step,
+    e.g. ます, ませんでした or ましたら.
+
+    Args:
+        verb (str): Japanese verb in kana, might contain kanji
+        verb_class (enum): VerbClass Enum representing the verb class
+            to which the verb belongs
+        ending (str): ending attached to the polite stem
+
+    Returns:
+        str: polite stem of the verb followed by the ending
+    '''
+    if verb_class == VerbClass.IRREGULAR:
+        return handle_irregular_verb(verb, True, ending, ending)
+    elif verb_class == VerbClass.GODAN:
+        return map_dictionary_to_i_ending(verb, ending)
+    return "{}{}".format(verb[:-1], ending)
 
 def generate_nai_form(verb, verb_class, is_regular_nai):
     ''' Generates the nai form of a Japanese verb
@@ -80,20 +147,22 @@ def generate_nai_form(verb, verb_class, is_regular_nai):
     Returns:
         str: nai ending attached to verb param
     '''
-    verb_stem = splice_verb(verb, verb_class)
-    ending = NAI_ENDING
-
     if not is_regular_nai:
-        return "{}{}".format(verb, ending)
-    if verb_class == VerbClass.IRREGULAR:
-        if splice_verb(verb, verb_class, False) == SURU_ENDING:
-            ending = "{}{}".format(SHI_PARTICLE, ending)
-        else:
-            ending = "{}{}".format(KO_PARTICLE, ending)
-    else:
-        if verb_class == VerbClass.GODAN:
-            verb_stem = map_dictionary_to_a_ending(verb)
-    return "{}{}".format(verb_stem, ending)
+        return "{}{}".format(verb, NAI_ENDING)
+    return base_nai_form(verb, verb_class, NAI_ENDING)
+
+# godan final kana -> (sound change particle, index of the -te / -ta ending to use)
+GODAN_TE_TA_INFIXES = {
+    RU_PARTICLE: (CHISAI_TSU_PARTICLE, 0),
+    TSU_PARTICLE: (CHISAI_TSU_PARTICLE, 0),
+    U_PARTICLE: (CHISAI_TSU_PARTICLE, 0),
+    BU_PARTICLE: (N_PARTICLE, 1),
+    MU_PARTICLE: (N_PARTICLE, 1),
+    NU_PARTICLE: (N_PARTICLE, 1),
+    KU_PARTICLE: (I_PARTICLE, 0),
+    GU_PARTICLE: (I_PARTICLE, 1),
+    SU_PARTICLE: (SHI_PARTICLE, 0),
+}
 
 def base_te_ta_form(verb, verb_class, *endings):
     ''' Handle the formation of the -te / -ta form for verbs belonging to
@@ -106,7 +175,8 @@ def base_te_ta_form(verb, verb_class, *endings):
         verb_class (enum): VerbClass Enum representing the verb class
             to which the verb belongs
         *endings: Variable length argument list. Must be in the form (te, de)
-        or (ta, da) 
+        or (ta, da). Longer endings built on them, such as (tara, dara), are
+        attached the same way.
         
         TODO... reformat this logic for *endings
 
@@ -116,69 +186,161 @@ def base_te_ta_form(verb, verb_class, *endings):
     '''
     if verb_class == VerbClass.IRREGULAR:
         return handle_irregular_verb(verb, True, endings[0], endings[0])
-    else:
-        verb_stem = splice_verb(verb, verb_class)
-        verb_ending = ""
-        if verb_class == VerbClass.ICHIDAN:
-            verb_ending = endings[0]
-        elif verb_class == VerbClass.GODAN:
-            last_kana = splice_verb(verb, verb_class, False)
-            
-            if last_kana in [RU_PARTICLE, TSU_PARTICLE, U_PARTICLE]:
-                verb_ending = "{}{}".format(CHISAI_TSU_PARTICLE, endings[0])
-            elif last_kana in [BU_PARTICLE, MU_PARTICLE, NU_PARTICLE]:
-                verb_ending = "{}{}".format(N_PARTICLE, endings[1])
-            elif last_kana in [KU_PARTICLE]:
-                verb_ending = "{}{}".format(I_PARTICLE, endings[0])
-            elif last_kana in [GU_PARTICLE]:
-                verb_ending = "{}{}".format(I_PARTICLE, endings[1])
-            elif last_kana in [SU_PARTICLE]:
-                verb_ending = "{}{}".format(SHI_PARTICLE, endings[0])
-        return "{}{}".format(verb_stem, verb_ending)
-
-def map_dictionary_to_a_ending(verb):
+    elif verb_class == VerbClass.ICHIDAN:
+        return "{}{}".format(verb[:-1], endings[0])
+    elif verb_class == VerbClass.GODAN:
+        infix = GODAN_TE_TA_INFIXES.get(verb[-1:])
+        if infix is not None:
+            return "{}{}{}".format(verb[:-1], infix[0], endings[infix[1]])
+    return verb[:-1]
+
+def suppletive_irregular_form(verb, suru_form, kuru_form):
+    ''' Replace the ending of an irregular verb with a different verb, as keigo
+    does (勉強する -> 勉強なさる, 持ってくる -> 持っていらっしゃる). Unlike
+    handle_irregular_verb, 来る is replaced by kuru_form as written.
+
+    Args:
+        verb (str): Japanese verb in kana, might contain kanji
+        suru_form (str): replacement of する
+        kuru_form (str): replacement of くる / 来る
+
+    Returns:
+        str: verb with its irregular ending replaced, or None if the verb is
+            not a suru / kuru verb
+    '''
+    particle_ending = verb[-2:]
+    if particle_ending == SURU_ENDING:
+        return "{}{}".format(verb[:-2], suru_form)
+    elif particle_ending in IRREGULAR_VERB_ENDINGS:
+        return "{}{}".format(verb[:-2], kuru_form)
+    return None
+
+# ---------------------------------------------------------- #
+#                  SHARED STEMS OF A VERB                    #
+# ---------------------------------------------------------- #
+VerbStems = collections.namedtuple("VerbStems", ["masu_stem", "nai_stem", "ta_form"])
+
+def verb_stems(verb, verb_class):
+    ''' Compute the stems shared by the extended forms of a godan or ichidan
+    verb once, so each extended form is a single concatenation
+
+    Args:
+        verb (str): Japanese verb in kana, might contain kanji
+        verb_class (enum): VerbClass Enum representing the verb class
+            to which the verb belongs
+
+    Returns:
+        VerbStems: polite (-i) stem, negative (-a) stem and plain past form
+    '''
+    return VerbStems(base_masu_form(verb, verb_class, ""), base_nai_form(verb, verb_class, ""),
+        base_te_ta_form(verb, verb_class, TA_PARTICLE, DA_PARTICLE))
+
+MASU_STEM, NAI_STEM, TA_FORM = range(3)
+
+# (form, tense, formality, polarity) -> (prefix, VerbStems index, ending) of every
+# extended form of godan and ichidan verbs. PositiveVerbForms / NegativeVerbForms
+# attach the same affixes, one form at a time.
+EXTENDED_FORM_AFFIXES = {
+    (VerbForm.DESIRE, None, Formality.PLAIN, Polarity.POSITIVE): ("", MASU_STEM, TAI_PLAIN_POSITIVE_ENDING),
+    (VerbForm.DESIRE, None, Formality.PLAIN, Polarity.NEGATIVE): ("", MASU_STEM, TAI_PLAIN_NEGATIVE_ENDING),
+    (VerbForm.DESIRE, None, Formality.POLITE, Polarity.POSITIVE): ("", MASU_STEM, TAI_POLITE_POSITIVE_ENDING),
+    (VerbForm.DESIRE, None, Formality.POLITE, Polarity.NEGATIVE): ("", MASU_STEM, TAI_POLITE_NEGATIVE_ENDING),
+    (VerbForm.SOU, None, Formality.PLAIN, Polarity.POSITIVE): ("", MASU_STEM, SOU_PLAIN_POSITIVE_ENDING),
+    (VerbForm.SOU, None, Formality.PLAIN, Polarity.NEGATIVE): ("", NAI_STEM, SOU_PLAIN_NEGATIVE_ENDING),
+    (VerbForm.SOU, None, Formality.POLITE, Polarity.POSITIVE): ("", MASU_STEM, SOU_POLITE_POSITIVE_ENDING),
+    (VerbForm.SOU, None, Formality.POLITE, Polarity.NEGATIVE): ("", NAI_STEM, SOU_POLITE_NEGATIVE_ENDING),
+    (VerbForm.NAGARA, None, None, None): ("", MASU_STEM, NAGARA_ENDING),
+    (VerbForm.ZU, None, None, None): ("", NAI_STEM, ZU_ENDING),
+    (VerbForm.TARI, None, None, None): ("", TA_FORM, RI_PARTICLE),
+    (VerbForm.HONORIFIC, None, Formality.PLAIN, Polarity.POSITIVE): (HONORIFIC_PREFIX, MASU_STEM, HONORIFIC_PLAIN_POSITIVE_ENDING),
+    (VerbForm.HONORIFIC, None, Formality.PLAIN, Polarity.NEGATIVE): (HONORIFIC_PREFIX, MASU_STEM, HONORIFIC_PLAIN_NEGATIVE_ENDING),
+    (VerbForm.HONORIFIC, None, Formality.POLITE, Polarity.POSITIVE): (HONORIFIC_PREFIX, MASU_STEM, HONORIFIC_POLITE_POSITIVE_ENDING),
+    (VerbForm.HONORIFIC, None, Formality.POLITE, Polarity.NEGATIVE): (HONORIFIC_PREFIX, MASU_STEM, HONORIFIC_POLITE_NEGATIVE_ENDING),
+    (VerbForm.HUMBLE, None, Formality.PLAIN, Polarity.POSITIVE): (HUMBLE_PREFIX, MASU_STEM, HUMBLE_PLAIN_POSITIVE_ENDING),
+    (VerbForm.HUMBLE, None, Formality.PLAIN, Polarity.NEGATIVE): (HUMBLE_PREFIX, MASU_STEM, HUMBLE_PLAIN_NEGATIVE_ENDING),
+    (VerbForm.HUMBLE, None, Formality.POLITE, Polarity.POSITIVE): (HUMBLE_PREFIX, MASU_STEM, HUMBLE_POLITE_POSITIVE_ENDING),
+    (VerbForm.HUMBLE, None, Formality.POLITE, Polarity.NEGATIVE): (HUMBLE_PREFIX, MASU_STEM, HUMBLE_POLITE_NEGATIVE_ENDING),
+}
+
+# target sound -> particles replacing the -u / -tsu / -su godan endings
+GODAN_SPECIAL_ENDINGS = {
+    'a': (WA_PARTICLE, TA_PARTICLE, SA_PARTICLE),
+    'e': (E_PARTICLE, TE_PARTICLE, SE_PARTICLE),
+    'i': (I_PARTICLE, CHI_PARTICLE, SHI_PARTICLE),
+    'o': (O_PARTICLE, TO_PARTICLE, SO_PARTICLE),
+}
+
+def shift_godan_ending(verb, romaji_ending, ending=""):
+    ''' Replace the last kana of a Godan verb with the kana of another vowel row
+    and attach an ending, in a single step. Shifted kana come from the
+    GODAN_ENDING_SHIFTS table, so romkan is only used for kana outside of it.
+
+    Args:
+        verb (str): Japanese verb in kana, might contain kanji
+        romaji_ending (str): target sound of the particle ('a', 'e', 'i' or 'o')
+        ending (:obj: str, optional): ending attached after the shifted kana.
+            Defaults to "".
+
+    Returns:
+        str: verb stem with the shifted kana and ending attached
+    '''
+    shifted_kana = GODAN_ENDING_SHIFTS.get((romaji_ending, verb[-1:]))
+    if shifted_kana is None:
+        shifted_verb = map_dict_form_to_different_ending(verb, romaji_ending, *GODAN_SPECIAL_ENDINGS[romaji_ending])
+        return "{}{}".format(shifted_verb, ending)
+    return "{}{}{}".format(verb[:-1], shifted_kana, ending)
+
+def map_dictionary_to_a_ending(verb, ending=""):
     ''' Generates Godan verb stem with corresponding -a particle attached
 
     Args:
         verb (str): Japanese verb in kana, might contain kanji
+        ending (:obj: str, optional): ending attached after the -a particle.
+            Defaults to "".
 
     Returns:
         str: verb stem with the correct -a particle attached (Godan verbs only)
     '''
-    return map_dict_form_to_different_ending(verb, 'a', WA_PARTICLE, TA_PARTICLE, SA_PARTICLE)
+    return shift_godan_ending(verb, 'a', ending)
 
-def map_dictionary_to_e_ending(verb):
+def map_dictionary_to_e_ending(verb, ending=""):
     '''Generates Godan verb stem with corresponding -e particle attached
 
     Args:
         verb (str): Japanese verb in kana, might contain kanji
+        ending (:obj: str, optional): ending attached after the -e particle.
+            Defaults to "".
 
     Returns:
         str: verb stem with the correct -e particle attached (Godan verbs only)
     '''
-    return map_dict_form_to_different_ending(verb, 'e', E_PARTICLE, TE_PARTICLE, SE_PARTICLE)
+    return shift_godan_ending(verb, 'e', ending)
 
-def map_dictionary_to_i_ending(verb):
+def map_dictionary_to_i_ending(verb, ending=""):
     '''Generates Godan verb stem with corresponding -i particle attached
 
     Args:
         verb (str): Japanese verb in kana, might contain kanji
+        ending (:obj: str, optional): ending attached after the -i particle.
+            Defaults to "".
 
     Returns:
         str: verb stem with the correct -i particle attached (Godan verbs only)
     '''
-    return map_dict_form_to_different_ending(verb, 'i', I_PARTICLE, CHI_PARTICLE, SHI_PARTICLE)
+    return shift_godan_ending(verb, 'i', ending)
 
-def map_dictionary_to_o_ending(verb):
+def map_dictionary_to_o_ending(verb, ending=""):
     '''Generates Godan verb stem with corresponding -o particle attached
 
     Args:
         verb (str): Japanese verb in kana, might contain kanji
+        ending (:obj: str, optional): ending attached after the -o particle.
+            Defaults to "".
 
     Returns:
         str: verb stem with the correct -o particle attached (Godan verbs only)
     '''
-    return map_dict_form_to_different_ending(verb, 'o', O_PARTICLE, TO_PARTICLE, SO_PARTICLE)
+    return shift_godan_ending(verb, 'o', ending)
 
 def map_dict_form_to_different_ending(verb, romaji_ending, *special_endings):
     '''Generates Godan verb stem and computes the correct particle to attach based on the
@@ -206,3 +368,56 @@ def map_dict_form_to_different_ending(verb, romaji_ending, *special_endings):
     else:
         transformed_last_kana_as_romaji = "{}{}".format(romkan.to_roma(last_kana)[:-1], romaji_ending)
         return "{}{}".format(verb_stem, romkan.to_hiragana(transformed_last_kana_as_romaji))
+
+GODAN_VERB_ENDINGS = (U_PARTICLE, KU_PARTICLE, GU_PARTICLE, SU_PARTICLE, TSU_PARTICLE, NU_PARTICLE, BU_PARTICLE, MU_PARTICLE, RU_PARTICLE)
+
+def _build_godan_ending_shifts():
+    shifts = {}
+    for romaji_ending, special_endings in GODAN_SPECIAL_ENDINGS.items():
+        for kana in GODAN_VERB_ENDINGS:
+            shifts[(romaji_ending, kana)] = map_dict_form_to_different_ending(kana, romaji_ending, *special_endings)
+    return shifts
+
+# (target sound, godan final kana) -> shifted kana, e.g. ('a', 'く') -> 'か'
+GODAN_ENDING_SHIFTS = _build_godan_ending_shifts()
+
+# ---------------------------------------------------------- #
+#               UTIL ADJECTIVE GENERATOR FUNCTIONS           #
+# ---------------------------------------------------------- #
+def base_adjective_form(adjective, adjective_class, i_ending, na_ending):
+    ''' Attach an ending to an adjective in a single step. i-adjectives drop
+    their final い (いい and its compounds use the stem よ, like 良い), while
+    na-adjectives keep their whole spelling.
+
+    Args:
+        adjective (str): Japanese adjective in kana, might contain kanji
+        adjective_class (enum): AdjectiveClass Enum representing the adjective class
+        i_ending (str): ending attached to an i-adjective stem
+        na_ending (str): ending attached to a na-adjective
+
+    Returns:
+        str: adjective stem followed by the ending matching its class
+    '''
+    if adjective_class == AdjectiveClass.NA_ADJECTIVE:
+        return "{}{}".format(adjective, na_ending)
+    if adjective[-2:] == II_ENDING and adjective not in REGULAR_II_ADJECTIVES:
+        return "{}{}{}".format(adjective[:-2], II_STEM, i_ending)
+    return "{}{}".format(adjective[:-1], i_ending)
+
+def guess_verb_class(verb, reading=None):
+    '''Guess the verb class of a dictionary form verb from its ending. Verbs ending
+    in する / くる / 来る are irregular, verbs ending in an -i or -e kana followed by
+    る are ichidan unless they are in the godan exception list of
+    VerbClassResolver (切る, 帰る), and everything else is godan. The kana before
+    る is unknown when it is written in kanji, so without a reading only the few
+    ichidan verbs spelled with one kanji and る (見る, 着る, 出る) are guessed to
+    be ichidan, and other kanji spellings (取る) to be godan.
+
+    Args:
+        verb (str): Japanese verb in kana, might contain kanji
+        reading (:obj: str, optional): kana reading of the verb. Defaults to None.
+
+    Returns:
+        enum: VerbClass Enum of the most likely verb class
+    '''
+    return resolve_verb_class(verb, reading)
@@ -0,0 +1,252 @@
+import argparse
+import os
+
+# Local modules
+from .constants.EnumeratedTypes import VerbClass
+from .constants.ParticleConstants import RU_PARTICLE
+from .constants.VerbEndingConstants import SURU_ENDING, KURU_ENDING, KURU_KANJI_ENDING
+
+# External Libraries
+import romkan
+
+DEFAULT_GODAN_EXCEPTIONS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "godan_iru_eru_verbs.txt")
+DEFAULT_ICHIDAN_KANJI_VERBS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "ichidan_kanji_verbs.txt")
+
+AMBIGUOUS_READING_MARKER = "*"
+IRREGULAR_ENDINGS = (SURU_ENDING, KURU_ENDING, KURU_KANJI_ENDING)
+
+# ---------------------------------------------------------- #
+#                 GODAN EXCEPTION FILE FORMAT                #
+# ---------------------------------------------------------- #
+# UTF-8, one godan verb ending in -iru / -eru per line, sorted. A verb written
+# with kanji is followed by a tab and its reading, e.g. "走る\tはしる". The
+# reading ends in "*" when an ichidan verb is read the same way (切る and 着る
+# are both きる), so that spelling alone does not make a verb godan. A verb
+# written in kana only stands alone on its line.
+def load_godan_exceptions(path=DEFAULT_GODAN_EXCEPTIONS_PATH):
+    '''Load a godan exception file
+
+    Args:
+        path (:obj: str, optional): exception file path.
+            Defaults to DEFAULT_GODAN_EXCEPTIONS_PATH.
+
+    Returns:
+        tuple: (surfaces, readings) frozensets. surfaces holds every listed
+            spelling, readings the kana spellings that are always godan.
+    '''
+    surfaces = set()
+    readings = set()
+    with open(path, encoding="utf-8") as exception_file:
+        for line in exception_file:
+            fields = line.rstrip("\n").split("\t")
+            if not fields[0]:
+                continue
+            surfaces.add(fields[0])
+            reading = fields[1] if len(fields) > 1 else fields[0]
+            if not reading.endswith(AMBIGUOUS_READING_MARKER):
+                readings.add(reading)
+    return frozenset(surfaces), frozenset(readings)
+
+# ---------------------------------------------------------- #
+#                ICHIDAN KANJI VERB FILE FORMAT              #
+# ---------------------------------------------------------- #
+# UTF-8, one ichidan verb written as a single kanji followed by る per line,
+# sorted, a tab and its reading, e.g. "見る\tみる". The kanji hides the -i / -e
+# kana before る, and these few verbs are the only ichidan ones spelled this
+# way, so a listed spelling is ichidan even without its reading.
+def load_ichidan_kanji_verbs(path=DEFAULT_ICHIDAN_KANJI_VERBS_PATH):
+    '''Load an ichidan kanji verb file
+
+    Args:
+        path (:obj: str, optional): ichidan kanji verb file path.
+            Defaults to DEFAULT_ICHIDAN_KANJI_VERBS_PATH.
+
+    Returns:
+        frozenset: listed spellings
+    '''
+    with open(path, encoding="utf-8") as verb_file:
+        return frozenset(line.split("\t")[0].rstrip("\n") for line in verb_file if line.strip())
+
+# kana -> True if it belongs to the -i or -e row
+_I_E_ROW_CACHE = {}
+
+def _is_i_e_row_kana(character):
+    is_i_e_row = _I_E_ROW_CACHE.get(character)
+    if is_i_e_row is None:
+        is_i_e_row = _I_E_ROW_CACHE[character] = romkan.to_roma(character)[-1:] in ("i", "e")
+    return is_i_e_row
+
+def _has_kanji(text):
+    return any(character > "ヿ" for character in text)
+
+class VerbClassResolver:
+    ''' Guesses the verb class of dictionary form verbs. Verbs ending in an -i or
+    -e kana followed by る look ichidan, but many are godan (切る, 帰る), so
+    they are checked against a bundled exception list first. The list is read
+    the first time a verb needs it and kept in frozensets, so a query is a few
+    set lookups.
+
+    Listed spellings match as a suffix too, so compounds such as 思い切る and
+    気に入る are godan like their last verb. Kanji spellings hide the kana
+    before る; pass the reading to let the -i / -e rule see it (見る, みる).
+    Without a reading, the few ichidan verbs written as one kanji and る
+    (見る, 着る, 出る) are taken from a second bundled list, also matched as
+    a suffix (夢見る); other kanji spellings are guessed to be godan.
+
+    Overrides take precedence over everything else, e.g. to load a custom
+    lexicon of (verb, verb_class) pairs.
+    '''
+    def __init__(self, path=DEFAULT_GODAN_EXCEPTIONS_PATH, overrides=None, ichidan_path=DEFAULT_ICHIDAN_KANJI_VERBS_PATH):
+        self.path = path
+        self.ichidan_path = ichidan_path
+        self.overrides = {}
+        self._surfaces = None
+        self._readings = None
+        self._ichidan_surfaces = None
+        self._max_surface_length = 0
+        if overrides:
+            self.add_overrides(overrides)
+
+    def add_override(self, verb, verb_class):
+        '''Force the verb class of a verb
+
+        Args:
+            verb (str): Japanese verb in kana, might contain kanji
+            verb_class (enum): VerbClass Enum returned for the verb
+        '''
+        self.overrides[verb] = verb_class
+
+    def add_overrides(self, lexicon):
+        '''Force the verb class of many verbs
+
+        Args:
+            lexicon (iterable): (verb, verb_class) pairs, or a dict of verb -> verb_class
+        '''
+        if isinstance(lexicon, dict):
+            lexicon = lexicon.items()
+        for verb, verb_class in lexicon:
+            self.add_override(verb, verb_class)
+
+    def _load(self):
+        self._surfaces, self._readings = load_godan_exceptions(self.path)
+        self._max_surface_length = max([len(surface) for surface in self._surfaces] or [0])
+        self._ichidan_surfaces = load_ichidan_kanji_verbs(self.ichidan_path)
+
+    def is_godan_exception(self, verb):
+        '''Check whether a verb, or the verb at the end of a compound, is in the
+        godan exception list
+
+        Args:
+            verb (str): Japanese verb in kana, might contain kanji
+
+        Returns:
+            bool: True if the exception list makes the verb godan
+        '''
+        if self._surfaces is None:
+            self._load()
+        if verb in self._surfaces:
+            return True
+        if not _has_kanji(verb):
+            return verb in self._readings
+        # 思い切る -> 切る; kana-only suffixes are too short to trust (いる)
+        for length in range(min(len(verb) - 1, self._max_surface_length), 1, -1):
+            suffix = verb[-length:]
+            if suffix in self._surfaces and _has_kanji(suffix):
+                return True
+        return False
+
+    def is_ichidan_kanji_verb(self, verb):
+        '''Check whether a verb ends in one of the ichidan verbs written as a
+        single kanji followed by る
+
+        Args:
+            verb (str): Japanese verb in kana, might contain kanji
+
+        Returns:
+            bool: True if the ichidan kanji verb list makes the verb ichidan
+        '''
+        if self._ichidan_surfaces is None:
+            self._load()
+        return verb[-2:] in self._ichidan_surfaces
+
+    def resolve(self, verb, reading=None):
+        '''Guess the verb class of a dictionary form verb
+
+        Args:
+            verb (str): Japanese verb in kana, might contain kanji
+            reading (:obj: str, optional): kana reading of the verb. Defaults to None.
+
+        Returns:
+            enum: VerbClass Enum of the most likely verb class
+        '''
+        verb_class = self.overrides.get(verb)
+        if verb_class is not None:
+            return verb_class
+        if verb[-2:] in IRREGULAR_ENDINGS:
+            return VerbClass.IRREGULAR
+        if verb[-1:] != RU_PARTICLE or len(verb) < 2:
+            return VerbClass.GODAN
+        if self.is_godan_exception(verb):
+            return VerbClass.GODAN
+        if reading is None and self.is_ichidan_kanji_verb(verb):
+            return VerbClass.ICHIDAN
+        kana = verb if reading is None else reading
+        if len(kana) > 1 and _is_i_e_row_kana(kana[-2]):
+            return VerbClass.ICHIDAN
+        return VerbClass.GODAN
+
+DEFAULT_RESOLVER = VerbClassResolver()
+
+def resolve_verb_class(verb, reading=None):
+    '''Guess the verb class of a dictionary form verb with DEFAULT_RESOLVER
+
+    Args:
+        verb (str): Japanese verb in kana, might contain kanji
+        reading (:obj: str, optional): kana reading of the verb. Defaults to None.
+
+    Returns:
+        enum: VerbClass Enum of the most likely verb class
+    '''
+    return DEFAULT_RESOLVER.resolve(verb, reading)
+
+def measure_lookup_rate(verbs, resolver=None, repeat=3):
+    '''Measure how many verb class queries a resolver answers per second
+
+    Args:
+        verbs (list): verbs to resolve
+        resolver (:obj: VerbClassResolver, optional): resolver under test.
+            Defaults to DEFAULT_RESOLVER.
+        repeat (:obj: int, optional): number of timed passes, the fastest is kept.
+            Defaults to 3.
+
+    Returns:
+        float: lookups per second
+    '''
+    if resolver is None:
+        resolver = DEFAULT_RESOLVER
+    # imported here, Profiling imports the generator, which imports this module
+    from .Profiling import best_time
+    resolver.resolve(verbs[0])
+
+    def lookup_pass():
+        for verb in verbs:
+            resolver.resolve(verb)
+
+    return len(verbs) / best_time(lookup_pass, repeat)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Guess the verb class of dictionary form verbs.")
+    parser.add_argument("verbs", nargs="*", help="verbs to resolve")
+    parser.add_argument("--benchmark", type=int, metavar="N", help="measure the lookup rate over N golden corpus verbs")
+    args = parser.parse_args(argv)
+
+    if args.benchmark:
+        from .GoldenCorpus import load_golden_corpus
+        corpus_verbs = [entry.verb for entry in load_golden_corpus()]
+        verbs = [corpus_verbs[index % len(corpus_verbs)] for index in range(args.benchmark)]
+        print("{:.0f} lookups/s".format(measure_lookup_rate(verbs)))
+    for verb in args.verbs:
+        print("{}\t{}".format(verb, resolve_verb_class(verb).name))
+
+if __name__ == "__main__":
+    main()
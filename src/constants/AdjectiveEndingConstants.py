@@ -0,0 +1,37 @@
+# IRREGULAR I-ADJECTIVE いい, whose other forms are built on よ (良い)
+II_ENDING = "いい"
+II_STEM = "よ"
+# adjectives ending in いい that are not compounds of いい
+REGULAR_II_ADJECTIVES = frozenset(["かわいい"])
+
+# I-ADJECTIVE ENDINGS, attached to the adjective without its final い
+I_ADJECTIVE_PLAIN_POSITIVE_PAST_ENDING = "かった"
+I_ADJECTIVE_PLAIN_NEGATIVE_NONPAST_ENDING = "くない"
+I_ADJECTIVE_PLAIN_NEGATIVE_PAST_ENDING = "くなかった"
+I_ADJECTIVE_POLITE_POSITIVE_PAST_ENDING = "かったです"
+I_ADJECTIVE_POLITE_NEGATIVE_NONPAST_ENDING = "くありません"
+I_ADJECTIVE_POLITE_NEGATIVE_PAST_ENDING = "くありませんでした"
+I_ADJECTIVE_TE_ENDING = "くて"
+I_ADJECTIVE_ADVERBIAL_ENDING = "く"
+I_ADJECTIVE_CONDITIONAL_POSITIVE_ENDING = "かったら"
+I_ADJECTIVE_CONDITIONAL_NEGATIVE_ENDING = "くなかったら"
+I_ADJECTIVE_PROVISIONAL_POSITIVE_ENDING = "ければ"
+I_ADJECTIVE_PROVISIONAL_NEGATIVE_ENDING = "くなければ"
+
+# NA-ADJECTIVE ENDINGS, attached to the whole adjective
+NA_ADJECTIVE_PLAIN_POSITIVE_NONPAST_ENDING = "だ"
+NA_ADJECTIVE_PLAIN_POSITIVE_PAST_ENDING = "だった"
+NA_ADJECTIVE_PLAIN_NEGATIVE_NONPAST_ENDING = "じゃない"
+NA_ADJECTIVE_PLAIN_NEGATIVE_PAST_ENDING = "じゃなかった"
+NA_ADJECTIVE_POLITE_POSITIVE_PAST_ENDING = "でした"
+NA_ADJECTIVE_POLITE_NEGATIVE_NONPAST_ENDING = "じゃありません"
+NA_ADJECTIVE_POLITE_NEGATIVE_PAST_ENDING = "じゃありませんでした"
+NA_ADJECTIVE_TE_ENDING = "で"
+NA_ADJECTIVE_ADVERBIAL_ENDING = "に"
+NA_ADJECTIVE_CONDITIONAL_POSITIVE_ENDING = "だったら"
+NA_ADJECTIVE_CONDITIONAL_NEGATIVE_ENDING = "じゃなかったら"
+NA_ADJECTIVE_PROVISIONAL_POSITIVE_ENDING = "なら"
+NA_ADJECTIVE_PROVISIONAL_NEGATIVE_ENDING = "じゃなければ"
+
+# POLITE COPULA, attached to the plain nonpast form of either class
+DESU_ENDING = "です"
@@ -17,3 +17,34 @@ class VerbClass(Enum):
     ICHIDAN = 2
     IRREGULAR = 3
     NONIRREGULAR = 4
+
+class VerbForm(Enum):
+    PLAIN = 1
+    POLITE = 2
+    TE = 3
+    CONDITIONAL = 4
+    VOLITIONAL = 5
+    POTENTIAL = 6
+    IMPERATIVE = 7
+    PROVISIONAL = 8
+    CAUSATIVE = 9
+    PASSIVE = 10
+    DESIRE = 11
+    SOU = 12
+    NAGARA = 13
+    ZU = 14
+    TARI = 15
+    HONORIFIC = 16
+    HUMBLE = 17
+
+class AdjectiveClass(Enum):
+    I_ADJECTIVE = 1
+    NA_ADJECTIVE = 2
+
+class AdjectiveForm(Enum):
+    PLAIN = 1
+    POLITE = 2
+    TE = 3
+    ADVERBIAL = 4
+    CONDITIONAL = 5
+    PROVISIONAL = 6
@@ -5,6 +5,8 @@ KUDASAI = "ください"
 # IRREGULAR VERB ENDINGS
 SURU_ENDING = "する"
 KURU_ENDING = "くる"
+KURU_KANJI_ENDING = "来る"
+KURU_KANJI = "来"
 
 # (POLITE) MASU FORM ENDINGS
 MASU_POSITIVE_NONPAST = "ます"
@@ -14,6 +16,7 @@ MASU_NEGATIVE_PAST = "ませんでした"
 
 # (PLAIN) KATTA FORM ENDING
 KATTA_ENDING = "かった"
+NAKATTA_ENDING = "なかった"
 
 # (PLAIN) NAI ENDING
 NAI_ENDING = "ない"
@@ -25,10 +28,21 @@ VOLITIONAL_PLAIN_COPULA = "だろう"
 VOLITIONAL_ICHIDAN_PLAIN_ENDING = "よう"
 VOLITIONAL_SURU_ENDING = "しよう"
 VOLITIONAL_KURU_ENDING = "こよう"
+VOLITIONAL_PLAIN_NEGATIVE_ENDING = "ないだろう"
+VOLITIONAL_POLITE_NEGATIVE_ENDING = "ないでしょう"
+
+# CONDITIONAL FORM ENDINGS
+CONDITIONAL_TA_ENDING = "たら"
+CONDITIONAL_DA_ENDING = "だら"
+CONDITIONAL_PLAIN_NEGATIVE_ENDING = "なかったら"
+CONDITIONAL_POLITE_POSITIVE_ENDING = "ましたら"
+CONDITIONAL_POLITE_NEGATIVE_ENDING = "ませんでしたら"
 
 # POTENTIAL FORM
 POTENTIAL_POLITE_ICHIDAN_ENDING = "られます"
 POTENTIAL_ICHIDAN_ENDING = "られる"
+POTENTIAL_ICHIDAN_PLAIN_NEGATIVE_ENDING = "られない"
+POTENTIAL_ICHIDAN_POLITE_NEGATIVE_ENDING = "られません"
 POTENTIAL_SURU_PLAIN_POSITIVE_ENDING = "できる"
 POTENTIAL_SURU_PLAIN_NEGATIVE_ENDING = "できない"
 POTENTIAL_SURU_POLITE_POSITIVE_ENDING = "できます"
@@ -43,23 +57,94 @@ PASSIVE_ICHIDAN_PLAIN_POSITIVE_ENDING = "られる"
 PASSIVE_ICHIDAN_POLITE_POSITIVE_ENDING = "られます"
 PASSIVE_ICHIDAN_PLAIN_NEGATIVE_ENDING = "られない"
 PASSIVE_ICHIDAN_POLITE_NEGATIVE_ENDING = "られません"
+PASSIVE_GODAN_PLAIN_POSITIVE_ENDING = "れる"
+PASSIVE_GODAN_POLITE_POSITIVE_ENDING = "れます"
+PASSIVE_GODAN_PLAIN_NEGATIVE_ENDING = "れない"
+PASSIVE_GODAN_POLITE_NEGATIVE_ENDING = "れません"
 
 # CAUSATIVE VERB ENDINGS
 CAUSATIVE_PLAIN_SURU_ENDING = "させる"
 CAUSATIVE_PLAIN_KURU_ENDING = "こさせる"
 CAUSATIVE_KURU_NEGATIVE_BASE = "こさせ"
+CAUSATIVE_KURU_PLAIN_NEGATIVE_ENDING = "こさせない"
+CAUSATIVE_KURU_POLITE_NEGATIVE_ENDING = "こさせません"
+CAUSATIVE_GODAN_PLAIN_POSITIVE_ENDING = "せる"
+CAUSATIVE_GODAN_POLITE_POSITIVE_ENDING = "せます"
+CAUSATIVE_GODAN_PLAIN_NEGATIVE_ENDING = "せない"
+CAUSATIVE_GODAN_POLITE_NEGATIVE_ENDING = "せません"
+CAUSATIVE_ICHIDAN_PLAIN_POSITIVE_ENDING = "させる"
+CAUSATIVE_ICHIDAN_POLITE_POSITIVE_ENDING = "させます"
+CAUSATIVE_ICHIDAN_PLAIN_NEGATIVE_ENDING = "させない"
+CAUSATIVE_ICHIDAN_POLITE_NEGATIVE_ENDING = "させません"
 
 # IMPERATIVE VERB ENDINGS
 IMPERATIVE_SURU_PLAIN_POSITIVE_ENDING = "しろ"
 IMPERATIVE_KURU_PLAIN_POSITIVE_ENDING = "こい"
+IMPERATIVE_SURU_PLAIN_NEGATIVE_ENDING = "するな"
+IMPERATIVE_KURU_PLAIN_NEGATIVE_ENDING = "くるな"
+IMPERATIVE_TE_POLITE_POSITIVE_ENDING = "てください"
+IMPERATIVE_DE_POLITE_POSITIVE_ENDING = "でください"
+IMPERATIVE_POLITE_NEGATIVE_ENDING = "ないでください"
 
 # PROVISIONAL VERB ENDINGS
 PROVISIONAL_SURU_PLAIN_POSITIVE_ENDING = "すれば"
 PROVISIONAL_SURU_POLITE_POSITIVE_ENDING = "しませば"
 PROVISIONAL_KURU_PLAIN_POSITIVE_ENDING = "くれば"
 PROVISIONAL_KURU_POLITE_POSITIVE_ENDING = "きませば"
+PROVISIONAL_ICHIDAN_PLAIN_POSITIVE_ENDING = "れば"
 PROVISIONAL_ICHIDAN_PLAIN_NEGATIVE_ENDING = "なければ"
+PROVISIONAL_KURU_PLAIN_NEGATIVE_ENDING = "こなければ"
+PROVISIONAL_POLITE_NEGATIVE_ENDING = "ませんなら"
 
 # PASSIVE VERB ENDINGS
 PASSIVE_SURU_PLAIN_POSITIVE_ENDING = "される"
 PASSIVE_KURU_PLAIN_POSITIVE_ENDING = "こられる"
+
+# DESIRE (-TAI) FORM ENDINGS
+TAI_PLAIN_POSITIVE_ENDING = "たい"
+TAI_POLITE_POSITIVE_ENDING = "たいです"
+TAI_PLAIN_NEGATIVE_ENDING = "たくない"
+TAI_POLITE_NEGATIVE_ENDING = "たくないです"
+
+# APPEARANCE (-SOU) FORM ENDINGS
+SOU_PLAIN_POSITIVE_ENDING = "そう"
+SOU_POLITE_POSITIVE_ENDING = "そうです"
+SOU_PLAIN_NEGATIVE_ENDING = "なさそう"
+SOU_POLITE_NEGATIVE_ENDING = "なさそうです"
+
+# -NAGARA, -ZU AND -TARI FORM ENDINGS
+NAGARA_ENDING = "ながら"
+ZU_ENDING = "ず"
+ZU_SURU_ENDING = "せず"
+TARI_ENDING = "たり"
+DARI_ENDING = "だり"
+
+# HONORIFIC (SONKEIGO) FORM ENDINGS
+HONORIFIC_PREFIX = "お"
+HONORIFIC_PLAIN_POSITIVE_ENDING = "になる"
+HONORIFIC_POLITE_POSITIVE_ENDING = "になります"
+HONORIFIC_PLAIN_NEGATIVE_ENDING = "にならない"
+HONORIFIC_POLITE_NEGATIVE_ENDING = "になりません"
+HONORIFIC_SURU_PLAIN_POSITIVE_ENDING = "なさる"
+HONORIFIC_SURU_POLITE_POSITIVE_ENDING = "なさいます"
+HONORIFIC_SURU_PLAIN_NEGATIVE_ENDING = "なさらない"
+HONORIFIC_SURU_POLITE_NEGATIVE_ENDING = "なさいません"
+HONORIFIC_KURU_PLAIN_POSITIVE_ENDING = "いらっしゃる"
+HONORIFIC_KURU_POLITE_POSITIVE_ENDING = "いらっしゃいます"
+HONORIFIC_KURU_PLAIN_NEGATIVE_ENDING = "いらっしゃらない"
+HONORIFIC_KURU_POLITE_NEGATIVE_ENDING = "いらっしゃいません"
+
+# HUMBLE (KENJOUGO) FORM ENDINGS
+HUMBLE_PREFIX = "お"
+HUMBLE_PLAIN_POSITIVE_ENDING = "する"
+HUMBLE_POLITE_POSITIVE_ENDING = "します"
+HUMBLE_PLAIN_NEGATIVE_ENDING = "しない"
+HUMBLE_POLITE_NEGATIVE_ENDING = "しません"
+HUMBLE_SURU_PLAIN_POSITIVE_ENDING = "いたす"
+HUMBLE_SURU_POLITE_POSITIVE_ENDING = "いたします"
+HUMBLE_SURU_PLAIN_NEGATIVE_ENDING = "いたさない"
+HUMBLE_SURU_POLITE_NEGATIVE_ENDING = "いたしません"
+HUMBLE_KURU_PLAIN_POSITIVE_ENDING = "まいる"
+HUMBLE_KURU_POLITE_POSITIVE_ENDING = "まいります"
+HUMBLE_KURU_PLAIN_NEGATIVE_ENDING = "まいらない"
+HUMBLE_KURU_POLITE_NEGATIVE_ENDING = "まいりません"
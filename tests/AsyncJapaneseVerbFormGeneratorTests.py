@@ -0,0 +1,89 @@
+import asyncio
+import concurrent.futures
+import contextlib
+import unittest
+
+from src.AsyncJapaneseVerbFormGenerator import *
+from src.constants.EnumeratedTypes import Polarity, Tense, VerbClass, VerbForm
+from src.Exceptions import InvalidJapaneseVerbException
+from src.JapaneseVerbFormGenerator import JapaneseVerbFormGenerator
+from src.Paradigm import PARADIGM_SIGNATURES
+
+VERBS = (("食べる", VerbClass.ICHIDAN), ("書く", VerbClass.GODAN), ("勉強する", VerbClass.IRREGULAR))
+REQUESTS = [(verb, verb_class) + signature for verb, verb_class in VERBS for signature in PARADIGM_SIGNATURES]
+
+class CountingExecutor(concurrent.futures.ThreadPoolExecutor):
+    def __init__(self):
+        super(CountingExecutor, self).__init__(1)
+        self.num_submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.num_submitted += 1
+        return super(CountingExecutor, self).submit(*args, **kwargs)
+
+class AsyncJapaneseVerbFormGeneratorTests(unittest.TestCase):
+    def setUp(self):
+        self.executor = CountingExecutor()
+        self.expected = conjugate_chunk(JapaneseVerbFormGenerator(), REQUESTS)
+
+    def tearDown(self):
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+    def test_conjugate(self):
+        async_generator = AsyncJapaneseVerbFormGenerator(executor=self.executor)
+        surface = asyncio.run(async_generator.conjugate("書く", VerbClass.GODAN, VerbForm.PLAIN, Tense.PAST, None, Polarity.NEGATIVE))
+        self.assertEqual(surface, "書かなかった")
+        paradigm = asyncio.run(async_generator.generate_paradigm("書く", VerbClass.GODAN))
+        self.assertEqual([entry[4] for entry in paradigm], self.expected[len(PARADIGM_SIGNATURES):2 * len(PARADIGM_SIGNATURES)])
+        self.assertEqual(self.executor.num_submitted, 0)
+
+    def test_small_batch_runs_inline(self):
+        async_generator = AsyncJapaneseVerbFormGenerator(executor=self.executor, inline_threshold=len(REQUESTS))
+        self.assertEqual(asyncio.run(async_generator.conjugate_many(REQUESTS)), self.expected)
+        self.assertEqual(self.executor.num_submitted, 0)
+
+    def test_large_batch_runs_in_chunks(self):
+        async_generator = AsyncJapaneseVerbFormGenerator(executor=self.executor, chunk_size=50, inline_threshold=10)
+        self.assertEqual(asyncio.run(async_generator.conjugate_many(REQUESTS)), self.expected)
+        self.assertEqual(self.executor.num_submitted, (len(REQUESTS) + 49) // 50)
+
+    def test_default_executor(self):
+        async_generator = AsyncJapaneseVerbFormGenerator(chunk_size=50, inline_threshold=10)
+        self.assertEqual(asyncio.run(async_generator.conjugate_many(REQUESTS)), self.expected)
+
+    def test_invalid_verb(self):
+        async_generator = AsyncJapaneseVerbFormGenerator(executor=self.executor, chunk_size=50, inline_threshold=10)
+        requests = REQUESTS + [("taberu", VerbClass.ICHIDAN, VerbForm.TE, None, None, None)]
+        self.assertRaises(InvalidJapaneseVerbException, asyncio.run, async_generator.conjugate_many(requests))
+
+    def test_cancellation(self):
+        async_generator = AsyncJapaneseVerbFormGenerator(executor=self.executor, chunk_size=10, inline_threshold=10, max_pending_chunks=2)
+        requests = REQUESTS * 50
+
+        async def consume(started):
+            async with contextlib.aclosing(async_generator.iter_conjugations(requests)) as surfaces:
+                async for _ in surfaces:
+                    started.set()
+                    await asyncio.sleep(10)
+
+        async def cancel_after_first_result():
+            started = asyncio.Event()
+            task = asyncio.ensure_future(consume(started))
+            await started.wait()
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(cancel_after_first_result())
+        self.assertEqual(self.executor.num_submitted, 2)
+
+    def test_measure_loop_latency(self):
+        async def run_batch():
+            await AsyncJapaneseVerbFormGenerator(executor=self.executor, chunk_size=20, inline_threshold=10).conjugate_many(REQUESTS)
+        batch_seconds, delays = asyncio.run(measure_loop_latency(run_batch))
+        self.assertGreater(batch_seconds, 0)
+        self.assertEqual(delays, sorted(delays))
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(AsyncJapaneseVerbFormGeneratorTests)
+    unittest.TextTestRunner(verbosity=2).run(suite)
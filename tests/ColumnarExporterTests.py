@@ -0,0 +1,77 @@
+import os
+import tempfile
+import unittest
+
+from src.ColumnarExporter import *
+from src.Paradigm import PARADIGM_SIGNATURES
+from src.constants.EnumeratedTypes import VerbClass
+
+from TestConstants import GodanVerbNomu, IchidanVerbTaberu, IrregularVerbSuru, IrregularVerbKuru
+
+VERBS = [
+    (GodanVerbNomu.Verb, GodanVerbNomu.Verb_Class),
+    (IchidanVerbTaberu.Verb, IchidanVerbTaberu.Verb_Class),
+    (IrregularVerbSuru.Verb, IrregularVerbSuru.Verb_Class),
+    (IrregularVerbKuru.Verb, IrregularVerbKuru.Verb_Class),
+]
+
+@unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+class ColumnarExporterTests(unittest.TestCase):
+    def setUp(self):
+        self.num_rows = len(VERBS) * len(PARADIGM_SIGNATURES)
+
+    def test_iterate_record_batches_bounded_batch_size(self):
+        batches = list(iterate_record_batches(VERBS, batch_size=10))
+        self.assertTrue(all(batch.num_rows <= 10 for batch in batches))
+        self.assertEqual(sum(batch.num_rows for batch in batches), self.num_rows)
+
+    def test_iterate_record_batches_dictionary_encoded_columns(self):
+        batch = next(iterate_record_batches(VERBS))
+        self.assertTrue(pyarrow.types.is_dictionary(batch.schema.field("form").type))
+        rows = batch.to_pylist()
+        self.assertEqual(rows[0]["lemma"], GodanVerbNomu.Verb)
+        self.assertEqual(rows[0]["verb_class"], "GODAN")
+        self.assertEqual(rows[0]["form"], "PLAIN")
+        self.assertEqual(rows[0]["tense"], "PAST")
+        self.assertEqual(rows[0]["surface"], GodanVerbNomu.PlainPositivePast)
+
+    def test_iterate_record_batches_te_form_has_null_parameters(self):
+        rows = next(iterate_record_batches(VERBS[:1])).to_pylist()
+        te_rows = [row for row in rows if row["form"] == "TE"]
+        self.assertEqual(len(te_rows), 1)
+        self.assertIsNone(te_rows[0]["tense"])
+        self.assertIsNone(te_rows[0]["formality"])
+        self.assertIsNone(te_rows[0]["polarity"])
+        self.assertEqual(te_rows[0]["surface"], GodanVerbNomu.TeForm)
+
+    def test_iterate_record_batches_invalid_batch_size(self):
+        with self.assertRaises(ValueError):
+            next(iterate_record_batches(VERBS, batch_size=0))
+
+    def test_export_conjugation_table_parquet(self):
+        import pyarrow.parquet
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "conjugations.parquet")
+            num_rows = export_conjugation_table(VERBS, path, batch_size=16)
+            table = pyarrow.parquet.read_table(path)
+        self.assertEqual(num_rows, self.num_rows)
+        self.assertEqual(table.num_rows, self.num_rows)
+        self.assertEqual(table.column_names, list(COLUMN_NAMES))
+
+    def test_export_conjugation_table_arrow_ipc(self):
+        import pyarrow.ipc
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "conjugations.arrow")
+            export_conjugation_table(VERBS, path, file_format=ARROW_IPC_FORMAT, batch_size=16)
+            with pyarrow.ipc.open_file(path) as reader:
+                table = reader.read_all()
+        self.assertEqual(table.num_rows, self.num_rows)
+        self.assertIn(IchidanVerbTaberu.PassivePoliteNegative, table.column("surface").to_pylist())
+
+    def test_export_conjugation_table_unsupported_format(self):
+        with self.assertRaises(ValueError):
+            export_conjugation_table(VERBS, "conjugations.csv", file_format="csv")
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(ColumnarExporterTests)
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,162 @@
+import multiprocessing
+import os
+import subprocess
+import sys
+import time
+import unittest
+
+from src.ConjugationCache import *
+from src.constants.EnumeratedTypes import Formality, Polarity, Tense, VerbClass, VerbForm
+from src.Exceptions import InvalidJapaneseVerbException
+from src.Paradigm import generate_paradigm
+
+PLAIN_PAST_KEY = ("食べる", VerbForm.PLAIN, VerbClass.ICHIDAN, Tense.PAST, Polarity.POSITIVE)
+
+def _lookup_in_child(cache, key, connection):
+    connection.send(cache.lookup(key))
+    connection.close()
+
+def _attach_in_child(name, lock, key, connection):
+    attached = SharedConjugationCache(name, create=False, lock=lock)
+    connection.send(attached.lookup(key))
+    attached.store(("見る",) + key[1:], "見た")
+    attached.close()
+    connection.close()
+
+class ConjugationCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.cache = SharedConjugationCache(num_slots=256, arena_size=4096, near_cache_size=0)
+
+    def tearDown(self):
+        self.cache.close()
+        self.cache.unlink()
+
+    def test_encode_cache_key(self):
+        self.assertEqual(encode_cache_key(PLAIN_PAST_KEY), bytes([1, 2, 1, 1]) + "食べる".encode("utf-8"))
+        self.assertEqual(encode_cache_key(("する", VerbForm.TE, VerbClass.IRREGULAR)), bytes([3, 3]) + "する".encode("utf-8"))
+        self.assertNotEqual(encode_cache_key(PLAIN_PAST_KEY), encode_cache_key(PLAIN_PAST_KEY[:4] + (Polarity.NEGATIVE,)))
+
+    def test_local_cache(self):
+        cache = LocalConjugationCache(max_entries=2)
+        self.assertEqual(cache.lookup(PLAIN_PAST_KEY), (False, None))
+        cache.store(PLAIN_PAST_KEY, "食べた")
+        self.assertEqual(cache.lookup(PLAIN_PAST_KEY), (True, "食べた"))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        cache.store(("見る",) + PLAIN_PAST_KEY[1:], "見た")
+        cache.store(("寝る",) + PLAIN_PAST_KEY[1:], "寝た")
+        self.assertEqual(cache.lookup(PLAIN_PAST_KEY), (False, None))
+
+    def test_shared_store_and_lookup(self):
+        self.assertEqual(self.cache.lookup(PLAIN_PAST_KEY), (False, None))
+        self.cache.store(PLAIN_PAST_KEY, "食べた")
+        self.assertEqual(self.cache.lookup(PLAIN_PAST_KEY), (True, "食べた"))
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_shared_none_value(self):
+        key = ("行く", VerbForm.VOLITIONAL, VerbClass.GODAN, Formality.POLITE, Polarity.NEGATIVE)
+        self.cache.store(key, None)
+        self.assertEqual(self.cache.lookup(key), (True, None))
+
+    def test_shared_eviction(self):
+        keys = [("{}る".format(index), VerbForm.TE, VerbClass.ICHIDAN) for index in range(1000)]
+        for index, key in enumerate(keys):
+            self.cache.store(key, "{}て".format(index))
+        # the arena holds far fewer than 1000 entries, the oldest are gone
+        self.assertEqual(self.cache.lookup(keys[0]), (False, None))
+        self.assertEqual(self.cache.lookup(keys[-1]), (True, "999て"))
+        for index, key in enumerate(keys):
+            is_cached, value = self.cache.lookup(key)
+            if is_cached:
+                self.assertEqual(value, "{}て".format(index))
+
+    def test_torn_value_is_a_miss(self):
+        self.cache.store(PLAIN_PAST_KEY, "食べた")
+        # a writer overwriting the value halfway leaves bytes that are not UTF-8
+        value_offset = self.cache._arena_offset + ENTRY_HEADER.size + len(encode_cache_key(PLAIN_PAST_KEY))
+        self.cache._buffer[value_offset] = 0xFF
+        self.assertEqual(self.cache.lookup(PLAIN_PAST_KEY), (False, None))
+
+    def test_shared_clear(self):
+        self.cache.store(PLAIN_PAST_KEY, "食べた")
+        self.cache.clear()
+        self.assertEqual(self.cache.lookup(PLAIN_PAST_KEY), (False, None))
+
+    def test_attach_by_name(self):
+        # attach from a process that did not inherit the cache, as an independently started worker would
+        context = multiprocessing.get_context("spawn")
+        cache = SharedConjugationCache(num_slots=256, arena_size=4096, lock=context.Lock())
+        try:
+            cache.store(PLAIN_PAST_KEY, "食べた")
+            receiver, sender = context.Pipe(duplex=False)
+            process = context.Process(target=_attach_in_child, args=(cache.name, cache.lock, PLAIN_PAST_KEY, sender))
+            process.start()
+            self.assertEqual(receiver.recv(), (True, "食べた"))
+            process.join()
+            self.assertEqual(cache.lookup(("見る",) + PLAIN_PAST_KEY[1:]), (True, "見た"))
+        finally:
+            cache.close()
+            cache.unlink()
+
+    def test_attach_from_independent_process(self):
+        # a process that runs its own resource tracker must not leave the block
+        # registered there, or that tracker unlinks it once the process exits
+        self.cache.store(PLAIN_PAST_KEY, "食べた")
+        script = ("from multiprocessing import resource_tracker\n"
+                  "from src.ConjugationCache import SharedConjugationCache\n"
+                  "SharedConjugationCache({!r}, create=False).close()\n"
+                  "print(getattr(resource_tracker._resource_tracker, '_pid', None) or 0)").format(self.cache.name)
+        output = subprocess.run([sys.executable, "-c", script], check=True, stdout=subprocess.PIPE,
+                                cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))).stdout
+        tracker_pid = int(output)
+        deadline = time.time() + 10
+        while tracker_pid and time.time() < deadline:
+            try:
+                os.kill(tracker_pid, 0)
+            except ProcessLookupError:
+                break
+            time.sleep(0.01)
+        attached = SharedConjugationCache(self.cache.name, create=False)
+        self.assertEqual(attached.lookup(PLAIN_PAST_KEY), (True, "食べた"))
+        attached.close()
+
+    def test_near_cache(self):
+        cache = SharedConjugationCache(num_slots=256, arena_size=4096)
+        try:
+            cache.store(PLAIN_PAST_KEY, "食べた")
+            for index in range(1000):
+                cache.store(("{}る".format(index), VerbForm.TE, VerbClass.ICHIDAN), "{}て".format(index))
+            # evicted from the shared arena, still answered by the near cache
+            self.assertEqual(cache.lookup(PLAIN_PAST_KEY), (True, "食べた"))
+            cache.clear()
+            self.assertEqual(cache.lookup(PLAIN_PAST_KEY), (False, None))
+        finally:
+            cache.close()
+            cache.unlink()
+
+    def test_forked_worker_sees_entries(self):
+        self.cache.store(PLAIN_PAST_KEY, "食べた")
+        context = multiprocessing.get_context("fork")
+        receiver, sender = context.Pipe(duplex=False)
+        process = context.Process(target=_lookup_in_child, args=(self.cache, PLAIN_PAST_KEY, sender))
+        process.start()
+        self.assertEqual(receiver.recv(), (True, "食べた"))
+        process.join()
+
+    def test_generator_with_cache(self):
+        generator = JapaneseVerbFormGenerator()
+        cached_generator = JapaneseVerbFormGenerator(cache=self.cache)
+        for verb, verb_class in (("食べる", VerbClass.ICHIDAN), ("書く", VerbClass.GODAN), ("勉強する", VerbClass.IRREGULAR)):
+            expected = list(generate_paradigm(generator, verb, verb_class))
+            self.assertEqual(list(generate_paradigm(cached_generator, verb, verb_class)), expected)
+            self.assertEqual(list(generate_paradigm(cached_generator, verb, verb_class)), expected)
+        self.assertGreater(self.cache.hits, 0)
+
+    def test_invalid_verb_not_cached(self):
+        cached_generator = JapaneseVerbFormGenerator(cache=self.cache)
+        for _ in range(2):
+            self.assertRaises(InvalidJapaneseVerbException, cached_generator.generate_te_form, "taberu", VerbClass.ICHIDAN)
+        self.assertEqual(self.cache.hits, 0)
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(ConjugationCacheTests)
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,81 @@
+import os
+import tempfile
+import unittest
+
+from src.ConjugationIndex import ConjugationIndex
+from src.Exceptions import InvalidJapaneseVerbException
+from src.constants.EnumeratedTypes import VerbClass
+
+from TestConstants import GodanVerbNomu, IchidanVerbTaberu, IrregularVerbSuru, verb_incorrect_particle_ending
+
+
+class ConjugationIndexTests(unittest.TestCase):
+    def setUp(self):
+        self.index = ConjugationIndex()
+        self.nomu = (GodanVerbNomu.Verb, GodanVerbNomu.Verb_Class)
+        self.taberu = (IchidanVerbTaberu.Verb, IchidanVerbTaberu.Verb_Class)
+
+    def test_add_verb(self):
+        self.index.add_verb(*self.nomu)
+        self.assertEqual(len(self.index), 1)
+        self.assertEqual(self.index.lookup(GodanVerbNomu.PlainNegativePast), (self.nomu,))
+        self.assertIn(GodanVerbNomu.TeForm, self.index)
+        self.assertEqual(self.index.lookup(IchidanVerbTaberu.TeForm), ())
+
+    def test_add_verb_with_paradigm(self):
+        paradigm = [(None, None, None, None, GodanVerbNomu.TeForm), (None, None, None, None, None)]
+        self.index.add_verb(*self.nomu, paradigm=paradigm)
+        self.assertEqual(self.index.surfaces(*self.nomu), (GodanVerbNomu.TeForm,))
+
+    def test_add_verb_twice_does_not_double_count(self):
+        self.index.add_verb(*self.nomu)
+        count = self.index.reference_count(GodanVerbNomu.PolitePositiveNonpast)
+        self.index.add_verb(*self.nomu)
+        self.assertEqual(len(self.index), 1)
+        self.assertEqual(self.index.reference_count(GodanVerbNomu.PolitePositiveNonpast), count)
+
+    def test_shared_surface_within_lemma_is_reference_counted(self):
+        # potential and passive forms of ichidan verbs are identical
+        self.index.add_verb(*self.taberu)
+        self.assertEqual(self.index.reference_count(IchidanVerbTaberu.PassivePlainPositive), 2)
+
+    def test_shared_surface_between_lemmas(self):
+        # 食べる as both ichidan and (incorrectly) godan share the dictionary form
+        taberu_godan = (IchidanVerbTaberu.Verb, VerbClass.GODAN)
+        self.index.add_verb(*self.taberu)
+        self.index.add_verb(*taberu_godan)
+        self.assertEqual(set(self.index.lookup(IchidanVerbTaberu.Verb)), set([self.taberu, taberu_godan]))
+
+        self.assertTrue(self.index.remove_verb(*taberu_godan))
+        self.assertEqual(self.index.lookup(IchidanVerbTaberu.Verb), (self.taberu,))
+
+    def test_remove_verb(self):
+        self.index.add_verb(*self.nomu)
+        self.index.add_verb(*self.taberu)
+        self.assertTrue(self.index.remove_verb(*self.nomu))
+        self.assertFalse(self.index.remove_verb(*self.nomu))
+        self.assertNotIn(GodanVerbNomu.TeForm, self.index)
+        self.assertIn(IchidanVerbTaberu.TeForm, self.index)
+
+    def test_add_invalid_verb_leaves_index_untouched(self):
+        self.index.add_verb(*self.nomu)
+        with self.assertRaises(InvalidJapaneseVerbException):
+            self.index.add_verb(verb_incorrect_particle_ending, VerbClass.GODAN)
+        self.assertEqual(self.index.lemmas(), [self.nomu])
+
+    def test_snapshot_restore(self):
+        self.index.add_verb(*self.nomu)
+        self.index.add_verb(*self.taberu)
+        self.index.add_verb(IrregularVerbSuru.Verb, IrregularVerbSuru.Verb_Class)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "index.json")
+            self.index.snapshot(path)
+            restored = ConjugationIndex.restore(path)
+
+        self.assertEqual(restored.lemmas(), self.index.lemmas())
+        self.assertEqual(restored.lookup(IrregularVerbSuru.PotentialPlainPositive), ((IrregularVerbSuru.Verb, VerbClass.IRREGULAR),))
+        self.assertEqual(restored.reference_count(IchidanVerbTaberu.PassivePlainPositive), 2)
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(ConjugationIndexTests)
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,100 @@
+import os
+import socket
+import tempfile
+import threading
+import unittest
+
+from src.ConjugationServer import *
+from src.JapaneseVerbFormGenerator import JapaneseVerbFormGenerator
+from src.constants.EnumeratedTypes import Formality, Polarity, Tense, VerbClass, VerbForm
+
+from TestConstants import GodanVerbNomu, IchidanVerbTaberu, IrregularVerbSuru
+
+
+class ConjugationServerTests(unittest.TestCase):
+    def setUp(self):
+        self.requests = [
+            (GodanVerbNomu.Verb, VerbClass.GODAN, VerbForm.PLAIN, Tense.PAST, None, Polarity.POSITIVE),
+            (IchidanVerbTaberu.Verb, VerbClass.ICHIDAN, VerbForm.POTENTIAL, None, Formality.POLITE, Polarity.NEGATIVE),
+            (IrregularVerbSuru.Verb, VerbClass.IRREGULAR, VerbForm.TE, None, None, None),
+        ]
+        self.expected_results = [
+            (STATUS_OK, GodanVerbNomu.PlainPositivePast),
+            (STATUS_OK, IchidanVerbTaberu.PotentialPoliteNegative),
+            (STATUS_OK, IrregularVerbSuru.TeForm),
+        ]
+
+    def _start_server(self, address):
+        server = create_server(address)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return server
+
+    def test_request_round_trip(self):
+        frame = encode_requests(self.requests)
+        self.assertEqual(decode_requests(frame[FRAME_HEADER.size:]), self.requests)
+
+    def test_response_round_trip(self):
+        results = [(STATUS_OK, "飲んだ"), (STATUS_INVALID_VERB, None), (STATUS_UNSUPPORTED_FORM, None)]
+        frame = encode_responses(results)
+        self.assertEqual(decode_responses(frame[FRAME_HEADER.size:]), results)
+
+    def test_oversized_surface_is_an_error(self):
+        results = [(STATUS_OK, "の" * (MAX_SURFACE_SIZE // 3 + 1)), (STATUS_OK, "飲んだ")]
+        frame = encode_responses(results)
+        self.assertEqual(decode_responses(frame[FRAME_HEADER.size:]), [(STATUS_ERROR, None), (STATUS_OK, "飲んだ")])
+
+    def test_malformed_frames_raise_protocol_error(self):
+        payload = encode_requests(self.requests)[FRAME_HEADER.size:]
+        with self.assertRaises(ProtocolError):
+            decode_requests(payload[:-1])
+        with self.assertRaises(ProtocolError):
+            decode_requests(payload + b"\x00")
+        with self.assertRaises(ProtocolError):
+            decode_requests(COUNT_HEADER.pack(1) + REQUEST_HEADER.pack(99, 1, 0, 0, 0, 0))
+
+    def test_conjugate_requests_status_codes(self):
+        requests = [
+            ("abc", VerbClass.GODAN, VerbForm.PLAIN, Tense.NONPAST, None, Polarity.POSITIVE),
+            (IrregularVerbSuru.Verb, VerbClass.IRREGULAR, VerbForm.PASSIVE, None, Formality.POLITE, Polarity.NEGATIVE),
+        ]
+        results = conjugate_requests(JapaneseVerbFormGenerator(), requests)
+        self.assertEqual(results, [(STATUS_INVALID_VERB, None), (STATUS_UNSUPPORTED_FORM, None)])
+
+    def test_tcp_server_pipelined_frames(self):
+        server = self._start_server(("127.0.0.1", 0))
+        with ConjugationClient(server.server_address, timeout=5) as client:
+            client.send_requests(self.requests)
+            client.send_requests(self.requests[:1])
+            self.assertEqual(client.receive_results(), self.expected_results)
+            self.assertEqual(client.receive_results(), self.expected_results[:1])
+            self.assertEqual(client.conjugate(*self.requests[0]), GodanVerbNomu.PlainPositivePast)
+
+    @unittest.skipUnless(hasattr(socket, "AF_UNIX"), "Unix domain sockets are not available")
+    def test_unix_server(self):
+        with tempfile.TemporaryDirectory() as directory:
+            server = self._start_server(os.path.join(directory, "conjugation.sock"))
+            with ConjugationClient(server.server_address, timeout=5) as client:
+                self.assertEqual(client.conjugate_many(self.requests), self.expected_results)
+
+    def test_server_answers_oversized_surface(self):
+        # the verb fits its 2 byte length, its past form does not
+        long_verb = "の" * (MAX_SURFACE_SIZE // 3 - 1) + "む"
+        server = self._start_server(("127.0.0.1", 0))
+        with ConjugationClient(server.server_address, timeout=5) as client:
+            requests = [(long_verb, VerbClass.GODAN, VerbForm.PLAIN, Tense.PAST, None, Polarity.POSITIVE)] + self.requests
+            self.assertEqual(client.conjugate_many(requests), [(STATUS_ERROR, None)] + self.expected_results)
+
+    def test_server_closes_connection_on_malformed_frame(self):
+        server = self._start_server(("127.0.0.1", 0))
+        with ConjugationClient(server.server_address, timeout=5) as client:
+            client.socket.sendall(FRAME_HEADER.pack(3) + b"abc")
+            with self.assertRaises(ProtocolError):
+                client.receive_results()
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(ConjugationServerTests)
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,82 @@
+import os
+import tempfile
+import unittest
+
+from src.ConjugationTrie import *
+from src.constants.EnumeratedTypes import Polarity, Tense, VerbClass, VerbForm
+from src.Exceptions import InvalidJapaneseVerbException
+from src.JapaneseVerbFormGenerator import JapaneseVerbFormGenerator
+from src.Paradigm import generate_paradigm
+
+LEXICON = (
+    ("食べる", VerbClass.ICHIDAN, 5.0, "たべる"),
+    ("足す", VerbClass.GODAN, 1.0, "たす"),
+    ("助ける", VerbClass.ICHIDAN, 2.0, "たすける"),
+    ("飲む", VerbClass.GODAN, 3.0, "のむ"),
+    ("書く", VerbClass.GODAN),
+)
+
+class ConjugationTrieTests(unittest.TestCase):
+    def setUp(self):
+        self.trie = ConjugationTrie.build(LEXICON, top_k=5)
+
+    def brute_force(self, prefix, k):
+        matches = [(-self.trie.scores[entry_id], len(reading), reading, entry_id)
+                   for entry_id, reading in enumerate(self.trie.readings) if reading.startswith(prefix)]
+        return [self.trie._completion(match[3]) for match in sorted(matches)[:k]]
+
+    def test_matches_brute_force(self):
+        for prefix in ("", "た", "たす", "たすけ", "たべさせ", "の", "のま", "書", "書か", "x", "たべるx"):
+            self.assertEqual(self.trie.complete(prefix), self.brute_force(prefix, 5), prefix)
+            self.assertEqual(self.trie.complete(prefix, 2), self.brute_force(prefix, 2), prefix)
+
+    def test_completion_fields(self):
+        completions = self.trie.complete("たべなかっ")
+        self.assertEqual(completions[0], Completion("たべなかった", "食べなかった", "食べる", VerbClass.ICHIDAN,
+            VerbForm.PLAIN, Tense.PAST, None, Polarity.NEGATIVE, 5.0))
+        self.assertTrue(all(completion.verb == "食べる" for completion in self.trie.complete("たべ")))
+        self.assertEqual(self.trie.complete("たべ")[0].reading, "たべず")
+
+    def test_every_form_is_indexed(self):
+        generator = JapaneseVerbFormGenerator()
+        trie = ConjugationTrie.build([("飲む", VerbClass.GODAN)], top_k=1)
+        for _, _, _, _, surface in generate_paradigm(generator, "飲む", VerbClass.GODAN):
+            if surface is not None:
+                self.assertTrue(trie.complete(surface), surface)
+                self.assertTrue(surface.startswith(trie.complete(surface)[0].reading))
+
+    def test_weights_rank_completions(self):
+        self.assertEqual(self.trie.complete("たす")[0].verb, "助ける")
+        weights = {(VerbForm.TE, None, None, None): 10.0}
+        trie = ConjugationTrie.build(LEXICON, top_k=5, form_weights=weights)
+        self.assertEqual(trie.complete("た", 1)[0].surface, "食べて")
+        self.assertEqual(trie.complete("た", 1)[0].score, 50.0)
+
+    def test_build_from_stream(self):
+        builder = ConjugationTrieBuilder()
+        builder.add_lexicon(iter(LEXICON))
+        self.assertEqual(builder.build(5).complete("の"), self.trie.complete("の"))
+        self.assertRaises(InvalidJapaneseVerbException, builder.add_verb, "たべ", VerbClass.ICHIDAN)
+
+    def test_save_and_load(self):
+        handle, path = tempfile.mkstemp()
+        os.close(handle)
+        try:
+            self.trie.save(path)
+            loaded = ConjugationTrie.load(path)
+            self.assertEqual(loaded.top_k, 5)
+            self.assertEqual(len(loaded), len(self.trie))
+            for prefix in ("", "た", "たすけ", "のま", "書"):
+                self.assertEqual(loaded.complete(prefix), self.trie.complete(prefix))
+            with open(path, "r+b") as trie_file:
+                trie_file.write(b"XXXX")
+            self.assertRaises(ValueError, ConjugationTrie.load, path)
+        finally:
+            os.remove(path)
+
+    def test_measure_completion_time(self):
+        self.assertGreater(measure_completion_time(self.trie, ["た", "の"], repeat=1), 0)
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(ConjugationTrieTests)
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,90 @@
+import array
+import unittest
+
+from src.ConjugationWorkerPool import *
+from src.constants.EnumeratedTypes import VerbClass
+from src.Exceptions import InvalidJapaneseVerbException
+from src.IntegerConjugator import IntegerConjugator, PARADIGM_FORM_IDS
+
+VERBS = (
+    ("食べる", VerbClass.ICHIDAN),
+    ("書く", VerbClass.GODAN),
+    ("待つ", VerbClass.GODAN),
+    ("勉強する", VerbClass.IRREGULAR),
+    ("来る", VerbClass.IRREGULAR),
+    ("泳ぐ", VerbClass.GODAN),
+)
+
+class ConjugationWorkerPoolTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.pool = ConjugationWorkerPool(workers=2, slots=2, chunk_size=64)
+        cls.conjugator = IntegerConjugator()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.pool.close()
+
+    def test_conjugate_paradigms(self):
+        verbs = [verb for verb, _ in VERBS] * 20
+        verb_classes = [verb_class.value for _, verb_class in VERBS] * 20
+        expected = [self.conjugator.conjugate(verb, verb_class, form_id) for verb, verb_class in zip(verbs, verb_classes) for form_id in PARADIGM_FORM_IDS]
+        self.assertEqual(self.pool.conjugate_paradigms(verbs, verb_classes), expected)
+        self.assertIn(None, expected)
+
+    def test_conjugate_many(self):
+        rows = [(verb, verb_class.value, form_id) for verb, verb_class in VERBS for form_id in PARADIGM_FORM_IDS[::3]] * 5
+        self.assertEqual(self.pool.conjugate_many(rows), [self.conjugator.conjugate(*row) for row in rows])
+        self.assertEqual(self.pool.conjugate_many([]), [])
+
+    def test_jobs_split_when_results_overflow(self):
+        with ConjugationWorkerPool(workers=1, slots=2, segment_bytes=1024, chunk_size=4096) as pool:
+            verbs = [verb for verb, _ in VERBS] * 5
+            verb_classes = [verb_class.value for _, verb_class in VERBS] * 5
+            expected = [self.conjugator.conjugate(verb, verb_class, form_id) for verb, verb_class in zip(verbs, verb_classes) for form_id in PARADIGM_FORM_IDS]
+            self.assertEqual(pool.conjugate_paradigms(verbs, verb_classes), expected)
+
+    def test_errors(self):
+        rows = [("書く", VerbClass.GODAN.value, PARADIGM_FORM_IDS[0])] * 100 + [("書くx", VerbClass.GODAN.value, PARADIGM_FORM_IDS[0])]
+        self.assertRaises(InvalidJapaneseVerbException, self.pool.conjugate_many, rows)
+        self.assertRaises(ValueError, self.pool.conjugate_many, [("書く", VerbClass.GODAN.value, 1)])
+        self.assertRaises(ValueError, self.pool.conjugate_many, [("書く", 9, PARADIGM_FORM_IDS[0])])
+        # the pool stays usable after an error
+        self.assertEqual(self.pool.conjugate_many([("書く", VerbClass.GODAN.value, PARADIGM_FORM_IDS[0])]), ["書いた"])
+
+    def test_pool_usable_after_oversized_job(self):
+        verbs = [verb for verb, _ in VERBS] * 14
+        verb_classes = [verb_class.value for _, verb_class in VERBS] * 14
+        expected = [self.conjugator.conjugate(verb, verb_class, form_id) for verb, verb_class in zip(verbs, verb_classes) for form_id in PARADIGM_FORM_IDS]
+        with ConjugationWorkerPool(workers=2, segment_bytes=4096) as pool:
+            # its paradigm overflows a slot and cannot be split
+            long_verb = "の" * 40 + "む"
+            self.assertRaises(ValueError, pool.conjugate_paradigms, [long_verb] + verbs, [VerbClass.GODAN.value] + verb_classes)
+            self.assertEqual(pool.conjugate_paradigms(verbs, verb_classes), expected)
+            # its request alone does not fit in a slot
+            huge_verb = "の" * 2000 + "む"
+            self.assertRaises(ValueError, pool.conjugate_paradigms, [huge_verb] + verbs, [VerbClass.GODAN.value] + verb_classes)
+            self.assertEqual(pool.conjugate_paradigms(verbs, verb_classes), expected)
+
+    def test_worker_exit_closes_pool(self):
+        pool = ConjugationWorkerPool(workers=1)
+        try:
+            pool._workers[0].process.terminate()
+            pool._workers[0].process.join()
+            self.assertRaises(RuntimeError, pool.conjugate_many, [("書く", VerbClass.GODAN.value, PARADIGM_FORM_IDS[0])])
+            self.assertRaises(RuntimeError, pool.conjugate_many, [("書く", VerbClass.GODAN.value, PARADIGM_FORM_IDS[0])])
+        finally:
+            pool.close()
+
+    def test_run_job(self):
+        tables = build_function_tables()
+        job = encode_job(JOB_RECORDS, ["飲む", "見る"], bytes([VerbClass.GODAN.value, VerbClass.ICHIDAN.value]), array.array("H", PARADIGM_FORM_IDS[:1] * 2))
+        self.assertEqual(run_job(tables, memoryview(job)), (STATUS_OK, "飲んだ\0見た".encode("utf-8"), 0))
+
+    def test_cpu_affinity(self):
+        with ConjugationWorkerPool(workers=1, cpu_affinity=True) as pool:
+            self.assertEqual(pool.conjugate_many([("見る", VerbClass.ICHIDAN.value, PARADIGM_FORM_IDS[0])]), ["見た"])
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(ConjugationWorkerPoolTests)
+    unittest.TextTestRunner(verbosity=2).run(suite)
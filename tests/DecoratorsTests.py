@@ -2,7 +2,8 @@ import unittest
 
 from src.JapaneseVerbFormGenerator import JapaneseVerbFormGenerator
 from src.Decorators import *
-from src.constants.EnumeratedTypes import VerbClass, Tense, Polarity
+from src.Exceptions import *
+from src.constants.EnumeratedTypes import AdjectiveClass, VerbClass, Tense, Polarity
 from src.constants.ParticleConstants import CHISAI_TSU_PARTICLE, KU_PARTICLE, GU_PARTICLE, SU_PARTICLE, U_PARTICLE, TSU_PARTICLE, TA_PARTICLE, DA_PARTICLE, PU_PARTICLE
 
 from TestConstants import GodanVerbNomu, korean_with_japanese, english_with_japanese, verb_incorrect_particle_ending
@@ -37,6 +38,37 @@ class UtilsTests(unittest.TestCase):
         result = self.japaneseVerbFormGenerator.generate_plain_form(GodanVerbNomu.Verb, GodanVerbNomu.Verb_Class, Tense.NONPAST, Polarity.POSITIVE)
         self.assertEqual(result, GodanVerbNomu.Verb)
 
+    def test_validateJapaneseVerbDecorator_TypedExceptions(self):
+        with self.assertRaises(InvalidVerbLengthException):
+            self.japaneseVerbFormGenerator.generate_plain_form(KU_PARTICLE, VerbClass.GODAN, Tense.PAST, Polarity.NEGATIVE)
+        with self.assertRaises(InvalidVerbEndingException):
+            self.japaneseVerbFormGenerator.generate_plain_form(verb_incorrect_particle_ending, VerbClass.GODAN, Tense.PAST, Polarity.NEGATIVE)
+        with self.assertRaises(InvalidJapaneseVerbException) as expectedException:
+            self.japaneseVerbFormGenerator.generate_plain_form(english_with_japanese, VerbClass.GODAN, Tense.PAST, Polarity.NEGATIVE)
+        self.assertEqual(expectedException.exception.code, NON_JAPANESE_CHARACTER)
+
+    def test_validate_verb(self):
+        self.assertEqual(validate_verb(GodanVerbNomu.Verb), VALID_VERB)
+        self.assertEqual(validate_verb(KU_PARTICLE), INVALID_VERB_LENGTH)
+        self.assertEqual(validate_verb("a"), INVALID_VERB_LENGTH | INVALID_VERB_ENDING | NON_JAPANESE_CHARACTER)
+
+    def test_validate_many(self):
+        verbs = [GodanVerbNomu.Verb, KU_PARTICLE, verb_incorrect_particle_ending, korean_with_japanese, english_with_japanese]
+        result = validate_many(verbs)
+        self.assertEqual(list(result), [VALID_VERB, INVALID_VERB_LENGTH, INVALID_VERB_ENDING, NON_JAPANESE_CHARACTER, NON_JAPANESE_CHARACTER])
+        self.assertEqual(list(result), [validate_verb(verb) for verb in verbs])
+
+    def test_validate_many_empty(self):
+        self.assertEqual(validate_many([]), bytearray())
+
+    def test_validate_adjective(self):
+        self.assertEqual(validate_adjective("高い", AdjectiveClass.I_ADJECTIVE), VALID_VERB)
+        self.assertEqual(validate_adjective("静か", AdjectiveClass.I_ADJECTIVE), INVALID_VERB_ENDING)
+        self.assertEqual(validate_adjective("い", AdjectiveClass.I_ADJECTIVE), INVALID_VERB_LENGTH)
+        self.assertEqual(validate_adjective("楽", AdjectiveClass.NA_ADJECTIVE), VALID_VERB)
+        self.assertEqual(validate_adjective("", AdjectiveClass.NA_ADJECTIVE), INVALID_VERB_LENGTH)
+        self.assertEqual(validate_adjective(english_with_japanese, AdjectiveClass.NA_ADJECTIVE), NON_JAPANESE_CHARACTER)
+
 if __name__ == '__main__':
     suite = unittest.TestLoader().loadTestsFromTestCase(UtilsTests)
     unittest.TextTestRunner(verbosity=2).run(suite)
\ No newline at end of file
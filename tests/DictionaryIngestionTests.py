@@ -0,0 +1,78 @@
+import collections
+import os
+import tempfile
+import tracemalloc
+import unittest
+
+from src.DictionaryIngestion import *
+from src.constants.EnumeratedTypes import VerbClass, VerbForm
+from src.JapaneseVerbFormGenerator import JapaneseVerbFormGenerator
+from src.Paradigm import PARADIGM_SIGNATURES, generate_paradigm
+
+SAMPLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "jmdict_sample.xml")
+
+def _write_large_dictionary(path, num_entries):
+    with open(SAMPLE_PATH, encoding="utf-8") as sample_file:
+        header = sample_file.read().split("<JMdict>")[0]
+    with open(path, "w", encoding="utf-8") as dictionary_file:
+        dictionary_file.write(header)
+        dictionary_file.write("<JMdict>\n")
+        for index in range(num_entries):
+            dictionary_file.write("<entry><ent_seq>{}</ent_seq><k_ele><keb>書く</keb></k_ele><r_ele><reb>かく</reb></r_ele>"
+                "<sense><pos>&v5k;</pos><gloss>to write</gloss><gloss>{}</gloss></sense></entry>\n".format(index, "x" * 200))
+        dictionary_file.write("</JMdict>\n")
+
+class DictionaryIngestionTests(unittest.TestCase):
+    def test_read_entity_declarations(self):
+        declarations = read_entity_declarations(SAMPLE_PATH)
+        self.assertEqual(declarations["Ichidan verb"], "v1")
+        self.assertEqual(declarations["Godan verb with 'ku' ending"], "v5k")
+
+    def test_iter_dictionary_verbs(self):
+        stats = collections.Counter()
+        verbs = list(iter_dictionary_verbs(SAMPLE_PATH, stats))
+        self.assertEqual((stats["entries"], stats["verbs"], stats["unsupported"]), (19, 14, 4))
+        self.assertEqual(verbs[0], DictionaryVerb(1000010, "食べる", "たべる", VerbClass.ICHIDAN, "v1"))
+        by_verb = {dictionary_verb.verb: dictionary_verb for dictionary_verb in verbs}
+        self.assertEqual(by_verb["帰る"].verb_class, VerbClass.GODAN)
+        self.assertEqual(by_verb["勉強する"], DictionaryVerb(1000150, "勉強する", "べんきょうする", VerbClass.IRREGULAR, "vs"))
+        self.assertEqual(by_verb["する"].verb_class, VerbClass.IRREGULAR)
+        self.assertEqual(by_verb["来る"].verb_class, VerbClass.IRREGULAR)
+        self.assertEqual(by_verb["見る"].verb, "見る")
+        for skipped in ("猫", "行く", "有る", "愛する", "呉れる"):
+            self.assertNotIn(skipped, by_verb)
+
+    def test_conjugate_dictionary(self):
+        generator = JapaneseVerbFormGenerator()
+        stats = collections.Counter()
+        results = list(conjugate_dictionary(SAMPLE_PATH, batch_size=4, stats=stats))
+        self.assertEqual(len(results), 14)
+        self.assertEqual(stats["invalid"], 0)
+        for dictionary_verb, surfaces in results:
+            expected = [entry[4] for entry in generate_paradigm(generator, dictionary_verb.verb, dictionary_verb.verb_class)]
+            self.assertEqual(surfaces, expected)
+
+    def test_conjugate_selected_signatures(self):
+        signatures = [signature for signature in PARADIGM_SIGNATURES if signature[0] == VerbForm.TE]
+        results = dict((dictionary_verb.verb, surfaces) for dictionary_verb, surfaces in conjugate_dictionary(SAMPLE_PATH, signatures))
+        self.assertEqual(results["書く"], ["書いて"])
+        self.assertEqual(results["勉強する"], ["勉強して"])
+
+    def test_bounded_memory(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "large.xml")
+            _write_large_dictionary(path, 20000)
+            # compile the specialized functions outside of the measurement
+            list(conjugate_dictionary(SAMPLE_PATH))
+            tracemalloc.start()
+            try:
+                num_verbs = sum(1 for _ in conjugate_dictionary(path, batch_size=100))
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            self.assertEqual(num_verbs, 20000)
+            self.assertLess(peak, os.path.getsize(path) / 10)
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(DictionaryIngestionTests)
+    unittest.TextTestRunner(verbosity=2).run(suite)
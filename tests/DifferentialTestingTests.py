@@ -0,0 +1,36 @@
+import random
+import unittest
+
+from src.DifferentialTesting import *
+from src.constants.EnumeratedTypes import VerbClass, VerbForm
+
+
+class DifferentialTestingTests(unittest.TestCase):
+    def test_registered_engines_match_reference(self):
+        mismatches = run_differential(num_cases=20000, seed=7)
+        self.assertEqual([format_mismatch(mismatch) for mismatch in mismatches], [])
+
+    def test_random_verbs_cover_every_class_and_ending(self):
+        rng = random.Random(0)
+        generated = random_cases(rng)
+        cases = [next(generated) for _ in range(len(GODAN_FINAL_KANA) + len(ICHIDAN_STEM_FINAL_KANA) + len(IRREGULAR_ENDINGS))]
+        self.assertEqual(set(verb[-1] for verb, verb_class in cases if verb_class == VerbClass.GODAN), set(GODAN_FINAL_KANA))
+        self.assertEqual(set(verb[-2:] for verb, verb_class in cases if verb_class == VerbClass.IRREGULAR), set(IRREGULAR_ENDINGS))
+
+    def test_broken_engine_is_reported_with_minimized_verb(self):
+        def broken_engine(verb, verb_class, form, tense=None, formality=None, polarity=None):
+            result = reference_conjugation(verb, verb_class, form, tense, formality, polarity)
+            if form == VerbForm.TE and verb_class == VerbClass.GODAN and verb.endswith("む"):
+                return "{}!".format(result)
+            return result
+
+        mismatches = run_differential(num_cases=5000, engines={"broken": broken_engine}, max_mismatches=1)
+        self.assertEqual(len(mismatches), 1)
+        mismatch = mismatches[0]
+        self.assertEqual(mismatch.engine, "broken")
+        self.assertEqual(len(mismatch.verb), 2)
+        self.assertEqual(mismatch.actual, "{}!".format(mismatch.expected))
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(DifferentialTestingTests)
+    unittest.TextTestRunner(verbosity=2).run(suite)
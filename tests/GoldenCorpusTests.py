@@ -0,0 +1,65 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from src.GoldenCorpus import *
+from src.constants.EnumeratedTypes import Polarity, Tense, VerbClass, VerbForm
+
+# accuracy of the current build on the bundled corpus. Known gaps are irregular
+# polite volitional, polite causative, passive, and suru negative causative forms
+MINIMUM_ACCURACY = 0.92
+
+
+class GoldenCorpusTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.entries = load_golden_corpus()
+        cls.report = verify_golden_corpus(cls.entries)
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_corpus_covers_every_verb_class(self):
+        self.assertGreater(len(self.entries), 1000)
+        verb_classes = set(entry.verb_class for entry in self.entries)
+        self.assertEqual(verb_classes, {VerbClass.GODAN, VerbClass.ICHIDAN, VerbClass.IRREGULAR})
+
+    def test_accuracy_does_not_regress(self):
+        self.assertGreaterEqual(self.report.accuracy, MINIMUM_ACCURACY, self.report.format())
+        self.assertEqual(self.report.class_accuracy(VerbClass.ICHIDAN), 1.0, self.report.format())
+
+    def test_plain_forms_are_exact(self):
+        for polarity in Polarity:
+            label = signature_label((VerbForm.PLAIN, Tense.NONPAST, None, polarity))
+            self.assertEqual(self.report.form_accuracy(label), 1.0)
+
+    def test_write_and_load_round_trip(self):
+        path = os.path.join(self.test_dir, "corpus.tsv.gz")
+        write_golden_corpus(self.entries[:10], path)
+        self.assertEqual(load_golden_corpus(path), self.entries[:10])
+
+    def test_mismatches_are_reported(self):
+        entry = self.entries[0]
+        label = signature_label(PARADIGM_SIGNATURES[0])
+        expected = dict(entry.expected)
+        expected[label] = "間違い"
+        report = verify_golden_corpus([GoldenEntry(entry.verb, entry.verb_class, expected)])
+        self.assertEqual(report.num_mismatches, 1)
+        self.assertEqual(report.mismatches[0].label, label)
+        self.assertEqual(report.mismatches[0].expected, "間違い")
+        self.assertLess(report.form_accuracy(label), 1.0)
+
+    def test_missing_columns_are_skipped(self):
+        entry = self.entries[0]
+        label = signature_label(PARADIGM_SIGNATURES[0])
+        report = verify_golden_corpus([GoldenEntry(entry.verb, entry.verb_class, {label: entry.expected[label]})])
+        self.assertEqual(report.total, 1)
+        self.assertEqual(report.accuracy, 1.0)
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(GoldenCorpusTests)
+    unittest.TextTestRunner(verbosity=2).run(suite)
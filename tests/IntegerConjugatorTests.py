@@ -0,0 +1,60 @@
+import unittest
+
+from src.IntegerConjugator import *
+from src.constants.EnumeratedTypes import Formality, Polarity, Tense, VerbClass, VerbForm
+from src.Exceptions import InvalidJapaneseVerbException
+from src.JapaneseVerbFormGenerator import JapaneseVerbFormGenerator
+from src.Paradigm import PARADIGM_SIGNATURES, generate_paradigm
+
+VERBS = (
+    ("食べる", VerbClass.ICHIDAN),
+    ("書く", VerbClass.GODAN),
+    ("行く", VerbClass.GODAN),
+    ("勉強する", VerbClass.IRREGULAR),
+    ("来る", VerbClass.IRREGULAR),
+)
+
+class IntegerConjugatorTests(unittest.TestCase):
+    def setUp(self):
+        self.conjugator = IntegerConjugator()
+
+    def test_pack_form_id(self):
+        form_id = pack_form_id(VerbForm.PLAIN.value, Tense.PAST.value, 0, Polarity.NEGATIVE.value)
+        self.assertEqual(form_id, 1 << 6 | 1 << 4 | 2)
+        self.assertEqual(unpack_form_id(form_id), (VerbForm.PLAIN.value, Tense.PAST.value, 0, Polarity.NEGATIVE.value))
+        self.assertEqual(signature_form_id((VerbForm.PLAIN, Tense.PAST, None, Polarity.NEGATIVE)), form_id)
+        self.assertEqual(len(set(PARADIGM_FORM_IDS)), len(PARADIGM_SIGNATURES))
+
+    def test_conjugate(self):
+        form_id = pack_form_id(VerbForm.POLITE.value, Tense.PAST.value, 0, Polarity.NEGATIVE.value)
+        self.assertEqual(self.conjugator.conjugate("食べる", VerbClass.ICHIDAN.value, form_id), "食べませんでした")
+        self.assertEqual(self.conjugator.conjugate_codes("書く", VerbClass.GODAN.value, VerbForm.TE.value), "書いて")
+        self.assertEqual(self.conjugator.conjugate_codes("食べる", VerbClass.ICHIDAN.value, VerbForm.VOLITIONAL.value, 0, Formality.POLITE.value, Polarity.POSITIVE.value), "食べましょう")
+
+    def test_matches_generator(self):
+        generator = JapaneseVerbFormGenerator()
+        for verb, verb_class in VERBS:
+            expected = [entry[4] for entry in generate_paradigm(generator, verb, verb_class)]
+            rows = [(verb, verb_class.value, form_id) for form_id in PARADIGM_FORM_IDS]
+            self.assertEqual(self.conjugator.conjugate_many(rows), expected)
+
+    def test_unknown_form_id(self):
+        te_form_id = pack_form_id(VerbForm.TE.value)
+        for verb_class, form_id in ((VerbClass.GODAN.value, te_form_id | Polarity.POSITIVE.value), (VerbClass.GODAN.value, MAX_FORM_ID + 1),
+                                    (VerbClass.GODAN.value, -1), (0, te_form_id), (MAX_VERB_CLASS + 1, te_form_id), (-1, te_form_id)):
+            self.assertRaises(ValueError, self.conjugator.conjugate, "書く", verb_class, form_id)
+
+    def test_validation(self):
+        form_id = pack_form_id(VerbForm.TE.value)
+        self.assertRaises(InvalidJapaneseVerbException, self.conjugator.conjugate, "kaku", VerbClass.GODAN.value, form_id)
+        self.assertRaises(InvalidJapaneseVerbException, self.conjugator.conjugate_many, [("kaku", VerbClass.GODAN.value, form_id)])
+        self.assertEqual(self.conjugator.conjugate("書", VerbClass.GODAN.value, form_id, validate=False), self.conjugator.routine(VerbClass.GODAN.value, form_id)("書"))
+
+    def test_benchmark_integer_path(self):
+        result = benchmark_integer_path(VERBS[:2], repeat=1)
+        self.assertEqual(result._fields, ("enum_from_codes", "enum_prebuilt", "integer"))
+        self.assertTrue(all(seconds > 0 for seconds in result))
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(IntegerConjugatorTests)
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,75 @@
+import unittest
+
+from src.JapaneseAdjectiveFormGenerator import *
+from src.Exceptions import (InvalidAdjectiveEndingException, InvalidAdjectiveLengthException, InvalidVerbEndingException,
+                            NonJapaneseAdjectiveCharacterException, NonJapaneseCharacterException)
+from src.Paradigm import ADJECTIVE_PARADIGM_SIGNATURES, generate_adjective_paradigm
+from src.constants.EnumeratedTypes import AdjectiveClass, Polarity, Tense
+
+from TestConstants import IAdjectiveTakai, IAdjectiveIi, IAdjectiveKakkoii, NaAdjectiveShizuka
+
+ADJECTIVES = (IAdjectiveTakai, IAdjectiveIi, IAdjectiveKakkoii, NaAdjectiveShizuka)
+
+class JapaneseAdjectiveFormGeneratorTests(unittest.TestCase):
+    def setUp(self):
+        self.generator = JapaneseAdjectiveFormGenerator()
+
+    def test_plain_forms(self):
+        for adjective in ADJECTIVES:
+            with self.subTest(adjective=adjective.Adjective):
+                self.assertEqual(self.generator.generate_plain_form(adjective.Adjective, adjective.Adjective_Class, Tense.NONPAST, Polarity.POSITIVE), adjective.PlainPositiveNonpast)
+                self.assertEqual(self.generator.generate_plain_form(adjective.Adjective, adjective.Adjective_Class, Tense.PAST, Polarity.POSITIVE), adjective.PlainPositivePast)
+                self.assertEqual(self.generator.generate_plain_form(adjective.Adjective, adjective.Adjective_Class, Tense.NONPAST, Polarity.NEGATIVE), adjective.PlainNegativeNonpast)
+                self.assertEqual(self.generator.generate_plain_form(adjective.Adjective, adjective.Adjective_Class, Tense.PAST, Polarity.NEGATIVE), adjective.PlainNegativePast)
+
+    def test_polite_forms(self):
+        for adjective in ADJECTIVES:
+            with self.subTest(adjective=adjective.Adjective):
+                self.assertEqual(self.generator.generate_polite_form(adjective.Adjective, adjective.Adjective_Class, Tense.NONPAST, Polarity.POSITIVE), adjective.PolitePositiveNonpast)
+                self.assertEqual(self.generator.generate_polite_form(adjective.Adjective, adjective.Adjective_Class, Tense.PAST, Polarity.POSITIVE), adjective.PolitePositivePast)
+                self.assertEqual(self.generator.generate_polite_form(adjective.Adjective, adjective.Adjective_Class, Tense.NONPAST, Polarity.NEGATIVE), adjective.PoliteNegativeNonpast)
+                self.assertEqual(self.generator.generate_polite_form(adjective.Adjective, adjective.Adjective_Class, Tense.PAST, Polarity.NEGATIVE), adjective.PoliteNegativePast)
+
+    def test_te_and_adverbial_forms(self):
+        for adjective in ADJECTIVES:
+            with self.subTest(adjective=adjective.Adjective):
+                self.assertEqual(self.generator.generate_te_form(adjective.Adjective, adjective.Adjective_Class), adjective.TeForm)
+                self.assertEqual(self.generator.generate_adverbial_form(adjective.Adjective, adjective.Adjective_Class), adjective.AdverbialForm)
+
+    def test_conditional_and_provisional_forms(self):
+        for adjective in ADJECTIVES:
+            with self.subTest(adjective=adjective.Adjective):
+                self.assertEqual(self.generator.generate_conditional_form(adjective.Adjective, adjective.Adjective_Class, Polarity.POSITIVE), adjective.ConditionalPositive)
+                self.assertEqual(self.generator.generate_conditional_form(adjective.Adjective, adjective.Adjective_Class, Polarity.NEGATIVE), adjective.ConditionalNegative)
+                self.assertEqual(self.generator.generate_provisional_form(adjective.Adjective, adjective.Adjective_Class, Polarity.POSITIVE), adjective.ProvisionalPositive)
+                self.assertEqual(self.generator.generate_provisional_form(adjective.Adjective, adjective.Adjective_Class, Polarity.NEGATIVE), adjective.ProvisionalNegative)
+
+    def test_regular_ii_ending(self):
+        self.assertEqual(self.generator.generate_plain_form("かわいい", AdjectiveClass.I_ADJECTIVE, Tense.NONPAST, Polarity.NEGATIVE), "かわいくない")
+        self.assertEqual(self.generator.generate_plain_form("良い", AdjectiveClass.I_ADJECTIVE, Tense.PAST, Polarity.POSITIVE), "良かった")
+
+    def test_adjective_paradigm(self):
+        paradigm = list(generate_adjective_paradigm(self.generator, IAdjectiveTakai.Adjective, IAdjectiveTakai.Adjective_Class))
+        self.assertEqual(len(paradigm), len(ADJECTIVE_PARADIGM_SIGNATURES))
+        self.assertIn(IAdjectiveTakai.PlainNegativePast, [surface for _, _, _, _, surface in paradigm])
+
+    def test_validation(self):
+        self.assertEqual(self.generator.generate_adverbial_form("楽", AdjectiveClass.NA_ADJECTIVE), "楽に")
+        self.assertRaises(InvalidVerbEndingException, self.generator.generate_te_form, "静か", AdjectiveClass.I_ADJECTIVE)
+        self.assertRaises(NonJapaneseCharacterException, self.generator.generate_te_form, "nice", AdjectiveClass.NA_ADJECTIVE)
+
+    def test_validation_reports_adjective_errors(self):
+        with self.assertRaises(InvalidAdjectiveEndingException) as context:
+            self.generator.generate_adverbial_form("たかX", AdjectiveClass.I_ADJECTIVE)
+        self.assertEqual(context.exception.args, ("Invalid Japanese Adjective Ending", "X"))
+        self.assertEqual(context.exception.code, InvalidVerbEndingException.code)
+        with self.assertRaises(InvalidAdjectiveLengthException) as context:
+            self.generator.generate_te_form("い", AdjectiveClass.I_ADJECTIVE)
+        self.assertEqual(context.exception.args, ("Invalid Japanese Adjective Length", 1, "い"))
+        with self.assertRaises(NonJapaneseAdjectiveCharacterException) as context:
+            self.generator.generate_te_form("nice", AdjectiveClass.NA_ADJECTIVE)
+        self.assertEqual(context.exception.args, ("Non-Japanese Character Found in Adjective", "nice"))
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(JapaneseAdjectiveFormGeneratorTests)
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -1,9 +1,10 @@
 import unittest
 
 from src.JapaneseVerbFormGenerator import *
+from src.Paradigm import conjugate_form
 from src.constants.EnumeratedTypes import Polarity, Formality, VerbClass, Tense
 
-from TestConstants import GodanVerbNomu, IchidanVerbTaberu, IrregularVerbSuru, IrregularVerbKuru
+from TestConstants import GodanVerbNomu, IchidanVerbTaberu, IrregularVerbSuru, IrregularVerbKuru, IrregularVerbKuruKanji, IrregularVerbMotteKuru
 
 # https://github.com/audreyr/how-to/blob/master/python/use_coverage_with_unittest.rst
 # https://github.com/audreyr/how-to/blob/master/python/use_coverage_with_unittest.rst#user-content-set-up-coveralls
@@ -154,6 +155,60 @@ class TestPositiveVerbForms(ParametrizedTestCase):
         result = self.japaneseVerbFormGenerator.generate_passive_form(self.verb.Verb, self.verb.Verb_Class, Formality.POLITE, self.polarity)
         self.assertEqual(result, self.verb.PassivePolitePositive)
 
+    # Desire Verb Forms Test
+    def test_desire_plain_positive(self):
+        result = self.japaneseVerbFormGenerator.generate_desire_form(self.verb.Verb, self.verb.Verb_Class, Formality.PLAIN, self.polarity)
+        self.assertEqual(result, self.verb.DesirePlainPositive)
+
+    def test_desire_polite_positive(self):
+        result = self.japaneseVerbFormGenerator.generate_desire_form(self.verb.Verb, self.verb.Verb_Class, Formality.POLITE, self.polarity)
+        self.assertEqual(result, self.verb.DesirePolitePositive)
+
+    # Appearance (Sou) Verb Forms Test
+    def test_sou_plain_positive(self):
+        result = self.japaneseVerbFormGenerator.generate_sou_form(self.verb.Verb, self.verb.Verb_Class, Formality.PLAIN, self.polarity)
+        self.assertEqual(result, self.verb.SouPlainPositive)
+
+    def test_sou_polite_positive(self):
+        result = self.japaneseVerbFormGenerator.generate_sou_form(self.verb.Verb, self.verb.Verb_Class, Formality.POLITE, self.polarity)
+        self.assertEqual(result, self.verb.SouPolitePositive)
+
+    # Honorific Verb Forms Test
+    def test_honorific_plain_positive(self):
+        result = self.japaneseVerbFormGenerator.generate_honorific_form(self.verb.Verb, self.verb.Verb_Class, Formality.PLAIN, self.polarity)
+        self.assertEqual(result, self.verb.HonorificPlainPositive)
+
+    def test_honorific_polite_positive(self):
+        result = self.japaneseVerbFormGenerator.generate_honorific_form(self.verb.Verb, self.verb.Verb_Class, Formality.POLITE, self.polarity)
+        self.assertEqual(result, self.verb.HonorificPolitePositive)
+
+    # Humble Verb Forms Test
+    def test_humble_plain_positive(self):
+        result = self.japaneseVerbFormGenerator.generate_humble_form(self.verb.Verb, self.verb.Verb_Class, Formality.PLAIN, self.polarity)
+        self.assertEqual(result, self.verb.HumblePlainPositive)
+
+    def test_humble_polite_positive(self):
+        result = self.japaneseVerbFormGenerator.generate_humble_form(self.verb.Verb, self.verb.Verb_Class, Formality.POLITE, self.polarity)
+        self.assertEqual(result, self.verb.HumblePolitePositive)
+
+    # Nagara, Zu and Tari Verb Forms Test
+    def test_nagara_form(self):
+        result = self.japaneseVerbFormGenerator.generate_nagara_form(self.verb.Verb, self.verb.Verb_Class)
+        self.assertEqual(result, self.verb.NagaraForm)
+
+    def test_zu_form(self):
+        result = self.japaneseVerbFormGenerator.generate_zu_form(self.verb.Verb, self.verb.Verb_Class)
+        self.assertEqual(result, self.verb.ZuForm)
+
+    def test_tari_form(self):
+        result = self.japaneseVerbFormGenerator.generate_tari_form(self.verb.Verb, self.verb.Verb_Class)
+        self.assertEqual(result, self.verb.TariForm)
+
+    # Extended Verb Forms Test
+    def test_extended_forms_match_single_forms(self):
+        for form, tense, formality, polarity, surface in self.japaneseVerbFormGenerator.generate_extended_forms(self.verb.Verb, self.verb.Verb_Class):
+            self.assertEqual(surface, conjugate_form(self.japaneseVerbFormGenerator, self.verb.Verb, self.verb.Verb_Class, form, tense, formality, polarity))
+
 # ---------------------------------------------------------- #
 #                    Negative Verb Form Tests                #
 # ---------------------------------------------------------- #
@@ -272,6 +327,42 @@ class TestNegativeVerbForms(ParametrizedTestCase):
         result = self.japaneseVerbFormGenerator.generate_passive_form(self.verb.Verb, self.verb.Verb_Class, Formality.POLITE, self.polarity)
         self.assertEqual(result, self.verb.PassivePoliteNegative)
 
+    # Desire Verb Forms Test
+    def test_desire_plain_negative(self):
+        result = self.japaneseVerbFormGenerator.generate_desire_form(self.verb.Verb, self.verb.Verb_Class, Formality.PLAIN, self.polarity)
+        self.assertEqual(result, self.verb.DesirePlainNegative)
+
+    def test_desire_polite_negative(self):
+        result = self.japaneseVerbFormGenerator.generate_desire_form(self.verb.Verb, self.verb.Verb_Class, Formality.POLITE, self.polarity)
+        self.assertEqual(result, self.verb.DesirePoliteNegative)
+
+    # Appearance (Sou) Verb Forms Test
+    def test_sou_plain_negative(self):
+        result = self.japaneseVerbFormGenerator.generate_sou_form(self.verb.Verb, self.verb.Verb_Class, Formality.PLAIN, self.polarity)
+        self.assertEqual(result, self.verb.SouPlainNegative)
+
+    def test_sou_polite_negative(self):
+        result = self.japaneseVerbFormGenerator.generate_sou_form(self.verb.Verb, self.verb.Verb_Class, Formality.POLITE, self.polarity)
+        self.assertEqual(result, self.verb.SouPoliteNegative)
+
+    # Honorific Verb Forms Test
+    def test_honorific_plain_negative(self):
+        result = self.japaneseVerbFormGenerator.generate_honorific_form(self.verb.Verb, self.verb.Verb_Class, Formality.PLAIN, self.polarity)
+        self.assertEqual(result, self.verb.HonorificPlainNegative)
+
+    def test_honorific_polite_negative(self):
+        result = self.japaneseVerbFormGenerator.generate_honorific_form(self.verb.Verb, self.verb.Verb_Class, Formality.POLITE, self.polarity)
+        self.assertEqual(result, self.verb.HonorificPoliteNegative)
+
+    # Humble Verb Forms Test
+    def test_humble_plain_negative(self):
+        result = self.japaneseVerbFormGenerator.generate_humble_form(self.verb.Verb, self.verb.Verb_Class, Formality.PLAIN, self.polarity)
+        self.assertEqual(result, self.verb.HumblePlainNegative)
+
+    def test_humble_polite_negative(self):
+        result = self.japaneseVerbFormGenerator.generate_humble_form(self.verb.Verb, self.verb.Verb_Class, Formality.POLITE, self.polarity)
+        self.assertEqual(result, self.verb.HumblePoliteNegative)
+
 # ---------------------------------------------------------- #
 #     Register Positive and Negative Verb Form Test Suites   #
 # ---------------------------------------------------------- #
@@ -283,11 +374,15 @@ def create_positive_verb_form_suite(suite):
         2. Ichidan Verb [Taberu / たベる]
         3. Irregular Verb [Suru / する]
         4. Irregular Verb [Kuru / くる]
+        5. Irregular Verb [Kuru / 来る]
+        6. Irregular Verb [Mottekuru / 持ってくる]
     '''
     suite.addTest(ParametrizedTestCase.parametrize(TestPositiveVerbForms, param=GodanVerbNomu))
     suite.addTest(ParametrizedTestCase.parametrize(TestPositiveVerbForms, param=IchidanVerbTaberu))
     suite.addTest(ParametrizedTestCase.parametrize(TestPositiveVerbForms, param=IrregularVerbSuru))
     suite.addTest(ParametrizedTestCase.parametrize(TestPositiveVerbForms, param=IrregularVerbKuru))
+    suite.addTest(ParametrizedTestCase.parametrize(TestPositiveVerbForms, param=IrregularVerbKuruKanji))
+    suite.addTest(ParametrizedTestCase.parametrize(TestPositiveVerbForms, param=IrregularVerbMotteKuru))
 
     return suite
 
@@ -299,11 +394,15 @@ def create_negative_verb_form_suite(suite):
         2. Ichidan Verb [Taberu / たベる]
         3. Irregular Verb [Suru / する]
         4. Irregular Verb [Kuru / くる]
+        5. Irregular Verb [Kuru / 来る]
+        6. Irregular Verb [Mottekuru / 持ってくる]
     '''
     suite.addTest(ParametrizedTestCase.parametrize(TestNegativeVerbForms, param=GodanVerbNomu))
     suite.addTest(ParametrizedTestCase.parametrize(TestNegativeVerbForms, param=IchidanVerbTaberu))
     suite.addTest(ParametrizedTestCase.parametrize(TestNegativeVerbForms, param=IrregularVerbSuru))
     suite.addTest(ParametrizedTestCase.parametrize(TestNegativeVerbForms, param=IrregularVerbKuru))
+    suite.addTest(ParametrizedTestCase.parametrize(TestNegativeVerbForms, param=IrregularVerbKuruKanji))
+    suite.addTest(ParametrizedTestCase.parametrize(TestNegativeVerbForms, param=IrregularVerbMotteKuru))
 
     return suite
 
@@ -0,0 +1,77 @@
+import unittest
+
+from src.LazyParadigm import *
+from src.constants.EnumeratedTypes import Formality, Polarity, Tense, VerbClass, VerbForm
+from src.Exceptions import InvalidJapaneseVerbException
+from src.JapaneseVerbFormGenerator import JapaneseVerbFormGenerator
+from src.Paradigm import PARADIGM_SIGNATURES, generate_paradigm
+
+VERBS = (
+    ("食べる", VerbClass.ICHIDAN),
+    ("書く", VerbClass.GODAN),
+    ("買う", VerbClass.GODAN),
+    ("待つ", VerbClass.GODAN),
+    ("勉強する", VerbClass.IRREGULAR),
+    ("来る", VerbClass.IRREGULAR),
+    ("くる", VerbClass.IRREGULAR),
+)
+
+class LazyParadigmTests(unittest.TestCase):
+    def test_matches_generate_paradigm(self):
+        generator = JapaneseVerbFormGenerator()
+        for verb, verb_class in VERBS:
+            self.assertEqual(list(LazyParadigm(verb, verb_class)), list(generate_paradigm(generator, verb, verb_class)))
+
+    def test_unsupported_irregular_and_wrong_class_verbs_match_generate_paradigm(self):
+        generator = JapaneseVerbFormGenerator()
+        cases = (
+            ("できる", VerbClass.IRREGULAR),
+            ("食べる", VerbClass.IRREGULAR),
+            ("書く", VerbClass.IRREGULAR),
+            ("書く", VerbClass.ICHIDAN),
+            ("食べる", VerbClass.GODAN),
+            ("勉強する", VerbClass.ICHIDAN),
+            ("来る", VerbClass.GODAN),
+        )
+        for verb, verb_class in cases:
+            self.assertEqual(list(LazyParadigm(verb, verb_class)), list(generate_paradigm(generator, verb, verb_class)), (verb, verb_class))
+        paradigm = LazyParadigm("できる", VerbClass.IRREGULAR)
+        self.assertIsNone(paradigm.plain_past_positive)
+        self.assertIsNone(paradigm.plain_past_negative)
+
+    def test_attribute_and_key_access(self):
+        paradigm = LazyParadigm("書く", VerbClass.GODAN)
+        self.assertEqual(paradigm.plain_past_negative, "書かなかった")
+        self.assertEqual(paradigm[(VerbForm.PLAIN, Tense.PAST, None, Polarity.NEGATIVE)], "書かなかった")
+        self.assertEqual(paradigm.te, "書いて")
+        self.assertEqual(paradigm[(VerbForm.HONORIFIC, None, Formality.POLITE, Polarity.POSITIVE)], "お書きになります")
+        self.assertEqual(len(paradigm), len(PARADIGM_SIGNATURES))
+        self.assertRaises(KeyError, paradigm.__getitem__, (VerbForm.TE, Tense.PAST, None, None))
+        self.assertRaises(AttributeError, getattr, paradigm, "plain_future")
+
+    def test_forms_computed_on_first_access(self):
+        paradigm = LazyParadigm("書く", VerbClass.GODAN)
+        self.assertEqual(paradigm.computed_names(), ["verb_class", "verb"])
+        paradigm.plain_nonpast_negative
+        paradigm.provisional_plain_negative
+        self.assertEqual(paradigm.computed_names(), ["verb_class", "nai_form", "a_base", "verb", "plain_nonpast_negative", "provisional_plain_negative"])
+        paradigm.polite_past_positive
+        self.assertIn("i_base", paradigm.computed_names())
+
+    def test_derive_recipe(self):
+        self.assertEqual(derive_recipe((VerbForm.PLAIN, Tense.PAST, None, Polarity.NEGATIVE), VerbClass.GODAN), ("", "a_base", "なかった"))
+        self.assertEqual(derive_recipe((VerbForm.CONDITIONAL, None, Formality.PLAIN, Polarity.POSITIVE), VerbClass.GODAN), ("", "ta_form", "ら"))
+        self.assertEqual(derive_recipe((VerbForm.HONORIFIC, None, Formality.PLAIN, Polarity.POSITIVE), VerbClass.GODAN), ("お", "i_base", "になる"))
+        # できる replaces する, so no intermediate builds it
+        self.assertIsNone(derive_recipe((VerbForm.POTENTIAL, None, Formality.PLAIN, Polarity.POSITIVE), VerbClass.IRREGULAR))
+
+    def test_invalid_verb(self):
+        self.assertRaises(InvalidJapaneseVerbException, LazyParadigm, "kaku", VerbClass.GODAN)
+
+    def test_benchmark_lazy_paradigm(self):
+        results = benchmark_lazy_paradigm(VERBS, DEFAULT_BENCHMARK_FORMS, repeat=1)
+        self.assertEqual([approach for approach, _ in results], ["generate_*", "eager paradigm", "LazyParadigm"])
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(LazyParadigmTests)
+    unittest.TextTestRunner(verbosity=2).run(suite)
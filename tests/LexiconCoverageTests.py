@@ -0,0 +1,68 @@
+import json
+import unittest
+
+from src.LexiconCoverage import *
+from src.constants.EnumeratedTypes import VerbClass
+from src.Exceptions import INVALID_VERB_ENDING, NON_JAPANESE_CHARACTER
+from src.JapaneseVerbFormGenerator import JapaneseVerbFormGenerator
+from src.Paradigm import PARADIGM_SIGNATURES
+
+LEXICON = (
+    ("食べる", VerbClass.ICHIDAN),
+    ("書く", VerbClass.GODAN),
+    ("聞く", VerbClass.GODAN),
+    ("勉強する", VerbClass.IRREGULAR),
+    ("来る", VerbClass.IRREGULAR),
+    ("たべx", VerbClass.ICHIDAN),
+)
+
+class FailingGenerator(JapaneseVerbFormGenerator):
+    def generate_te_form(self, verb, verb_class):
+        raise RuntimeError("te form failed")
+
+class LexiconCoverageTests(unittest.TestCase):
+    def test_verb_ending(self):
+        self.assertEqual(verb_ending("書く", VerbClass.GODAN), "く")
+        self.assertEqual(verb_ending("勉強する", VerbClass.IRREGULAR), "する")
+        self.assertEqual(verb_ending("持って来る", VerbClass.IRREGULAR), "来る")
+
+    def test_counts(self):
+        report = analyze_lexicon(iter(LEXICON))
+        self.assertEqual(report.num_verbs, 6)
+        self.assertEqual(report.verbs[(VerbClass.GODAN, "く")], 2)
+        self.assertEqual(report.invalid_verbs, {(VerbClass.ICHIDAN, "x", INVALID_VERB_ENDING | NON_JAPANESE_CHARACTER): 1})
+        self.assertEqual(report.num_conjugations, 5 * len(PARADIGM_SIGNATURES))
+        self.assertEqual(report.outcomes[("te", VerbClass.GODAN, "く", OUTCOME_OK)], 2)
+        self.assertEqual(sum(count for count, _, _ in report.timings.values()), report.num_conjugations)
+
+    def test_failure_buckets(self):
+        report = analyze_lexicon(LEXICON)
+        buckets = report.failure_buckets()
+        self.assertTrue(buckets)
+        self.assertTrue(all(bucket.verb_class == VerbClass.IRREGULAR and bucket.outcome == OUTCOME_NONE for bucket in buckets))
+        self.assertIn(("passive_polite_positive", "する", ["勉強する"]), [(bucket.form, bucket.ending, bucket.examples) for bucket in buckets])
+
+    def test_exceptions_are_bucketed(self):
+        report = analyze_lexicon(LEXICON * 3, generator=FailingGenerator(), max_examples=2)
+        buckets = [bucket for bucket in report.failure_buckets() if bucket.outcome == "RuntimeError"]
+        self.assertEqual([(bucket.form, bucket.verb_class, bucket.count) for bucket in buckets if bucket.ending == "く"], [("te", VerbClass.GODAN, 6)])
+        self.assertEqual(len(buckets[0].examples), 2)
+
+    def test_memory_bounded_by_groups(self):
+        small = analyze_lexicon(LEXICON)
+        large = analyze_lexicon(LEXICON * 20)
+        self.assertEqual(set(small.outcomes), set(large.outcomes))
+        self.assertEqual(set(small.timings), set(large.timings))
+        self.assertEqual(max(len(examples) for examples in large.examples.values()), 3)
+
+    def test_report_output(self):
+        report = analyze_lexicon(LEXICON)
+        data = json.loads(json.dumps(report.to_dict()))
+        self.assertEqual(sum(row["count"] for row in data["outcomes"]), report.num_conjugations)
+        self.assertEqual(len(data["failures"]), len(report.failure_buckets()))
+        self.assertIn("6 verbs", report.format())
+        self.assertEqual(len(report.slowest_groups(5)), 5)
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(LexiconCoverageTests)
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,29 @@
+import unittest
+
+from src.LoadGenerator import *
+
+
+class LoadGeneratorTests(unittest.TestCase):
+    def test_percentile(self):
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 0.5), 50)
+        self.assertEqual(percentile(values, 0.99), 99)
+        self.assertEqual(percentile(values, 1.0), 100)
+        self.assertEqual(percentile([], 0.99), 0.0)
+
+    def test_build_request_frames(self):
+        frames = build_request_frames(3, 10)
+        self.assertEqual(len(frames), 3)
+        self.assertEqual(frames, build_request_frames(3, 10))
+
+    def test_run_local_load(self):
+        report = run_local_load(rate=2000, duration=0.2, batch_size=20)
+        self.assertEqual(report.num_requests, 400)
+        self.assertEqual(report.num_failures, 0)
+        self.assertLessEqual(report.p50_ms, report.p99_ms)
+        self.assertLessEqual(report.p99_ms, report.max_ms)
+        self.assertIn("p99", format_report(report))
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(LoadGeneratorTests)
+    unittest.TextTestRunner(verbosity=2).run(suite)
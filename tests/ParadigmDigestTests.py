@@ -0,0 +1,84 @@
+import os
+import tempfile
+import unittest
+
+from src.ParadigmDigest import *
+from src.constants.EnumeratedTypes import VerbClass
+from src.JapaneseVerbFormGenerator import JapaneseVerbFormGenerator
+
+LEXICON = [
+    ("食べる", VerbClass.ICHIDAN),
+    ("見る", VerbClass.ICHIDAN),
+    ("書く", VerbClass.GODAN),
+    ("聞く", VerbClass.GODAN),
+    ("飲む", VerbClass.GODAN),
+    ("勉強する", VerbClass.IRREGULAR),
+    ("来る", VerbClass.IRREGULAR),
+]
+
+class GodanTeChangedGenerator(JapaneseVerbFormGenerator):
+    def generate_te_form(self, verb, verb_class):
+        te_form = JapaneseVerbFormGenerator.generate_te_form(self, verb, verb_class)
+        return te_form + "ね" if verb.endswith("く") else te_form
+
+class ParadigmDigestTests(unittest.TestCase):
+    def test_digests_are_deterministic(self):
+        digest = paradigm_digest("書く", VerbClass.GODAN)
+        self.assertEqual(digest, paradigm_digest("書く", VerbClass.GODAN, JapaneseVerbFormGenerator()))
+        self.assertEqual(len(digest), 64)
+        self.assertNotEqual(digest, paradigm_digest("書く", VerbClass.ICHIDAN))
+        self.assertNotEqual(paradigm_digest("書くx", VerbClass.GODAN), paradigm_digest("書く", VerbClass.GODAN))
+        self.assertEqual(LexiconDigest.compute(LEXICON).root, LexiconDigest.compute(reversed(LEXICON)).root)
+
+    def test_diff_generators(self):
+        lexicon_diff = diff_generators(LEXICON, JapaneseVerbFormGenerator(), GodanTeChangedGenerator())
+        self.assertEqual(lexicon_diff, LexiconDiff([("書く", VerbClass.GODAN), ("聞く", VerbClass.GODAN)], [], []))
+        self.assertEqual(diff_generators(LEXICON, JapaneseVerbFormGenerator(), JapaneseVerbFormGenerator()), LexiconDiff([], [], []))
+
+    def test_added_and_removed(self):
+        old = LexiconDigest.compute(LEXICON[:-1])
+        new = LexiconDigest.compute(LEXICON[1:])
+        self.assertEqual(old.diff(new), LexiconDiff([], [("来る", VerbClass.IRREGULAR)], [("食べる", VerbClass.ICHIDAN)]))
+
+    def test_diff_descends_into_changed_buckets_only(self):
+        old = LexiconDigest.compute(LEXICON)
+        new = LexiconDigest.compute(LEXICON)
+        self.assertEqual(old.changed_buckets(new), [])
+        new.add("書く", VerbClass.GODAN, "0" * 64)
+        self.assertNotEqual(old.root, new.root)
+        self.assertEqual(len(old.changed_buckets(new)), 1)
+        self.assertEqual(len(old.levels()), MERKLE_DEPTH + 1)
+        self.assertEqual(old.diff(new).changed, [("書く", VerbClass.GODAN)])
+
+    def test_save_and_load(self):
+        lexicon_digest = LexiconDigest.compute(LEXICON)
+        for suffix in (".tsv", ".tsv.gz"):
+            handle, path = tempfile.mkstemp(suffix=suffix)
+            os.close(handle)
+            try:
+                lexicon_digest.save(path)
+                loaded = LexiconDigest.load(path)
+                self.assertEqual(loaded.digests, lexicon_digest.digests)
+                self.assertEqual(loaded.root, lexicon_digest.root)
+            finally:
+                os.remove(path)
+
+    def test_load_rejects_tampered_files(self):
+        handle, path = tempfile.mkstemp(suffix=".tsv")
+        os.close(handle)
+        try:
+            LexiconDigest.compute(LEXICON).save(path)
+            with open(path, encoding="utf-8") as digest_file:
+                lines = digest_file.readlines()
+            with open(path, "w", encoding="utf-8") as digest_file:
+                digest_file.writelines(lines[:-1])
+            self.assertRaises(ValueError, LexiconDigest.load, path)
+            with open(path, "w", encoding="utf-8") as digest_file:
+                digest_file.write("verb\tverb_class\tdigest\n")
+            self.assertRaises(ValueError, LexiconDigest.load, path)
+        finally:
+            os.remove(path)
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(ParadigmDigestTests)
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,88 @@
+import json
+import pickle
+import unittest
+
+from src.ParadigmSerializer import *
+from src.constants.EnumeratedTypes import Formality, Polarity, Tense, VerbClass, VerbForm
+from src.JapaneseVerbFormGenerator import JapaneseVerbFormGenerator
+from src.Paradigm import generate_paradigm
+
+VERBS = (
+    ("食べる", VerbClass.ICHIDAN),
+    ("書く", VerbClass.GODAN),
+    ("泳ぐ", VerbClass.GODAN),
+    ("勉強する", VerbClass.IRREGULAR),
+    ("来る", VerbClass.IRREGULAR),
+    ("くる", VerbClass.IRREGULAR),
+    ("する", VerbClass.IRREGULAR),
+)
+
+class ParadigmSerializerTests(unittest.TestCase):
+    def setUp(self):
+        self.generator = JapaneseVerbFormGenerator()
+
+    def paradigm(self, verb, verb_class):
+        return list(generate_paradigm(self.generator, verb, verb_class))
+
+    def test_round_trip(self):
+        for verb, verb_class in VERBS:
+            entries = self.paradigm(verb, verb_class)
+            self.assertEqual(decode_paradigm(encode_paradigm(verb, verb_class, entries)), (verb, verb_class, entries))
+            # entries in another order are encoded through the per-signature table
+            entries.reverse()
+            self.assertEqual(decode_paradigm(encode_paradigm(verb, verb_class, iter(entries))), (verb, verb_class, entries))
+
+    def test_header(self):
+        data = encode_paradigm("書く", VerbClass.GODAN, [])
+        self.assertEqual(data, bytes([FORMAT_VERSION, VerbClass.GODAN.value, 0, 6]) + "書く".encode("utf-8"))
+        self.assertEqual(decode_paradigm(data), ("書く", VerbClass.GODAN, []))
+
+    def test_entries_share_stem(self):
+        entries = [
+            (VerbForm.PLAIN, Tense.PAST, None, Polarity.POSITIVE, "書いた"),
+            (VerbForm.TE, None, None, None, "書いて"),
+            (VerbForm.HONORIFIC, None, Formality.PLAIN, Polarity.POSITIVE, "お書きになる"),
+            (VerbForm.IMPERATIVE, None, Formality.POLITE, Polarity.NEGATIVE, None),
+        ]
+        data = encode_paradigm("書く", VerbClass.GODAN, entries)
+        table = data[10:10 + 4 * ENTRY_SIZE]
+        self.assertEqual(table[:ENTRY_SIZE], bytes([VerbForm.PLAIN.value, Tense.PAST.value, 0, Polarity.POSITIVE.value, KIND_SUFFIX, 2]))
+        self.assertEqual(table[ENTRY_SIZE:2 * ENTRY_SIZE], bytes([VerbForm.TE.value, 0, 0, 0, KIND_SUFFIX, 2]))
+        self.assertEqual(table[2 * ENTRY_SIZE + 4:3 * ENTRY_SIZE], bytes([KIND_SURFACE, 6]))
+        self.assertEqual(table[3 * ENTRY_SIZE + 4:], bytes([KIND_NONE, 0]))
+        self.assertEqual(data[10 + 4 * ENTRY_SIZE:].decode("utf-8"), "いたいてお書きになる")
+        self.assertEqual(decode_paradigm(data)[2], entries)
+
+    def test_smaller_than_pickle_and_json(self):
+        verb, verb_class = "食べる", VerbClass.ICHIDAN
+        entries = self.paradigm(verb, verb_class)
+        data = encode_paradigm(verb, verb_class, entries)
+        self.assertLess(len(data), len(pickle.dumps((verb, verb_class, entries), pickle.HIGHEST_PROTOCOL)))
+        self.assertLess(len(data), len(json.dumps([verb, verb_class.name, [[str(cell) for cell in entry] for entry in entries]], ensure_ascii=False).encode("utf-8")))
+
+    def test_unknown_signature(self):
+        entries = [(VerbForm.TE, Tense.PAST, None, None, "書いて")]
+        self.assertRaises(ValueError, encode_paradigm, "書く", VerbClass.GODAN, entries)
+        entries = [(VerbForm.TE, None, None, None, "書" + "い" * 256)]
+        self.assertRaises(ValueError, encode_paradigm, "書く", VerbClass.GODAN, entries)
+
+    def test_malformed_data(self):
+        data = encode_paradigm("食べる", VerbClass.ICHIDAN, self.paradigm("食べる", VerbClass.ICHIDAN))
+        self.assertRaises(ValueError, decode_paradigm, data[:-1])
+        self.assertRaises(ValueError, decode_paradigm, data[:20])
+        self.assertRaises(ValueError, decode_paradigm, data + "る".encode("utf-8"))
+        self.assertRaises(ValueError, decode_paradigm, bytes([FORMAT_VERSION + 1]) + data[1:])
+        self.assertRaises(ValueError, decode_paradigm, b"")
+
+    def test_benchmark_serializers(self):
+        paradigms = [(verb, verb_class, self.paradigm(verb, verb_class)) for verb, verb_class in VERBS]
+        results = benchmark_serializers(paradigms, repeat=1)
+        self.assertEqual([result.name for result in results], ["binary", "pickle", "json"])
+        binary, pickle_result, json_result = results
+        self.assertLess(binary.bytes_per_paradigm, pickle_result.bytes_per_paradigm)
+        self.assertLess(binary.bytes_per_paradigm, json_result.bytes_per_paradigm)
+        self.assertGreater(binary.decodes_per_minute, 0)
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(ParadigmSerializerTests)
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,58 @@
+import os
+import tempfile
+import unittest
+
+from src.PerformanceRegression import *
+from src.constants.EnumeratedTypes import VerbClass
+
+def result(name, score):
+    return WorkloadResult(name, 1000.0 * score, 1000.0, score)
+
+class PerformanceRegressionTests(unittest.TestCase):
+    def test_checked_in_baseline_covers_every_workload(self):
+        baseline = load_baseline()
+        self.assertEqual(list(baseline["scores"]), list(WORKLOADS))
+        self.assertTrue(0 < baseline["tolerance"] < 1)
+        self.assertTrue(all(score > 0 for score in baseline["scores"].values()))
+
+    def test_compare_to_baseline(self):
+        baseline = {"version": BASELINE_VERSION, "tolerance": 0.25, "scores": {"single_conjugation": 0.1, "full_paradigm": 0.2}}
+        results = [result("single_conjugation", 0.08), result("full_paradigm", 0.1), result("batch_10k", 0.01)]
+        self.assertEqual(compare_to_baseline(results, baseline), [Regression("full_paradigm", 0.2, 0.1, 0.5)])
+        self.assertEqual([regression.name for regression in compare_to_baseline(results, baseline, tolerance=0.1)], ["single_conjugation", "full_paradigm"])
+        self.assertEqual(compare_to_baseline([result("single_conjugation", 0.5)], baseline), [])
+
+    def test_write_and_load_baseline(self):
+        handle, path = tempfile.mkstemp(suffix=".json")
+        os.close(handle)
+        try:
+            write_baseline([result("single_conjugation", 0.1), result("full_paradigm", 0.2)], path, tolerance=0.3)
+            baseline = load_baseline(path)
+            self.assertEqual(baseline["tolerance"], 0.3)
+            self.assertEqual(baseline["scores"], {"single_conjugation": 0.1, "full_paradigm": 0.2})
+            baseline_text = open(path, encoding="utf-8").read().replace('"version": 1', '"version": 99')
+            with open(path, "w", encoding="utf-8") as baseline_file:
+                baseline_file.write(baseline_text)
+            self.assertRaises(ValueError, load_baseline, path)
+        finally:
+            os.remove(path)
+
+    def test_run_workloads(self):
+        results = run_workloads(scale=0.01, min_time=0.001, repeat=1)
+        self.assertEqual([workload_result.name for workload_result in results], list(WORKLOADS))
+        for workload_result in results:
+            self.assertGreater(workload_result.operations_per_second, 0)
+            self.assertAlmostEqual(workload_result.score, workload_result.operations_per_second / workload_result.calibration_per_second)
+
+    def test_irregular_heavy_workload(self):
+        verbs = irregular_heavy_workload(1000)
+        irregular = sum(1 for _, verb_class in verbs if verb_class == VerbClass.IRREGULAR)
+        self.assertTrue(650 < irregular < 850)
+        self.assertEqual(irregular_heavy_workload(50), irregular_heavy_workload(50))
+
+    def test_calibration_loop(self):
+        self.assertEqual(calibration_loop(2), calibration_loop(1) * 2)
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(PerformanceRegressionTests)
+    unittest.TextTestRunner(verbosity=2).run(suite)
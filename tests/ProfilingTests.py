@@ -0,0 +1,52 @@
+import os
+import tempfile
+import tracemalloc
+import unittest
+
+from src.Profiling import *
+from src.Paradigm import PARADIGM_SIGNATURES
+
+
+class ProfilingTests(unittest.TestCase):
+    def test_zipf_workload_reproducible(self):
+        self.assertEqual(zipf_workload(100, seed=1), zipf_workload(100, seed=1))
+        self.assertEqual(len(zipf_workload(100)), 100)
+
+    def test_zipf_workload_favors_high_ranks(self):
+        workload = zipf_workload(2000, exponent=1.5)
+        self.assertGreater(workload.count(SYNTHETIC_LEXICON[0]), workload.count(SYNTHETIC_LEXICON[-1]))
+
+    def test_run_workload(self):
+        self.assertEqual(run_workload(SYNTHETIC_LEXICON), len(SYNTHETIC_LEXICON) * len(PARADIGM_SIGNATURES))
+
+    def test_measure_throughput(self):
+        self.assertGreater(measure_throughput(SYNTHETIC_LEXICON[:5], repeat=1), 0)
+
+    def test_best_time(self):
+        calls = []
+        self.assertGreaterEqual(best_time(lambda: calls.append(None), repeat=4), 0)
+        self.assertEqual(len(calls), 4)
+
+    def test_measure_peak_allocations(self):
+        peak_bytes = measure_peak_allocations(SYNTHETIC_LEXICON[:5])
+        # every conjugation allocates at least its result string
+        self.assertGreater(peak_bytes, 0)
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_profile_workload_writes_outputs(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output_prefix = os.path.join(directory, "profile")
+            summary = profile_workload(zipf_workload(20), output_prefix, top=5)
+            self.assertTrue(os.path.exists(output_prefix + ".prof"))
+            with open(output_prefix + ".collapsed", encoding="utf-8") as collapsed_file:
+                lines = collapsed_file.read().splitlines()
+
+        self.assertIn("cumulative", summary)
+        self.assertTrue(any("Utils.py:splice_verb" in line for line in lines))
+        for line in lines:
+            stack, weight = line.rsplit(" ", 1)
+            self.assertGreater(int(weight), 0)
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(ProfilingTests)
+    unittest.TextTestRunner(verbosity=2).run(suite)
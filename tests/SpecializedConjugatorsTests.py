@@ -0,0 +1,70 @@
+import unittest
+
+from src.SpecializedConjugators import *
+from src.constants.EnumeratedTypes import Formality, Polarity, Tense, VerbClass, VerbForm
+from src.JapaneseVerbFormGenerator import JapaneseVerbFormGenerator
+from src.Paradigm import PARADIGM_SIGNATURES, generate_paradigm
+
+VERBS = (
+    ("食べる", VerbClass.ICHIDAN),
+    ("起きる", VerbClass.ICHIDAN),
+    ("書く", VerbClass.GODAN),
+    ("泳ぐ", VerbClass.GODAN),
+    ("話す", VerbClass.GODAN),
+    ("かう", VerbClass.GODAN),
+    ("勉強する", VerbClass.IRREGULAR),
+    ("する", VerbClass.IRREGULAR),
+    ("来る", VerbClass.IRREGULAR),
+    ("持ってくる", VerbClass.IRREGULAR),
+)
+
+PLAIN_PAST_NEGATIVE = (VerbForm.PLAIN, Tense.PAST, None, Polarity.NEGATIVE)
+
+class SpecializedConjugatorsTests(unittest.TestCase):
+    def test_matches_generator(self):
+        generator = JapaneseVerbFormGenerator()
+        for verb, verb_class in VERBS:
+            for form, tense, formality, polarity, surface in generate_paradigm(generator, verb, verb_class):
+                function = specialized_function(verb_class, form, tense, formality, polarity)
+                self.assertEqual(function(verb), surface)
+
+    def test_unprobed_endings_match_generator(self):
+        # verbs passed with a class whose probed endings they do not have
+        generator = JapaneseVerbFormGenerator()
+        for verb, verb_class in (("できる", VerbClass.IRREGULAR), ("食べる", VerbClass.IRREGULAR), ("書く", VerbClass.IRREGULAR)):
+            for form, tense, formality, polarity, surface in generate_paradigm(generator, verb, verb_class):
+                function = specialized_function(verb_class, form, tense, formality, polarity)
+                self.assertEqual(function(verb), surface, (verb, form, tense, formality, polarity))
+
+    def test_derive_endings(self):
+        prefix, key_length, suffixes = derive_endings(PLAIN_PAST_NEGATIVE, VerbClass.GODAN)
+        self.assertEqual((prefix, key_length), ("", 1))
+        self.assertEqual(suffixes["く"], "かなかった")
+        prefix, key_length, suffixes = derive_endings((VerbForm.HONORIFIC, None, Formality.PLAIN, Polarity.POSITIVE), VerbClass.ICHIDAN)
+        self.assertEqual(prefix, "お")
+        self.assertEqual(set(suffixes.values()), set(["になる"]))
+        prefix, key_length, suffixes = derive_endings(PLAIN_PAST_NEGATIVE, VerbClass.IRREGULAR)
+        self.assertEqual((key_length, suffixes["来る"]), (2, "来なかった"))
+
+    def test_function_source(self):
+        self.assertIn("_PLAIN_PAST_NEGATIVE_GODAN_ENDINGS[verb[-1:]]", function_source(PLAIN_PAST_NEGATIVE, VerbClass.GODAN))
+        self.assertEqual(function_source(PLAIN_PAST_NEGATIVE, VerbClass.ICHIDAN), "def plain_past_negative_ichidan(verb):\n    if verb[-1:] not in {{{}}}:\n        return None\n    return verb[:-1] + 'なかった'\n".format(
+            ", ".join(repr(key) for key in REGULAR_ENDING_KEYS)))
+        self.assertEqual(function_source((VerbForm.PLAIN, Tense.NONPAST, None, Polarity.POSITIVE), VerbClass.IRREGULAR), "def plain_nonpast_positive_irregular(verb):\n    if verb[-2:] not in {'する', 'くる', '来る'}:\n        return None\n    return verb\n")
+
+    def test_generated_module(self):
+        namespace = {}
+        exec(compile(generate_source(), "<test>", "exec"), namespace)
+        self.assertEqual(len(namespace["FUNCTIONS"]), len(PARADIGM_SIGNATURES) * len(VerbClass))
+        self.assertEqual(namespace["plain_past_negative_godan"]("書く"), "書かなかった")
+
+    def test_unknown_signature(self):
+        self.assertRaises(ValueError, specialized_function, VerbClass.GODAN, VerbForm.TE, Tense.PAST)
+
+    def test_benchmark_specialized_functions(self):
+        results = benchmark_specialized_functions(VERBS, repeat=1)
+        self.assertEqual([name for name, _ in results], ["generate_*", "IntegerConjugator", "specialized"])
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(SpecializedConjugatorsTests)
+    unittest.TextTestRunner(verbosity=2).run(suite)
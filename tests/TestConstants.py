@@ -1,4 +1,4 @@
-from src.constants.EnumeratedTypes import Formality, Polarity, Tense, VerbClass
+from src.constants.EnumeratedTypes import AdjectiveClass, Formality, Polarity, Tense, VerbClass
 
 # regex for kanji / kana: "[一-龯ぁ-んァ-ン]+"
 # 飲む
@@ -66,6 +66,34 @@ class GodanVerbNomu:
     ProvisionalPlainPositive = "飲めば"
     ProvisionalPlainNegative = "飲まなければ"
 
+    # Desire Verb Forms
+    DesirePlainPositive = "飲みたい"
+    DesirePlainNegative = "飲みたくない"
+    DesirePolitePositive = "飲みたいです"
+    DesirePoliteNegative = "飲みたくないです"
+
+    # Appearance (Sou) Verb Forms
+    SouPlainPositive = "飲みそう"
+    SouPlainNegative = "飲まなさそう"
+    SouPolitePositive = "飲みそうです"
+    SouPoliteNegative = "飲まなさそうです"
+
+    NagaraForm = "飲みながら"
+    ZuForm = "飲まず"
+    TariForm = "飲んだり"
+
+    # Honorific Verb Forms
+    HonorificPlainPositive = "お飲みになる"
+    HonorificPlainNegative = "お飲みにならない"
+    HonorificPolitePositive = "お飲みになります"
+    HonorificPoliteNegative = "お飲みになりません"
+
+    # Humble Verb Forms
+    HumblePlainPositive = "お飲みする"
+    HumblePlainNegative = "お飲みしない"
+    HumblePolitePositive = "お飲みします"
+    HumblePoliteNegative = "お飲みしません"
+
 
 class IchidanVerbTaberu:
     # http://www.japaneseverbconjugator.com/VerbDetails.asp?txtVerb=%E9%A3%9F%E3%81%B9%E3%82%8B
@@ -123,6 +151,34 @@ class IchidanVerbTaberu:
     ProvisionalPlainPositive = "食べれば"
     ProvisionalPlainNegative = "食べなければ"
 
+    # Desire Verb Forms
+    DesirePlainPositive = "食べたい"
+    DesirePlainNegative = "食べたくない"
+    DesirePolitePositive = "食べたいです"
+    DesirePoliteNegative = "食べたくないです"
+
+    # Appearance (Sou) Verb Forms
+    SouPlainPositive = "食べそう"
+    SouPlainNegative = "食べなさそう"
+    SouPolitePositive = "食べそうです"
+    SouPoliteNegative = "食べなさそうです"
+
+    NagaraForm = "食べながら"
+    ZuForm = "食べず"
+    TariForm = "食べたり"
+
+    # Honorific Verb Forms
+    HonorificPlainPositive = "お食べになる"
+    HonorificPlainNegative = "お食べにならない"
+    HonorificPolitePositive = "お食べになります"
+    HonorificPoliteNegative = "お食べになりません"
+
+    # Humble Verb Forms
+    HumblePlainPositive = "お食べする"
+    HumblePlainNegative = "お食べしない"
+    HumblePolitePositive = "お食べします"
+    HumblePoliteNegative = "お食べしません"
+
 
 class IrregularVerbSuru: 
     # http://www.japaneseverbconjugator.com/Suru.asp
@@ -183,6 +239,34 @@ class IrregularVerbSuru:
     ProvisionalPolitePositive = "勉強しませば"
     ProvisionalPoliteNegative = "勉強しませんなら"
 
+    # Desire Verb Forms
+    DesirePlainPositive = "勉強したい"
+    DesirePlainNegative = "勉強したくない"
+    DesirePolitePositive = "勉強したいです"
+    DesirePoliteNegative = "勉強したくないです"
+
+    # Appearance (Sou) Verb Forms
+    SouPlainPositive = "勉強しそう"
+    SouPlainNegative = "勉強しなさそう"
+    SouPolitePositive = "勉強しそうです"
+    SouPoliteNegative = "勉強しなさそうです"
+
+    NagaraForm = "勉強しながら"
+    ZuForm = "勉強せず"
+    TariForm = "勉強したり"
+
+    # Honorific Verb Forms
+    HonorificPlainPositive = "勉強なさる"
+    HonorificPlainNegative = "勉強なさらない"
+    HonorificPolitePositive = "勉強なさいます"
+    HonorificPoliteNegative = "勉強なさいません"
+
+    # Humble Verb Forms
+    HumblePlainPositive = "勉強いたす"
+    HumblePlainNegative = "勉強いたさない"
+    HumblePolitePositive = "勉強いたします"
+    HumblePoliteNegative = "勉強いたしません"
+
 
 class IrregularVerbKuru: 
     # http://www.japaneseverbconjugator.com/Kuru.asp
@@ -244,4 +328,290 @@ class IrregularVerbKuru:
     ProvisionalPlainPositive = "くれば"
     ProvisionalPlainNegative = "こなければ"
     ProvisionalPolitePositive = "きませば"
-    ProvisionalPoliteNegative = "きませんなら"
\ No newline at end of file
+    ProvisionalPoliteNegative = "きませんなら"
+
+    # Desire Verb Forms
+    DesirePlainPositive = "きたい"
+    DesirePlainNegative = "きたくない"
+    DesirePolitePositive = "きたいです"
+    DesirePoliteNegative = "きたくないです"
+
+    # Appearance (Sou) Verb Forms
+    SouPlainPositive = "きそう"
+    SouPlainNegative = "こなさそう"
+    SouPolitePositive = "きそうです"
+    SouPoliteNegative = "こなさそうです"
+
+    NagaraForm = "きながら"
+    ZuForm = "こず"
+    TariForm = "きたり"
+
+    # Honorific Verb Forms
+    HonorificPlainPositive = "いらっしゃる"
+    HonorificPlainNegative = "いらっしゃらない"
+    HonorificPolitePositive = "いらっしゃいます"
+    HonorificPoliteNegative = "いらっしゃいません"
+
+    # Humble Verb Forms
+    HumblePlainPositive = "まいる"
+    HumblePlainNegative = "まいらない"
+    HumblePolitePositive = "まいります"
+    HumblePoliteNegative = "まいりません"
+
+
+class IrregularVerbKuruKanji: 
+    # kuru spelled with kanji, every reading of 来 (き, こ, く) is written 来
+    Verb = "来る" # plain positive nonpast
+    Verb_Class = VerbClass.IRREGULAR
+
+    # Formal Verb Forms
+    PolitePositiveNonpast = "来ます"
+    PolitePositivePast = "来ました"
+    PoliteNegativeNonpast = "来ません"
+    PoliteNegativePast = "来ませんでした"
+
+    # Plain Verb Forms
+    PlainPositivePast = "来た" # ta form
+    PlainNegativeNonpast = "来ない" # nai form
+    PlainNegativePast = "来なかった" # katta form
+
+    TeForm = "来て"
+
+    # Conditional Verb Forms
+    ConditionalPlainPositive = "来たら" # tara form
+    ConditionalPolitePositive = "来ましたら" # tara form
+    ConditionalPlainNegative = "来なかったら" # tara form
+    ConditionalPoliteNegative = "来ませんでしたら" # tara form
+
+    # Volitional Verb Forms
+    VolitionalPolitePositive = "来ましょう"
+    VolitionalPoliteNegative = "来ないでしょう"
+    VolitionalPlainPositive = "来よう"
+    VolitionalPlainNegative = "来ないだろう"
+
+    # VolitionalPlainPositivePast = "来たろう"
+    # VolitionalPolitePositivePast = "来たでしょう"
+    # VolitionalPlainNegativePast = "来なかっただろう"
+    # VolitionalPoliteNegativePast = "来なかったでしょう"
+
+    # Potential Verb Forms
+    PotentialPlainPositive = "来られる"
+    PotentialPlainNegative = "来られない"
+    PotentialPolitePositive = "来られます"
+    PotentialPoliteNegative = "来られません"
+
+    # Imperative Verb Forms
+    ImperativePlainPositive = "来い"
+    ImperativePlainNegative = "来るな"
+    ImperativePolitePositive = "来てください"
+    ImperativePoliteNegative = "来ないでください"
+
+    # Causative Verb Forms
+    CausativePlainPositive = "来させる"
+    CausativePlainNegative = "来させない"
+    CausativePolitePositive = "来させます"
+    CausativePoliteNegative = "来させません"
+
+    # Passive Verb Forms
+    PassivePlainPositive = "来られる"
+
+    # Provisional Verb Forms
+    ProvisionalPlainPositive = "来れば"
+    ProvisionalPlainNegative = "来なければ"
+    ProvisionalPolitePositive = "来ませば"
+    ProvisionalPoliteNegative = "来ませんなら"
+
+    # Desire Verb Forms
+    DesirePlainPositive = "来たい"
+    DesirePlainNegative = "来たくない"
+    DesirePolitePositive = "来たいです"
+    DesirePoliteNegative = "来たくないです"
+
+    # Appearance (Sou) Verb Forms
+    SouPlainPositive = "来そう"
+    SouPlainNegative = "来なさそう"
+    SouPolitePositive = "来そうです"
+    SouPoliteNegative = "来なさそうです"
+
+    NagaraForm = "来ながら"
+    ZuForm = "来ず"
+    TariForm = "来たり"
+
+    # Honorific Verb Forms
+    HonorificPlainPositive = "いらっしゃる"
+    HonorificPlainNegative = "いらっしゃらない"
+    HonorificPolitePositive = "いらっしゃいます"
+    HonorificPoliteNegative = "いらっしゃいません"
+
+    # Humble Verb Forms
+    HumblePlainPositive = "まいる"
+    HumblePlainNegative = "まいらない"
+    HumblePolitePositive = "まいります"
+    HumblePoliteNegative = "まいりません"
+
+
+class IrregularVerbMotteKuru: 
+    # compound kuru verb, conjugated like くる after the 持って stem
+    Verb = "持ってくる" # plain positive nonpast
+    Verb_Class = VerbClass.IRREGULAR
+
+    # Formal Verb Forms
+    PolitePositiveNonpast = "持ってきます"
+    PolitePositivePast = "持ってきました"
+    PoliteNegativeNonpast = "持ってきません"
+    PoliteNegativePast = "持ってきませんでした"
+
+    # Plain Verb Forms
+    PlainPositivePast = "持ってきた" # ta form
+    PlainNegativeNonpast = "持ってこない" # nai form
+    PlainNegativePast = "持ってこなかった" # katta form
+
+    TeForm = "持ってきて"
+
+    # Conditional Verb Forms
+    ConditionalPlainPositive = "持ってきたら" # tara form
+    ConditionalPolitePositive = "持ってきましたら" # tara form
+    ConditionalPlainNegative = "持ってこなかったら" # tara form
+    ConditionalPoliteNegative = "持ってきませんでしたら" # tara form
+
+    # Volitional Verb Forms
+    VolitionalPolitePositive = "持ってきましょう"
+    VolitionalPoliteNegative = "持ってこないでしょう"
+    VolitionalPlainPositive = "持ってこよう"
+    VolitionalPlainNegative = "持ってこないだろう"
+
+    # VolitionalPlainPositivePast = "持ってきたろう"
+    # VolitionalPolitePositivePast = "持ってきたでしょう"
+    # VolitionalPlainNegativePast = "持ってこなかっただろう"
+    # VolitionalPoliteNegativePast = "持ってこなかったでしょう"
+
+    # Potential Verb Forms
+    PotentialPlainPositive = "持ってこられる"
+    PotentialPlainNegative = "持ってこられない"
+    PotentialPolitePositive = "持ってこられます"
+    PotentialPoliteNegative = "持ってこられません"
+
+    # Imperative Verb Forms
+    ImperativePlainPositive = "持ってこい"
+    ImperativePlainNegative = "持ってくるな"
+    ImperativePolitePositive = "持ってきてください"
+    ImperativePoliteNegative = "持ってこないでください"
+
+    # Causative Verb Forms
+    CausativePlainPositive = "持ってこさせる"
+    CausativePlainNegative = "持ってこさせない"
+    CausativePolitePositive = "持ってこさせます"
+    CausativePoliteNegative = "持ってこさせません"
+
+    # Passive Verb Forms
+    PassivePlainPositive = "持ってこられる"
+
+    # Provisional Verb Forms
+    ProvisionalPlainPositive = "持ってくれば"
+    ProvisionalPlainNegative = "持ってこなければ"
+    ProvisionalPolitePositive = "持ってきませば"
+    ProvisionalPoliteNegative = "持ってきませんなら"
+
+    # Desire Verb Forms
+    DesirePlainPositive = "持ってきたい"
+    DesirePlainNegative = "持ってきたくない"
+    DesirePolitePositive = "持ってきたいです"
+    DesirePoliteNegative = "持ってきたくないです"
+
+    # Appearance (Sou) Verb Forms
+    SouPlainPositive = "持ってきそう"
+    SouPlainNegative = "持ってこなさそう"
+    SouPolitePositive = "持ってきそうです"
+    SouPoliteNegative = "持ってこなさそうです"
+
+    NagaraForm = "持ってきながら"
+    ZuForm = "持ってこず"
+    TariForm = "持ってきたり"
+
+    # Honorific Verb Forms
+    HonorificPlainPositive = "持っていらっしゃる"
+    HonorificPlainNegative = "持っていらっしゃらない"
+    HonorificPolitePositive = "持っていらっしゃいます"
+    HonorificPoliteNegative = "持っていらっしゃいません"
+
+    # Humble Verb Forms
+    HumblePlainPositive = "持ってまいる"
+    HumblePlainNegative = "持ってまいらない"
+    HumblePolitePositive = "持ってまいります"
+    HumblePoliteNegative = "持ってまいりません"
+
+class IAdjectiveTakai:
+    Adjective = "高い"
+    Adjective_Class = AdjectiveClass.I_ADJECTIVE
+
+    PlainPositiveNonpast = "高い"
+    PlainPositivePast = "高かった"
+    PlainNegativeNonpast = "高くない"
+    PlainNegativePast = "高くなかった"
+    PolitePositiveNonpast = "高いです"
+    PolitePositivePast = "高かったです"
+    PoliteNegativeNonpast = "高くありません"
+    PoliteNegativePast = "高くありませんでした"
+    TeForm = "高くて"
+    AdverbialForm = "高く"
+    ConditionalPositive = "高かったら"
+    ConditionalNegative = "高くなかったら"
+    ProvisionalPositive = "高ければ"
+    ProvisionalNegative = "高くなければ"
+
+class IAdjectiveIi:
+    Adjective = "いい"
+    Adjective_Class = AdjectiveClass.I_ADJECTIVE
+
+    PlainPositiveNonpast = "いい"
+    PlainPositivePast = "よかった"
+    PlainNegativeNonpast = "よくない"
+    PlainNegativePast = "よくなかった"
+    PolitePositiveNonpast = "いいです"
+    PolitePositivePast = "よかったです"
+    PoliteNegativeNonpast = "よくありません"
+    PoliteNegativePast = "よくありませんでした"
+    TeForm = "よくて"
+    AdverbialForm = "よく"
+    ConditionalPositive = "よかったら"
+    ConditionalNegative = "よくなかったら"
+    ProvisionalPositive = "よければ"
+    ProvisionalNegative = "よくなければ"
+
+class IAdjectiveKakkoii:
+    Adjective = "かっこいい"
+    Adjective_Class = AdjectiveClass.I_ADJECTIVE
+
+    PlainPositiveNonpast = "かっこいい"
+    PlainPositivePast = "かっこよかった"
+    PlainNegativeNonpast = "かっこよくない"
+    PlainNegativePast = "かっこよくなかった"
+    PolitePositiveNonpast = "かっこいいです"
+    PolitePositivePast = "かっこよかったです"
+    PoliteNegativeNonpast = "かっこよくありません"
+    PoliteNegativePast = "かっこよくありませんでした"
+    TeForm = "かっこよくて"
+    AdverbialForm = "かっこよく"
+    ConditionalPositive = "かっこよかったら"
+    ConditionalNegative = "かっこよくなかったら"
+    ProvisionalPositive = "かっこよければ"
+    ProvisionalNegative = "かっこよくなければ"
+
+class NaAdjectiveShizuka:
+    Adjective = "静か"
+    Adjective_Class = AdjectiveClass.NA_ADJECTIVE
+
+    PlainPositiveNonpast = "静かだ"
+    PlainPositivePast = "静かだった"
+    PlainNegativeNonpast = "静かじゃない"
+    PlainNegativePast = "静かじゃなかった"
+    PolitePositiveNonpast = "静かです"
+    PolitePositivePast = "静かでした"
+    PoliteNegativeNonpast = "静かじゃありません"
+    PoliteNegativePast = "静かじゃありませんでした"
+    TeForm = "静かで"
+    AdverbialForm = "静かに"
+    ConditionalPositive = "静かだったら"
+    ConditionalNegative = "静かじゃなかったら"
+    ProvisionalPositive = "静かなら"
+    ProvisionalNegative = "静かじゃなければ"
@@ -0,0 +1,104 @@
+import io
+import os
+import tempfile
+import unittest
+
+from src.TextRewriter import *
+from src.JapaneseVerbFormGenerator import JapaneseVerbFormGenerator
+from src.Utils import guess_verb_class
+from src.constants.EnumeratedTypes import Formality, Polarity, Tense, VerbClass, VerbForm
+
+from TestConstants import GodanVerbNomu, IchidanVerbTaberu, IrregularVerbSuru
+
+LEXICON = [
+    (GodanVerbNomu.Verb, GodanVerbNomu.Verb_Class),
+    (IchidanVerbTaberu.Verb, IchidanVerbTaberu.Verb_Class),
+]
+
+
+class TextRewriterTests(unittest.TestCase):
+    def setUp(self):
+        self.rewriter = StreamingVerbRewriter(VerbForm.PLAIN, tense=Tense.NONPAST, polarity=Polarity.POSITIVE, lexicon=LEXICON)
+
+    def test_tokenize_japanese_runs(self):
+        text = "水を飲みます。Hello, 食べる!"
+        tokens = tokenize_japanese_runs(text)
+        self.assertEqual(tokens, ["水を飲みます", "。Hello, ", "食べる", "!"])
+        self.assertEqual("".join(tokens), text)
+
+    def test_rewrite_text_polite_to_plain_with_lexicon(self):
+        result = self.rewriter.rewrite_text("私は水を" + GodanVerbNomu.PolitePositiveNonpast + "。パンを" + IchidanVerbTaberu.PolitePositivePast + "。")
+        self.assertEqual(result, "私は水を" + GodanVerbNomu.Verb + "。パンを" + IchidanVerbTaberu.PlainPositivePast + "。")
+
+    def test_rewrite_keeps_tense_and_polarity_of_matched_surface(self):
+        self.assertEqual(self.rewriter.rewrite_text("水を" + GodanVerbNomu.PoliteNegativePast + "。"), "水を" + GodanVerbNomu.PlainNegativePast + "。")
+        rewriter = StreamingVerbRewriter(VerbForm.POLITE, tense=Tense.NONPAST, polarity=Polarity.POSITIVE, lexicon=LEXICON)
+        self.assertEqual(rewriter.rewrite_text(IchidanVerbTaberu.PlainNegativePast), IchidanVerbTaberu.PoliteNegativePast)
+        # the -te form has no tense or polarity, so the rewriter's are used
+        self.assertEqual(rewriter.rewrite_text(GodanVerbNomu.TeForm), GodanVerbNomu.PolitePositiveNonpast)
+
+    def test_rewrite_text_guesses_unknown_dictionary_form_verbs(self):
+        rewriter = StreamingVerbRewriter(VerbForm.POLITE, tense=Tense.NONPAST, polarity=Polarity.POSITIVE, guess_unknown_verbs=True)
+        self.assertEqual(rewriter.rewrite_text("毎日" + IrregularVerbSuru.Verb + "。"), "毎日" + IrregularVerbSuru.PolitePositiveNonpast + "。")
+        self.assertEqual(rewriter.rewrite_text("本を読む。日本語で話す。"), "本を読みます。日本語で話します。")
+        self.assertEqual(rewriter.rewrite_text("Hello world"), "Hello world")
+
+    def test_guessing_skips_copulas_and_fixed_expressions(self):
+        rewriter = StreamingVerbRewriter(VerbForm.POLITE, tense=Tense.NONPAST, polarity=Polarity.POSITIVE, guess_unknown_verbs=True)
+        for text in ("これはペンです。ありがとう。", "学生です。", "有難う。", "おはようございます。", "行きましょう。"):
+            self.assertEqual(rewriter.rewrite_text(text), text)
+
+    def test_rewrite_text_without_guessing(self):
+        rewriter = StreamingVerbRewriter(VerbForm.TE)
+        self.assertEqual(rewriter.rewrite_text("話す。"), "話す。")
+        rewriter = StreamingVerbRewriter(VerbForm.POLITE, tense=Tense.NONPAST, polarity=Polarity.POSITIVE)
+        self.assertEqual(rewriter.rewrite_text("これはペンです。ありがとう。"), "これはペンです。ありがとう。")
+
+    def test_target_form_parameters_are_required(self):
+        self.assertRaises(ValueError, StreamingVerbRewriter, VerbForm.POLITE, lexicon=LEXICON)
+        self.assertRaises(ValueError, StreamingVerbRewriter, VerbForm.PLAIN, tense=Tense.PAST)
+        self.assertRaises(ValueError, StreamingVerbRewriter, VerbForm.POTENTIAL, polarity=Polarity.POSITIVE)
+        StreamingVerbRewriter(VerbForm.POTENTIAL, formality=Formality.PLAIN, polarity=Polarity.POSITIVE)
+
+    def test_lexicon_verbs_conjugated_once(self):
+        calls = []
+        class CountingGenerator(JapaneseVerbFormGenerator):
+            def generate_te_form(self, verb, verb_class):
+                calls.append(verb)
+                return JapaneseVerbFormGenerator.generate_te_form(self, verb, verb_class)
+        StreamingVerbRewriter(VerbForm.TE, lexicon=LEXICON, generator=CountingGenerator())
+        self.assertEqual(calls, [verb for verb, _ in LEXICON])
+
+    def test_rewrite_text_custom_tokenizer(self):
+        rewriter = StreamingVerbRewriter(VerbForm.TE, lexicon=LEXICON, tokenizer=lambda text: text.split("|"))
+        self.assertEqual(rewriter.rewrite_text("水を|" + GodanVerbNomu.Verb), "水を" + GodanVerbNomu.TeForm)
+
+    def test_rewrite_stream_matches_rewrite_text_across_chunk_boundaries(self):
+        text = "私は水を飲みます。パンを食べました、そして話す。\n" * 20
+        expected = self.rewriter.rewrite_text(text)
+        for chunk_size in [1, 3, 7, 64]:
+            self.rewriter.chunk_size = chunk_size
+            result = "".join(self.rewriter.rewrite_stream(io.StringIO(text)))
+            self.assertEqual(result, expected)
+
+    def test_rewrite_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            input_path = os.path.join(directory, "input.txt")
+            output_path = os.path.join(directory, "output.txt")
+            with open(input_path, "w", encoding="utf-8") as input_file:
+                input_file.write(GodanVerbNomu.PolitePositivePast + "\n")
+            self.rewriter.rewrite_file(input_path, output_path)
+            with open(output_path, encoding="utf-8") as output_file:
+                self.assertEqual(output_file.read(), GodanVerbNomu.PlainPositivePast + "\n")
+
+    def test_guess_verb_class(self):
+        self.assertEqual(guess_verb_class(IrregularVerbSuru.Verb), VerbClass.IRREGULAR)
+        self.assertEqual(guess_verb_class("来る"), VerbClass.IRREGULAR)
+        self.assertEqual(guess_verb_class(IchidanVerbTaberu.Verb), VerbClass.ICHIDAN)
+        self.assertEqual(guess_verb_class(GodanVerbNomu.Verb), VerbClass.GODAN)
+        self.assertEqual(guess_verb_class("帰る"), VerbClass.GODAN)
+        self.assertEqual(guess_verb_class("見る", "みる"), VerbClass.ICHIDAN)
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(TextRewriterTests)
+    unittest.TextTestRunner(verbosity=2).run(suite)
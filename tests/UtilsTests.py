@@ -15,6 +15,39 @@ class UtilsTests(unittest.TestCase):
         # TODO: refactor to throw error
         self.assertIsNone(result)
 
+    def test_handle_irregular_verb_kuru_kanji(self):
+        result = handle_irregular_verb("持って来る", True, "ます", "ます")
+        self.assertEqual(result, "持って来ます")
+
+    def test_handle_irregular_verb_memoized_ending(self):
+        handle_irregular_verb(IrregularVerbSuru.Verb, True, "ます", "ます")
+        self.assertEqual(IRREGULAR_ENDING_CACHE[(SURU_ENDING, True, "ます", "ます")], "します")
+        result = handle_irregular_verb("運動する", True, "ます", "ます")
+        self.assertEqual(result, "運動します")
+
+    def test_generate_nai_form_kuru_kanji(self):
+        result = generate_nai_form("来る", VerbClass.IRREGULAR, True)
+        self.assertEqual(result, "来ない")
+
+    def test_base_nai_form_attaches_ending_to_stem(self):
+        self.assertEqual(base_nai_form(GodanVerbNomu.Verb, VerbClass.GODAN, "なかった"), "飲まなかった")
+        self.assertEqual(base_nai_form(IchidanVerbTaberu.Verb, VerbClass.ICHIDAN, "なければ"), "食べなければ")
+        self.assertEqual(base_nai_form("持って来る", VerbClass.IRREGULAR, "ない"), "持って来ない")
+
+    def test_base_masu_form_attaches_ending_to_stem(self):
+        self.assertEqual(base_masu_form("待つ", VerbClass.GODAN, "ましたら"), "待ちましたら")
+        self.assertEqual(base_masu_form(IchidanVerbTaberu.Verb, VerbClass.ICHIDAN, "ます"), "食べます")
+        self.assertEqual(base_masu_form("勉強する", VerbClass.IRREGULAR, "ません"), "勉強しません")
+
+    def test_godan_ending_shifts_match_romkan(self):
+        for (romaji_ending, kana), shifted_kana in GODAN_ENDING_SHIFTS.items():
+            expected = map_dict_form_to_different_ending("飲" + kana, romaji_ending, *GODAN_SPECIAL_ENDINGS[romaji_ending])
+            self.assertEqual("飲" + shifted_kana, expected)
+
+    def test_shift_godan_ending_with_ending(self):
+        self.assertEqual(map_dictionary_to_a_ending("話す", "せる"), "話させる")
+        self.assertEqual(map_dictionary_to_o_ending("泳ぐ", U_PARTICLE), "泳ごう")
+
     # all below this must be godan verb
     def test_base_te_ta_form_CHISAI_TSU(self):
         verb = "使う"
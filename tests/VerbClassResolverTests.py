@@ -0,0 +1,88 @@
+import os
+import tempfile
+import unittest
+
+from src.VerbClassResolver import *
+from src.constants.EnumeratedTypes import VerbClass
+
+
+class VerbClassResolverTests(unittest.TestCase):
+    def setUp(self):
+        self.resolver = VerbClassResolver()
+
+    def test_exception_file_is_sorted(self):
+        for path in (DEFAULT_GODAN_EXCEPTIONS_PATH, DEFAULT_ICHIDAN_KANJI_VERBS_PATH):
+            with open(path, encoding="utf-8") as exception_file:
+                lines = exception_file.read().splitlines()
+            self.assertEqual(lines, sorted(set(lines)), path)
+
+    def test_load_godan_exceptions(self):
+        surfaces, readings = load_godan_exceptions()
+        self.assertIsInstance(surfaces, frozenset)
+        self.assertIn("切る", surfaces)
+        self.assertIn("しゃべる", readings)
+        # 着る is ichidan, so きる alone does not mean 切る
+        self.assertNotIn("きる", readings)
+
+    def test_loaded_lazily(self):
+        self.assertIsNone(self.resolver._surfaces)
+        self.resolver.resolve("食べる")
+        self.assertIsNotNone(self.resolver._surfaces)
+
+    def test_godan_exceptions(self):
+        for verb in ["切る", "帰る", "入る", "走る", "知る", "喋る", "しゃべる", "はいる"]:
+            self.assertEqual(self.resolver.resolve(verb), VerbClass.GODAN, verb)
+
+    def test_ichidan(self):
+        for verb in ["食べる", "起きる", "たべる", "きる", "かえる"]:
+            self.assertEqual(self.resolver.resolve(verb), VerbClass.ICHIDAN, verb)
+
+    def test_compounds(self):
+        self.assertEqual(self.resolver.resolve("思い切る"), VerbClass.GODAN)
+        self.assertEqual(self.resolver.resolve("気に入る"), VerbClass.GODAN)
+        self.assertEqual(self.resolver.resolve("勉強する"), VerbClass.IRREGULAR)
+
+    def test_reading(self):
+        self.assertEqual(self.resolver.resolve("見る", "みる"), VerbClass.ICHIDAN)
+        self.assertEqual(self.resolver.resolve("着る", "きる"), VerbClass.ICHIDAN)
+        self.assertEqual(self.resolver.resolve("切る", "きる"), VerbClass.GODAN)
+
+    def test_ichidan_kanji_verbs(self):
+        # one kanji and る hides the kana before る, but these are all ichidan
+        for verb in ["見る", "着る", "寝る", "出る", "似る", "煮る", "夢見る", "抜け出る"]:
+            self.assertEqual(self.resolver.resolve(verb), VerbClass.ICHIDAN, verb)
+        for verb in ["切る", "帰る", "知る", "取る", "乗る", "見入る"]:
+            self.assertEqual(self.resolver.resolve(verb), VerbClass.GODAN, verb)
+        self.assertIsInstance(load_ichidan_kanji_verbs(), frozenset)
+
+    def test_godan_endings(self):
+        self.assertEqual(self.resolver.resolve("飲む"), VerbClass.GODAN)
+        self.assertEqual(self.resolver.resolve("分かる"), VerbClass.GODAN)
+
+    def test_overrides(self):
+        resolver = VerbClassResolver(overrides=[("見る", VerbClass.ICHIDAN)])
+        self.assertEqual(resolver.resolve("見る"), VerbClass.ICHIDAN)
+        resolver.add_overrides({"きる": VerbClass.GODAN})
+        self.assertEqual(resolver.resolve("きる"), VerbClass.GODAN)
+
+    def test_custom_exception_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "exceptions.txt")
+            with open(path, "w", encoding="utf-8") as exception_file:
+                exception_file.write("ねる\n")
+            resolver = VerbClassResolver(path, ichidan_path=path)
+            self.assertEqual(resolver.resolve("ねる"), VerbClass.GODAN)
+            self.assertEqual(resolver.resolve("見る"), VerbClass.GODAN)
+            self.assertEqual(resolver.resolve("切る", "きる"), VerbClass.ICHIDAN)
+
+    def test_resolve_verb_class(self):
+        self.assertEqual(resolve_verb_class("帰る"), VerbClass.GODAN)
+        self.assertEqual(resolve_verb_class("見る"), VerbClass.ICHIDAN)
+        self.assertEqual(resolve_verb_class("見る", "みる"), VerbClass.ICHIDAN)
+
+    def test_measure_lookup_rate(self):
+        self.assertGreater(measure_lookup_rate(["切る", "食べる", "飲む"] * 100, repeat=1), 0)
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(VerbClassResolverTests)
+    unittest.TextTestRunner(verbosity=2).run(suite)